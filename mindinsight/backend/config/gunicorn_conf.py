@@ -112,3 +112,11 @@ def worker_int(worker):
     if LISTEN_PROCESS is not None:
         LISTEN_PROCESS.terminate()
     worker.log.info("Worker int processed.")
+
+
+def worker_exit(server, worker):
+    """Release the resources of data manager when worker exits."""
+    del server
+    data_manager_module = import_module('mindinsight.datavisual.data_transform.data_manager')
+    data_manager_module.DATA_MANAGER.close()
+    worker.log.info("Worker exit processed.")
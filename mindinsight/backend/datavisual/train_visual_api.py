@@ -20,9 +20,11 @@ This module provides the interfaces to train processors functions.
 from flask import Blueprint
 from flask import request
 from flask import jsonify
+from flask import make_response
 
 from mindinsight.conf import settings
 from mindinsight.datavisual.utils.tools import if_nan_inf_to_none
+from mindinsight.datavisual.utils.tools import encode_binary_response, BINARY_RESPONSE_MIMETYPE
 from mindinsight.datavisual.processors.histogram_processor import HistogramProcessor
 from mindinsight.datavisual.processors.tensor_processor import TensorProcessor
 from mindinsight.datavisual.processors.images_processor import ImageProcessor
@@ -34,6 +36,7 @@ from mindinsight.utils.exceptions import ParamValueError
 
 
 VALID_MODE = {"normal", "optimize"}
+VALID_RESPONSE_FORMAT = {"json", "binary"}
 BLUEPRINT = Blueprint("train_visual", __name__, url_prefix=settings.URL_PATH_PREFIX+settings.API_PREFIX)
 
 
@@ -77,6 +80,8 @@ def scalar_metadata():
     """
     Interface to fetch metadata about the scalars for the particular run and tag.
 
+    Scalars are downsampled to `max_points` points if it is given.
+
     Returns:
         Response, which contains a list in JSON containing scalar events, each
             one of which is an object containing items' wall_time, step and value.
@@ -85,7 +90,7 @@ def scalar_metadata():
     train_id = request.args.get('train_id')
 
     processor = ScalarsProcessor(DATA_MANAGER)
-    response = processor.get_metadata_list(train_id, tag)
+    response = processor.get_metadata_list(train_id, tag, **_get_downsample_params())
 
     metadatas = response['metadatas']
     for metadata in metadatas:
@@ -196,32 +201,81 @@ def histogram():
 
 @BLUEPRINT.route("/datavisual/scalars", methods=["GET"])
 def get_scalars():
-    """Get scalar data for given train_ids and tags."""
+    """Get scalar data for given train_ids and tags, downsampled to `max_points` points if it is given."""
     train_ids = request.args.getlist('train_id')
     tags = request.args.getlist('tag')
 
     processor = ScalarsProcessor(DATA_MANAGER)
-    scalars = processor.get_scalars(train_ids, tags)
+    scalars = processor.get_scalars(train_ids, tags, **_get_downsample_params())
     return jsonify({'scalars': scalars})
 
 
+def _get_downsample_params():
+    """
+    Get the optional downsampling params of scalars from the request.
+
+    Returns:
+        dict, the given `max_points` and `downsample_mode` params.
+    """
+    params = {}
+    max_points = request.args.get('max_points', default=None)
+    if max_points is not None:
+        params['max_points'] = max_points
+    downsample_mode = request.args.get('downsample', default=None)
+    if downsample_mode is not None:
+        params['downsample_mode'] = downsample_mode
+    return params
+
+
+def _is_binary_format():
+    """
+    Check whether the binary response is requested by the `format` param.
+
+    Returns:
+        bool, whether the response format is 'binary'.
+    """
+    response_format = request.args.get('format', default='json')
+    if response_format not in VALID_RESPONSE_FORMAT:
+        raise ParamValueError("Invalid format. format must be in {}".format(sorted(VALID_RESPONSE_FORMAT)))
+    return response_format == 'binary'
+
+
+def _make_data_response(response, binary):
+    """
+    Make the response in JSON, or in binary with the data of numpy.ndarray.
+
+    Args:
+        response (dict): The response.
+        binary (bool): Whether to make the binary response, see `encode_binary_response`.
+
+    Returns:
+        Response, the JSON or binary response.
+    """
+    if not binary:
+        return jsonify(response)
+    binary_response = make_response(encode_binary_response(response))
+    binary_response.headers['Content-Type'] = BINARY_RESPONSE_MIMETYPE
+    return binary_response
+
+
 @BLUEPRINT.route("/datavisual/tensors", methods=["GET"])
 def get_tensors():
     """
     Interface to obtain tensor data.
 
     Returns:
-        Response, which contains a JSON object.
+        Response, which contains a JSON object, or the binary when `format` is 'binary'.
     """
     train_ids = request.args.getlist('train_id')
     tags = request.args.getlist('tag')
     step = request.args.get("step", default=None)
     dims = request.args.get("dims", default=None)
     detail = request.args.get("detail", default=None)
+    binary = _is_binary_format()
 
     processor = TensorProcessor(DATA_MANAGER)
-    response = processor.get_tensors(train_ids, tags, step, dims, detail)
-    return jsonify(response)
+    response = processor.get_tensors(train_ids, tags, step, dims, detail, binary=binary)
+    return _make_data_response(response, binary)
 
 
 def init_module(app):
@@ -254,12 +308,13 @@ def list_landscapes():
     Get the loss landscape data.
 
     Returns:
-        Response, which contains a JSON object.
+        Response, which contains a JSON object, or the binary when `format` is 'binary'.
     """
     train_ids = request.args.getlist('train_id')
     landscape_type = request.args.get('type', 'interval')
     interval_id = request.args.get('interval_id', 0)
+    binary = _is_binary_format()
 
     processor = LandscapeProcessor(DATA_MANAGER)
-    response = processor.list_landscapes(train_ids, landscape_type, interval_id)
-    return jsonify(response)
+    response = processor.list_landscapes(train_ids, landscape_type, interval_id, binary=binary)
+    return _make_data_response(response, binary)
@@ -20,6 +20,7 @@ import urllib.parse
 
 from flask import Blueprint
 from flask import jsonify
+from flask import make_response
 from flask import request
 
 from mindinsight.conf import settings
@@ -306,8 +307,11 @@ def query_image():
     """
     Query image.
 
+    The response has the ETag of the image, and it is 304 Not Modified if the
+    ETag matches `If-None-Match` of the request.
+
     Returns:
-        bytes, image binary content for UI to demonstrate.
+        Response, image binary content for UI to demonstrate.
     """
     train_id = request.args.get('train_id')
     if train_id is None:
@@ -322,9 +326,15 @@ def query_image():
         raise ParamValueError(f"type:{image_type}, valid options: 'original' 'overlay' 'outcome'")
 
     encapsulator = DatafileEncap(EXPLAIN_MANAGER)
-    image = encapsulator.query_image_binary(train_id, image_path, image_type)
-
-    return image
+    etag = encapsulator.query_image_etag(train_id, image_path, image_type)
+    if request.if_none_match.contains(etag):
+        response = make_response(b'', 304)
+    else:
+        image = encapsulator.query_image_binary(train_id, image_path, image_type)
+        response = make_response(image)
+    response.set_etag(etag)
+
+    return response
 
 
 def init_module(app):
@@ -18,6 +18,7 @@ Profile api.
 This module provides the interfaces to profile functions.
 """
 import json
+import math
 import os
 
 from flask import Blueprint
@@ -26,9 +27,10 @@ from flask import request
 from marshmallow import ValidationError
 
 from mindinsight.conf import settings
-from mindinsight.datavisual.utils.tools import to_int
+from mindinsight.datavisual.utils.tools import to_float, to_int
 from mindinsight.profiler.analyser.analyser_factory import AnalyserFactory
 from mindinsight.profiler.analyser.minddata_analyser import MinddataAnalyser
+from mindinsight.profiler.analyser.timeline_store import to_ns
 from mindinsight.profiler.common.exceptions.exceptions import ProfilerFileNotFoundException
 from mindinsight.profiler.common.util import analyse_device_list_from_profiler_dir, \
     check_train_job_and_profiler_dir, get_profile_data_version
@@ -564,9 +566,15 @@ def get_msprof_timeline():
     """
     Get msprof timeline.
 
+    The optional `start` and `end` in microseconds select the events in the window `[start, end)`, and the optional
+    `resolution` merges the short events of each track into the given number of buckets of the window.
+
     Returns:
         Response, the detail information of timeline.
 
+    Raises:
+        ParamValueError: If the window or the resolution is invalid.
+
     Examples:
         >>> GET http://xxxx/v1/mindinsight/profile/msprof_timeline
     """
@@ -599,11 +607,32 @@ def get_msprof_timeline():
     else:
         scope_name = True
 
+    start = _get_timeline_time_arg('start')
+    end = _get_timeline_time_arg('end')
+    if start is not None and end is not None and start >= end:
+        raise ParamValueError("The start should be less than the end.")
+    resolution = request.args.get("resolution", None)
+    if resolution is not None:
+        resolution = to_int(resolution, 'resolution')
+        if resolution <= 0:
+            raise ParamValueError("The resolution should be greater than 0.")
+
     analyser = AnalyserFactory.instance().get_analyser(
         'msprof_timeline', profiler_dir_abs, None)
-    timeline = analyser.get_merged_timeline(rank_list, model_list, kind, merge_model, scope_name)
+    timeline = analyser.iter_merged_timeline_json(rank_list, model_list, kind, merge_model, scope_name,
+                                                  start, end, resolution)
 
-    return jsonify(timeline)
+    return CustomResponse(timeline, mimetype='application/json')
+
+
+def _get_timeline_time_arg(arg_name):
+    """Get the time argument of the timeline in microseconds, and convert it to nanoseconds."""
+    value = request.args.get(arg_name, None)
+    if value is None:
+        return None
+    if not math.isfinite(to_float(value, arg_name)):
+        raise ParamValueError(f"The {arg_name} should be a finite number.")
+    return to_ns(value)
 
 
 @BLUEPRINT.route("/profile/memory-summary", methods=["GET"])
@@ -65,5 +65,6 @@ MAX_GRAPH_STEP_SIZE_PER_TAG = 1
 MAX_HISTOGRAM_STEP_SIZE_PER_TAG = 50
 MAX_TENSOR_STEP_SIZE_PER_TAG = 20
 MAX_TENSOR_RESPONSE_DATA_SIZE = 100000
+MAX_TENSOR_BINARY_RESPONSE_DATA_SIZE = 10000000
 
 ENABLE_RECOMMENDED_WATCHPOINTS = True
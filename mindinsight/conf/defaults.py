@@ -40,7 +40,15 @@ MAX_OFFLINE_DEBUGGER_SESSION_NUM = 2
 ####################################
 RELOAD_INTERVAL = 3 # Seconds
 SUMMARY_BASE_DIR = os.getcwd()
+# Save the index of loaded summary files in the workspace to speed up loading them again after restart.
+ENABLE_SUMMARY_INDEX_CACHE = True
 
 # set MAX_GRAPH_NODE_SIZE to 100000, which is able to support yolov4 with one card 11 graphs
 # will increase the value after supporting to load graphs in parallel
 MAX_GRAPH_NODE_SIZE = 100000
+
+####################################
+# Explainer default settings.
+####################################
+# Save the rendered images in the workspace to serve them again after restart.
+ENABLE_EXPLAINER_IMAGE_DISK_CACHE = False
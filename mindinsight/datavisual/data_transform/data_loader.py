@@ -43,6 +43,11 @@ class DataLoader:
     def is_integrity(self, integrity):
         self._is_integrity = integrity
 
+    @property
+    def has_unsaved_indexes(self):
+        """Whether any summary index is to be saved in a later load, even if no file changes."""
+        return self._loader is not None and self._loader.has_unsaved_indexes
+
     def load(self, executor=None):
         """Load the data when loader is exist.
 
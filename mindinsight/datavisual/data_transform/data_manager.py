@@ -27,7 +27,8 @@ import time
 import os
 from typing import Iterable, Optional
 
-from mindinsight.datavisual.data_transform.summary_watcher import SummaryWatcher
+from mindinsight.datavisual.data_transform.summary_watcher import IncrementalSummaryWatcher
+from mindinsight.datavisual.utils.directory_monitor import DirectoryMonitor
 
 from mindinsight.conf import settings
 from mindinsight.datavisual.common import exceptions
@@ -393,10 +394,12 @@ class _BaseCacheManager:
 class _BriefCacheManager(_BaseCacheManager):
     """A cache manager that holds all disk train jobs on disk."""
 
-    def __init__(self, summary_base_dir):
+    def __init__(self, summary_base_dir, directory_monitor=None):
         super(_BriefCacheManager, self).__init__(summary_base_dir)
-        self._summary_watcher = SummaryWatcher()
+        self._summary_watcher = IncrementalSummaryWatcher(directory_monitor)
         self._status = BriefCacheStatus.INIT.value
+        # Updaters which have updated all the cache items, they only need to update the changed ones.
+        self._applied_updaters = set()
 
     @property
     def status(self):
@@ -430,7 +433,7 @@ class _BriefCacheManager(_BaseCacheManager):
     def update_cache(self, executor=None):
         """Update cache."""
         logger.debug('Start to update BriefCacheManager.')
-        summaries_info = self._summary_watcher.list_summary_directories(self._summary_base_dir)
+        summaries_info, changes = self._summary_watcher.list_summary_directories_with_changes(self._summary_base_dir)
 
         basic_train_jobs = []
         for info in summaries_info:
@@ -441,10 +444,15 @@ class _BriefCacheManager(_BaseCacheManager):
 
         with self._lock:
             new_cache_items = self._merge_with_disk(basic_train_jobs)
+            changed_train_ids = changes.added | changes.updated | (new_cache_items.keys() - self._cache_items.keys())
             self._cache_items = new_cache_items
-        for updater in self._updaters.values():
-            for cache_item in self._cache_items.values():
+        for updater in list(self._updaters.values()):
+            applied = updater in self._applied_updaters
+            for train_id, cache_item in self._cache_items.items():
+                if applied and train_id not in changed_train_ids:
+                    continue
                 updater.update_item(cache_item)
+            self._applied_updaters.add(updater)
 
     def _merge_with_disk(self, disk_train_jobs: Iterable[_BasicTrainJob]):
         """
@@ -495,6 +503,8 @@ class _DetailCacheManager(_BaseCacheManager):
         self._loader_generators = [DataLoaderGenerator(summary_base_dir)]
         self._loading_mutex = threading.Lock()
         self.summaries_info = []
+        # Changes of summary directories since the last listing, None means all the directories may change.
+        self.summary_changes = None
 
     def has_content(self):
         """Whether this cache manager has train jobs."""
@@ -635,7 +645,7 @@ class _DetailCacheManager(_BaseCacheManager):
         """This function generates the loader from given path."""
         loader_dict = {}
         for generator in self._loader_generators:
-            loader_dict.update(generator.generate_loaders(self._loader_pool, self.summaries_info))
+            loader_dict.update(generator.generate_loaders(self._loader_pool, self.summaries_info, self.summary_changes))
 
         sorted_loaders = sorted(loader_dict.items(), key=lambda loader: loader[1].latest_update_time)
         latest_loaders = sorted_loaders[-MAX_DATA_LOADER_SIZE:]
@@ -666,11 +676,23 @@ class _DetailCacheManager(_BaseCacheManager):
         """Load data through multiple threads."""
         self._generate_loaders()
         loader_pool = self._get_snapshot_loader_pool()
+        unchanged_ids = self._get_unchanged_train_ids()
         loaded = True
-        for loader_id in loader_pool:
+        for loader_id, loader in loader_pool.items():
+            if loader_id in unchanged_ids and loader.cache_status == CacheStatus.CACHED \
+                    and not loader.data_loader.has_unsaved_indexes:
+                # All the files were loaded, and the summary directory has not changed since then.
+                continue
             loaded = self._execute_loader(loader_id, executor) and loaded
         return loaded
 
+    def _get_unchanged_train_ids(self):
+        """Get ids of train jobs whose summary directories have not changed since the last listing."""
+        if self.summary_changes is None:
+            return set()
+        listed_ids = {info.get('relative_path') for info in self.summaries_info}
+        return listed_ids - self.summary_changes.added - self.summary_changes.updated
+
     def delete_train_job(self, train_id):
         """
         Delete train job with a train id.
@@ -896,21 +918,28 @@ class DataManager:
         self._status_mutex = threading.Lock()
         self._brief_cache_status_mutex = threading.Lock()
 
+        # The directory monitor is shared by the summary watchers of brief cache and detail cache.
+        self._directory_monitor = DirectoryMonitor.create()
         self._detail_cache = _DetailCacheManager(self._summary_base_dir)
-        self._brief_cache = _BriefCacheManager(self._summary_base_dir)
+        self._brief_cache = _BriefCacheManager(self._summary_base_dir, self._directory_monitor)
 
         # This lock is used to make sure that only one self._load_data_in_thread() is running.
         # Because self._load_data_in_thread() will create process pool when loading files, we can not
         # afford to run multiple self._load_data_in_thread() simultaneously (will create too many processes).
         self._load_data_lock = threading.Lock()
         self._load_brief_data_lock = threading.Lock()
-        self._summary_watcher = SummaryWatcher()
+        self._summary_watcher = IncrementalSummaryWatcher(self._directory_monitor)
 
     @property
     def summary_base_dir(self):
         """Get summary base dir."""
         return self._summary_base_dir
 
+    def close(self):
+        """Close the directory monitor, the summary directories are polled after closed."""
+        if self._directory_monitor is not None:
+            self._directory_monitor.close()
+
     def start_load_data(self, reload_interval=0):
         """
         Start threads for loading data.
@@ -1008,7 +1037,8 @@ class DataManager:
 
         with ComputingResourceManager.get_instance().get_executor(
                 max_processes_cnt=settings.MAX_PROCESSES_COUNT) as executor:
-            self._detail_cache.summaries_info = self._summary_watcher.list_summary_directories(self._summary_base_dir)
+            self._detail_cache.summaries_info, self._detail_cache.summary_changes = \
+                self._summary_watcher.list_summary_directories_with_changes(self._summary_base_dir)
             last_time = time.time()
             for _ in self._detail_cache.update_cache(executor):
                 update_interval = time.time() - last_time
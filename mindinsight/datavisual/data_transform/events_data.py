@@ -64,12 +64,13 @@ class EventsData:
         self._config = CONFIG
         self._max_step_sizes_per_tag = self._config['max_step_sizes_per_tag']
 
-        self._tags = list()
+        # Dicts are used as insertion-ordered sets, the values are ignored.
+        self._tags = dict()
         self._deleted_tags = set()
         self._reservoir_by_tag = {}
         self._reservoir_mutex_lock = threading.Lock()
 
-        self._tags_by_plugin = collections.defaultdict(list)
+        self._tags_by_plugin = collections.defaultdict(dict)
         self._tags_by_plugin_mutex_lock = collections.defaultdict(threading.Lock)
 
     def add_tensor_event(self, tensor_event):
@@ -85,7 +86,7 @@ class EventsData:
         tag = tensor_event.tag
         plugin_name = tensor_event.plugin_name
 
-        if tag not in set(self._tags):
+        if tag not in self._tags:
             deleted_tag = self._check_tag_out_of_spec(plugin_name)
             if deleted_tag is not None:
                 if tag in self._deleted_tags:
@@ -93,28 +94,27 @@ class EventsData:
                     return
                 self.delete_tensor_event(deleted_tag)
 
-            self._tags.append(tag)
+            self._tags[tag] = None
 
         with self._tags_by_plugin_mutex_lock[plugin_name]:
-            if tag not in self._tags_by_plugin[plugin_name]:
-                self._tags_by_plugin[plugin_name].append(tag)
+            self._tags_by_plugin[plugin_name].setdefault(tag)
 
         with self._reservoir_mutex_lock:
-            if tag not in self._reservoir_by_tag:
+            tensor_reservoir = self._reservoir_by_tag.get(tag)
+            if tensor_reservoir is None:
                 reservoir_size = self._get_reservoir_size(tensor_event.plugin_name)
-                self._reservoir_by_tag[tag] = reservoir.ReservoirFactory().create_reservoir(
-                    plugin_name, reservoir_size
-                )
+                tensor_reservoir = reservoir.ReservoirFactory().create_reservoir(plugin_name, reservoir_size)
+                self._reservoir_by_tag[tag] = tensor_reservoir
 
         tensor = _Tensor(wall_time=tensor_event.wall_time,
                          step=tensor_event.step,
                          value=tensor_event.value,
                          filename=tensor_event.filename)
 
-        if self._is_out_of_order_step(tensor_event.step, tensor_event.tag):
-            self.purge_reservoir_data(tensor_event.filename, tensor_event.step, self._reservoir_by_tag[tag])
+        if self._is_out_of_order_step(tensor_event.step, tensor_reservoir):
+            self.purge_reservoir_data(tensor_event.filename, tensor_event.step, tensor_reservoir)
 
-        self._reservoir_by_tag[tag].add_sample(tensor)
+        tensor_reservoir.add_sample(tensor)
 
     def delete_tensor_event(self, tag):
         """
@@ -130,16 +130,15 @@ class EventsData:
                 'Too many deleted tags, %d upper limit reached, tags updating may not function hereafter',
                 _MAX_DELETED_TAGS_SIZE)
         logger.info('%r and all related samples are going to be deleted', tag)
-        self._tags.remove(tag)
+        self._tags.pop(tag, None)
         for plugin_name, lock in self._tags_by_plugin_mutex_lock.items():
             with lock:
                 if tag in self._tags_by_plugin[plugin_name]:
-                    self._tags_by_plugin[plugin_name].remove(tag)
+                    self._tags_by_plugin[plugin_name].pop(tag)
                     break
 
         with self._reservoir_mutex_lock:
-            if tag in self._reservoir_by_tag:
-                self._reservoir_by_tag.pop(tag)
+            self._reservoir_by_tag.pop(tag, None)
 
     def list_tags_by_plugin(self, plugin_name):
         """
@@ -158,7 +157,7 @@ class EventsData:
             raise KeyError('Plugin %r could not be found.' % plugin_name)
         with self._tags_by_plugin_mutex_lock[plugin_name]:
             # Return a snapshot to avoid concurrent mutation and iteration issues.
-            return sorted(list(self._tags_by_plugin[plugin_name]))
+            return sorted(self._tags_by_plugin[plugin_name])
 
     def tensors(self, tag):
         """
@@ -174,23 +173,20 @@ class EventsData:
             raise KeyError('TAG %r could not be found.' % tag)
         return self._reservoir_by_tag[tag].samples()
 
-    def _is_out_of_order_step(self, step, tag):
+    @staticmethod
+    def _is_out_of_order_step(step, tensor_reservoir):
         """
         If the current step is smaller than the latest one, it is out-of-order step.
 
         Args:
             step (int): Check if the given step out of order.
-            tag (str): The checked tensor of the given tag.
+            tensor_reservoir (Reservoir): The reservoir of the checked tag.
 
         Returns:
             bool, boolean value.
         """
-        if self.tensors(tag):
-            tensors = self.tensors(tag)
-            last_step = tensors[-1].step
-            if step <= last_step:
-                return True
-        return False
+        last_step = tensor_reservoir.last_step()
+        return last_step is not None and step <= last_step
 
     @staticmethod
     def purge_reservoir_data(filename, start_step, tensor_reservoir):
@@ -205,8 +201,8 @@ class EventsData:
         Returns:
             int, the number of items removed.
         """
-        cnt_out_of_order = tensor_reservoir.remove_sample(
-            lambda x: x.step < start_step or (x.step > start_step and is_new_file(x.filename, filename)))
+        cnt_out_of_order = tensor_reservoir.remove_sample_by_step(
+            start_step, lambda last_filename: is_new_file(last_filename, filename))
 
         return cnt_out_of_order
 
@@ -64,6 +64,10 @@ class Graph:
         self._leaf_nodes = {}
         self._full_name_map_name = {}
 
+        # The names of the direct children of each scope, and the cached dict format of the children.
+        self._scope_children = None
+        self._scope_node_dicts = {}
+
     def build_graph(self, proto_data):
         """This method is used to build the graph."""
         logger.info("Start to build graph")
@@ -82,6 +86,7 @@ class Graph:
         self._calc_subnode_count()
         self._leaf_nodes = self._get_leaf_nodes()
         self._full_name_map_name = self._get_leaf_node_full_name_map()
+        self._scope_children = self._get_scope_children()
 
         precision = 6
         time_consuming = round(time.time() - start_time, precision)
@@ -141,11 +146,35 @@ class Graph:
             list[dict], a list object contain `Node` object.
         """
         scope = "" if scope is None else scope
-        nodes = []
-        for node in self._normal_node_map.values():
-            if node.scope == scope:
-                nodes.append(node.to_dict())
-        return nodes
+        nodes = self._scope_node_dicts.get(scope)
+        if nodes is None:
+            if self._scope_children is None:
+                self._scope_children = self._get_scope_children()
+            nodes = [self._normal_node_map[name].to_dict() for name in self._scope_children.get(scope, [])]
+            self._scope_node_dicts[scope] = nodes
+        return list(nodes)
+
+    def count_node_by_scope(self, scope=None):
+        """
+        Count nodes by the scope of nodes. The scope of a node is the same as its parent node name.
+
+        Args:
+            scope (str): A scope of nodes.
+
+        Returns:
+            int, the count of nodes in the scope.
+        """
+        scope = "" if scope is None else scope
+        if self._scope_children is None:
+            self._scope_children = self._get_scope_children()
+        return len(self._scope_children.get(scope, []))
+
+    def _get_scope_children(self):
+        """Get the names of the direct children of each scope."""
+        scope_children = defaultdict(list)
+        for name, node in self._normal_node_map.items():
+            scope_children[node.scope].append(name)
+        return dict(scope_children)
 
     def search_single_node(self, node_name):
         """
@@ -443,6 +472,22 @@ class Graph:
         """Get the normal node count."""
         return len(self._normal_node_map)
 
+    @property
+    def normal_nodes(self):
+        """Get the normal nodes, the key is node name, value is `Node` object."""
+        return self._normal_node_map
+
+    def restore(self, node_map):
+        """
+        Restore the normal nodes of a built graph, and the attributes derived from them.
+
+        Args:
+            node_map (dict): The normal nodes of the built graph, the key is node name, value is `Node` object.
+        """
+        self._normal_node_map = node_map
+        self._leaf_nodes = self._get_leaf_nodes()
+        self._scope_children = self._get_scope_children()
+
     def _cache_node(self, node):
         """Store the node in the cache."""
         # Notice:
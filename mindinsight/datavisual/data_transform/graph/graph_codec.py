@@ -0,0 +1,210 @@
+# Copyright 2026 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+This file is used to encode graphs and nodes into a compact format.
+
+Nodes are encoded as flat NumPy arrays of indexes into a string table, so that a graph can be passed between
+processes without pickling every node and edge dict. Structured values such as shapes, attributes of edges and
+stacks are encoded as JSON strings in the string table, the same values are stored only once.
+"""
+import json
+
+import numpy as np
+
+from mindinsight.datavisual.data_transform.graph.node import Node
+from mindinsight.domain.graph.base import DebuggerSource
+
+_EDGE_METHODS = ('inputs', 'outputs', 'proxy_inputs', 'proxy_outputs')
+# The nodes of these attributes of a graph are rebuilt from the other attributes.
+_DERIVED_GRAPH_ATTRS = ('_normal_node_map', '_leaf_nodes', '_scope_children', '_scope_node_dicts')
+
+
+class StringTable:
+    """The table of unique strings."""
+
+    def __init__(self, strings=None):
+        self._strings = [] if strings is None else strings
+        self._indexes = {}
+
+    def __getitem__(self, index):
+        return self._strings[index]
+
+    def index(self, string):
+        """Get the index of the string, the string is added to the table if it is not in the table."""
+        index = self._indexes.get(string)
+        if index is None:
+            index = len(self._strings)
+            self._strings.append(string)
+            self._indexes[string] = index
+        return index
+
+    def index_json(self, value):
+        """Get the index of the JSON string of the value."""
+        return self.index(json.dumps(value))
+
+    def pack(self):
+        """
+        Pack the table.
+
+        Returns:
+            tuple[str, numpy.ndarray], the joined strings and the length of each string.
+        """
+        return ''.join(self._strings), np.array([len(string) for string in self._strings], dtype=np.int64)
+
+    @classmethod
+    def unpack(cls, packed):
+        """Unpack the table packed by `StringTable.pack`."""
+        joined, lengths = packed
+        ends = np.cumsum(lengths).tolist()
+        starts = [0] + ends[:-1]
+        return cls([joined[start:end] for start, end in zip(starts, ends)])
+
+
+def pack_nodes(nodes, table):
+    """
+    Pack nodes into arrays.
+
+    Args:
+        nodes (list[Node]): The nodes.
+        table (StringTable): The string table to store strings.
+
+    Returns:
+        dict[str, numpy.ndarray], the packed nodes.
+    """
+    strings = []
+    numbers = []
+    flags = []
+    attrs = []
+    edges = []
+    for node_index, node in enumerate(nodes):
+        strings.append((table.index(node.name),
+                        table.index(node.node_id),
+                        table.index(node.type),
+                        table.index(node.scope),
+                        table.index(node.full_name),
+                        table.index_json(node.output_data_type),
+                        table.index_json(node.output_shape),
+                        table.index_json(node.elem_types),
+                        table.index_json([source.to_dict() for source in node.stack])))
+        numbers.append((node.output_i, node.subnode_count, node.topological_index, node.output_nums))
+        flags.append((node.is_dynamic_shape_node, node.independent_layout))
+        for key, value in node.attr.items():
+            attrs.append((node_index, table.index(key), table.index_json(value)))
+        for method_index, method in enumerate(_EDGE_METHODS):
+            for target_name, edge_attr in getattr(node, method).items():
+                edges.append((node_index, method_index, table.index(target_name), table.index_json(edge_attr)))
+
+    return {
+        'strings': np.array(strings, dtype=np.int32).reshape(-1, 9),
+        'numbers': np.array(numbers, dtype=np.int64).reshape(-1, 4),
+        'flags': np.array(flags, dtype=np.bool_).reshape(-1, 2),
+        'attrs': np.array(attrs, dtype=np.int32).reshape(-1, 3),
+        'edges': np.array(edges, dtype=np.int32).reshape(-1, 4),
+    }
+
+
+def unpack_nodes(packed, table):
+    """
+    Unpack nodes packed by `pack_nodes`.
+
+    Args:
+        packed (dict[str, numpy.ndarray]): The packed nodes.
+        table (StringTable): The string table.
+
+    Returns:
+        list[Node], the nodes.
+    """
+    nodes = []
+    for string_indexes, numbers, flags in zip(packed['strings'].tolist(), packed['numbers'].tolist(),
+                                              packed['flags'].tolist()):
+        name, node_id, node_type, scope, full_name, data_type, output_shape, elem_types, stack = string_indexes
+        node = Node(name=table[name], node_id=table[node_id], full_name=table[full_name],
+                    topological_index=numbers[2])
+        node.type = table[node_type]
+        node.scope = table[scope]
+        node.output_data_type = json.loads(table[data_type])
+        node.output_shape = json.loads(table[output_shape])
+        node.elem_types = json.loads(table[elem_types])
+        node.stack = [DebuggerSource(**source) for source in json.loads(table[stack])]
+        node.output_i, node.subnode_count, _, node.output_nums = numbers
+        node.is_dynamic_shape_node, node.independent_layout = flags
+        nodes.append(node)
+
+    for node_index, key, value in packed['attrs'].tolist():
+        nodes[node_index].attr[table[key]] = json.loads(table[value])
+    for node_index, method_index, target_name, edge_attr in packed['edges'].tolist():
+        getattr(nodes[node_index], _EDGE_METHODS[method_index])[table[target_name]] = json.loads(table[edge_attr])
+    return nodes
+
+
+def pack_graph(graph):
+    """
+    Pack a built graph.
+
+    Args:
+        graph (Graph): The built graph.
+
+    Returns:
+        dict, the packed graph.
+    """
+    table = StringTable()
+    packed = {'nodes': pack_nodes(list(graph.normal_nodes.values()), table)}
+    node_maps = {}
+    string_maps = {}
+    others = {}
+    for key, value in vars(graph).items():
+        if key in _DERIVED_GRAPH_ATTRS:
+            continue
+        if isinstance(value, dict) and value and all(isinstance(node, Node) for node in value.values()):
+            node_maps[key] = np.array([table.index(name) for name in value], dtype=np.int32)
+        elif isinstance(value, dict) and value \
+                and all(isinstance(item, str) for pair in value.items() for item in pair):
+            string_maps[key] = np.array([(table.index(name), table.index(item)) for name, item in value.items()],
+                                        dtype=np.int32)
+        else:
+            others[key] = value
+
+    packed.update({
+        'node_maps': node_maps,
+        'string_maps': string_maps,
+        'others': others,
+        'table': table.pack()
+    })
+    return packed
+
+
+def unpack_graph(graph_class, packed):
+    """
+    Unpack a graph packed by `pack_graph`.
+
+    Args:
+        graph_class (type): The class of the graph.
+        packed (dict): The packed graph.
+
+    Returns:
+        Graph, the graph.
+    """
+    table = StringTable.unpack(packed['table'])
+    graph = graph_class()
+    node_map = {node.name: node for node in unpack_nodes(packed['nodes'], table)}
+    for key, names in packed['node_maps'].items():
+        setattr(graph, key, {table[name]: node_map[table[name]] for name in names.tolist()
+                             if table[name] in node_map})
+    for key, pairs in packed['string_maps'].items():
+        setattr(graph, key, {table[name]: table[item] for name, item in pairs.tolist()})
+    for key, value in packed['others'].items():
+        setattr(graph, key, value)
+    graph.restore(node_map)
+    return graph
@@ -13,13 +13,11 @@
 # limitations under the License.
 # ============================================================================
 """This file is used to define the MindSpore graph."""
-from mindinsight.datavisual.common.enums import PluginNameEnum
 from mindinsight.datavisual.common.log import logger
-from mindinsight.datavisual.data_transform.graph.graph import EdgeTypeEnum, Graph, check_invalid_character
-from mindinsight.datavisual.data_transform.graph.node import Node
+from mindinsight.datavisual.data_transform.graph.graph import Graph
 from mindinsight.datavisual.data_transform.graph.node_tree import NodeTree
-from mindinsight.datavisual.proto_files.mindinsight_anf_ir_pb2 import DataType
-from mindinsight.domain.graph.base import NodeTypeEnum, DebuggerSource
+from mindinsight.datavisual.data_transform.graph.parsed_graph import ParsedGraph
+from mindinsight.domain.graph.base import NodeTypeEnum
 
 
 class MSGraph(Graph):
@@ -30,13 +28,11 @@ class MSGraph(Graph):
         The proto data is parsed and all nodes are stored in the specified structure.
 
         Args:
-            proto_data (anf_ir_pb2.GraphProto): Refer to anf_ir_pb2.GraphProto object.
+            proto_data (Union[anf_ir_pb2.GraphProto, ParsedGraph]): Refer to anf_ir_pb2.GraphProto object,
+                or the nodes parsed from it.
         """
-        logger.info("Start to parse graph proto data.")
-
-        self._parse_op_nodes(proto_data.node)
-        self._parse_parameters(proto_data.parameters)
-        self._parse_consts(proto_data.const_vals)
+        parsed_graph = proto_data if isinstance(proto_data, ParsedGraph) else ParsedGraph.from_proto(proto_data)
+        self._add_parsed_nodes(parsed_graph)
 
         self._update_input_after_create_node()
         self._update_output_after_create_node()
@@ -44,176 +40,30 @@ class MSGraph(Graph):
         logger.info("Parse proto data end, normal node count(only contain op node, "
                     "parameter, const): %s.", self.normal_node_count)
 
-    def _parse_op_nodes(self, node_protos):
-        """
-        Parse `anf_ir_pb2.NodeProto` object, and create a normal node.
-
-        Args:
-            node_protos (list[anf_ir_pb2.NodeProto]): Refer to anf_ir_pb2.NodeProto.
-        """
-        logger.debug("Start to parse op nodes from proto.")
-        for topological_index, node_proto in enumerate(node_protos):
-            if not node_proto.name:
-                logger.warning("Finding a node with an empty name will not save it.")
-                continue
-
-            self._parse_op_node(topological_index, node_proto)
-
-    def _parse_op_node(self, topological_index, node_proto):
-        """Parse `anf_ir_pb2.NodeProto` object, and create a normal node."""
-        name = node_proto.name.split('/')[-1]
-        node_id = name.split('op')[-1]
-        name = f'{node_proto.op_type}-op{node_id}'
-        node_name = Node.create_node_name(node_proto.scope, name)
-
-        if node_proto.full_name:
-            node_name = node_proto.full_name
-
-        if node_proto.full_name and any(
-                node_proto.full_name.lower().endswith(f'[:{plugin.value.lower()}]') for plugin in PluginNameEnum):
-            node_name = Node.create_node_name(scope=node_proto.scope,
-                                              base_name=f'{node_proto.op_type}-op{node_proto.name}')
-
-        # The Graphviz plug-in that the UI USES can't handle these special characters.
-        check_invalid_character(node_name)
-
-        node = Node(name=node_name, node_id=node_id, topological_index=topological_index)
-        node.full_name = node_proto.full_name
-        node.type = node_proto.op_type
-        if getattr(node_proto, 'source_address', None):
-            node.stack = DebuggerSource.build_stack_from_source_address(node_proto.source_address)
-        self._parse_attributes(node_proto.attribute, node)
-        self._parse_inputs(node_proto.input, node)
-
-        node.output_i = node_proto.output_i
-        node.scope = node_proto.scope
-        node.output_shape = self._get_shape_by_parse_type_proto(node_proto.output_type)
-        node.output_nums = len(node.output_shape)
-        node.output_data_type = self._get_data_type_by_parse_type_proto(node_proto.output_type, node)
-
-        self._cache_node(node)
-
-    def _parse_parameters(self, parameter_protos):
+    def _add_parsed_nodes(self, parsed_graph):
         """
-        Parse `anf_ir_pb2.ParameterProto` object, and create a parameter node.
+        Add copies of the parsed nodes to the cache.
 
         Args:
-            parameter_protos (list[anf_ir_pb2.ParameterProto]): Refer to anf_ir_pb2.ParameterProto.
+            parsed_graph (ParsedGraph): The nodes parsed from the graph proto.
         """
-        logger.debug("Start to parse parameters from proto.")
-        for parameter in parameter_protos:
-            if not parameter.name:
-                logger.warning("Finding a parameter with an empty name will not save it.")
-                continue
-            check_invalid_character(parameter.name)
-            node = Node(name=parameter.name, node_id=parameter.name)
-            node.type = NodeTypeEnum.PARAMETER.value
-            node.output_shape = self._get_shape_by_parse_type_proto(parameter.type)
-            node.output_nums = len(node.output_shape)
-            node.output_data_type = self._get_data_type_by_parse_type_proto(parameter.type, node)
-            attr = dict(
-                type=self._get_data_type_by_parse_type_proto(parameter.type, node),
-                shape=str(self._get_shape_by_parse_type_proto(parameter.type))
-            )
-            node.add_attr(attr)
-
-            self._cache_node(node)
-            logger.debug("Foreach graph proto parameters, node id: %s, node name: %s, "
-                         "node def name: %s", node.node_id, node.name, parameter.name)
-
-    def _parse_consts(self, consts):
-        """
-        Parse `anf_ir_pb2.NameValueProto` object, and create a const node.
-
-        Args:
-            consts (list[anf_ir_pb2.NameValueProto]): Refer to `anf_ir_pb2.NameValueProto` object.
-        """
-        logger.debug("Start to parse consts from proto.")
-        for const in consts:
-            if not const.key:
-                logger.warning("Finding a const with an empty key will not save it.")
-                continue
-            check_invalid_character(const.key)
-            node = Node(name=const.key, node_id=const.key, full_name=const.full_name)
-            node.type = NodeTypeEnum.CONST.value
-            if const.value.ByteSize() > self.MAX_NODE_ATTRIBUTE_VALUE_BYTES:
-                node.add_attr({const.key: 'dtype: ' + DataType.Name(const.value.dtype)})
-            else:
-                node.add_attr({const.key: str(const.value)})
-
-            if const.value.dtype == DataType.DT_TENSOR:
-                shape = list(const.value.tensor_val.dims)
-                node.output_shape.append(shape)
-                if const.value.tensor_val.HasField('data_type'):
-                    node.elem_types.append(DataType.Name(const.value.tensor_val.data_type))
-            else:
-                node.elem_types.append(DataType.Name(const.value.dtype))
-                # dim is zero
-                node.output_shape.append([])
-
-            node.output_nums = len(node.output_shape)
-
-            self._cache_node(node)
-
-    def _get_shape_by_parse_type_proto(self, type_proto):
-        """
-        Parse proto's `message TypeProto` to get shape information.
-
-        Args:
-            type_proto (anf_ir_pb2.TypeProto): Refer to anf_ir_pb2.TypeProto.
+        for op_node in self._filter_op_nodes(parsed_graph.op_nodes):
+            self._cache_node(ParsedGraph.copy_node(op_node.node))
+        for node in parsed_graph.parameter_nodes + parsed_graph.const_nodes:
+            self._cache_node(ParsedGraph.copy_node(node))
 
-        Returns:
-            list, a list of shape.
-        """
-        shapes = []
-        if type_proto.HasField('data_type'):
-            if type_proto.data_type != DataType.DT_TENSOR and \
-                    type_proto.data_type != DataType.DT_TUPLE:
-                # Append an empty list as a placeholder
-                # for the convenience of output number calculation.
-                shapes.append([])
-                return shapes
-        if type_proto.HasField('tensor_type'):
-            tensor_type = type_proto.tensor_type
-            tensor_shape_proto = tensor_type.shape
-            shape = [dim.size for dim in tensor_shape_proto.dim]
-            shapes.append(shape)
-        if type_proto.HasField('sequence_type'):
-            for elem_type in type_proto.sequence_type.elem_types:
-                shapes.extend(self._get_shape_by_parse_type_proto(elem_type))
-        return shapes
-
-    def _get_data_type_by_parse_type_proto(self, type_proto, node):
+    @staticmethod
+    def _filter_op_nodes(op_nodes):
         """
-        Get data type by parse type proto object.
-
-        The name of the DataType, refer to `anf_ir_pb2.DataType` object.
-        If data type is tensor or tuple, the data name we return is `data_type[element_type, element_type]`.
+        Filter the parsed op nodes which should be added to the graph, all the op nodes are kept by default.
 
         Args:
-            type_proto (anf_ir_pb2.TypeProto): Refer to anf_ir_pb2.TypeProto.
+            op_nodes (list[ParsedOpNode]): The parsed op nodes.
 
         Returns:
-            str, the data type.
-
+            list[ParsedOpNode], the op nodes to be added.
         """
-        data_type_name = self._get_data_type_name_by_value(type_proto, type_proto.data_type, field_name='data_type')
-        if type_proto.data_type == DataType.DT_TENSOR:
-            tensor_type_proto = type_proto.tensor_type
-            value = type_proto.tensor_type.elem_type
-            elem_type_name = self._get_data_type_name_by_value(tensor_type_proto, value, field_name='elem_type')
-            node.elem_types.append(elem_type_name)
-            return f'{data_type_name}[{elem_type_name}]'
-
-        if type_proto.data_type == DataType.DT_TUPLE:
-            data_types = []
-            for elem_type in type_proto.sequence_type.elem_types:
-                data_types.append(self._get_data_type_by_parse_type_proto(elem_type, node))
-            return f'{data_type_name}{str(data_types)}'
-
-        node.elem_types.append(data_type_name)
-
-        return data_type_name
+        return op_nodes
 
     def get_nodes(self, searched_node_list):
         """
@@ -338,57 +188,6 @@ class MSGraph(Graph):
             }
             search_node_list.append(sub_node_dict)
 
-    def _parse_inputs(self, input_protos, node):
-        """
-        Parse `anf_ir_pb2.InputProto` object.
-
-        Args:
-            input_protos (list[anf_ir_pb2.InputProto]): Refer to `anf_ir_pb2.InputProto` object.
-            node (Node): Refer to `Node` object, it is used to log message and update input.
-        """
-        for input_proto in input_protos:
-            if not input_proto.name:
-                logger.warning("The name in input proto of node(%s) is empty, will ignore.", node.name)
-                continue
-
-            if "/" in input_proto.name:
-                input_proto.name = input_proto.name.split("op")[-1]
-
-            edge_type = EdgeTypeEnum.DATA.value if not input_proto.type else EdgeTypeEnum.CONTROL.value
-
-            # Notice:
-            # 1. The name in the input proto is the node id of the Node object.
-            # 2. In the current step, the shape of source node cannot be obtained,
-            #    so it is set to empty list by default, and the next step will update it.
-            # 3. Same with scope, set the default value first.
-            input_attr = {
-                "shape": [],
-                "edge_type": edge_type,
-                "independent_layout": False,
-                'data_type': ''
-            }
-
-            node.add_inputs(src_name=input_proto.name, input_attr=input_attr)
-
-    def _parse_attributes(self, attributes, node):
-        """
-        Parse `anf_ir_pb2.AttributeProto` object., and Filters large attribute values.
-
-        Args:
-            attributes (list[anf_ir_pb2.AttributeProto]): Refer to `anf_ir_pb2.AttributeProto` object.
-            node (Node): Refer to `Node` object, it is used to log message and update attr.
-        """
-        for attr in attributes:
-            if attr.value.ByteSize() > self.MAX_NODE_ATTRIBUTE_VALUE_BYTES:
-                message = f"The attribute value of node({node.name}) " \
-                          f"is over {self.MAX_NODE_ATTRIBUTE_VALUE_BYTES} Bytes, will ignore."
-                logger.warning(message)
-                continue
-            if attr.name in ('input_is_dynamic_shape', 'output_is_dynamic_shape') and not \
-                    node.is_dynamic_shape_node and attr.value.bool_val:
-                node.is_dynamic_shape_node = True
-            node.add_attr({attr.name: str(attr.value)})
-
     def _update_input_after_create_node(self):
         """Update the input of node after create node."""
         for node in self._normal_node_map.values():
@@ -417,8 +216,3 @@ class MSGraph(Graph):
                     continue
 
                 src_node.add_outputs(node.name, input_attr)
-
-    @staticmethod
-    def _get_data_type_name_by_value(data_type, value, field_name='data_type'):
-        """Get the data type name by the enum value, data_type refer to `DataType` object."""
-        return data_type.DESCRIPTOR.fields_by_name[field_name].enum_type.values_by_number[value].name
@@ -17,6 +17,7 @@ from collections import defaultdict
 
 from mindinsight.datavisual.common.log import logger
 from mindinsight.datavisual.data_transform.graph.msgraph import MSGraph
+from mindinsight.datavisual.data_transform.graph.parsed_graph import ParsedGraph
 from mindinsight.domain.graph.base import NodeTypeEnum
 
 
@@ -25,6 +26,11 @@ class OptimizedGraph(MSGraph):
 
     MIN_GROUP_NODE_COUNT = 10
 
+    NON_COMPUTATIONAL_TYPES = (NodeTypeEnum.LOAD.value,
+                               NodeTypeEnum.TUPLE_GET_ITEM.value,
+                               NodeTypeEnum.MAKETUPLE.value,
+                               NodeTypeEnum.UPDATE_STATE.value)
+
     def __init__(self):
         super().__init__()
         self._load_node_temp_cache = {}
@@ -91,13 +97,11 @@ class OptimizedGraph(MSGraph):
         The proto data is parsed and all nodes are stored in the specified structure.
 
         Args:
-            proto_data (anf_ir_pb2.GraphProto): Refer to anf_ir_pb2.GraphProto object.
+            proto_data (Union[anf_ir_pb2.GraphProto, ParsedGraph]): Refer to anf_ir_pb2.GraphProto object,
+                or the nodes parsed from it.
         """
-        logger.info("Start to parse graph proto data.")
-
-        self._parse_op_nodes(proto_data.node)
-        self._parse_parameters(proto_data.parameters)
-        self._parse_consts(proto_data.const_vals)
+        parsed_graph = proto_data if isinstance(proto_data, ParsedGraph) else ParsedGraph.from_proto(proto_data)
+        self._add_parsed_nodes(parsed_graph)
 
         self._update_input_after_create_node()
         self._update_output_after_create_node()
@@ -109,24 +113,38 @@ class OptimizedGraph(MSGraph):
         logger.info("Parse proto data end, normal node count(only contain op node, "
                     "parameter, const): %s.", self.normal_node_count)
 
-    def _parse_op_nodes(self, node_protos):
+    @staticmethod
+    def _filter_op_nodes(op_nodes):
         """
-        Parse `anf_ir_pb2.NodeProto` object, and create a normal node.
+        Filter out the op nodes of gradients and optimizers.
 
         Args:
-            node_protos (list[anf_ir_pb2.NodeProto]): Refer to anf_ir_pb2.NodeProto.
+            op_nodes (list[ParsedOpNode]): The parsed op nodes.
+
+        Returns:
+            list[ParsedOpNode], the op nodes to be added.
         """
-        logger.debug("Start to parse op nodes from proto.")
-        for topological_index, node_proto in enumerate(node_protos):
-            if not node_proto.name:
-                logger.warning("Finding a node with an empty name will not save it.")
+        filtered_op_nodes = []
+        for op_node in op_nodes:
+            full_name = op_node.node.full_name
+            if full_name.startswith("Gradients") or "optimizer" in full_name or "opt" in op_node.instance_name:
                 continue
+            filtered_op_nodes.append(op_node)
+        return filtered_op_nodes
 
-            if node_proto.full_name.startswith("Gradients") or "optimizer" in node_proto.full_name \
-                    or "opt" in node_proto.instance_name:
-                continue
+    @classmethod
+    def may_have_nodes(cls, parsed_graph):
+        """
+        Check whether the graph built from the parsed graph may have nodes, without building it.
+
+        Args:
+            parsed_graph (ParsedGraph): The nodes parsed from the graph proto.
 
-            self._parse_op_node(topological_index, node_proto)
+        Returns:
+            bool, False if there is no computational op node to be added, so the built graph must be empty.
+        """
+        return any(op_node.node.type not in cls.NON_COMPUTATIONAL_TYPES
+                   for op_node in cls._filter_op_nodes(parsed_graph.op_nodes))
 
     def _update_input_after_create_node(self):
         """Update the input of node after create node."""
@@ -149,10 +167,7 @@ class OptimizedGraph(MSGraph):
                     continue
 
                 src_node = self._get_normal_node(node_name=src_node_name)
-                if src_node.type in (NodeTypeEnum.LOAD.value,
-                                     NodeTypeEnum.TUPLE_GET_ITEM.value,
-                                     NodeTypeEnum.MAKETUPLE.value,
-                                     NodeTypeEnum.UPDATE_STATE.value):
+                if src_node.type in self.NON_COMPUTATIONAL_TYPES:
                     node.delete_inputs(src_node_name)
                     for source_node_name, source_attr in dict(src_node.inputs).items():
                         source_node = self._get_normal_node(node_name=source_node_name)
@@ -175,10 +190,7 @@ class OptimizedGraph(MSGraph):
                     continue
 
                 src_node = self._get_normal_node(node_name=src_node_name)
-                if src_node.type in (NodeTypeEnum.LOAD.value,
-                                     NodeTypeEnum.TUPLE_GET_ITEM.value,
-                                     NodeTypeEnum.MAKETUPLE.value,
-                                     NodeTypeEnum.UPDATE_STATE.value):
+                if src_node.type in self.NON_COMPUTATIONAL_TYPES:
                     node.delete_outputs(src_node_name)
                     for source_node_name, source_attr in dict(src_node.outputs).items():
                         source_node = self._get_normal_node(node_name=source_node_name)
@@ -193,10 +205,7 @@ class OptimizedGraph(MSGraph):
         """Deleted non-computational operators."""
         delete_names = []
         for node in self._normal_node_map.values():
-            if node.type in (NodeTypeEnum.LOAD.value,
-                             NodeTypeEnum.TUPLE_GET_ITEM.value,
-                             NodeTypeEnum.MAKETUPLE.value,
-                             NodeTypeEnum.UPDATE_STATE.value):
+            if node.type in self.NON_COMPUTATIONAL_TYPES:
                 delete_names.append(node.name)
 
         self._delete_nodes_of_cache(delete_names)
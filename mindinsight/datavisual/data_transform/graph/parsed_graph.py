@@ -0,0 +1,414 @@
+# Copyright 2026 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+This file is used to define the nodes parsed from the graph proto.
+
+The graph proto is parsed once, and the graphs of different views are built from copies of the parsed nodes.
+The parsed nodes and the built graphs are packed by `graph_codec` when they are pickled, so that they are passed
+between processes in a compact format.
+"""
+import collections
+import threading
+
+from mindinsight.datavisual.common.enums import PluginNameEnum
+from mindinsight.datavisual.common.log import logger
+from mindinsight.datavisual.data_transform.graph import graph_codec
+from mindinsight.datavisual.data_transform.graph.graph import EdgeTypeEnum, Graph, check_invalid_character
+from mindinsight.datavisual.data_transform.graph.node import Node
+from mindinsight.datavisual.proto_files.mindinsight_anf_ir_pb2 import DataType
+from mindinsight.domain.graph.base import NodeTypeEnum, DebuggerSource
+from mindinsight.utils.exceptions import UnknownError
+
+ParsedOpNode = collections.namedtuple('ParsedOpNode', ['node', 'instance_name'])
+
+
+class ParsedGraph:
+    """
+    The nodes parsed from a graph proto, the nodes should not be modified.
+
+    Args:
+        op_nodes (list[ParsedOpNode]): The op nodes in topological order and their instance names.
+        parameter_nodes (list[Node]): The parameter nodes.
+        const_nodes (list[Node]): The const nodes.
+    """
+
+    def __init__(self, op_nodes, parameter_nodes, const_nodes):
+        self.op_nodes = op_nodes
+        self.parameter_nodes = parameter_nodes
+        self.const_nodes = const_nodes
+
+    def __getstate__(self):
+        table = graph_codec.StringTable()
+        op_nodes = graph_codec.pack_nodes([op_node.node for op_node in self.op_nodes], table)
+        instance_names = [table.index(op_node.instance_name) for op_node in self.op_nodes]
+        parameter_nodes = graph_codec.pack_nodes(self.parameter_nodes, table)
+        const_nodes = graph_codec.pack_nodes(self.const_nodes, table)
+        return op_nodes, instance_names, parameter_nodes, const_nodes, table.pack()
+
+    def __setstate__(self, state):
+        op_nodes, instance_names, parameter_nodes, const_nodes, packed_table = state
+        table = graph_codec.StringTable.unpack(packed_table)
+        self.op_nodes = [ParsedOpNode(node, table[instance_name])
+                         for node, instance_name in zip(graph_codec.unpack_nodes(op_nodes, table), instance_names)]
+        self.parameter_nodes = graph_codec.unpack_nodes(parameter_nodes, table)
+        self.const_nodes = graph_codec.unpack_nodes(const_nodes, table)
+
+    @classmethod
+    def from_proto(cls, proto_data):
+        """
+        Parse the graph proto.
+
+        Args:
+            proto_data (anf_ir_pb2.GraphProto): Refer to anf_ir_pb2.GraphProto object.
+
+        Returns:
+            ParsedGraph, the parsed graph.
+        """
+        logger.info("Start to parse graph proto data.")
+        parser = _GraphProtoParser()
+        parsed_graph = cls(parser.parse_op_nodes(proto_data.node),
+                           parser.parse_parameters(proto_data.parameters),
+                           parser.parse_consts(proto_data.const_vals))
+        logger.info("Parse proto data end, op node count: %s, parameter count: %s, const count: %s.",
+                    len(parsed_graph.op_nodes), len(parsed_graph.parameter_nodes), len(parsed_graph.const_nodes))
+        return parsed_graph
+
+    @staticmethod
+    def copy_node(node):
+        """
+        Copy a parsed node, so that the copy can be modified when building a graph.
+
+        Args:
+            node (Node): The parsed node.
+
+        Returns:
+            Node, the copy of the node.
+        """
+        new_node = Node(name=node.name, node_id=node.node_id, topological_index=node.topological_index)
+        Node.copy_node_without_input_output(node, new_node)
+        new_node.is_dynamic_shape_node = node.is_dynamic_shape_node
+        for src_name, input_attr in node.inputs.items():
+            new_node.add_inputs(src_name, dict(input_attr))
+        return new_node
+
+
+class LazyGraph:
+    """
+    The graph which is built from the parsed graph on first access, attributes are delegated to the built graph.
+
+    A built graph is packed when the lazy graph is pickled, and it is unpacked on first access after unpickling.
+
+    Args:
+        graph_class (type): The class of the graph, such as `OptimizedGraph`.
+        parsed_graph (ParsedGraph): The parsed graph. Default: None.
+        graph (Graph): The built graph, `parsed_graph` is ignored if it is given. Default: None.
+    """
+
+    def __init__(self, graph_class, parsed_graph=None, graph=None):
+        self._graph_class = graph_class
+        self._parsed_graph = None if graph is not None else parsed_graph
+        self._packed_graph = None
+        self._graph = graph
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        with self._lock:
+            state = dict(self.__dict__)
+        state.pop('_lock')
+        if state['_graph'] is not None:
+            state['_packed_graph'] = graph_codec.pack_graph(state['_graph'])
+            state['_graph'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        if name.startswith('__') or name in ('_graph_class', '_parsed_graph', '_packed_graph', '_graph', '_lock'):
+            raise AttributeError(name)
+        return getattr(self.get_graph(), name)
+
+    def get_graph(self):
+        """
+        Get the graph, build or unpack it if it is not built.
+
+        Returns:
+            Graph, the built graph.
+        """
+        with self._lock:
+            if self._graph is None and self._packed_graph is not None:
+                self._graph = graph_codec.unpack_graph(self._graph_class, self._packed_graph)
+                self._packed_graph = None
+            if self._graph is None:
+                graph = self._graph_class()
+                try:
+                    graph.build_graph(self._parsed_graph)
+                except Exception as ex:
+                    logger.error("Build graph failed, graph class: %s.", self._graph_class.__name__)
+                    logger.exception(ex)
+                    raise UnknownError(str(ex))
+                self._graph = graph
+                self._parsed_graph = None
+            return self._graph
+
+
+class _GraphProtoParser:
+    """Parse the nodes in the graph proto."""
+
+    MAX_NODE_ATTRIBUTE_VALUE_BYTES = Graph.MAX_NODE_ATTRIBUTE_VALUE_BYTES
+
+    def parse_op_nodes(self, node_protos):
+        """
+        Parse `anf_ir_pb2.NodeProto` object, and create op nodes.
+
+        Args:
+            node_protos (list[anf_ir_pb2.NodeProto]): Refer to anf_ir_pb2.NodeProto.
+
+        Returns:
+            list[ParsedOpNode], the op nodes in topological order.
+        """
+        logger.debug("Start to parse op nodes from proto.")
+        op_nodes = []
+        for topological_index, node_proto in enumerate(node_protos):
+            if not node_proto.name:
+                logger.warning("Finding a node with an empty name will not save it.")
+                continue
+
+            node = self._parse_op_node(topological_index, node_proto)
+            op_nodes.append(ParsedOpNode(node, node_proto.instance_name))
+        return op_nodes
+
+    def _parse_op_node(self, topological_index, node_proto):
+        """Parse `anf_ir_pb2.NodeProto` object, and create a normal node."""
+        name = node_proto.name.split('/')[-1]
+        node_id = name.split('op')[-1]
+        name = f'{node_proto.op_type}-op{node_id}'
+        node_name = Node.create_node_name(node_proto.scope, name)
+
+        if node_proto.full_name:
+            node_name = node_proto.full_name
+
+        if node_proto.full_name and any(
+                node_proto.full_name.lower().endswith(f'[:{plugin.value.lower()}]') for plugin in PluginNameEnum):
+            node_name = Node.create_node_name(scope=node_proto.scope,
+                                              base_name=f'{node_proto.op_type}-op{node_proto.name}')
+
+        # The Graphviz plug-in that the UI USES can't handle these special characters.
+        check_invalid_character(node_name)
+
+        node = Node(name=node_name, node_id=node_id, topological_index=topological_index)
+        node.full_name = node_proto.full_name
+        node.type = node_proto.op_type
+        if getattr(node_proto, 'source_address', None):
+            node.stack = DebuggerSource.build_stack_from_source_address(node_proto.source_address)
+        self._parse_attributes(node_proto.attribute, node)
+        self._parse_inputs(node_proto.input, node)
+
+        node.output_i = node_proto.output_i
+        node.scope = node_proto.scope
+        node.output_shape = self._get_shape_by_parse_type_proto(node_proto.output_type)
+        node.output_nums = len(node.output_shape)
+        node.output_data_type = self._get_data_type_by_parse_type_proto(node_proto.output_type, node)
+
+        return node
+
+    def parse_parameters(self, parameter_protos):
+        """
+        Parse `anf_ir_pb2.ParameterProto` object, and create parameter nodes.
+
+        Args:
+            parameter_protos (list[anf_ir_pb2.ParameterProto]): Refer to anf_ir_pb2.ParameterProto.
+
+        Returns:
+            list[Node], the parameter nodes.
+        """
+        logger.debug("Start to parse parameters from proto.")
+        nodes = []
+        for parameter in parameter_protos:
+            if not parameter.name:
+                logger.warning("Finding a parameter with an empty name will not save it.")
+                continue
+            check_invalid_character(parameter.name)
+            node = Node(name=parameter.name, node_id=parameter.name)
+            node.type = NodeTypeEnum.PARAMETER.value
+            node.output_shape = self._get_shape_by_parse_type_proto(parameter.type)
+            node.output_nums = len(node.output_shape)
+            node.output_data_type = self._get_data_type_by_parse_type_proto(parameter.type, node)
+            attr = dict(
+                type=self._get_data_type_by_parse_type_proto(parameter.type, node),
+                shape=str(self._get_shape_by_parse_type_proto(parameter.type))
+            )
+            node.add_attr(attr)
+
+            nodes.append(node)
+            logger.debug("Foreach graph proto parameters, node id: %s, node name: %s, "
+                         "node def name: %s", node.node_id, node.name, parameter.name)
+        return nodes
+
+    def parse_consts(self, consts):
+        """
+        Parse `anf_ir_pb2.NameValueProto` object, and create const nodes.
+
+        Args:
+            consts (list[anf_ir_pb2.NameValueProto]): Refer to `anf_ir_pb2.NameValueProto` object.
+
+        Returns:
+            list[Node], the const nodes.
+        """
+        logger.debug("Start to parse consts from proto.")
+        nodes = []
+        for const in consts:
+            if not const.key:
+                logger.warning("Finding a const with an empty key will not save it.")
+                continue
+            check_invalid_character(const.key)
+            node = Node(name=const.key, node_id=const.key, full_name=const.full_name)
+            node.type = NodeTypeEnum.CONST.value
+            if const.value.ByteSize() > self.MAX_NODE_ATTRIBUTE_VALUE_BYTES:
+                node.add_attr({const.key: 'dtype: ' + DataType.Name(const.value.dtype)})
+            else:
+                node.add_attr({const.key: str(const.value)})
+
+            if const.value.dtype == DataType.DT_TENSOR:
+                shape = list(const.value.tensor_val.dims)
+                node.output_shape.append(shape)
+                if const.value.tensor_val.HasField('data_type'):
+                    node.elem_types.append(DataType.Name(const.value.tensor_val.data_type))
+            else:
+                node.elem_types.append(DataType.Name(const.value.dtype))
+                # dim is zero
+                node.output_shape.append([])
+
+            node.output_nums = len(node.output_shape)
+
+            nodes.append(node)
+        return nodes
+
+    def _get_shape_by_parse_type_proto(self, type_proto):
+        """
+        Parse proto's `message TypeProto` to get shape information.
+
+        Args:
+            type_proto (anf_ir_pb2.TypeProto): Refer to anf_ir_pb2.TypeProto.
+
+        Returns:
+            list, a list of shape.
+        """
+        shapes = []
+        if type_proto.HasField('data_type'):
+            if type_proto.data_type != DataType.DT_TENSOR and \
+                    type_proto.data_type != DataType.DT_TUPLE:
+                # Append an empty list as a placeholder
+                # for the convenience of output number calculation.
+                shapes.append([])
+                return shapes
+        if type_proto.HasField('tensor_type'):
+            tensor_type = type_proto.tensor_type
+            tensor_shape_proto = tensor_type.shape
+            shape = [dim.size for dim in tensor_shape_proto.dim]
+            shapes.append(shape)
+        if type_proto.HasField('sequence_type'):
+            for elem_type in type_proto.sequence_type.elem_types:
+                shapes.extend(self._get_shape_by_parse_type_proto(elem_type))
+        return shapes
+
+    def _get_data_type_by_parse_type_proto(self, type_proto, node):
+        """
+        Get data type by parse type proto object.
+
+        The name of the DataType, refer to `anf_ir_pb2.DataType` object.
+        If data type is tensor or tuple, the data name we return is `data_type[element_type, element_type]`.
+
+        Args:
+            type_proto (anf_ir_pb2.TypeProto): Refer to anf_ir_pb2.TypeProto.
+
+        Returns:
+            str, the data type.
+
+        """
+        data_type_name = self._get_data_type_name_by_value(type_proto, type_proto.data_type, field_name='data_type')
+        if type_proto.data_type == DataType.DT_TENSOR:
+            tensor_type_proto = type_proto.tensor_type
+            value = type_proto.tensor_type.elem_type
+            elem_type_name = self._get_data_type_name_by_value(tensor_type_proto, value, field_name='elem_type')
+            node.elem_types.append(elem_type_name)
+            return f'{data_type_name}[{elem_type_name}]'
+
+        if type_proto.data_type == DataType.DT_TUPLE:
+            data_types = []
+            for elem_type in type_proto.sequence_type.elem_types:
+                data_types.append(self._get_data_type_by_parse_type_proto(elem_type, node))
+            return f'{data_type_name}{str(data_types)}'
+
+        node.elem_types.append(data_type_name)
+
+        return data_type_name
+
+    def _parse_inputs(self, input_protos, node):
+        """
+        Parse `anf_ir_pb2.InputProto` object.
+
+        Args:
+            input_protos (list[anf_ir_pb2.InputProto]): Refer to `anf_ir_pb2.InputProto` object.
+            node (Node): Refer to `Node` object, it is used to log message and update input.
+        """
+        for input_proto in input_protos:
+            if not input_proto.name:
+                logger.warning("The name in input proto of node(%s) is empty, will ignore.", node.name)
+                continue
+
+            if "/" in input_proto.name:
+                input_proto.name = input_proto.name.split("op")[-1]
+
+            edge_type = EdgeTypeEnum.DATA.value if not input_proto.type else EdgeTypeEnum.CONTROL.value
+
+            # Notice:
+            # 1. The name in the input proto is the node id of the Node object.
+            # 2. In the current step, the shape of source node cannot be obtained,
+            #    so it is set to empty list by default, and the next step will update it.
+            # 3. Same with scope, set the default value first.
+            input_attr = {
+                "shape": [],
+                "edge_type": edge_type,
+                "independent_layout": False,
+                'data_type': ''
+            }
+
+            node.add_inputs(src_name=input_proto.name, input_attr=input_attr)
+
+    def _parse_attributes(self, attributes, node):
+        """
+        Parse `anf_ir_pb2.AttributeProto` object., and Filters large attribute values.
+
+        Args:
+            attributes (list[anf_ir_pb2.AttributeProto]): Refer to `anf_ir_pb2.AttributeProto` object.
+            node (Node): Refer to `Node` object, it is used to log message and update attr.
+        """
+        for attr in attributes:
+            if attr.value.ByteSize() > self.MAX_NODE_ATTRIBUTE_VALUE_BYTES:
+                message = f"The attribute value of node({node.name}) " \
+                          f"is over {self.MAX_NODE_ATTRIBUTE_VALUE_BYTES} Bytes, will ignore."
+                logger.warning(message)
+                continue
+            if attr.name in ('input_is_dynamic_shape', 'output_is_dynamic_shape') and not \
+                    node.is_dynamic_shape_node and attr.value.bool_val:
+                node.is_dynamic_shape_node = True
+            node.add_attr({attr.name: str(attr.value)})
+
+    @staticmethod
+    def _get_data_type_name_by_value(data_type, value, field_name='data_type'):
+        """Get the data type name by the enum value, data_type refer to `DataType` object."""
+        return data_type.DESCRIPTOR.fields_by_name[field_name].enum_type.values_by_number[value].name
@@ -46,6 +46,8 @@ class DataLoaderGenerator(LoaderGenerator):
         """
         self._summary_path = self._check_and_normalize_summary_path(summary_path)
         self._summary_watcher = SummaryWatcher()
+        # Whether the summary directories have valid files, keyed by relative path.
+        self._valid_dirs = {}
 
     def register_folder_analyzer(self, analyzer):
         """Register folder analyzer."""
@@ -70,13 +72,15 @@ class DataLoaderGenerator(LoaderGenerator):
 
         return summary_path
 
-    def generate_loaders(self, loader_pool, summaries_info):
+    def generate_loaders(self, loader_pool, summaries_info, summary_changes=None):
         """
         Generate loader from summary path, if summary path is empty, will return empty list.
 
         Args:
             loader_pool (dict[str, LoaderStruct]): Current loader pool in data_manager.
             summaries_info (list): Summaries info list.
+            summary_changes (SummaryDirectoryChanges): Changes of summary directories since the last generating,
+                all the summary directories are checked for valid files again if it is None. Default: None.
 
         Returns:
             dict[str, LoaderStruct], a dict of `Loader`.
@@ -90,13 +94,11 @@ class DataLoaderGenerator(LoaderGenerator):
 
         dir_map_mtime_dict = {}
         min_modify_time = None
+        self._update_valid_dirs(summaries_info, summary_changes)
 
         for item in summaries_info:
             relative_path = item.get("relative_path")
-            current_dir = FileHandler.join(self._summary_path, relative_path)
-            dataloader = DataLoader(current_dir)
-
-            if not dataloader.has_valid_files():
+            if not self._has_valid_files(relative_path):
                 logger.debug("Can not find valid train log file in folder %s , "
                              "will ignore.", relative_path)
                 continue
@@ -133,6 +135,26 @@ class DataLoaderGenerator(LoaderGenerator):
 
         return loader_dict
 
+    def _update_valid_dirs(self, summaries_info, summary_changes):
+        """Forget whether the changed or removed summary directories have valid files."""
+        if summary_changes is None:
+            self._valid_dirs.clear()
+            return
+        listed_paths = {item.get("relative_path") for item in summaries_info}
+        for relative_path in list(self._valid_dirs):
+            if relative_path not in listed_paths or relative_path in summary_changes.added \
+                    or relative_path in summary_changes.updated:
+                self._valid_dirs.pop(relative_path)
+
+    def _has_valid_files(self, relative_path):
+        """Check whether the summary directory has valid files, the result is kept until the directory changes."""
+        has_valid_files = self._valid_dirs.get(relative_path)
+        if has_valid_files is None:
+            current_dir = FileHandler.join(self._summary_path, relative_path)
+            has_valid_files = DataLoader(current_dir).has_valid_files()
+            self._valid_dirs[relative_path] = has_valid_files
+        return has_valid_files
+
     def _generate_loader_by_relative_path(self, relative_path):
         """
         Generate loader by relative path.
@@ -21,13 +21,15 @@ MAX_DATA_LOADER_SIZE = 15
 class LoaderGenerator:
     """Base loader generator for loader generators."""
     @abstractmethod
-    def generate_loaders(self, loader_pool, summaries_info):
+    def generate_loaders(self, loader_pool, summaries_info, summary_changes=None):
         """
         Abstract method for generating loaders.
 
         Args:
             loader_pool (dict[str, LoaderStruct]): Current loader pool in data_manager.
             summaries_info (list): Summaries info list.
+            summary_changes (SummaryDirectoryChanges): Changes of summary directories since the last generating,
+                all the summary directories are treated as changed if it is None. Default: None.
 
         Returns:
             dict[str, LoaderStruct], a dict of `Loader`.
@@ -19,14 +19,18 @@ This module is used to load the MindSpore training log file.
 Each instance will read an entire run, a run can contain one or
 more log file.
 """
+import collections
 import re
 import struct
+import threading
 import time
+from concurrent import futures
 from os import path
 
 from google.protobuf.message import DecodeError
 from google.protobuf.text_format import ParseError
 
+from mindinsight.conf import settings
 from mindinsight.datavisual.common import exceptions
 from mindinsight.datavisual.common.enums import PluginNameEnum
 from mindinsight.datavisual.common.log import logger
@@ -35,20 +39,25 @@ from mindinsight.datavisual.data_transform.events_data import EventsData
 from mindinsight.datavisual.data_transform.events_data import TensorEvent
 from mindinsight.datavisual.data_transform.graph import MSGraph
 from mindinsight.datavisual.data_transform.graph import OptimizedGraph
+from mindinsight.datavisual.data_transform.graph.parsed_graph import LazyGraph, ParsedGraph
 from mindinsight.datavisual.data_transform.histogram import Histogram
 from mindinsight.datavisual.data_transform.histogram_container import HistogramContainer
 from mindinsight.datavisual.data_transform.image_container import ImageContainer
 from mindinsight.datavisual.data_transform.tensor_container import TensorContainer, MAX_TENSOR_COUNT
 from mindinsight.datavisual.data_transform.loss_landscape_container import LossLandscapeContainer
+from mindinsight.datavisual.data_transform.summary_index import SummaryIndex
 from mindinsight.datavisual.proto_files import mindinsight_anf_ir_pb2 as anf_ir_pb2
 from mindinsight.datavisual.proto_files import mindinsight_summary_pb2 as summary_pb2
 from mindinsight.datavisual.utils.tools import exception_no_raise_wrapper
 from mindinsight.utils.computing_resource_mgr import ComputingResourceManager, Executor
-from mindinsight.utils.exceptions import UnknownError
+from mindinsight.utils.exceptions import PathNotExistError, UnknownError
 
 HEADER_SIZE = 8
 CRC_STR_SIZE = 4
 MAX_EVENT_STRING = 500000000
+# The byte budget and the event count of one batch of events submitted to the executor.
+MAX_BATCH_EVENT_BYTES = 16 * 1024 * 1024
+MAX_BATCH_EVENT_COUNT = 10000
 
 
 class MSDataLoader:
@@ -77,6 +86,11 @@ class MSDataLoader:
     def is_integrity(self, integrity):
         self._is_integrity = integrity
 
+    @property
+    def has_unsaved_indexes(self):
+        """Whether any summary index is to be saved in a later load, even if no file changes."""
+        return any(parser.has_unsaved_indexes for parser in self._parser_list)
+
     def get_events_data(self):
         """Return events data read from log file."""
         return self._events_data
@@ -183,6 +197,11 @@ class _Parser:
     def is_integrity(self, integrity):
         self._is_integrity = integrity
 
+    @property
+    def has_unsaved_indexes(self):
+        """Whether any index of the parsed files is to be saved in a later parse round."""
+        return False
+
     def parse_files(self, executor, filenames, events_data):
         """
         Load files and parse files content.
@@ -299,12 +318,27 @@ class _PbParser(_Parser):
 
 
 class _SummaryParser(_Parser):
-    """The summary file parser."""
+    """
+    The summary file parser.
 
-    def __init__(self, summary_dir):
+    Args:
+        summary_dir (str): Log directory.
+        max_batch_bytes (int): The byte budget of the events submitted to the executor in one task.
+        max_batch_count (int): The max count of the events submitted to the executor in one task.
+    """
+
+    def __init__(self, summary_dir, max_batch_bytes=MAX_BATCH_EVENT_BYTES, max_batch_count=MAX_BATCH_EVENT_COUNT):
         super(_SummaryParser, self).__init__(summary_dir)
         self._latest_file_size = 0
         self._summary_file_handler = None
+        self._max_batch_bytes = max_batch_bytes
+        self._max_batch_count = max_batch_count
+        self._pending_batches = collections.deque()
+        self._pending_batches_lock = threading.Lock()
+        self._summary_index = None
+        # Indexes of the summary files to be saved, including the index of the file being loaded, which is kept
+        # to be saved again after new records are appended. Key: file path, value: SummaryIndex.
+        self._unsaved_indexes = {}
 
     def parse_files(self, executor, filenames, events_data):
         """
@@ -318,6 +352,7 @@ class _SummaryParser(_Parser):
         Returns:
             bool, True if all the summary files are finished loading.
         """
+        self._save_indexes()
         summary_files = self.filter_files(filenames)
         summary_files = self.sort_files(summary_files)
         if self._latest_filename in summary_files:
@@ -331,6 +366,14 @@ class _SummaryParser(_Parser):
                 self._summary_file_handler = FileHandler(file_path, 'rb')
                 self._latest_filename = filename
                 self._latest_file_size = 0
+                self._summary_index = None
+                if settings.ENABLE_SUMMARY_INDEX_CACHE:
+                    is_loaded = self._load_file_index(executor, file_path, events_data)
+                    if not is_loaded:
+                        self._summary_index = SummaryIndex(file_path)
+                    self._unsaved_indexes[self._summary_index.file_path] = self._summary_index
+                    if is_loaded:
+                        return False
 
             new_size = FileHandler.file_stat(file_path).size
             if new_size == self._latest_file_size:
@@ -347,8 +390,30 @@ class _SummaryParser(_Parser):
             except UnknownError as ex:
                 logger.warning("Parse summary file failed, detail: %r,"
                                "file path: %s.", str(ex), file_path)
+        self._save_indexes()
         return True
 
+    @property
+    def has_unsaved_indexes(self):
+        """
+        Whether any index is waiting to be saved, once its batches are applied or its summary file settles.
+
+        Indexes which can never be saved, as their summary files are damaged or not fully read, are excluded,
+        or the loader would be loaded again in every round.
+        """
+        for file_path, summary_index in list(self._unsaved_indexes.items()):
+            if summary_index.is_saved() or (not self.is_integrity and summary_index is self._summary_index):
+                continue
+            if summary_index.pending_count:
+                return True
+            try:
+                file_size = FileHandler.file_stat(file_path).size
+            except PathNotExistError:
+                continue
+            if file_size == summary_index.end_offset:
+                return True
+        return False
+
     def filter_files(self, filenames):
         """
         Gets a list of summary files.
@@ -363,9 +428,91 @@ class _SummaryParser(_Parser):
             lambda filename: (re.search(r'summary\.\d+', filename)
                               and not filename.endswith("_lineage")), filenames))
 
+    def _load_file_index(self, executor, file_path, events_data):
+        """
+        Rebuild the events of a summary file from its saved index.
+
+        Scalars are rebuilt from the index directly, records with other values are read by their offsets and
+        decoded again. The loaded index is kept as the index of the file, so that the records appended later are
+        added to it.
+
+        Args:
+            executor (Executor): The executor instance.
+            file_path (str): The path of the summary file.
+            events_data (EventsData): The container of event data.
+
+        Returns:
+            bool, True if the summary file is loaded from its index.
+        """
+        file_stat = FileHandler.file_stat(file_path)
+        summary_index = SummaryIndex.load(file_path, file_stat.size, file_stat.mtime)
+        if summary_index is None:
+            return False
+        logger.info("Load summary file from index, file path: %s.", file_path)
+
+        scalar_future = futures.Future()
+        scalar_future.set_result(summary_index.get_scalar_records(self._latest_filename))
+        with self._pending_batches_lock:
+            self._pending_batches.append((scalar_future, None))
+
+        file_handler = self._summary_file_handler
+        events = []
+        batch_bytes = 0
+        try:
+            for offset in summary_index.get_decode_offsets():
+                file_handler.reset_offset(offset)
+                event_str = self.event_load(file_handler)
+                events.append((offset, event_str))
+                batch_bytes += len(event_str)
+                if batch_bytes >= self._max_batch_bytes or len(events) >= self._max_batch_count:
+                    self._submit_event_batch(executor, events, events_data, None)
+                    events = []
+                    batch_bytes = 0
+        except (OSError, TypeError, exceptions.MindInsightException) as ex:
+            logger.warning("Read records by summary index failed, detail: %r, file path: %s.", str(ex), file_path)
+        self._submit_event_batch(executor, events, events_data, None)
+        self._apply_done_batches(events_data)
+
+        file_handler.reset_offset(summary_index.end_offset)
+        self._latest_file_size = summary_index.end_offset
+        self._summary_index = summary_index
+        return True
+
+    def _save_indexes(self):
+        """Save the indexes of summary files which are finished loading and no longer being written."""
+        for file_path, summary_index in list(self._unsaved_indexes.items()):
+            is_latest = summary_index is self._summary_index
+            is_saved = self._save_index_if_settled(summary_index)
+            if is_saved is None:
+                self._unsaved_indexes.pop(file_path, None)
+            # The latest file may be appended, its index is kept until another file is loaded.
+            elif is_saved and not is_latest:
+                self._unsaved_indexes.pop(file_path, None)
+
+    def _save_index_if_settled(self, summary_index):
+        """
+        Save the index of a summary file if the file is finished loading and no longer being written.
+
+        Args:
+            summary_index (SummaryIndex): The index of the summary file.
+
+        Returns:
+            Union[bool, None], True if the index is saved, None if the summary file is removed.
+        """
+        if not self.is_integrity and summary_index is self._summary_index:
+            return False
+        try:
+            file_stat = FileHandler.file_stat(summary_index.file_path)
+        except PathNotExistError:
+            return None
+        return summary_index.save_if_settled(file_stat.size, file_stat.mtime)
+
     def _load_single_file(self, file_handler, executor, events_data):
         """
-        Load a log file data.
+        Load a batch of events from a log file.
+
+        Events are read until the byte budget or the event count of one batch is reached, then the whole batch
+        is submitted to the executor as a single task.
 
         Args:
             file_handler (FileHandler): A file handler.
@@ -375,6 +522,9 @@ class _SummaryParser(_Parser):
         Returns:
             bool, True if the summary file is finished loading.
         """
+        events = []
+        batch_bytes = 0
+        summary_index = self._summary_index
         while True:
             start_offset = file_handler.offset
             try:
@@ -382,34 +532,21 @@ class _SummaryParser(_Parser):
                 event_str = self.event_load(file_handler)
                 if event_str is None:
                     file_handler.reset_offset(start_offset)
+                    self._submit_event_batch(executor, events, events_data, summary_index)
                     return True
                 if len(event_str) > MAX_EVENT_STRING:
                     logger.warning("file_path: %s, event string: %d exceeds %d and drop it.",
                                    file_handler.file_path, len(event_str), MAX_EVENT_STRING)
                     continue
 
-                future = executor.submit(self._event_parse, event_str, self._latest_filename)
-
-                def _add_tensor_event_callback(future_value):
-                    tensor_values = future_value.result()
-                    for tensor_value in tensor_values:
-                        if tensor_value.plugin_name == PluginNameEnum.GRAPH.value:
-                            try:
-                                graph_tags = events_data.list_tags_by_plugin(PluginNameEnum.GRAPH.value)
-                            except KeyError:
-                                graph_tags = []
-
-                            summary_tags = self.filter_files(graph_tags)
-                            for tag in summary_tags:
-                                events_data.delete_tensor_event(tag)
-
-                        events_data.add_tensor_event(tensor_value)
-
-                if future is not None:
-                    future.add_done_callback(exception_no_raise_wrapper(_add_tensor_event_callback))
-                return False
+                events.append((start_offset, event_str))
+                batch_bytes += len(event_str)
+                if batch_bytes >= self._max_batch_bytes or len(events) >= self._max_batch_count:
+                    self._submit_event_batch(executor, events, events_data, summary_index)
+                    return False
             except exceptions.CRCLengthFailedError as exc:
                 file_handler.reset_offset(start_offset)
+                self._submit_event_batch(executor, events, events_data, summary_index)
                 file_size = file_handler.file_stat(file_handler.file_path).size
                 logger.error("Check crc failed and ignore this file, please check the integrity of the file, "
                              "file_path: %s, offset: %s, file size: %s. Detail: %s.",
@@ -422,12 +559,95 @@ class _SummaryParser(_Parser):
                     return True
                 return False
             except (OSError, DecodeError, exceptions.MindInsightException) as ex:
+                self._submit_event_batch(executor, events, events_data, summary_index)
                 logger.error("Parse log file fail, and ignore this file, detail: %r, "
                              "file path: %s.", str(ex), file_handler.file_path)
                 return True
             except Exception as ex:
                 logger.exception(ex)
                 raise UnknownError(str(ex))
+            finally:
+                if summary_index is not None:
+                    summary_index.end_offset = file_handler.offset
+
+    def _submit_event_batch(self, executor, events, events_data, summary_index):
+        """
+        Submit a batch of event strings to the executor as one task.
+
+        Args:
+            executor (Executor): The executor instance.
+            events (list[tuple[int, bytes]]): The offsets and event strings read from the summary file.
+            events_data (EventsData): The container of event data.
+            summary_index (Union[SummaryIndex, None]): The index to add the parsed records to, or None.
+        """
+        if not events:
+            return
+        future = executor.submit(self._events_parse, events, self._latest_filename)
+        if future is None:
+            return
+        with self._pending_batches_lock:
+            self._pending_batches.append((future, summary_index))
+            if summary_index is not None:
+                summary_index.pending_count += 1
+        future.add_done_callback(exception_no_raise_wrapper(
+            lambda _: self._apply_done_batches(events_data)))
+
+    def _apply_done_batches(self, events_data):
+        """
+        Add the tensor events of finished batches to `EventsData`.
+
+        Batches may finish out of order in the process pool, so only the leading finished batches are applied
+        to keep the tensor events in the same order as they are in the summary file.
+
+        The index of a summary file is saved once the last batch of the file is applied, if the file is fully
+        read and settled, since the loader may not be loaded again when the file stays unchanged.
+
+        Args:
+            events_data (EventsData): The container of event data.
+        """
+        finished_indexes = []
+        with self._pending_batches_lock:
+            while self._pending_batches and self._pending_batches[0][0].done():
+                future, summary_index = self._pending_batches.popleft()
+                if summary_index is not None:
+                    summary_index.pending_count -= 1
+                    if not summary_index.pending_count:
+                        finished_indexes.append(summary_index)
+                try:
+                    records = future.result()
+                except Exception as ex:
+                    logger.error("Parse summary events failed, detail: %r.", str(ex))
+                    if summary_index is not None:
+                        self._unsaved_indexes.pop(summary_index.file_path, None)
+                    continue
+                for offset, tensor_values in records:
+                    if summary_index is not None:
+                        summary_index.add_record(offset, tensor_values)
+                    for tensor_value in tensor_values:
+                        self._add_tensor_event(tensor_value, events_data)
+        for summary_index in finished_indexes:
+            if self._unsaved_indexes.get(summary_index.file_path) is summary_index:
+                self._save_index_if_settled(summary_index)
+
+    def _add_tensor_event(self, tensor_value, events_data):
+        """
+        Add a tensor event to `EventsData`, a new graph replaces the graphs of previous summary files.
+
+        Args:
+            tensor_value (TensorEvent): The tensor event to be added.
+            events_data (EventsData): The container of event data.
+        """
+        if tensor_value.plugin_name == PluginNameEnum.GRAPH.value:
+            try:
+                graph_tags = events_data.list_tags_by_plugin(PluginNameEnum.GRAPH.value)
+            except KeyError:
+                graph_tags = []
+
+            summary_tags = self.filter_files(graph_tags)
+            for tag in summary_tags:
+                events_data.delete_tensor_event(tag)
+
+        events_data.add_tensor_event(tensor_value)
 
     @staticmethod
     def event_load(file_handler):
@@ -557,6 +777,23 @@ class _SummaryParser(_Parser):
 
         return ret_tensor_events
 
+    @staticmethod
+    def _events_parse(events, latest_file_name):
+        """
+        Transform a batch of `Event` data to tensor events.
+
+        This method is static to avoid sending unnecessary objects to other processes.
+
+        Args:
+            events (list[tuple[int, bytes]]): The offsets and message event strings in summary proto,
+                in the order they are read.
+            latest_file_name (str): Latest file name.
+
+        Returns:
+            list[tuple[int, list[TensorEvent]]], the offset and tensor events of each event string, in order.
+        """
+        return [(offset, _SummaryParser._event_parse(event_str, latest_file_name)) for offset, event_str in events]
+
     def sort_files(self, filenames):
         """Sort by creating time increments and filenames decrement."""
         filenames = sorted(filenames,
@@ -566,30 +803,60 @@ class _SummaryParser(_Parser):
 
 
 def build_graph_events(graph_proto, filename, step, wall_time):
-    """Build graph events for MSgraph and OptimizedGraph."""
+    """
+    Build graph events for MSgraph and OptimizedGraph.
+
+    The graph proto is parsed once for both graphs, and the OptimizedGraph is built on first access.
+    """
     ret_tensor_events = []
-    graph_event = build_graph_event(graph_proto, PluginNameEnum.GRAPH.value, filename, step, wall_time)
-    if graph_event.value.list_node_by_scope():
+    try:
+        parsed_graph = ParsedGraph.from_proto(graph_proto)
+    except Exception as ex:
+        logger.error("Parse graph failed, file path: %s.", filename)
+        logger.exception(ex)
+        raise UnknownError(str(ex))
+
+    graph_event = build_graph_event(parsed_graph, PluginNameEnum.GRAPH.value, filename, step, wall_time)
+    if graph_event.value.count_node_by_scope():
         ret_tensor_events.append(graph_event)
-    optimized_graph_event = build_graph_event(graph_proto, PluginNameEnum.OPTIMIZED_GRAPH.value, filename, step,
-                                              wall_time)
-    if optimized_graph_event.value.list_node_by_scope():
+    if OptimizedGraph.may_have_nodes(parsed_graph):
+        optimized_graph_event = build_graph_event(parsed_graph, PluginNameEnum.OPTIMIZED_GRAPH.value, filename, step,
+                                                  wall_time)
         ret_tensor_events.append(optimized_graph_event)
     return ret_tensor_events
 
 
 def build_graph_event(graph_proto, plugin, filename, step, wall_time):
-    """Build a graph event."""
-    graph = MSGraph() if plugin == PluginNameEnum.GRAPH.value else OptimizedGraph()
+    """
+    Build a graph event, the OptimizedGraph is built on first access.
 
-    try:
-        graph.build_graph(graph_proto)
-    except Exception as ex:
-        # Normally, there are no exceptions, and it is only possible for users on the MindSpore side
-        # to dump other non-default graphs.
-        logger.error("Build graph failed, file path: %s.", filename)
-        logger.exception(ex)
-        raise UnknownError(str(ex))
+    The graph is wrapped by `LazyGraph`, so that it is passed between processes in a compact format.
+
+    Args:
+        graph_proto (Union[anf_ir_pb2.GraphProto, ParsedGraph]): The graph proto or the nodes parsed from it.
+        plugin (str): The plugin name of the graph.
+        filename (str): The file name of the summary file.
+        step (int): The step of the graph.
+        wall_time (float): The wall time of the graph.
+
+    Returns:
+        TensorEvent, the graph event.
+    """
+    if plugin == PluginNameEnum.GRAPH.value:
+        graph = MSGraph()
+        try:
+            graph.build_graph(graph_proto)
+        except Exception as ex:
+            # Normally, there are no exceptions, and it is only possible for users on the MindSpore side
+            # to dump other non-default graphs.
+            logger.error("Build graph failed, file path: %s.", filename)
+            logger.exception(ex)
+            raise UnknownError(str(ex))
+        graph = LazyGraph(MSGraph, graph=graph)
+    else:
+        if not isinstance(graph_proto, ParsedGraph):
+            graph_proto = ParsedGraph.from_proto(graph_proto)
+        graph = LazyGraph(OptimizedGraph, graph_proto)
 
     tensor_event = TensorEvent(wall_time=wall_time,
                                step=step,
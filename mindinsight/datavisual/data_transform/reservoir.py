@@ -14,9 +14,13 @@
 # ============================================================================
 """A reservoir sampling on the values."""
 
+import collections
+import itertools
 import random
 import threading
 
+import numpy as np
+
 from mindinsight.datavisual.common.log import logger
 from mindinsight.datavisual.common.enums import PluginNameEnum
 from mindinsight.utils.exceptions import ParamValueError
@@ -93,10 +97,20 @@ class Reservoir:
                 if rand_int < self._samples_max_size:
                     self._samples.pop(rand_int)
                 else:
-                    self._samples = self._samples[:-1]
+                    self._samples.pop()
                 self._add_sample(sample)
             self._sample_counter += 1
 
+    def last_step(self):
+        """
+        Get the step of the last sample.
+
+        Returns:
+            Union[int, None], the largest step of the stored samples, None if there are no samples.
+        """
+        with self._mutex:
+            return self._samples[-1].step if self._samples else None
+
     def _add_sample(self, sample):
         """Search the index and add sample."""
         if not self._samples or sample.step > self._samples[-1].step:
@@ -138,6 +152,206 @@ class Reservoir:
 
         return remove_size
 
+    def remove_sample_by_step(self, start_step, filename_filter):
+        """
+        Remove the samples from Reservoir whose step is equal to the start step,
+        or greater than it but the file name does not meet the filter criteria.
+
+        Args:
+            start_step (int): The start step.
+            filename_filter (Callable[[str], bool]): Determines whether a sample with greater step is kept
+                by its file name.
+
+        Returns:
+            int, the number of samples removed.
+        """
+        return self.remove_sample(
+            lambda x: x.step < start_step or (x.step > start_step and filename_filter(x.filename)))
+
+
+_ScalarSample = collections.namedtuple('_ScalarSample', ['wall_time', 'step', 'value', 'filename'])
+
+
+class ScalarSamples(collections.abc.Sequence):
+    """
+    Samples of a scalar reservoir, stored in columns.
+
+    Items are namedtuples with `wall_time`, `step`, `value` and `filename`, while the columns
+    can be got directly as arrays.
+
+    Args:
+        steps (numpy.ndarray): Steps of samples.
+        wall_times (numpy.ndarray): Wall times of samples.
+        values (numpy.ndarray): Values of samples.
+        filename_ids (numpy.ndarray): Indexes of the file names of samples in `filenames`.
+        filenames (list[str]): File names of samples.
+        version (int): The version of the reservoir when the samples are taken, it changes whenever
+            samples are added or removed. Default: None.
+    """
+
+    def __init__(self, steps, wall_times, values, filename_ids, filenames, version=None):
+        self.steps = steps
+        self.wall_times = wall_times
+        self.values = values
+        self.version = version
+        self._filename_ids = filename_ids
+        self._filenames = filenames
+
+    def __len__(self):
+        return len(self.steps)
+
+    def take(self, indices):
+        """
+        Take the samples at the given indexes.
+
+        Args:
+            indices (numpy.ndarray): Indexes of samples.
+
+        Returns:
+            ScalarSamples, the samples taken.
+        """
+        return ScalarSamples(self.steps[indices], self.wall_times[indices], self.values[indices],
+                             self._filename_ids[indices], self._filenames, self.version)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ScalarSamples(self.steps[index], self.wall_times[index], self.values[index],
+                                 self._filename_ids[index], self._filenames, self.version)
+        return _ScalarSample(wall_time=float(self.wall_times[index]),
+                             step=int(self.steps[index]),
+                             value=float(self.values[index]),
+                             filename=self._filenames[self._filename_ids[index]])
+
+
+class ScalarReservoir(Reservoir):
+    """
+    Reservoir for scalars, which keeps steps, wall times and values in typed arrays.
+
+    Args:
+        size (int): Container Size. If the size is 0, the container is not limited.
+    """
+    _INITIAL_CAPACITY = 64
+    # Versions are unique among all scalar reservoirs, so that samples of different reservoirs are distinguished.
+    _version_counter = itertools.count()
+
+    def __init__(self, size):
+        super().__init__(size)
+        self._version = next(self._version_counter)
+        # Columns start small and grow on demand, as most tags hold far fewer samples than the size limit.
+        capacity = min(size, self._INITIAL_CAPACITY) if size else self._INITIAL_CAPACITY
+        self._steps = np.empty(capacity, dtype=np.int64)
+        self._wall_times = np.empty(capacity, dtype=np.float64)
+        self._values = np.empty(capacity, dtype=np.float64)
+        self._filename_ids = np.empty(capacity, dtype=np.int32)
+        self._count = 0
+        self._filenames = []
+        self._filename_id_map = {}
+
+    def samples(self):
+        """Return all stored samples."""
+        with self._mutex:
+            return self._get_samples()
+
+    def _get_samples(self):
+        """Get a snapshot of the stored samples."""
+        count = self._count
+        return ScalarSamples(self._steps[:count].copy(), self._wall_times[:count].copy(),
+                             self._values[:count].copy(), self._filename_ids[:count].copy(),
+                             list(self._filenames), self._version)
+
+    def add_sample(self, sample):
+        """Adds sample, see parent class for details."""
+        with self._mutex:
+            if self._count < self._samples_max_size or self._samples_max_size == 0:
+                self._add_sample(sample)
+            else:
+                # Use the Reservoir Sampling algorithm to replace the old sample.
+                rand_int = self._sample_selector.randint(0, self._sample_counter)
+                if rand_int < self._samples_max_size:
+                    self._move(rand_int + 1, rand_int)
+                self._count -= 1
+                self._add_sample(sample)
+            self._sample_counter += 1
+            self._version = next(self._version_counter)
+
+    def last_step(self):
+        """Get the step of the last sample, see parent class for details."""
+        with self._mutex:
+            return int(self._steps[self._count - 1]) if self._count else None
+
+    def _add_sample(self, sample):
+        """Search the index and add sample."""
+        count = self._count
+        if count == len(self._steps):
+            self._grow()
+        if not count or sample.step > self._steps[count - 1]:
+            index = count
+        else:
+            index = int(np.searchsorted(self._steps[:count], sample.step))
+            self._move(index, index + 1)
+        self._steps[index] = sample.step
+        self._wall_times[index] = sample.wall_time
+        self._values[index] = sample.value
+        self._filename_ids[index] = self._get_filename_id(sample.filename)
+        self._count = count + 1
+
+    def _move(self, src_index, dst_index):
+        """Move the samples from the source index to the end, to start at the destination index."""
+        count = self._count
+        length = count - src_index
+        for column in (self._steps, self._wall_times, self._values, self._filename_ids):
+            column[dst_index:dst_index + length] = column[src_index:count]
+
+    def _grow(self):
+        """Double the capacity of columns, within the size limit."""
+        capacity = len(self._steps) * 2
+        if self._samples_max_size:
+            capacity = min(capacity, self._samples_max_size)
+        for name in ('_steps', '_wall_times', '_values', '_filename_ids'):
+            column = getattr(self, name)
+            new_column = np.empty(capacity, dtype=column.dtype)
+            new_column[:self._count] = column[:self._count]
+            setattr(self, name, new_column)
+
+    def _get_filename_id(self, filename):
+        """Get the index of the file name in the file name table."""
+        filename_id = self._filename_id_map.get(filename)
+        if filename_id is None:
+            filename_id = len(self._filenames)
+            self._filenames.append(filename)
+            self._filename_id_map[filename] = filename_id
+        return filename_id
+
+    def remove_sample(self, filter_fun):
+        """Remove samples, see parent class for details."""
+        with self._mutex:
+            keep_mask = np.array([bool(filter_fun(sample)) for sample in self._get_samples()], dtype=bool)
+            return self._keep_samples(keep_mask)
+
+    def remove_sample_by_step(self, start_step, filename_filter):
+        """Remove samples by step, see parent class for details."""
+        with self._mutex:
+            filename_mask = np.array([bool(filename_filter(filename)) for filename in self._filenames], dtype=bool)
+            count = self._count
+            steps = self._steps[:count]
+            keep_mask = (steps < start_step) | ((steps > start_step) & filename_mask[self._filename_ids[:count]])
+            return self._keep_samples(keep_mask)
+
+    def _keep_samples(self, keep_mask):
+        """Keep the samples selected by the mask and update the sample counter."""
+        before_remove_size = self._count
+        after_remove_size = int(np.count_nonzero(keep_mask))
+        remove_size = before_remove_size - after_remove_size
+        if remove_size > 0:
+            for column in (self._steps, self._wall_times, self._values, self._filename_ids):
+                column[:after_remove_size] = column[:before_remove_size][keep_mask]
+            self._count = after_remove_size
+            self._version = next(self._version_counter)
+            # update _sample_counter when samples has been removed.
+            sample_remaining_rate = float(after_remove_size) / before_remove_size
+            self._sample_counter = int(round(self._sample_counter * sample_remaining_rate))
+        return remove_size
+
 
 class _VisualRange:
     """Simple helper class to merge visual ranges."""
@@ -247,4 +461,6 @@ class ReservoirFactory:
         """
         if plugin_name in (PluginNameEnum.HISTOGRAM.value, PluginNameEnum.TENSOR.value):
             return HistogramReservoir(size)
+        if plugin_name == PluginNameEnum.SCALAR.value:
+            return ScalarReservoir(size)
         return Reservoir(size)
@@ -0,0 +1,275 @@
+# Copyright 2026 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Persistent index of the records in a summary file.
+
+The index records the step, wall time and byte offset of every record of each tag, and the value of scalars.
+It is stored in the MindInsight workspace and keyed by the file path, size and modify time of the summary file,
+so that the events of an unchanged summary file can be rebuilt without decoding every record again.
+"""
+import hashlib
+import json
+import os
+import time
+
+import numpy as np
+
+from mindinsight.conf import settings
+from mindinsight.datavisual.common.enums import PluginNameEnum
+from mindinsight.datavisual.common.log import logger
+from mindinsight.datavisual.data_transform.events_data import TensorEvent
+from mindinsight.utils.cache import remove_stale_cache_files, write_cache_file
+
+INDEX_VERSION = 1
+# A summary file is indexed only if it has not been modified for this many seconds.
+INDEX_SETTLE_SECONDS = 60
+# The index files of the removed summary files are removed at most once in this many seconds.
+STALE_INDEX_CHECK_INTERVAL = 3600
+
+_INDEX_SUFFIX = '.npz'
+
+
+def get_index_cache_dir():
+    """Get the directory to store summary index files."""
+    return os.path.join(settings.WORKSPACE, 'cache', 'summary_index')
+
+
+class _TagIndex:
+    """Records of a tag in the summary file."""
+
+    def __init__(self, plugin_name):
+        self.plugin_name = plugin_name
+        self.offsets = []
+        self.steps = []
+        self.wall_times = []
+        self.values = []
+
+
+class SummaryIndex:
+    """
+    Index of the records in a summary file.
+
+    Args:
+        file_path (str): The path of the summary file.
+    """
+
+    _last_stale_check_time = 0
+
+    def __init__(self, file_path):
+        self._file_path = os.path.realpath(file_path)
+        self._tags = {}
+        self._end_offset = 0
+        self._saved_offset = None
+        self.pending_count = 0
+
+    @property
+    def file_path(self):
+        """The real path of the summary file."""
+        return self._file_path
+
+    @property
+    def end_offset(self):
+        """The offset of the end of the last indexed record."""
+        return self._end_offset
+
+    @end_offset.setter
+    def end_offset(self, offset):
+        self._end_offset = offset
+
+    def add_record(self, offset, tensor_events):
+        """
+        Add the tensor events parsed from the record at the given offset.
+
+        Args:
+            offset (int): The offset of the record in the summary file.
+            tensor_events (list[TensorEvent]): Tensor events parsed from the record.
+        """
+        for tensor_event in tensor_events:
+            tag_index = self._tags.get(tensor_event.tag)
+            if tag_index is None:
+                tag_index = _TagIndex(tensor_event.plugin_name)
+                self._tags[tensor_event.tag] = tag_index
+            tag_index.offsets.append(offset)
+            tag_index.steps.append(tensor_event.step)
+            tag_index.wall_times.append(tensor_event.wall_time)
+            if tensor_event.plugin_name == PluginNameEnum.SCALAR.value:
+                tag_index.values.append(tensor_event.value)
+
+    def get_decode_offsets(self):
+        """
+        Get offsets of the records which should be decoded again, they contain values other than scalars.
+
+        Returns:
+            list[int], sorted offsets of records.
+        """
+        offsets = set()
+        for tag_index in self._tags.values():
+            if tag_index.plugin_name != PluginNameEnum.SCALAR.value:
+                offsets.update(tag_index.offsets)
+        return sorted(offsets)
+
+    def get_scalar_records(self, filename):
+        """
+        Rebuild the tensor events of scalars which do not need decoding.
+
+        Args:
+            filename (str): The file name of the summary file.
+
+        Returns:
+            list[tuple[int, list[TensorEvent]]], the offset and tensor events of records, sorted by offset.
+        """
+        decode_offsets = set(self.get_decode_offsets())
+        records = {}
+        for tag, tag_index in self._tags.items():
+            if tag_index.plugin_name != PluginNameEnum.SCALAR.value:
+                continue
+            for offset, step, wall_time, value in zip(tag_index.offsets, tag_index.steps,
+                                                      tag_index.wall_times, tag_index.values):
+                if offset in decode_offsets:
+                    continue
+                tensor_event = TensorEvent(wall_time=wall_time,
+                                           step=step,
+                                           tag=tag,
+                                           plugin_name=tag_index.plugin_name,
+                                           value=value,
+                                           filename=filename)
+                records.setdefault(offset, []).append(tensor_event)
+        return sorted(records.items(), key=lambda record: record[0])
+
+    def is_saved(self):
+        """Whether the index is saved with the latest end offset."""
+        return self._saved_offset == self._end_offset
+
+    def save(self, file_size, mtime):
+        """
+        Save the index to the cache directory.
+
+        Args:
+            file_size (int): The size of the summary file.
+            mtime (float): The modify time of the summary file.
+
+        Returns:
+            bool, True if the index is saved.
+        """
+        tags = []
+        arrays = {}
+        for index, (tag, tag_index) in enumerate(self._tags.items()):
+            tags.append([tag, tag_index.plugin_name])
+            arrays['offsets_%d' % index] = np.array(tag_index.offsets, dtype=np.int64)
+            arrays['steps_%d' % index] = np.array(tag_index.steps, dtype=np.int64)
+            arrays['wall_times_%d' % index] = np.array(tag_index.wall_times, dtype=np.float64)
+            arrays['values_%d' % index] = np.array(tag_index.values, dtype=np.float64)
+        meta = {
+            'version': INDEX_VERSION,
+            'file_path': self._file_path,
+            'size': file_size,
+            'mtime': mtime,
+            'end_offset': self._end_offset,
+            'tags': tags
+        }
+        arrays['meta'] = np.array(json.dumps(meta))
+
+        try:
+            write_cache_file(_get_index_path(self._file_path), lambda file: np.savez(file, **arrays))
+        except OSError as ex:
+            logger.warning("Save summary index failed, file path: %s, detail: %s.", self._file_path, str(ex))
+            return False
+        self._saved_offset = self._end_offset
+        logger.info("Save summary index success, file path: %s.", self._file_path)
+        self._remove_stale_indexes()
+        return True
+
+    @classmethod
+    def _remove_stale_indexes(cls):
+        """Remove the index files of the removed summary files, at most once in `STALE_INDEX_CHECK_INTERVAL`."""
+        now = time.time()
+        if now - cls._last_stale_check_time < STALE_INDEX_CHECK_INTERVAL:
+            return
+        cls._last_stale_check_time = now
+        removed_count = remove_stale_cache_files(get_index_cache_dir(), _INDEX_SUFFIX, _read_summary_file_path)
+        if removed_count:
+            logger.info("Remove %d stale summary indexes.", removed_count)
+
+    def save_if_settled(self, file_size, mtime):
+        """
+        Save the index if all the records of the summary file are indexed and the file is not being written.
+
+        Args:
+            file_size (int): The size of the summary file.
+            mtime (float): The modify time of the summary file.
+
+        Returns:
+            bool, True if the index is saved with the latest end offset.
+        """
+        if self.is_saved():
+            return True
+        if self.pending_count or file_size != self._end_offset:
+            return False
+        if time.time() - mtime < INDEX_SETTLE_SECONDS:
+            return False
+        return self.save(file_size, mtime)
+
+    @classmethod
+    def load(cls, file_path, file_size, mtime):
+        """
+        Load the index of the summary file from the cache directory.
+
+        Args:
+            file_path (str): The path of the summary file.
+            file_size (int): The current size of the summary file.
+            mtime (float): The current modify time of the summary file.
+
+        Returns:
+            Union[SummaryIndex, None], the index if it matches the summary file, else None.
+        """
+        summary_index = cls(file_path)
+        index_path = _get_index_path(summary_index._file_path)
+        if not os.path.isfile(index_path):
+            return None
+        try:
+            with np.load(index_path, allow_pickle=False) as arrays:
+                meta = json.loads(str(arrays['meta']))
+                if meta.get('version') != INDEX_VERSION or meta.get('file_path') != summary_index._file_path \
+                        or meta.get('size') != file_size or meta.get('mtime') != mtime:
+                    return None
+                for index, (tag, plugin_name) in enumerate(meta['tags']):
+                    tag_index = _TagIndex(plugin_name)
+                    tag_index.offsets = arrays['offsets_%d' % index].tolist()
+                    tag_index.steps = arrays['steps_%d' % index].tolist()
+                    tag_index.wall_times = arrays['wall_times_%d' % index].tolist()
+                    tag_index.values = arrays['values_%d' % index].tolist()
+                    summary_index._tags[tag] = tag_index
+        except (OSError, ValueError, KeyError) as ex:
+            logger.warning("Load summary index failed, file path: %s, detail: %s.", file_path, str(ex))
+            return None
+        summary_index.end_offset = meta['end_offset']
+        summary_index._saved_offset = summary_index.end_offset
+        return summary_index
+
+
+def _get_index_path(file_path):
+    """Get the path of the index file of the given summary file."""
+    file_key = hashlib.sha256(file_path.encode('utf-8')).hexdigest()
+    return os.path.join(get_index_cache_dir(), file_key + _INDEX_SUFFIX)
+
+
+def _read_summary_file_path(index_path):
+    """Read the path of the summary file from its index file, None if the index file is invalid."""
+    try:
+        with np.load(index_path, allow_pickle=False) as arrays:
+            return json.loads(str(arrays['meta'])).get('file_path')
+    except (OSError, ValueError, KeyError) as ex:
+        logger.warning("Read summary index failed, index path: %s, detail: %s.", index_path, str(ex))
+        return None
@@ -14,10 +14,13 @@
 # ============================================================================
 """Summary watcher module."""
 
+import collections
 import json
 import os
 import re
 import datetime
+import threading
+import time
 from pathlib import Path
 
 from mindinsight.datavisual.common.log import logger
@@ -141,11 +144,31 @@ class SummaryWatcher:
             counter (Counter): An instance of CountLimiter.
             list_explain (bool): Indicates whether to list only the mindexplain folder.
         """
+        self._update_subdir_summary_dict(summary_dict, summary_base_dir, entry_path, entry, counter, list_explain)
+
+        relative_path = './'
+        self._check_by_analyzers(entry, summary_base_dir, relative_path, summary_dict)
+
+    def _update_subdir_summary_dict(self, summary_dict, summary_base_dir, entry_path, entry, counter, list_explain):
+        """
+        Update summary_dict with the entries of the subdir.
+
+        Args:
+            summary_dict (dict): Temporary data structure to hold summary directory info.
+            summary_base_dir (str): Path of summary base directory.
+            entry_path(str): Path entry.
+            entry (DirEntry): Directory entry of the subdir.
+            counter (Counter): An instance of CountLimiter.
+            list_explain (bool): Indicates whether to list only the mindexplain folder.
+
+        Returns:
+            Union[list[DirEntry], None], the scanned entries of the subdir, None if the subdir is not accessible.
+        """
         try:
             subdir_entries = os.scandir(entry_path)
         except PermissionError:
             logger.warning('Path of %s under summary base directory is not accessible.', entry.name)
-            return
+            return None
 
         # sort in ascending order according to modification time.
         subdir_entries = [subdir_entry for subdir_entry in subdir_entries if not subdir_entry.is_symlink()]
@@ -164,8 +187,7 @@ class SummaryWatcher:
                 pass
             self._update_summary_dict(summary_dict, summary_base_dir, subdir_relative_path, subdir_entry, list_explain)
 
-        relative_path = './'
-        self._check_by_analyzers(entry, summary_base_dir, relative_path, summary_dict)
+        return subdir_entries
 
     def _is_valid_summary_directory(self, summary_base_dir, relative_path):
         """
@@ -303,9 +325,11 @@ class SummaryWatcher:
     def _find_profiler_dir(self, entry, summary_base_dir, relative_path):
         """Find profiler dir by the given relative path."""
         profiler_pattern = re.search(self.PROFILER_DIRECTORY_REGEX, entry.name)
+        if profiler_pattern is None:
+            return "", False
         full_dir_path = os.path.join(summary_base_dir, relative_path, entry.name)
         is_valid_profiler_dir, profiler_type = self._is_valid_profiler_directory(full_dir_path)
-        if profiler_pattern is None or not is_valid_profiler_dir:
+        if not is_valid_profiler_dir:
             return profiler_type, False
 
         return profiler_type, True
@@ -533,6 +557,240 @@ class SummaryWatcher:
         return len(directories), directories[offset * limit:(offset + 1) * limit]
 
 
+SummaryDirectoryChanges = collections.namedtuple('SummaryDirectoryChanges', ['added', 'updated', 'removed'])
+
+
+class _SubdirSnapshot:
+    """
+    Scan result of a subdirectory of the summary base directory.
+
+    Args:
+        mtime_ns (int): Modification time of the subdirectory when it is scanned.
+        racy (bool): Whether the subdirectory is modified too close to the scan to tell later changes by mtime.
+        tracked_stats (dict): The (mtime, size) and whether it is a directory of the summary files and directories
+            in the subdirectory, keyed by name.
+        summary_info (Union[dict, None]): The summary directory info of the subdirectory.
+    """
+
+    def __init__(self, mtime_ns, racy, tracked_stats, summary_info):
+        self.mtime_ns = mtime_ns
+        self.racy = racy
+        self.tracked_stats = tracked_stats
+        self.summary_info = summary_info
+
+
+class IncrementalSummaryWatcher(SummaryWatcher):
+    """
+    Summary watcher which keeps the scan result of the subdirectories between listings.
+
+    A subdirectory of the summary base directory is scanned again only if its modification time changes, or any of
+    the summary files and directories in it changes. On Linux, the subdirectories are also watched by inotify if
+    possible, so that the summary files in a watched subdirectory need not to be checked one by one. Results of
+    folder analyzers on the entries of an unchanged subdirectory are reused. All the subdirectories are scanned
+    again every `FULL_SCAN_INTERVAL` seconds in case that any change is missed.
+
+    The changes of summary directories between listings are provided by
+    `IncrementalSummaryWatcher.list_summary_directories_with_changes`, so that the train jobs not changed need not
+    to be processed again.
+
+    Args:
+        monitor (DirectoryMonitor): The monitor to watch the subdirectories by inotify, which may be shared with
+            other watchers. If it is None, the subdirectories are polled. Default: None.
+    """
+
+    FULL_SCAN_INTERVAL = 600
+    # A subdirectory modified within this many seconds before it is scanned will be scanned again,
+    # since the following modifications may not change its modification time on coarse file systems.
+    MTIME_RESOLUTION = 2
+
+    def __init__(self, monitor=None):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._monitor = monitor
+        self._summary_base_dir = None
+        self._last_full_scan_time = 0
+        self._snapshots = {}
+        self._listed_directories = {}
+        self._scanning = False
+        self._changed_paths = set()
+        self._visited_paths = set()
+        self._rescanned_paths = set()
+
+    def list_summary_directories(self, summary_base_dir, overall=True, list_explain=False):
+        """
+        List summary directories within base directory.
+
+        Refer to `SummaryWatcher.list_summary_directories`, only the overall listing of summary directories is
+        incremental.
+        """
+        if not overall or list_explain:
+            return super().list_summary_directories(summary_base_dir, overall=overall, list_explain=list_explain)
+        directories, _ = self.list_summary_directories_with_changes(summary_base_dir)
+        return directories
+
+    def list_summary_directories_with_changes(self, summary_base_dir):
+        """
+        List summary directories within base directory, and the changes since the last overall listing.
+
+        Args:
+            summary_base_dir (str): Path of summary base directory.
+
+        Returns:
+            tuple[list, SummaryDirectoryChanges], the summary directories same as
+                `SummaryWatcher.list_summary_directories`, and the relative paths of summary directories added,
+                updated and removed since the last overall listing. Summary directories whose files changed are
+                updated, even though their info is not changed.
+        """
+        with self._lock:
+            self._prepare_scan(summary_base_dir)
+            self._scanning = True
+            try:
+                directories = super().list_summary_directories(summary_base_dir)
+            finally:
+                self._scanning = False
+            for path in set(self._snapshots) - self._visited_paths:
+                self._remove_snapshot(path)
+            return directories, self._compare_with_last_listing(directories)
+
+    def _prepare_scan(self, summary_base_dir):
+        """Drop the snapshots which can not be trusted before scanning."""
+        summary_base_dir = os.path.realpath(summary_base_dir)
+        now = time.time()
+        if summary_base_dir != self._summary_base_dir:
+            self._summary_base_dir = summary_base_dir
+            self._listed_directories = {}
+            self._clear_snapshots()
+            self._last_full_scan_time = now
+        elif now - self._last_full_scan_time >= self.FULL_SCAN_INTERVAL:
+            self._clear_snapshots()
+            self._last_full_scan_time = now
+
+        self._changed_paths = self._monitor.fetch_changed_paths(self) if self._monitor is not None else set()
+        if self._changed_paths is None:
+            logger.info('Inotify events are lost, all the summary directories will be scanned.')
+            self._clear_snapshots()
+            self._changed_paths = set()
+        self._visited_paths = set()
+        self._rescanned_paths = set()
+
+    def _clear_snapshots(self):
+        """Remove all the snapshots."""
+        for path in list(self._snapshots):
+            self._remove_snapshot(path)
+
+    def _remove_snapshot(self, entry_path):
+        """Remove the snapshot of the subdirectory and stop watching it."""
+        self._snapshots.pop(entry_path, None)
+        if self._monitor is not None:
+            self._monitor.unwatch(entry_path, self)
+
+    def _update_subdir_summary_dict(self, summary_dict, summary_base_dir, entry_path, entry, counter, list_explain):
+        """
+        Update summary_dict with the entries of the subdir.
+
+        Refer to `SummaryWatcher._update_subdir_summary_dict`, the snapshot of the subdir is used if it is not
+        changed since the last scan.
+        """
+        if not self._scanning:
+            return super()._update_subdir_summary_dict(summary_dict, summary_base_dir, entry_path, entry, counter,
+                                                       list_explain)
+
+        self._visited_paths.add(entry_path)
+        relative_path = os.path.join('.', entry.name)
+        snapshot = self._snapshots.get(entry_path)
+        if snapshot is None or not self._is_snapshot_valid(snapshot, entry_path, entry):
+            self._rescanned_paths.add(relative_path)
+            snapshot = self._scan_subdir(summary_base_dir, entry_path, entry, list_explain)
+            if snapshot is None:
+                self._remove_snapshot(entry_path)
+                return None
+            self._snapshots[entry_path] = snapshot
+
+        if snapshot.summary_info is not None and len(summary_dict) < self.MAX_SUMMARY_DIR_COUNT:
+            summary_dict[relative_path] = dict(snapshot.summary_info)
+        return None
+
+    def _scan_subdir(self, summary_base_dir, entry_path, entry, list_explain):
+        """
+        Scan the subdirectory and take a snapshot.
+
+        Returns:
+            Union[_SubdirSnapshot, None], the snapshot, None if the subdirectory is not accessible.
+        """
+        scan_time = time.time()
+        try:
+            mtime_ns = os.stat(entry_path).st_mtime_ns
+        except OSError:
+            return None
+        # Start watching before scanning, so that the changes during scanning will not be missed.
+        if self._monitor is not None:
+            self._monitor.watch(entry_path, self)
+
+        subdir_summary_dict = {}
+        subdir_entries = super()._update_subdir_summary_dict(subdir_summary_dict, summary_base_dir, entry_path,
+                                                             entry, Counter(), list_explain)
+        if subdir_entries is None:
+            return None
+
+        tracked_stats = {}
+        for subdir_entry in subdir_entries:
+            try:
+                is_dir = subdir_entry.is_dir()
+                if not is_dir and not self._is_summary_file_name(subdir_entry.name):
+                    continue
+                stat = subdir_entry.stat()
+            except OSError:
+                continue
+            tracked_stats[subdir_entry.name] = ((stat.st_mtime_ns, stat.st_size), is_dir)
+
+        racy = scan_time - mtime_ns / 1e9 < self.MTIME_RESOLUTION
+        summary_info = subdir_summary_dict.get(os.path.join('.', entry.name))
+        return _SubdirSnapshot(mtime_ns, racy, tracked_stats, summary_info)
+
+    def _is_snapshot_valid(self, snapshot, entry_path, entry):
+        """Check whether the subdirectory is not changed since the snapshot is taken."""
+        if snapshot.racy or entry_path in self._changed_paths:
+            return False
+        try:
+            if entry.stat().st_mtime_ns != snapshot.mtime_ns:
+                return False
+        except OSError:
+            return False
+
+        # The changes of files in a watched directory are reported by inotify.
+        watched = self._monitor is not None and self._monitor.is_watching(entry_path, self)
+        for name, (stat_key, is_dir) in snapshot.tracked_stats.items():
+            if watched and not is_dir:
+                continue
+            try:
+                stat = os.stat(os.path.join(entry_path, name))
+            except OSError:
+                return False
+            if (stat.st_mtime_ns, stat.st_size) != stat_key:
+                return False
+        return True
+
+    def _is_summary_file_name(self, name):
+        """Check whether the name is a summary file or pb file name."""
+        return re.search(self.SUMMARY_FILENAME_REGEX, name) is not None \
+            or re.search(self.PB_FILENAME_REGEX, name) is not None
+
+    def _compare_with_last_listing(self, directories):
+        """Get the changes of summary directories compared with the last listing."""
+        listed_directories = {directory['relative_path']: directory for directory in directories}
+        last_directories = self._listed_directories
+        self._listed_directories = listed_directories
+
+        added = set(listed_directories) - set(last_directories)
+        removed = set(last_directories) - set(listed_directories)
+        updated = set()
+        for relative_path, directory in listed_directories.items():
+            if relative_path in last_directories and (relative_path in self._rescanned_paths
+                                                      or directory != last_directories[relative_path]):
+                updated.add(relative_path)
+        return SummaryDirectoryChanges(added, updated, removed)
+
+
 def _new_entry(ctime, mtime, profiler=None):
     """Create a new entry."""
     return {
@@ -67,6 +67,9 @@ class TensorContainer:
     """
     Tensor data container.
 
+    The tensor data is kept as compact float32 values, the ndarray, statistics and histogram are calculated on
+    first access, so that tensors dropped before being viewed cost no calculation.
+
     Args:
         tensor_message (Summary.TensorProto): Tensor message in summary file.
     """
@@ -75,18 +78,19 @@ class TensorContainer:
         # Original dims can not be pickled to transfer to other process, so tuple is used.
         self._dims = tuple(tensor_message.dims)
         self._data_type = tensor_message.data_type
-        self._empty = len(tensor_message.float_data) == 0
-        self._np_array = self.get_ndarray(tensor_message.float_data) if not self._empty else np.array([])
+        size = len(tensor_message.float_data)
+        self._empty = size == 0
         self._error_code = None
-        if self._np_array.size > MAX_TENSOR_COUNT:
+        if size > MAX_TENSOR_COUNT:
             self._error_code = TENSOR_TOO_LARGE_ERROR
-            self._np_array = np.array([])
-        self._stats = TensorUtils.get_statistics_from_tensor(self._np_array)
-        original_buckets = calc_original_buckets(self._np_array, self._stats)
-        self._count = sum(bucket.count for bucket in original_buckets)
-        self._max = self._stats.max
-        self._min = self._stats.min
-        self._histogram = Histogram(tuple(original_buckets), self._max, self._min, self._count)
+            size = 0
+        self._size = size
+        # The float data is stored as float32 in the proto, so the values are kept without loss.
+        self._data = np.fromiter(tensor_message.float_data, dtype=np.float32, count=size) if size else None
+        self._np_array = None
+        self._stats = None
+        self._count = None
+        self._histogram = None
 
     @property
     def empty(self):
@@ -96,7 +100,7 @@ class TensorContainer:
     @property
     def size(self):
         """Get size of tensor."""
-        return self._np_array.size
+        return self._size
 
     @property
     def error_code(self):
@@ -116,38 +120,57 @@ class TensorContainer:
     @property
     def tensor_value(self):
         """Get ndarray of tensor."""
+        if self._np_array is None:
+            if self._data is None:
+                self._np_array = np.array([])
+            else:
+                self._np_array = self._data.astype(np.float64).reshape(self.dims)
         return self._np_array
 
+    @property
+    def source_value(self):
+        """Get ndarray of tensor in float32, the dtype the values are stored in."""
+        if self._data is None:
+            return np.array([], dtype=np.float32)
+        return self._data.reshape(self.dims)
+
     @property
     def max(self):
         """Get max value of tensor."""
-        return self._max
+        return self.stats.max
 
     @property
     def min(self):
         """Get min value of tensor."""
-        return self._min
+        return self.stats.min
 
     @property
     def stats(self):
         """Get statistics data of tensor."""
+        if self._stats is None:
+            self._stats = TensorUtils.get_statistics_from_tensor(self.tensor_value)
         return self._stats
 
     @property
     def count(self):
         """Get count value of tensor."""
+        if self._histogram is None:
+            _ = self.histogram
         return self._count
 
     @property
     def histogram(self):
         """Get histogram data."""
+        if self._histogram is None:
+            stats = self.stats
+            original_buckets = calc_original_buckets(self.tensor_value, stats)
+            self._count = sum(bucket.count for bucket in original_buckets)
+            self._histogram = Histogram(tuple(original_buckets), stats.max, stats.min, self._count)
         return self._histogram
 
     def buckets(self):
         """Get histogram buckets."""
-        if self._histogram is None:
-            return None
-        return self._histogram.buckets()
+        return self.histogram.buckets()
 
     def get_ndarray(self, tensor):
         """
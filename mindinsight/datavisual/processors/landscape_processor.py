@@ -18,8 +18,8 @@ from mindinsight.datavisual.common.exceptions import TrainJobNotExistError, Land
 from mindinsight.datavisual.common.log import logger
 from mindinsight.datavisual.common.validation import Validation
 from mindinsight.datavisual.processors.base_processor import BaseProcessor
-from mindinsight.lineagemgr.model import filter_summary_lineage
-from mindinsight.utils.exceptions import MindInsightException, ParamValueError
+from mindinsight.lineagemgr.model import get_summary_lineage_by_train_id
+from mindinsight.utils.exceptions import ParamValueError
 from mindinsight.datavisual.data_transform.tensor_container import TensorContainer
 
 
@@ -49,19 +49,30 @@ class LandscapeProcessor(BaseProcessor):
         intervals.sort(key=lambda interval: interval.get("value")[0])
         return dict(intervals=intervals)
 
-    def list_landscapes(self, train_ids, landscape_type='interval', interval_id=None):
-        """Get the landscape data for all train jobs."""
+    def list_landscapes(self, train_ids, landscape_type='interval', interval_id=None, binary=False):
+        """
+        Get the landscape data for all train jobs.
+
+        Args:
+            train_ids (list[str]): The train ids.
+            landscape_type (str): The landscape type, 'interval' or 'final'. Default: 'interval'.
+            interval_id (str): The interval id of landscape. Default: None.
+            binary (bool): Whether to keep the points as numpy.ndarray for the binary response. Default: False.
+
+        Returns:
+            dict, the landscapes.
+        """
         landscapes = []
         for train_id in train_ids:
             if not isinstance(train_id, str) or not train_id.startswith('./'):
                 logger.warning("The train id %s is invalid, it should be an relative path", train_id)
                 landscape = {"error_code": ParamValueError().error_code, "train_id": train_id}
             else:
-                landscape = self._get_landscape(train_id, landscape_type, interval_id)
+                landscape = self._get_landscape(train_id, landscape_type, interval_id, binary)
             landscapes.append(landscape)
         return dict(landscapes=landscapes)
 
-    def _get_landscape(self, train_id, landscape_type, interval_id):
+    def _get_landscape(self, train_id, landscape_type, interval_id, binary=False):
         """Get the landscape data."""
         train_job = self._data_manager.get_train_job_by_plugin(train_id, PluginNameEnum.LANDSCAPE.value)
         if train_job is None:
@@ -77,12 +88,12 @@ class LandscapeProcessor(BaseProcessor):
                         and not self._is_final_landscape(loss_landscape) \
                         and self._get_interval_id(loss_landscape) == interval_id:
                     landscape['train_id'] = train_id
-                    landscape['points'] = self._get_points(loss_landscape)
-                    landscape['path'] = self._get_path(loss_landscape)
+                    landscape['points'] = self._get_points(loss_landscape, binary)
+                    landscape['path'] = self._get_path(loss_landscape, binary)
 
                 if landscape_type == 'final' and self._is_final_landscape(loss_landscape):
                     landscape['train_id'] = train_id
-                    landscape['points'] = self._get_points(loss_landscape)
+                    landscape['points'] = self._get_points(loss_landscape, binary)
 
                 if landscape:
                     landscape['metadata'] = self._get_metadata(loss_landscape, train_id)
@@ -102,30 +113,31 @@ class LandscapeProcessor(BaseProcessor):
         """If the landscape is the final one."""
         return not bool(loss_landscape.loss_path.intervals)
 
-    def _get_points(self, loss_landscape):
+    def _get_points(self, loss_landscape, binary=False):
         """Get points data."""
         points = dict(
-            x=self._transform_tensor_to_list(loss_landscape.landscape.x),
-            y=self._transform_tensor_to_list(loss_landscape.landscape.y),
-            z=self._transform_tensor_to_list(loss_landscape.landscape.z)
+            x=self._transform_tensor_to_list(loss_landscape.landscape.x, binary),
+            y=self._transform_tensor_to_list(loss_landscape.landscape.y, binary),
+            z=self._transform_tensor_to_list(loss_landscape.landscape.z, binary)
         )
         return points
 
-    def _get_path(self, loss_landscape):
+    def _get_path(self, loss_landscape, binary=False):
         """Get the path of landscape."""
         path = dict(
-            x=self._transform_tensor_to_list(loss_landscape.loss_path.points.x),
-            y=self._transform_tensor_to_list(loss_landscape.loss_path.points.y),
-            z=self._transform_tensor_to_list(loss_landscape.loss_path.points.z),
+            x=self._transform_tensor_to_list(loss_landscape.loss_path.points.x, binary),
+            y=self._transform_tensor_to_list(loss_landscape.loss_path.points.y, binary),
+            z=self._transform_tensor_to_list(loss_landscape.loss_path.points.z, binary),
             intervals=list(loss_landscape.loss_path.intervals),
         )
         return path
 
     @staticmethod
-    def _transform_tensor_to_list(tensor: TensorContainer):
-        """Convert the tensor to list."""
-        data = tensor.tensor_value
-        return data.tolist()
+    def _transform_tensor_to_list(tensor: TensorContainer, binary=False):
+        """Convert the tensor to list, or keep it as numpy.ndarray for the binary response."""
+        if binary:
+            return tensor.source_value
+        return tensor.tensor_value.tolist()
 
     def _get_metadata(self, loss_landscape, train_id):
         """Get the metadata."""
@@ -140,23 +152,18 @@ class LandscapeProcessor(BaseProcessor):
 
     def _get_lineage_data(self, train_id):
         """Get the lineage data."""
-        try:
-            lineage_info = filter_summary_lineage(self._data_manager)
-        except MindInsightException:
-            lineage_info = {}
-        lineage_objects = lineage_info.get("object", [])
-        for lineage_data in lineage_objects:
-            if lineage_data.get("summary_dir") == train_id:
-                learning_rate = lineage_data.get('model_lineage', {}).get('learning_rate', None)
-                loss = lineage_data.get('model_lineage', {}).get('loss', None)
-                result = dict(
-                    network=lineage_data.get('model_lineage', {}).get('network', None),
-                    learning_rate=format(learning_rate, '6e') if learning_rate is not None else None,
-                    optimizer=lineage_data.get('model_lineage', {}).get('optimizer', None),
-                    metric=lineage_data.get('model_lineage', {}).get('metric', {}),
-                    loss=format(loss, '6e') if loss is not None else None,
-                )
-                return result
+        lineage_data = get_summary_lineage_by_train_id(self._data_manager, train_id)
+        if lineage_data is not None:
+            learning_rate = lineage_data.get('model_lineage', {}).get('learning_rate', None)
+            loss = lineage_data.get('model_lineage', {}).get('loss', None)
+            result = dict(
+                network=lineage_data.get('model_lineage', {}).get('network', None),
+                learning_rate=format(learning_rate, '6e') if learning_rate is not None else None,
+                optimizer=lineage_data.get('model_lineage', {}).get('optimizer', None),
+                metric=lineage_data.get('model_lineage', {}).get('metric', {}),
+                loss=format(loss, '6e') if loss is not None else None,
+            )
+            return result
         return dict(
             network=None,
             learning_rate=None,
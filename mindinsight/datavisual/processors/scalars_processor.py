@@ -13,67 +13,110 @@
 # limitations under the License.
 # ============================================================================
 """Scalar Processor APIs."""
+import numpy as np
+
+from mindinsight.utils.cache import LRUCache
 from mindinsight.utils.exceptions import ParamValueError
 from mindinsight.datavisual.common.log import logger
-from mindinsight.datavisual.utils.tools import if_nan_inf_to_none
+from mindinsight.datavisual.utils.downsample import DownsampleMode, downsample_indices
+from mindinsight.datavisual.utils.tools import if_nan_inf_to_none, to_int
 from mindinsight.datavisual.common.exceptions import ScalarNotExistError
 from mindinsight.datavisual.common.exceptions import TrainJobNotExistError
 from mindinsight.datavisual.common.validation import Validation
+from mindinsight.datavisual.data_transform.reservoir import ScalarSamples
 from mindinsight.datavisual.processors.base_processor import BaseProcessor
 
+MIN_DOWNSAMPLE_POINTS = 4
+MAX_DOWNSAMPLED_SCALARS_CACHE_SIZE = 4096
+# Downsampled scalars, key: (train_id, tag, max_points, downsample_mode), value: ScalarSamples.
+_DOWNSAMPLED_SCALARS_CACHE = LRUCache(MAX_DOWNSAMPLED_SCALARS_CACHE_SIZE)
+
 
 class ScalarsProcessor(BaseProcessor):
     """Scalar Processor."""
 
-    def get_metadata_list(self, train_id, tag):
+    def get_metadata_list(self, train_id, tag, max_points=None, downsample_mode=DownsampleMode.LTTB.value):
         """
         Builds a JSON-serializable object with information about scalars.
 
         Args:
             train_id (str): The ID of the events data.
             tag (str): The name of the tag the scalars all belonging to.
+            max_points (Union[str, int, None]): The max count of scalars returned, scalars are downsampled
+                if there are more. Default: None, means all scalars are returned.
+            downsample_mode (str): The downsampling algorithm, refer to `DownsampleMode`. Default: 'lttb'.
 
         Returns:
             list[dict], a list of dictionaries containing the `wall_time`, `step`, `value` for each scalar.
         """
         Validation.check_param_empty(train_id=train_id, tag=tag)
+        max_points = self._check_downsample_params(max_points, downsample_mode)
         job_response = []
         try:
             tensors = self._data_manager.list_tensors(train_id, tag)
         except ParamValueError as ex:
             raise ScalarNotExistError(ex.message)
 
-        for tensor in tensors:
+        tensors = _downsample_scalars(train_id, tag, tensors, max_points, downsample_mode)
+        wall_times, steps, values = _get_scalar_columns(tensors)
+        for wall_time, step, value in zip(wall_times, steps, values):
             job_response.append({
-                'wall_time': tensor.wall_time,
-                'step': tensor.step,
-                'value': tensor.value})
+                'wall_time': wall_time,
+                'step': step,
+                'value': value})
         return dict(metadatas=job_response)
 
-    def get_scalars(self, train_ids, tags):
+    def get_scalars(self, train_ids, tags, max_points=None, downsample_mode=DownsampleMode.LTTB.value):
         """
         Get scalar data for given train_ids and tags.
 
         Args:
             train_ids (list): Specify list of train job ID.
             tags (list): Specify list of tags.
+            max_points (Union[str, int, None]): The max count of scalars returned for each train job and tag,
+                scalars are downsampled if there are more. Default: None, means all scalars are returned.
+            downsample_mode (str): The downsampling algorithm, refer to `DownsampleMode`. Default: 'lttb'.
 
         Returns:
             list[dict], a list of dictionaries containing the `wall_time`, `step`, `value` for each scalar.
         """
+        max_points = self._check_downsample_params(max_points, downsample_mode)
         scalars = []
         for train_id in train_ids:
-            scalars += self._get_train_scalars(train_id, tags)
+            scalars += self._get_train_scalars(train_id, tags, max_points, downsample_mode)
 
         return scalars
 
-    def _get_train_scalars(self, train_id, tags):
+    @staticmethod
+    def _check_downsample_params(max_points, downsample_mode):
+        """
+        Check the downsampling parameters.
+
+        Args:
+            max_points (Union[str, int, None]): The max count of scalars returned.
+            downsample_mode (str): The downsampling algorithm.
+
+        Returns:
+            Union[int, None], the max count of scalars returned.
+        """
+        if downsample_mode not in DownsampleMode.list_members():
+            raise ParamValueError("'downsample' only can be one of {}.".format(DownsampleMode.list_members()))
+        if max_points is None:
+            return None
+        max_points = to_int(max_points, 'max_points')
+        if max_points < MIN_DOWNSAMPLE_POINTS:
+            raise ParamValueError("'max_points' should be greater than or equal to {}.".format(MIN_DOWNSAMPLE_POINTS))
+        return max_points
+
+    def _get_train_scalars(self, train_id, tags, max_points=None, downsample_mode=DownsampleMode.LTTB.value):
         """
         Get scalar data for given train_id and tags.
 
         Args:
             train_id (str): Specify train job ID.
             tags (list): Specify list of tags.
+            max_points (Union[int, None]): The max count of scalars returned for each tag. Default: None.
+            downsample_mode (str): The downsampling algorithm. Default: 'lttb'.
 
         Returns:
             list[dict], a list of dictionaries containing the `wall_time`, `step`, `value` for each scalar.
@@ -94,13 +137,75 @@ class ScalarsProcessor(BaseProcessor):
                 'values': [],
             }
 
-            for tensor in tensors:
+            tensors = _downsample_scalars(train_id, tag, tensors, max_points, downsample_mode)
+            wall_times, steps, values = _get_scalar_columns(tensors, nan_inf_to_none=True)
+            for wall_time, step, value in zip(wall_times, steps, values):
                 scalar['values'].append({
-                    'wall_time': tensor.wall_time,
-                    'step': tensor.step,
-                    'value': if_nan_inf_to_none('scalar_value', tensor.value),
+                    'wall_time': wall_time,
+                    'step': step,
+                    'value': value,
                 })
 
             scalars.append(scalar)
 
         return scalars
+
+
+def _downsample_scalars(train_id, tag, tensors, max_points, downsample_mode):
+    """
+    Downsample scalars if there are more than the max count.
+
+    Downsampled scalars are cached, and the cache is used until the samples of the tag change.
+
+    Args:
+        train_id (str): Specify train job ID.
+        tag (str): The tag name.
+        tensors (Union[ScalarSamples, list[_Tensor]]): Scalar tensors.
+        max_points (Union[int, None]): The max count of scalars, None means no downsampling.
+        downsample_mode (str): The downsampling algorithm.
+
+    Returns:
+        Union[ScalarSamples, list[_Tensor]], the downsampled scalar tensors.
+    """
+    if max_points is None or len(tensors) <= max_points:
+        return tensors
+    if not isinstance(tensors, ScalarSamples):
+        steps = np.array([tensor.step for tensor in tensors], dtype=np.float64)
+        values = np.array([tensor.value for tensor in tensors], dtype=np.float64)
+        indices = downsample_indices(steps, values, max_points, downsample_mode)
+        return [tensors[index] for index in indices.tolist()]
+
+    cache_key = (train_id, tag, max_points, downsample_mode)
+    downsampled = _DOWNSAMPLED_SCALARS_CACHE.get(cache_key)
+    if downsampled is not None and downsampled.version == tensors.version:
+        return downsampled
+    indices = downsample_indices(tensors.steps, tensors.values, max_points, downsample_mode)
+    downsampled = tensors.take(indices)
+    _DOWNSAMPLED_SCALARS_CACHE.put(cache_key, downsampled)
+    return downsampled
+
+
+def _get_scalar_columns(tensors, nan_inf_to_none=False):
+    """
+    Get wall times, steps and values of scalars as lists.
+
+    Args:
+        tensors (Union[ScalarSamples, list[_Tensor]]): Scalar tensors.
+        nan_inf_to_none (bool): Whether to transform NaN or Inf values to None.
+
+    Returns:
+        tuple[list, list, list], wall times, steps and values of scalars.
+    """
+    if not isinstance(tensors, ScalarSamples):
+        wall_times = [tensor.wall_time for tensor in tensors]
+        steps = [tensor.step for tensor in tensors]
+        values = [tensor.value for tensor in tensors]
+        if nan_inf_to_none:
+            values = [if_nan_inf_to_none('scalar_value', value) for value in values]
+        return wall_times, steps, values
+
+    values = tensors.values.tolist()
+    if nan_inf_to_none:
+        for index in np.flatnonzero(~np.isfinite(tensors.values)).tolist():
+            values[index] = None
+    return tensors.wall_times.tolist(), tensors.steps.tolist(), values
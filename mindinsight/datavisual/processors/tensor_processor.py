@@ -18,7 +18,7 @@ import numpy as np
 from mindinsight.datavisual.utils.tools import to_int
 from mindinsight.utils.exceptions import ParamValueError
 from mindinsight.utils.tensor import TensorUtils, MAX_DIMENSIONS_FOR_TENSOR
-from mindinsight.conf.constants import MAX_TENSOR_RESPONSE_DATA_SIZE
+from mindinsight.conf.constants import MAX_TENSOR_RESPONSE_DATA_SIZE, MAX_TENSOR_BINARY_RESPONSE_DATA_SIZE
 from mindinsight.datavisual.common.validation import Validation
 from mindinsight.datavisual.common.exceptions import StepTensorDataNotInCacheError, TensorNotExistError
 from mindinsight.datavisual.common.exceptions import ResponseDataExceedMaxValueError, TensorTooLargeError
@@ -29,7 +29,7 @@ from mindinsight.datavisual.proto_files import mindinsight_anf_ir_pb2 as anf_ir_
 
 class TensorProcessor(BaseProcessor):
     """Tensor Processor."""
-    def get_tensors(self, train_ids, tags, step, dims, detail):
+    def get_tensors(self, train_ids, tags, step, dims, detail, binary=False):
         """
         Get tensor data for given train_ids, tags, step, dims and detail.
 
@@ -39,6 +39,7 @@ class TensorProcessor(BaseProcessor):
             step (int): Specify step of tag, it's necessary when detail is equal to 'data'.
             dims (str): Specify dims of step, it's necessary when detail is equal to 'data'.
             detail (str): Specify which data to query, available values: 'stats', 'histogram' and 'data'.
+            binary (bool): Whether to keep the data as numpy.ndarray for the binary response. Default: False.
 
         Returns:
             dict, a dict including the `tensors`.
@@ -48,11 +49,11 @@ class TensorProcessor(BaseProcessor):
 
         tensors = []
         for train_id in train_ids:
-            tensors += self._get_train_tensors(train_id, tags, step, dims, detail)
+            tensors += self._get_train_tensors(train_id, tags, step, dims, detail, binary)
 
         return {"tensors": tensors}
 
-    def _get_train_tensors(self, train_id, tags, step, dims, detail):
+    def _get_train_tensors(self, train_id, tags, step, dims, detail, binary=False):
         """
         Get tensor data for given train_id, tags, step, dims and detail.
 
@@ -62,6 +63,7 @@ class TensorProcessor(BaseProcessor):
             step (int): Specify step of tensor, it's necessary when detail is set to 'data'.
             dims (str): Specify dims of tensor, it's necessary when detail is set to 'data'.
             detail (str): Specify which data to query, available values: 'stats', 'histogram' and 'data'.
+            binary (bool): Whether to keep the data as numpy.ndarray for the binary response. Default: False.
 
         Returns:
             list[dict], a list of dictionaries containing the `train_id`, `tag`, `values`.
@@ -89,7 +91,7 @@ class TensorProcessor(BaseProcessor):
                 # Limit to query max two dimensions for tensor in table view.
                 dims = TensorUtils.parse_shape(dims, limit=MAX_DIMENSIONS_FOR_TENSOR)
                 step = to_int(step, "step")
-                values = self._get_tensors_data(step, dims, tensors)
+                values = self._get_tensors_data(step, dims, tensors, binary)
             elif detail == 'histogram':
                 values = self._get_tensors_histogram(tensors)
             else:
@@ -154,7 +156,7 @@ class TensorProcessor(BaseProcessor):
 
         return values
 
-    def _get_tensors_data(self, step, dims, tensors):
+    def _get_tensors_data(self, step, dims, tensors, binary=False):
         """
         Builds a JSON-serializable object with information about tensor dims data.
 
@@ -162,6 +164,8 @@ class TensorProcessor(BaseProcessor):
             step (int): Specify step of tensor.
             dims (tuple): Specify dims of tensor.
             tensors (list): The list of _Tensor data.
+            binary (bool): Whether to keep the data as numpy.ndarray for the binary response, in which NAN and INF
+                are kept as they are. Default: False.
 
         Returns:
             dict, a dict including the `wall_time`, `step`, and `value' for each tensor.
@@ -199,10 +203,10 @@ class TensorProcessor(BaseProcessor):
             if value.error_code is not None:
                 raise TensorTooLargeError("Step: {}".format(tensor.step))
             res_data = TensorUtils.get_specific_dims_data(value.tensor_value, dims)
-            flatten_data = res_data.flatten().tolist()
-            if len(flatten_data) > MAX_TENSOR_RESPONSE_DATA_SIZE:
+            max_data_size = MAX_TENSOR_BINARY_RESPONSE_DATA_SIZE if binary else MAX_TENSOR_RESPONSE_DATA_SIZE
+            if res_data.size > max_data_size:
                 raise ResponseDataExceedMaxValueError("the size of response data: {} exceed max value: {}."
-                                                      .format(len(flatten_data), MAX_TENSOR_RESPONSE_DATA_SIZE))
+                                                      .format(res_data.size, max_data_size))
 
             def transfer(array):
                 if not isinstance(array, np.ndarray):
@@ -224,8 +228,15 @@ class TensorProcessor(BaseProcessor):
                             transfer_data[index] = float(data)
                 return transfer_data
 
-            stats = TensorUtils.get_statistics_from_tensor(res_data)
-            if stats.nan_count + stats.neg_inf_count + stats.pos_inf_count > 0:
+            if res_data.size == value.tensor_value.size:
+                # The dims select the whole tensor, whose statistics are calculated already.
+                stats = value.stats
+            else:
+                stats = TensorUtils.get_statistics_from_tensor(res_data)
+            if binary:
+                # The data are sent in the dtype they are stored in, which is half the size of float64.
+                tensor_data = TensorUtils.get_specific_dims_data(value.source_value, dims)
+            elif stats.nan_count + stats.neg_inf_count + stats.pos_inf_count > 0:
                 tensor_data = transfer(res_data)
             else:
                 tensor_data = res_data.tolist()
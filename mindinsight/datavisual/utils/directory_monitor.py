@@ -0,0 +1,212 @@
+# Copyright 2026 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Monitor changes of directory entries with inotify on Linux."""
+import ctypes
+import ctypes.util
+import os
+import struct
+import sys
+import threading
+import weakref
+
+from mindinsight.datavisual.common.log import logger
+
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+
+_WATCH_MASK = _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | \
+              _IN_DELETE | _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR
+
+# struct inotify_event {int wd; uint32_t mask; uint32_t cookie; uint32_t len; char name[];}
+_EVENT_HEADER = struct.Struct('iIII')
+_READ_SIZE = 64 * 1024
+
+
+class DirectoryMonitor:
+    """
+    Monitor the changes of the entries in watched directories, only the direct entries are monitored.
+
+    Use `DirectoryMonitor.create` to create a monitor, which returns None if inotify is not available. A monitor can
+    be shared by several owners, e.g. summary watchers. Each owner watches its own directories and fetches its own
+    changes, and a directory is watched until all its owners stop watching it. The monitor should be closed when it
+    is not used any more, else the inotify instance is released only when the monitor is garbage collected.
+    """
+
+    def __init__(self, fd, libc):
+        self._fd = fd
+        self._libc = libc
+        self._lock = threading.Lock()
+        self._wd_to_path = {}
+        self._path_to_wd = {}
+        self._path_owners = {}
+        self._changed_paths = {}
+        self._overflowed_owners = set()
+        self._finalizer = weakref.finalize(self, os.close, fd)
+
+    @classmethod
+    def create(cls):
+        """
+        Create a directory monitor.
+
+        Returns:
+            Union[DirectoryMonitor, None], the monitor, or None if inotify is not available.
+        """
+        if not sys.platform.startswith('linux'):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError) as ex:
+            logger.info("Inotify is not available, detail: %s.", str(ex))
+            return None
+        if fd < 0:
+            logger.info("Inotify is not available, errno: %d.", ctypes.get_errno())
+            return None
+        return cls(fd, libc)
+
+    @property
+    def closed(self):
+        """Whether the monitor is closed."""
+        return not self._finalizer.alive
+
+    def is_watching(self, path, owner):
+        """Whether the directory is being watched for the owner."""
+        with self._lock:
+            return owner in self._path_owners.get(path, ())
+
+    def watch(self, path, owner):
+        """
+        Watch the directory for the owner.
+
+        Args:
+            path (str): The real path of the directory.
+            owner (object): The owner of the watch.
+
+        Returns:
+            bool, True if the directory is being watched.
+        """
+        with self._lock:
+            if path in self._path_to_wd:
+                self._path_owners[path].add(owner)
+                return True
+            if self.closed:
+                return False
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), _WATCH_MASK)
+            if wd < 0:
+                # Usually the limit of watches is reached, the directory should be polled.
+                logger.debug("Watch directory %s failed, errno: %d.", path, ctypes.get_errno())
+                return False
+            self._wd_to_path[wd] = path
+            self._path_to_wd[path] = wd
+            self._path_owners[path] = {owner}
+            return True
+
+    def unwatch(self, path, owner):
+        """
+        Stop watching the directory for the owner.
+
+        Args:
+            path (str): The real path of the directory.
+            owner (object): The owner of the watch.
+        """
+        with self._lock:
+            owners = self._path_owners.get(path)
+            if owners is None:
+                return
+            owners.discard(owner)
+            if owners:
+                return
+            del self._path_owners[path]
+            wd = self._path_to_wd.pop(path)
+            self._wd_to_path.pop(wd, None)
+            if not self.closed:
+                self._libc.inotify_rm_watch(self._fd, wd)
+
+    def fetch_changed_paths(self, owner):
+        """
+        Fetch the directories watched for the owner whose entries changed since the last fetching of the owner.
+
+        Args:
+            owner (object): The owner of the watches.
+
+        Returns:
+            Union[set[str], None], paths of the changed directories, None if events are lost and all the watched
+                directories should be treated as changed.
+        """
+        with self._lock:
+            while not self.closed:
+                try:
+                    data = os.read(self._fd, _READ_SIZE)
+                except BlockingIOError:
+                    break
+                except OSError as ex:
+                    logger.warning("Read inotify events failed, detail: %s.", str(ex))
+                    self._set_overflowed()
+                    break
+                if not data:
+                    break
+                self._parse_events(data)
+
+            changed_paths = self._changed_paths.pop(owner, set())
+            if owner in self._overflowed_owners:
+                self._overflowed_owners.discard(owner)
+                return None
+            return changed_paths
+
+    def _set_overflowed(self):
+        """Mark events lost for all the owners."""
+        for owners in self._path_owners.values():
+            self._overflowed_owners.update(owners)
+
+    def _parse_events(self, data):
+        """Parse the raw inotify events."""
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _, name_len = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size + name_len
+            if mask & _IN_Q_OVERFLOW:
+                self._set_overflowed()
+                continue
+            path = self._wd_to_path.get(wd)
+            if path is None:
+                continue
+            owners = self._path_owners[path]
+            for owner in owners:
+                self._changed_paths.setdefault(owner, set()).add(path)
+            if mask & _IN_IGNORED:
+                # The watch is removed by the kernel, e.g. the directory is deleted.
+                self._wd_to_path.pop(wd, None)
+                self._path_to_wd.pop(path, None)
+                self._path_owners.pop(path, None)
+
+    def close(self):
+        """Close the monitor, the directories are not watched any more."""
+        with self._lock:
+            self._finalizer()
+            self._wd_to_path.clear()
+            self._path_to_wd.clear()
+            self._path_owners.clear()
+            self._changed_paths.clear()
+            self._overflowed_owners.clear()
@@ -0,0 +1,120 @@
+# Copyright 2026 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Shape-preserving downsampling of series."""
+import enum
+
+import numpy as np
+
+
+class DownsampleMode(enum.Enum):
+    """Downsampling algorithms."""
+    LTTB = 'lttb'
+    MIN_MAX = 'minmax'
+
+    @classmethod
+    def list_members(cls):
+        """List all members."""
+        return [member.value for member in cls]
+
+
+def lttb_indices(x, y, max_points):
+    """
+    Select points with the Largest-Triangle-Three-Buckets algorithm.
+
+    The first and last points are always kept, the other points are split into `max_points - 2` buckets,
+    and the point forming the largest triangle with the previously selected point and the average point
+    of the next bucket is selected in each bucket. Non-finite values are always selected in their buckets.
+
+    Args:
+        x (numpy.ndarray): X values in increasing order.
+        y (numpy.ndarray): Y values.
+        max_points (int): The max count of selected points, should be at least 3.
+
+    Returns:
+        numpy.ndarray, indexes of selected points in increasing order.
+    """
+    count = len(x)
+    if count <= max_points:
+        return np.arange(count)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    bounds = np.linspace(1, count - 1, max_points - 1).astype(np.int64)
+    bucket_sizes = np.diff(bounds)
+    # The average points of each bucket, the average of the last bucket is the last point.
+    avg_x = np.append(np.add.reduceat(x[1:count - 1], bounds[:-1] - 1) / bucket_sizes, x[-1])
+    avg_y = np.append(np.add.reduceat(y[1:count - 1], bounds[:-1] - 1) / bucket_sizes, y[-1])
+
+    indices = np.empty(max_points, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = count - 1
+    selected = 0
+    for bucket in range(max_points - 2):
+        start, end = bounds[bucket], bounds[bucket + 1]
+        next_x, next_y = avg_x[bucket + 1], avg_y[bucket + 1]
+        areas = np.abs((x[selected] - next_x) * (y[start:end] - y[selected])
+                       - (x[selected] - x[start:end]) * (next_y - y[selected]))
+        areas[~np.isfinite(areas)] = np.inf
+        selected = start + int(np.argmax(areas))
+        indices[bucket + 1] = selected
+    return indices
+
+
+def min_max_indices(y, max_points):
+    """
+    Select the min and max points of each bucket.
+
+    The first and last points are always kept, the other points are split into `(max_points - 2) // 2` buckets,
+    and the min and max points are selected in each bucket. NaN values are treated as max values.
+
+    Args:
+        y (numpy.ndarray): Y values.
+        max_points (int): The max count of selected points, should be at least 4.
+
+    Returns:
+        numpy.ndarray, indexes of selected points in increasing order.
+    """
+    count = len(y)
+    if count <= max_points:
+        return np.arange(count)
+
+    y = np.asarray(y, dtype=np.float64)
+    bucket_count = (max_points - 2) // 2
+    bucket_ids = np.repeat(np.arange(bucket_count), np.diff(np.linspace(1, count - 1, bucket_count + 1)
+                                                             .astype(np.int64)))
+    # Sort points by bucket and value, so the first and last point of each bucket are the min and max points.
+    order = np.lexsort((y[1:count - 1], bucket_ids)) + 1
+    bucket_ends = np.cumsum(np.bincount(bucket_ids, minlength=bucket_count))
+    bucket_starts = bucket_ends - np.bincount(bucket_ids, minlength=bucket_count)
+    selected = np.concatenate(([0], order[bucket_starts], order[bucket_ends - 1], [count - 1]))
+    return np.unique(selected)
+
+
+def downsample_indices(x, y, max_points, mode=DownsampleMode.LTTB.value):
+    """
+    Select points to draw the shape of the series with at most `max_points` points.
+
+    Args:
+        x (numpy.ndarray): X values in increasing order.
+        y (numpy.ndarray): Y values.
+        max_points (int): The max count of selected points.
+        mode (str): The downsampling algorithm, refer to `DownsampleMode`. Default: 'lttb'.
+
+    Returns:
+        numpy.ndarray, indexes of selected points in increasing order.
+    """
+    if mode == DownsampleMode.MIN_MAX.value:
+        return min_max_indices(y, max_points)
+    return lttb_indices(x, y, max_points)
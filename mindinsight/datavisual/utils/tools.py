@@ -14,11 +14,15 @@
 # ============================================================================
 """Common Tools."""
 import imghdr
+import json
 import math
 import os
+import struct
 
 from numbers import Number
 
+import numpy as np
+
 from mindinsight.datavisual.common.exceptions import MaxCountExceededError
 from mindinsight.datavisual.common.exceptions import PathNotDirectoryError
 from mindinsight.datavisual.common.log import logger
@@ -32,6 +36,9 @@ _IMG_EXT_TO_MIMETYPE = {
     'png': 'image/png',
 }
 _DEFAULT_IMAGE_MIMETYPE = 'application/octet-stream'
+BINARY_RESPONSE_MIMETYPE = 'application/octet-stream'
+# The buffers in binary response are aligned, so they can be viewed as typed arrays without copy.
+_BINARY_ALIGNMENT = 8
 
 
 def find_app_package():
@@ -158,6 +165,48 @@ def if_nan_inf_to_none(name, value):
     return value
 
 
+def encode_binary_response(response):
+    """
+    Encode the response with numpy.ndarray values into binary.
+
+    The binary consists of the header length in little-endian uint32, the JSON header padded with spaces, and the
+    data section. Each numpy.ndarray in the response is replaced in the header by the descriptor
+    `{"__ndarray__": {"dtype": str, "shape": list[int], "offset": int, "byte_length": int}}`, and its data are
+    put in the data section in little-endian C order, with the offset relative to the start of data section.
+    The header and the buffers are aligned to 8 bytes, and NaN and INF are kept as IEEE 754 values.
+
+    Args:
+        response (Any): The JSON-serializable response, with numpy.ndarray values.
+
+    Returns:
+        bytes, the binary response.
+    """
+    buffers = []
+    data_size = 0
+
+    def replace_ndarray(value):
+        nonlocal data_size
+        if isinstance(value, np.ndarray):
+            array = np.require(value, dtype=value.dtype.newbyteorder('<'), requirements='C')
+            descriptor = {'dtype': array.dtype.name, 'shape': list(array.shape),
+                          'offset': data_size, 'byte_length': array.nbytes}
+            buffers.append(array.reshape(-1).view(np.uint8))
+            padding = -array.nbytes % _BINARY_ALIGNMENT
+            if padding:
+                buffers.append(bytes(padding))
+            data_size += array.nbytes + padding
+            return {'__ndarray__': descriptor}
+        if isinstance(value, dict):
+            return {key: replace_ndarray(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [replace_ndarray(item) for item in value]
+        return value
+
+    header = json.dumps(replace_ndarray(response)).encode('utf-8')
+    header += b' ' * (-(len(header) + 4) % _BINARY_ALIGNMENT)
+    return b''.join([struct.pack('<I', len(header)), header] + buffers)
+
+
 def exception_wrapper(func):
     """Exception wrapper"""
     def wrapper(*args, **kwargs):
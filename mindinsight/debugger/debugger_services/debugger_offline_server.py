@@ -37,8 +37,12 @@ from mindinsight.debugger.proto.debug_grpc_pb2 import EventReply
 from mindinsight.debugger.stream_cache.data_loader import DataLoader
 from mindinsight.debugger.stream_operator.watchpoint_operator import WatchpointOperator
 from mindinsight.domain.graph.proto.ms_graph_pb2 import TensorProto
+from mindinsight.utils.cache import LRUCache
 from mindinsight.utils.exceptions import MindInsightException
 
+# The max total count of the files in the cached dump directory indexes.
+MAX_DUMP_DIR_INDEX_FILES = 1000000
+
 
 class DebuggerOfflineServer(DebuggerServerBase):
     """Debugger Offline Server."""
@@ -104,6 +108,7 @@ class DebuggerOfflineManager:
         self.check_toolkit(self._data_loader)
         self._is_running_flag = False
         self._old_run_cmd = {}
+        self._dump_dir_indexes = LRUCache(MAX_DUMP_DIR_INDEX_FILES)
 
     def stop(self):
         """Stop server."""
@@ -706,40 +711,45 @@ class DebuggerOfflineManager:
         Returns:
             int, the time stamp of the watchpointhit.
         """
-        res = 0
         name = watchpointhit['name']
-        slot = watchpointhit['slot']
-        iteration = step
-        rank_id = watchpointhit['rank_id']
-        root_graph_id = watchpointhit['root_graph_id']
-        tensor_files = self.find_tensor_file(name, slot, iteration, rank_id, root_graph_id)
-        node_name = name.rsplit('/')[-1]
-        for tensor_file in tensor_files:
-            try:
-                file_name = tensor_file
-                node_name_location = file_name.find(node_name)
-                post_str = file_name[node_name_location + len(node_name):]
-                time_str = post_str.split('.')[3]
-                time_stamp = int(time_str)
-                if time_stamp > res:
-                    res = time_stamp
-            except (ValueError, TypeError, IndexError) as err:
-                log.error("Can not find time_stamp in file: %s, the detail error is: %s.", tensor_file, err)
-                continue
+        dump_dir_index = self._get_dump_dir_index(step, watchpointhit['root_graph_id'], watchpointhit['rank_id'])
+        res = dump_dir_index.get_timestamp(name.rsplit('/')[-1], watchpointhit['slot'])
         log.debug("Time stamp is: %s.", res)
         return res
 
     def find_tensor_file(self, name, slot, iteration, rank_id, root_graph_id):
         """Find the tensor file."""
-        iteration_path = self.get_iteration_path(iteration, root_graph_id, rank_id)
+        dump_dir_index = self._get_dump_dir_index(iteration, root_graph_id, rank_id)
         # Find the pure node_name without scope
         node_name = name.rsplit('/')[-1]
-        tensor_files = [fname for fname in os.listdir(iteration_path) if
-                        re.match(r"[^\.]+\.{}\.[0-9]+\.[0-9]+\.[0-9]+\.output\.{}.*\.npy".format(node_name, slot),
-                                 fname)]
-        log.debug("Find %s files in path: %s.", len(tensor_files), iteration_path)
+        tensor_files = dump_dir_index.get_files(node_name, slot)
+        log.debug("Find %s files in path: %s.", len(tensor_files), dump_dir_index.dir_path)
         return tensor_files
 
+    def _get_dump_dir_index(self, iteration, root_graph_id, rank_id):
+        """
+        Get the index of the tensor files in the iteration directory.
+
+        The index is cached for each iteration, and it is rebuilt if the directory is modified.
+
+        Args:
+            iteration (int): The iteration id.
+            root_graph_id (int): The root graph id.
+            rank_id (int): The rank id.
+
+        Returns:
+            DumpDirIndex, the index of the iteration directory.
+        """
+        iteration_path = self.get_iteration_path(iteration, root_graph_id, rank_id)
+        dir_mtime = os.stat(iteration_path).st_mtime_ns
+        cache_key = (rank_id, root_graph_id, iteration)
+        cached = self._dump_dir_indexes.get(cache_key)
+        if cached is not None and cached[0] == dir_mtime and cached[1].dir_path == iteration_path:
+            return cached[1]
+        dump_dir_index = DumpDirIndex(iteration_path)
+        self._dump_dir_indexes.put(cache_key, (dir_mtime, dump_dir_index), max(dump_dir_index.file_count, 1))
+        return dump_dir_index
+
     def get_iteration_path(self, iteration, root_graph_id, rank_id):
         """Get the path of tensors in current iteration."""
         dump_dir = self._data_loader.get_dump_dir()
@@ -824,6 +834,61 @@ class CommandListener:
         return event
 
 
+class DumpDirIndex:
+    """
+    The index of the output tensor files in the dump directory of an iteration.
+
+    The file name is like `{op_type}.{op_name}.{task_id}.{stream_id}.{timestamp}.output.{slot}.{format}.npy`, the
+    files are grouped by the op name and the slot.
+
+    Args:
+        dir_path (str): The dump directory of the iteration.
+    """
+    _FILE_NAME_PATTERN = re.compile(
+        r"[^\.]+\.(?P<node_name>.+)\.[0-9]+\.[0-9]+\.(?P<timestamp>[0-9]+)\.output\.(?P<slot>[0-9]+)(\..*)?\.npy")
+
+    def __init__(self, dir_path):
+        self.dir_path = dir_path
+        self.file_count = 0
+        self._files = defaultdict(list)
+        self._timestamps = {}
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                match = self._FILE_NAME_PATTERN.match(entry.name)
+                if match is None:
+                    continue
+                key = (match.group('node_name'), match.group('slot'))
+                self._files[key].append(entry.name)
+                self._timestamps[key] = max(self._timestamps.get(key, 0), int(match.group('timestamp')))
+                self.file_count += 1
+
+    def get_files(self, node_name, slot):
+        """
+        Get the output tensor files of the node.
+
+        Args:
+            node_name (str): The op name without scope.
+            slot (Union[int, str]): The output slot.
+
+        Returns:
+            list[str], the file names.
+        """
+        return list(self._files.get((node_name, str(slot)), []))
+
+    def get_timestamp(self, node_name, slot):
+        """
+        Get the latest timestamp of the output tensor files of the node.
+
+        Args:
+            node_name (str): The op name without scope.
+            slot (Union[int, str]): The output slot.
+
+        Returns:
+            int, the latest timestamp, 0 if there is no file.
+        """
+        return self._timestamps.get((node_name, str(slot)), 0)
+
+
 def convert_watchpointhit(watchpointhit):
     """Convert watchpointhit object to dict."""
     parameters = watchpointhit.parameters
@@ -0,0 +1,159 @@
+# Copyright 2026 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""The cache of rendered images."""
+import hashlib
+import os
+import threading
+
+from mindinsight.conf import settings
+from mindinsight.explainer.common.log import logger
+from mindinsight.utils.cache import LRUCache, write_cache_file
+
+# The max total size of the images cached in memory, in bytes.
+MAX_MEMORY_CACHE_SIZE = 256 * 1024 * 1024
+# The max total size of the images cached on disk, in bytes.
+MAX_DISK_CACHE_SIZE = 1024 * 1024 * 1024
+
+_IMAGE_SUFFIX = '.png'
+
+
+def get_image_cache_dir():
+    """Get the directory to store rendered images."""
+    return os.path.join(settings.WORKSPACE, 'cache', 'explainer_image')
+
+
+def get_etag(key):
+    """
+    Get the ETag of the image.
+
+    Args:
+        key (tuple): The key of the image, which contains the modification time of the source files.
+
+    Returns:
+        str, the ETag.
+    """
+    return hashlib.sha256(repr(key).encode('utf-8')).hexdigest()
+
+
+class RenderedImageCache:
+    """
+    The cache of rendered images.
+
+    The images are kept in memory, and also saved in the workspace if `ENABLE_EXPLAINER_IMAGE_DISK_CACHE` is set.
+    The images are found by their ETags, so an image is rendered again once its source files change. The oldest
+    images on disk are removed when the total size exceeds the max size.
+
+    Args:
+        max_memory_size (int): The max total size of the images in memory. Default: MAX_MEMORY_CACHE_SIZE.
+        max_disk_size (int): The max total size of the images on disk. Default: MAX_DISK_CACHE_SIZE.
+    """
+
+    def __init__(self, max_memory_size=MAX_MEMORY_CACHE_SIZE, max_disk_size=MAX_DISK_CACHE_SIZE):
+        self._images = LRUCache(max_memory_size)
+        self._max_disk_size = max_disk_size
+        self._disk_size = None
+        self._disk_lock = threading.Lock()
+
+    def get(self, etag):
+        """
+        Get the image.
+
+        Args:
+            etag (str): The ETag of the image.
+
+        Returns:
+            Union[bytes, None], the image, None if it is not cached.
+        """
+        image = self._images.get(etag)
+        if image is None and settings.ENABLE_EXPLAINER_IMAGE_DISK_CACHE:
+            image = self._load(etag)
+            if image is not None:
+                self._images.put(etag, image, len(image))
+        return image
+
+    def put(self, etag, image):
+        """
+        Put the image.
+
+        Args:
+            etag (str): The ETag of the image.
+            image (bytes): The image.
+        """
+        self._images.put(etag, image, len(image))
+        if settings.ENABLE_EXPLAINER_IMAGE_DISK_CACHE:
+            self._save(etag, image)
+
+    def clear(self):
+        """Clear the images in memory."""
+        self._images.clear()
+
+    def _load(self, etag):
+        """Load the image from disk, the image is touched so it is removed later."""
+        image_path = os.path.join(get_image_cache_dir(), etag + _IMAGE_SUFFIX)
+        try:
+            with open(image_path, 'rb') as image_file:
+                image = image_file.read()
+            os.utime(image_path)
+        except FileNotFoundError:
+            return None
+        except OSError as ex:
+            logger.warning("Load rendered image failed, file path: %s, detail: %s.", image_path, str(ex))
+            return None
+        return image
+
+    def _save(self, etag, image):
+        """Save the image to disk, and remove the oldest images if the total size exceeds the max size."""
+        cache_dir = get_image_cache_dir()
+        image_path = os.path.join(cache_dir, etag + _IMAGE_SUFFIX)
+        with self._disk_lock:
+            try:
+                write_cache_file(image_path, lambda image_file: image_file.write(image))
+                if self._disk_size is None:
+                    # The first image saved is counted in the listing.
+                    self._disk_size = sum(size for _, size, _ in self._list_images(cache_dir))
+                else:
+                    self._disk_size += len(image)
+                if self._disk_size > self._max_disk_size:
+                    self._remove_oldest(cache_dir)
+            except OSError as ex:
+                logger.warning("Save rendered image failed, file path: %s, detail: %s.", image_path, str(ex))
+
+    def _remove_oldest(self, cache_dir):
+        """Remove the oldest images until the total size is within half of the max size."""
+        images = sorted(self._list_images(cache_dir), key=lambda image: image[2])
+        self._disk_size = sum(size for _, size, _ in images)
+        for image_path, size, _ in images:
+            if self._disk_size <= self._max_disk_size // 2:
+                break
+            try:
+                os.remove(image_path)
+            except FileNotFoundError:
+                pass
+            self._disk_size -= size
+
+    @staticmethod
+    def _list_images(cache_dir):
+        """List the path, size and modification time of the images on disk."""
+        images = []
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(_IMAGE_SUFFIX):
+                    continue
+                try:
+                    entry_stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                images.append((entry.path, entry_stat.st_size, entry_stat.st_mtime_ns))
+        return images
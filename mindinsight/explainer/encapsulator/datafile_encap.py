@@ -14,6 +14,7 @@
 # ============================================================================
 """Datafile encapsulator."""
 
+import contextlib
 import io
 import os
 
@@ -23,6 +24,7 @@ from PIL import Image
 from mindinsight.datavisual.common.exceptions import ImageNotExistError
 from mindinsight.explainer.common.enums import ImageQueryTypes
 from mindinsight.explainer.encapsulator._hoc_pil_apply import EditStep, pil_apply_edit_steps
+from mindinsight.explainer.encapsulator._image_cache import RenderedImageCache, get_etag
 from mindinsight.explainer.encapsulator.explain_data_encap import ExplainDataEncap
 from mindinsight.utils.exceptions import FileSystemPermissionError
 from mindinsight.utils.exceptions import UnknownError
@@ -43,6 +45,9 @@ _RGB_MODE = "RGB"
 
 _PNG_FORMAT = "PNG"
 
+# The rendered overlay and outcome images.
+_RENDERED_IMAGES = RenderedImageCache()
+
 
 def _clean_train_id_b4_join(train_id):
     """Clean train_id before joining to a path."""
@@ -51,6 +56,36 @@ def _clean_train_id_b4_join(train_id):
     return train_id
 
 
+def _get_saliency_cmap():
+    """
+    Get the RGBA colors of the saliency intensities.
+
+    Returns:
+        numpy.ndarray, the uint8 colors of the intensities from 0 to 255, in shape of (256, 4).
+    """
+    saliency = np.arange(_UINT8_MAX + 1)[:, np.newaxis] / _UINT8_MAX
+    rgba = saliency * _SALIENCY_CMAP_HI
+    rgba += (1 - saliency) * _SALIENCY_CMAP_LOW
+    rgba[:, 3] = saliency[:, 0] * _UINT8_MAX
+    return np.uint8(rgba)
+
+
+_SALIENCY_CMAP = _get_saliency_cmap()
+
+
+@contextlib.contextmanager
+def _translate_image_error(train_id, image_path, image_type):
+    """Translate the errors of reading an image file."""
+    try:
+        yield
+    except FileNotFoundError:
+        raise ImageNotExistError(f"train_id:{train_id} path:{image_path} type:{image_type}")
+    except PermissionError:
+        raise FileSystemPermissionError(f"train_id:{train_id} path:{image_path} type:{image_type}")
+    except OSError:
+        raise UnknownError(f"Invalid image file: train_id:{train_id} path:{image_path} type:{image_type}")
+
+
 class DatafileEncap(ExplainDataEncap):
     """Datafile encapsulator."""
 
@@ -58,6 +93,8 @@ class DatafileEncap(ExplainDataEncap):
         """
         Query image binary content.
 
+        The overlay and outcome images are cached once rendered.
+
         Args:
             train_id (str): Job ID.
             image_path (str): Image path relative to explain job's summary directory.
@@ -69,20 +106,72 @@ class DatafileEncap(ExplainDataEncap):
         if image_type == ImageQueryTypes.OUTCOME.value:
             return self._get_hoc_image(image_path, train_id)
 
+        abs_image_path = self._get_abs_image_path(train_id, image_path)
+        if image_type != ImageQueryTypes.OVERLAY.value:
+            # no need to convert
+            with _translate_image_error(train_id, image_path, image_type), open(abs_image_path, "rb") as fp:
+                return fp.read()
+
+        etag = self._get_image_etag(train_id, image_path, image_type, abs_image_path)
+        image = _RENDERED_IMAGES.get(etag)
+        if image is None:
+            image = self._get_overlay_image(abs_image_path, train_id, image_path, image_type)
+            _RENDERED_IMAGES.put(etag, image)
+        return image
+
+    def query_image_etag(self, train_id, image_path, image_type):
+        """
+        Query the ETag of the image, which changes when the image changes.
+
+        Args:
+            train_id (str): Job ID.
+            image_path (str): Image path relative to explain job's summary directory.
+            image_type (str): Image type, Options: 'original', 'overlay' or 'outcome'.
+
+        Returns:
+            str, the ETag of the image.
+        """
+        if image_type == ImageQueryTypes.OUTCOME.value:
+            job, sample, _, _ = self._get_hoc_sample(image_path, train_id)
+            abs_image_path = self._get_abs_image_path(train_id, sample['image'])
+            return self._get_image_etag(train_id, image_path, image_type, abs_image_path, job.update_time)
+
+        abs_image_path = self._get_abs_image_path(train_id, image_path)
+        return self._get_image_etag(train_id, image_path, image_type, abs_image_path)
+
+    def _get_abs_image_path(self, train_id, image_path):
+        """Get the absolute path of the image file, which should be in summary base dir."""
         abs_image_path = os.path.join(self.job_manager.summary_base_dir,
                                       _clean_train_id_b4_join(train_id),
                                       image_path)
 
         if self._is_forbidden(abs_image_path):
             raise FileSystemPermissionError("Forbidden.")
+        return abs_image_path
 
-        try:
+    @staticmethod
+    def _get_image_etag(train_id, image_path, image_type, abs_image_path, version=None):
+        """
+        Get the ETag of the image by the modification time and size of the image file.
 
-            if image_type != ImageQueryTypes.OVERLAY.value:
-                # no need to convert
-                with open(abs_image_path, "rb") as fp:
-                    return fp.read()
+        Args:
+            train_id (str): Job ID.
+            image_path (str): Image path relative to explain job's summary directory.
+            image_type (str): Image type, Options: 'original', 'overlay' or 'outcome'.
+            abs_image_path (str): The absolute path of the image file.
+            version (Any): The version of the other data to render the image. Default: None.
 
+        Returns:
+            str, the ETag of the image.
+        """
+        with _translate_image_error(train_id, image_path, image_type):
+            file_stat = os.stat(abs_image_path)
+        return get_etag((train_id, image_path, image_type, file_stat.st_mtime_ns, file_stat.st_size, version))
+
+    @staticmethod
+    def _get_overlay_image(abs_image_path, train_id, image_path, image_type):
+        """Get the image of saliency map in the color map for image data demonstration in UI."""
+        with _translate_image_error(train_id, image_path, image_type):
             image = Image.open(abs_image_path)
 
             if image.mode == _RGBA_MODE:
@@ -90,29 +179,14 @@ class DatafileEncap(ExplainDataEncap):
                 with open(abs_image_path, "rb") as fp:
                     return fp.read()
 
-        except FileNotFoundError:
-            raise ImageNotExistError(f"train_id:{train_id} path:{image_path} type:{image_type}")
-        except PermissionError:
-            raise FileSystemPermissionError(f"train_id:{train_id} path:{image_path} type:{image_type}")
-        except OSError:
-            raise UnknownError(f"Invalid image file: train_id:{train_id} path:{image_path} type:{image_type}")
-
-        if image.mode == _SINGLE_CHANNEL_MODE:
-            saliency = np.asarray(image) / _UINT8_MAX
-        elif image.mode == _RGB_MODE:
             saliency = np.asarray(image)
-            saliency = saliency[:, :, 0] / _UINT8_MAX
-        else:
-            raise UnknownError(f"Invalid overlay image mode:{image.mode}.")
 
-        saliency_stack = np.empty((saliency.shape[0], saliency.shape[1], 4))
-        for c in range(3):
-            saliency_stack[:, :, c] = saliency
-        rgba = saliency_stack * _SALIENCY_CMAP_HI
-        rgba += (1 - saliency_stack) * _SALIENCY_CMAP_LOW
-        rgba[:, :, 3] = saliency * _UINT8_MAX
+        if image.mode == _RGB_MODE:
+            saliency = saliency[:, :, 0]
+        elif image.mode != _SINGLE_CHANNEL_MODE:
+            raise UnknownError(f"Invalid overlay image mode:{image.mode}.")
 
-        overlay = Image.fromarray(np.uint8(rgba), mode=_RGBA_MODE)
+        overlay = Image.fromarray(_SALIENCY_CMAP[saliency], mode=_RGBA_MODE)
         buffer = io.BytesIO()
         overlay.save(buffer, format=_PNG_FORMAT)
 
@@ -124,9 +198,8 @@ class DatafileEncap(ExplainDataEncap):
         path = os.path.realpath(path)
         return not path.startswith(base_dir)
 
-    def _get_hoc_image(self, image_path, train_id):
-        """Get hoc image for image data demonstration in UI."""
-
+    def _get_hoc_sample(self, image_path, train_id):
+        """Get the job, the sample, the label index and the layer of the hoc image."""
         sample_id, label, layer = image_path.strip(".jpg").split("_")
         layer = int(layer)
         job = self.job_manager.get_job(train_id)
@@ -134,21 +207,23 @@ class DatafileEncap(ExplainDataEncap):
         label_idx = job.labels.index(label)
 
         chosen_sample = samples[int(sample_id)]
+        return job, chosen_sample, label_idx, layer
+
+    def _get_hoc_image(self, image_path, train_id):
+        """Get hoc image for image data demonstration in UI."""
+
+        job, chosen_sample, label_idx, layer = self._get_hoc_sample(image_path, train_id)
         original_path_image = chosen_sample['image']
-        abs_image_path = os.path.join(self.job_manager.summary_base_dir, _clean_train_id_b4_join(train_id),
-                                      original_path_image)
-        if self._is_forbidden(abs_image_path):
-            raise FileSystemPermissionError("Forbidden.")
+        abs_image_path = self._get_abs_image_path(train_id, original_path_image)
 
         image_type = ImageQueryTypes.OUTCOME.value
-        try:
+        etag = self._get_image_etag(train_id, image_path, image_type, abs_image_path, job.update_time)
+        image_binary = _RENDERED_IMAGES.get(etag)
+        if image_binary is not None:
+            return image_binary
+
+        with _translate_image_error(train_id, image_path, image_type):
             image = Image.open(abs_image_path)
-        except FileNotFoundError:
-            raise ImageNotExistError(f"train_id:{train_id} path:{image_path} type:{image_type}")
-        except PermissionError:
-            raise FileSystemPermissionError(f"train_id:{train_id} path:{image_path} type:{image_type}")
-        except OSError:
-            raise UnknownError(f"Invalid image file: train_id:{train_id} path:{image_path} type:{image_type}")
 
         edit_steps = []
         boxes = chosen_sample["hierarchical_occlusion"][label_idx]["hoc_layers"][layer]["boxes"]
@@ -160,4 +235,6 @@ class DatafileEncap(ExplainDataEncap):
         buffer = io.BytesIO()
         image_cp.save(buffer, format=_PNG_FORMAT)
 
-        return buffer.getvalue()
+        image_binary = buffer.getvalue()
+        _RENDERED_IMAGES.put(etag, image_binary)
+        return image_binary
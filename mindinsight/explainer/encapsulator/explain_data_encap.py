@@ -20,52 +20,6 @@ from mindinsight.explainer.common.enums import ExplanationKeys
 from mindinsight.utils.exceptions import ParamValueError
 
 
-def _sort_key_min_confidence(sample, labels):
-    """Samples sort key by the minimum confidence."""
-    min_confidence = float("+inf")
-    for inference in sample["inferences"]:
-        if labels and inference["label"] not in labels:
-            continue
-        if inference["confidence"] < min_confidence:
-            min_confidence = inference["confidence"]
-    return min_confidence
-
-
-def _sort_key_max_confidence(sample, labels):
-    """Samples sort key by the maximum confidence."""
-    max_confidence = float("-inf")
-    for inference in sample["inferences"]:
-        if labels and inference["label"] not in labels:
-            continue
-        if inference["confidence"] > max_confidence:
-            max_confidence = inference["confidence"]
-    return max_confidence
-
-
-def _sort_key_min_confidence_sd(sample, labels):
-    """Samples sort key by the minimum confidence_sd."""
-    min_confidence_sd = float("+inf")
-    for inference in sample["inferences"]:
-        if labels and inference["label"] not in labels:
-            continue
-        confidence_sd = inference.get("confidence_sd", float("+inf"))
-        if confidence_sd < min_confidence_sd:
-            min_confidence_sd = confidence_sd
-    return min_confidence_sd
-
-
-def _sort_key_max_confidence_sd(sample, labels):
-    """Samples sort key by the maximum confidence_sd."""
-    max_confidence_sd = float("-inf")
-    for inference in sample["inferences"]:
-        if labels and inference["label"] not in labels:
-            continue
-        confidence_sd = inference.get("confidence_sd", float("-inf"))
-        if confidence_sd > max_confidence_sd:
-            max_confidence_sd = confidence_sd
-    return max_confidence_sd
-
-
 class ExplainDataEncap:
     """Explain data encapsulator base class."""
 
@@ -105,53 +59,34 @@ class ExplanationEncap(ExplainDataEncap):
                 will be drop out.
 
         Returns:
-             list[dict], samples to be queried.
+             list[int], ids of the samples to be queried, in order.
         """
-
-        samples = copy.deepcopy(job.get_all_samples())
         if drop_type not in (None, ExplanationKeys.SALIENCY.value, ExplanationKeys.HOC.value):
             raise ParamValueError(
                 f"Argument drop_type valid options: None, {ExplanationKeys.SALIENCY.value}, "
                 f"{ExplanationKeys.HOC.value}, but got {drop_type}.")
-
-        if drop_type is not None:
-            samples = [sample for sample in samples if any(infer[drop_type] for infer in sample['inferences'])]
-        if labels:
-            filtered = []
-            for sample in samples:
-                infer_labels = [inference["label"] for inference in sample["inferences"]]
-                for infer_label in infer_labels:
-                    if infer_label in labels:
-                        filtered.append(sample)
-                        break
-            samples = filtered
-
-        if prediction_types and len(prediction_types) < 3:
-            filtered = []
-            for sample in samples:
-                infer_types = [inference["prediction_type"] for inference in sample["inferences"]]
-                for infer_type in infer_types:
-                    if infer_type in prediction_types:
-                        filtered.append(sample)
-                        break
-            samples = filtered
-
-        reverse = sorted_type == "descending"
-        if sorted_name == "confidence":
-            if reverse:
-                samples.sort(key=lambda x: _sort_key_max_confidence(x, labels), reverse=reverse)
-            else:
-                samples.sort(key=lambda x: _sort_key_min_confidence(x, labels), reverse=reverse)
-        elif sorted_name == "uncertainty":
+        if sorted_name == "uncertainty":
             if not job.uncertainty_enabled:
                 raise ParamValueError("Uncertainty is not enabled, sorted_name cannot be 'uncertainty'")
-            if reverse:
-                samples.sort(key=lambda x: _sort_key_max_confidence_sd(x, labels), reverse=reverse)
-            else:
-                samples.sort(key=lambda x: _sort_key_min_confidence_sd(x, labels), reverse=reverse)
-        elif sorted_name != "":
+        elif sorted_name not in ("", "confidence"):
             raise ParamValueError("sorted_name")
-        return samples
+
+        return job.query_samples(labels=labels, sorted_name=sorted_name, sorted_type=sorted_type,
+                                 prediction_types=prediction_types, drop_type=drop_type)
+
+    @staticmethod
+    def _get_samples(job, sample_ids):
+        """
+        Get the copies of samples, which can be edited.
+
+        Args:
+            job (ExplainManager): Explain job to be query from.
+            sample_ids (list[int]): Ids of the samples.
+
+        Returns:
+             list[dict], the samples.
+        """
+        return copy.deepcopy(job.get_samples(sample_ids))
 
     def _get_image_url(self, train_id, image_path, image_type):
         """Returns image's url."""
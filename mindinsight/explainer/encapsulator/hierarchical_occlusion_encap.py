@@ -53,19 +53,18 @@ class HierarchicalOcclusionEncap(ExplanationEncap):
             raise TrainJobNotExistError(train_id)
 
         if drop_empty:
-            samples = self._query_samples(job, labels, sorted_name, sorted_type, prediction_types,
+            sample_ids = self._query_samples(job, labels, sorted_name, sorted_type, prediction_types,
                                           drop_type=ExplanationKeys.HOC.value)
         else:
-            samples = self._query_samples(job, labels, sorted_name, sorted_type, prediction_types)
+            sample_ids = self._query_samples(job, labels, sorted_name, sorted_type, prediction_types)
 
         sample_infos = []
         obj_offset = offset * limit
-        count = len(samples)
+        count = len(sample_ids)
         end = count
         if obj_offset + limit < end:
             end = obj_offset + limit
-        for i in range(obj_offset, end):
-            sample = samples[i]
+        for sample in self._get_samples(job, sample_ids[obj_offset:end]):
             sample_infos.append(self._touch_sample(sample, job, drop_empty))
 
         return count, sample_infos
@@ -28,6 +28,7 @@ from mindinsight.datavisual.data_access.file_handler import FileHandler
 from mindinsight.explainer.common.enums import ExplainFieldsEnum
 from mindinsight.explainer.common.log import logger
 from mindinsight.explainer.manager.explain_parser import ExplainParser
+from mindinsight.explainer.manager.sample_index import SampleIndex
 from mindinsight.utils.exceptions import ParamValueError, UnknownError
 
 _NAN_CONSTANT = 'NaN'
@@ -80,6 +81,8 @@ class ExplainLoader:
             'uncertainty_enabled': False,
         }
         self._samples = defaultdict(dict)
+        self._sample_index = SampleIndex()
+        self._changed_sample_ids = set()
         self._metadata = {'explainers': [], 'metrics': [], 'labels': [], 'min_confidence': 0.5}
         self._benchmark = {'explainer_score': defaultdict(dict), 'label_score': defaultdict(dict)}
 
@@ -238,11 +241,7 @@ class ExplainLoader:
         Return:
             int, total number of available samples in the loading job.
         """
-        sample_count = 0
-        for sample in self._samples.values():
-            if sample.get('image', False):
-                sample_count += 1
-        return sample_count
+        return self._sample_index.sample_count
 
     @property
     def samples(self) -> List[Dict]:
@@ -347,6 +346,46 @@ class ExplainLoader:
                             self._samples.items() if info.get('image', False)]
         return returned_samples
 
+    def get_samples(self, sample_ids: Iterable[int]) -> List[Dict]:
+        """
+        Return the information of the given samples, in the same structure as `get_all_samples`.
+
+        Args:
+            sample_ids (Iterable[int]): The sample ids, usually returned by `query_samples`.
+
+        Returns:
+            list[dict], the sample objects.
+        """
+        returned_samples = []
+        for sample_id in sample_ids:
+            info = self._samples[sample_id]
+            returned_samples.append({'id': sample_id, 'name': info['name'], 'image': info['image'],
+                                     'inferences': list(info['inferences'].values())})
+        return returned_samples
+
+    def query_samples(self,
+                      labels: Optional[List[str]] = None,
+                      sorted_name: str = '',
+                      sorted_type: Optional[str] = None,
+                      prediction_types: Optional[List[str]] = None,
+                      drop_type: Optional[str] = None) -> List[int]:
+        """
+        Filter and sort the available samples by the sample index.
+
+        Args:
+            labels (list[str]): Label filter, samples with any inference of the labels are kept. Default: None.
+            sorted_name (str): Field to be sorted, 'confidence' or 'uncertainty'. Default: ''.
+            sorted_type (str): Sorting order, 'ascending' or 'descending'. Default: None.
+            prediction_types (list[str]): Prediction type filter. Default: None.
+            drop_type (str, None): When it is 'hoc_layers' or 'saliency_maps', samples without the explanations are
+                dropped out. Default: None.
+
+        Returns:
+            list[int], the ids of the samples in order.
+        """
+        return self._sample_index.query(labels=labels, prediction_types=prediction_types, drop_type=drop_type,
+                                        sorted_name=sorted_name, sorted_type=sorted_type)
+
     def _import_data_from_event(self, event_dict: Dict):
         """Parse and import data from the event data."""
         if 'metadata' not in event_dict and self._is_metadata_empty():
@@ -463,6 +502,7 @@ class ExplainLoader:
 
         if sample.image_path:
             self._samples[sample_id]['image'] = sample.image_path
+        self._changed_sample_ids.add(sample_id)
 
         for tag in _SAMPLE_FIELD_NAMES:
             if tag == ExplainFieldsEnum.GROUND_TRUTH_LABEL:
@@ -474,10 +514,12 @@ class ExplainLoader:
                 self._import_explanation_from_event(sample, sample_id)
             elif tag == ExplainFieldsEnum.HIERARCHICAL_OCCLUSION:
                 self._import_hoc_from_event(sample, sample_id)
+        self._sample_index.update(sample_id, self._samples[sample_id])
 
     def _reform_sample_info(self):
-        """Reform the sample info."""
-        for _, sample_info in self._samples.items():
+        """Reform the info of the samples changed since the last reform."""
+        for sample_id in self._changed_sample_ids:
+            sample_info = self._samples[sample_id]
             inferences = sample_info['inferences']
             res_dict = defaultdict(list)
             for explainer, label_heatmap_path_dict in sample_info['explanation'].items():
@@ -489,6 +531,8 @@ class ExplainLoader:
 
             for label, item in sample_info['hierarchical_occlusion'].items():
                 inferences[label]['hoc_layers'] = item['hoc_layers']
+            self._sample_index.update(sample_id, sample_info)
+        self._changed_sample_ids.clear()
 
     def _import_inference_from_event(self, event, sample_id):
         """Parse the inference event."""
@@ -559,6 +603,8 @@ class ExplainLoader:
     def _clear_job(self):
         """Clear the cached data and update the time info of the loader."""
         self._samples.clear()
+        self._sample_index.clear()
+        self._changed_sample_ids.clear()
         self._loader_info['create_time'] = os.stat(self._loader_info['summary_dir']).st_ctime
         self._loader_info['update_time'] = os.stat(self._loader_info['summary_dir']).st_mtime
         self._loader_info['query_time'] = max(self._loader_info['update_time'], self._loader_info['query_time'])
@@ -0,0 +1,183 @@
+# Copyright 2026 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""The index of explain samples."""
+import threading
+
+import numpy as np
+
+from mindinsight.explainer.common.enums import ExplanationKeys
+
+_SALIENCY = ExplanationKeys.SALIENCY.value
+_HOC = ExplanationKeys.HOC.value
+
+
+class SampleIndex:
+    """
+    The index of samples, which keeps the inferences of all samples in arrays.
+
+    Each row of the arrays is an inference of a sample, with its label, confidence, confidence_sd, prediction type
+    and whether it has saliency maps and hoc layers. The samples are marked by `update` when they change, and the
+    rows of the changed samples are read again on the next query.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._samples = {}
+        self._sample_ids = []
+        self._rows = []
+        self._dirty_positions = set()
+        self._label_codes = {}
+        self._type_codes = {}
+        self._arrays = None
+
+    def clear(self):
+        """Clear the samples."""
+        with self._lock:
+            self.__init__()
+
+    def update(self, sample_id, sample):
+        """
+        Mark the sample changed.
+
+        Args:
+            sample_id (int): The sample id.
+            sample (dict): The sample info, with image and inferences.
+        """
+        with self._lock:
+            position = self._samples.get(sample_id, (None, None))[0]
+            if position is None:
+                position = len(self._sample_ids)
+                self._sample_ids.append(sample_id)
+                self._rows.append(None)
+            self._samples[sample_id] = (position, sample)
+            self._dirty_positions.add(position)
+
+    @property
+    def sample_count(self):
+        """The number of samples with image."""
+        with self._lock:
+            return int(np.count_nonzero(self._get_arrays()['available']))
+
+    def query(self, labels=None, prediction_types=None, drop_type=None, sorted_name='', sorted_type=None):
+        """
+        Query the samples with image.
+
+        A sample is kept if any of its inferences is of the labels, and any of its inferences is of the prediction
+        types. The samples are sorted by the confidence or confidence_sd of the inferences of the labels, the max
+        value is used when sorted in descending order, else the min value.
+
+        Args:
+            labels (list[str]): Label filter. Default: None.
+            prediction_types (list[str]): Prediction type filter. Default: None.
+            drop_type (str, None): When it is 'hoc_layers' or 'saliency_maps', samples without the explanations are
+                dropped out. Default: None.
+            sorted_name (str): Field to be sorted, 'confidence', 'uncertainty' or '' for the loaded order.
+                Default: ''.
+            sorted_type (str): Sorting order, 'ascending' or 'descending'. Default: None.
+
+        Returns:
+            list[int], the sample ids.
+        """
+        with self._lock:
+            arrays = self._get_arrays()
+            sample_positions = arrays['sample']
+            sample_count = len(self._sample_ids)
+
+            kept = arrays['available'].copy()
+            if drop_type is not None:
+                kept &= self._any_rows(arrays[drop_type], sample_positions, sample_count)
+
+            label_rows = None
+            if labels:
+                label_rows = np.isin(arrays['label'], [self._label_codes.get(label, -1) for label in labels])
+                kept &= self._any_rows(label_rows, sample_positions, sample_count)
+
+            if prediction_types and len(prediction_types) < 3:
+                type_rows = np.isin(arrays['type'], [self._type_codes.get(prediction_type, -1)
+                                                     for prediction_type in prediction_types])
+                kept &= self._any_rows(type_rows, sample_positions, sample_count)
+
+            positions = np.flatnonzero(kept)
+            if sorted_name in ('confidence', 'uncertainty'):
+                values = arrays['confidence' if sorted_name == 'confidence' else 'confidence_sd']
+                reverse = sorted_type == 'descending'
+                keys = self._reduce_rows(values, label_rows, sample_positions, sample_count, reverse)[positions]
+                positions = positions[np.argsort(-keys if reverse else keys, kind='stable')]
+            return [self._sample_ids[position] for position in positions.tolist()]
+
+    @staticmethod
+    def _any_rows(rows, sample_positions, sample_count):
+        """Check whether any row of each sample is True."""
+        return np.bincount(sample_positions[rows], minlength=sample_count) > 0
+
+    @staticmethod
+    def _reduce_rows(values, rows, sample_positions, sample_count, reverse):
+        """Get the max values of the rows of each sample if reverse, else the min values, NaN is ignored."""
+        if rows is not None:
+            values, sample_positions = values[rows], sample_positions[rows]
+        valid = ~np.isnan(values)
+        values, sample_positions = values[valid], sample_positions[valid]
+        if reverse:
+            keys = np.full(sample_count, -np.inf)
+            np.maximum.at(keys, sample_positions, values)
+        else:
+            keys = np.full(sample_count, np.inf)
+            np.minimum.at(keys, sample_positions, values)
+        return keys
+
+    def _get_arrays(self):
+        """Get the arrays of rows, the rows of the changed samples are read again."""
+        if self._arrays is not None and not self._dirty_positions:
+            return self._arrays
+
+        for position in self._dirty_positions:
+            self._rows[position] = self._read_rows(self._samples[self._sample_ids[position]][1])
+        self._dirty_positions.clear()
+
+        row_counts = [len(rows[1]) for rows in self._rows]
+        columns = list(zip(*(row for rows in self._rows for row in rows[1])))
+        if not columns:
+            columns = [()] * 6
+        labels, confidences, confidence_sds, types, saliency_flags, hoc_flags = columns
+        self._arrays = {
+            'available': np.array([rows[0] for rows in self._rows], dtype=bool),
+            'sample': np.repeat(np.arange(len(self._rows)), row_counts),
+            'label': np.array(labels, dtype=np.int64),
+            'confidence': np.array(confidences, dtype=np.float64),
+            'confidence_sd': np.array(confidence_sds, dtype=np.float64),
+            'type': np.array(types, dtype=np.int64),
+            _SALIENCY: np.array(saliency_flags, dtype=bool),
+            _HOC: np.array(hoc_flags, dtype=bool),
+        }
+        return self._arrays
+
+    def _read_rows(self, sample):
+        """Read whether the sample has image, and the rows of its inferences."""
+        inferences = sample.get('inferences', {})
+        if isinstance(inferences, dict):
+            inferences = inferences.values()
+        rows = []
+        for inference in inferences:
+            confidence = inference.get('confidence')
+            confidence_sd = inference.get('confidence_sd')
+            rows.append((
+                self._label_codes.setdefault(inference.get('label'), len(self._label_codes)),
+                np.nan if confidence is None else confidence,
+                np.nan if confidence_sd is None else confidence_sd,
+                self._type_codes.setdefault(inference.get('prediction_type'), len(self._type_codes)),
+                bool(inference.get(_SALIENCY)),
+                bool(inference.get(_HOC)),
+            ))
+        return bool(sample.get('image', False)), rows
@@ -21,8 +21,7 @@ from mindinsight.lineagemgr.common.exceptions.exceptions import LineageSummaryAn
     MindInsightException
 from mindinsight.lineagemgr.common.log import logger
 from mindinsight.lineagemgr.common.path_parser import SummaryPathParser
-from mindinsight.lineagemgr.summary.file_handler import FileHandler
-from mindinsight.lineagemgr.summary.lineage_summary_analyzer import LineageSummaryAnalyzer
+from mindinsight.lineagemgr.summary.lineage_summary_analyzer import LineageSummaryReader
 from mindinsight.lineagemgr.querier.query_model import LineageObj
 from mindinsight.utils.exceptions import ParamValueError
 
@@ -88,6 +87,7 @@ class LineageParser:
         self._super_lineage_obj = None
         self._latest_filename = None
         self._latest_file_size = None
+        self._summary_reader = None
         self._cached_file_list = None
 
     def load(self):
@@ -106,12 +106,13 @@ class LineageParser:
             index = lineage_files.index(self._latest_filename)
 
         for filename in lineage_files[index:]:
+            file_path = os.path.join(self._summary_dir, filename)
             if filename != self._latest_filename:
                 self._latest_filename = filename
                 self._latest_file_size = 0
+                self._summary_reader = None
 
-            file_path = os.path.join(self._summary_dir, filename)
-            new_size = FileHandler(file_path).size
+            new_size = os.path.getsize(file_path)
             if new_size == self._latest_file_size:
                 continue
 
@@ -141,14 +142,12 @@ class LineageParser:
 
     def _parse_summary_log(self):
         """
-        Parse the single summary log.
-
-        Returns:
-            bool, `True` if parse summary log success, else `False`.
+        Parse the records appended to the latest summary log since the last parsing.
         """
-        file_path = os.path.realpath(os.path.join(self._summary_dir, self._latest_filename))
-        lineage_info = LineageSummaryAnalyzer.get_summary_infos(file_path)
-        user_defined_info = LineageSummaryAnalyzer.get_user_defined_info(file_path)
+        if self._summary_reader is None:
+            file_path = os.path.realpath(os.path.join(self._summary_dir, self._latest_filename))
+            self._summary_reader = LineageSummaryReader(file_path)
+        lineage_info, user_defined_info = self._summary_reader.read()
         self._update_lineage_obj(lineage_info, user_defined_info)
 
     def _update_lineage_obj(self, lineage_info, user_defined_info):
@@ -13,19 +13,25 @@
 # limitations under the License.
 # ============================================================================
 """This file is used to define the model lineage python api."""
+import threading
+import weakref
+
 import numpy as np
 import pandas as pd
 
+from mindinsight.datavisual.common.exceptions import TrainJobNotExistError
 from mindinsight.lineagemgr.common.exceptions.exceptions import LineageQuerySummaryDataError, \
     LineageQuerierParamException, LineageSearchConditionParamError, LineageParamTypeError, LineageSummaryParseException
 from mindinsight.lineagemgr.common.log import logger as log
 from mindinsight.lineagemgr.common.validator.model_parameter import SearchModelConditionParameter
 from mindinsight.lineagemgr.common.validator.validate import validate_search_model_condition, validate_condition
 from mindinsight.lineagemgr.common.validator.validate_path import validate_and_normalize_path
-from mindinsight.lineagemgr.lineage_parser import LineageOrganizer
+from mindinsight.lineagemgr.lineage_parser import LineageOrganizer, LINEAGE
+from mindinsight.lineagemgr.querier.column_table import LineageColumnTable, get_lineage_fingerprint
 from mindinsight.lineagemgr.querier.querier import Querier
 from mindinsight.optimizer.common.enums import ReasonCode
 from mindinsight.optimizer.utils.utils import is_simple_numpy_number
+from mindinsight.utils.cache import LRUCache
 from mindinsight.utils.exceptions import MindInsightException
 
 METRIC_PREFIX = "[M]"
@@ -33,6 +39,15 @@ USER_DEFINED_PREFIX = "[U]"
 
 USER_DEFINED_INFO_LIMIT = 100
 
+# The max number of train job lineages cached for each data manager.
+MAX_TRAIN_JOB_LINEAGE_COUNT = 10000
+
+# The lineage tables of data managers, which are kept between queries.
+_LINEAGE_TABLES = weakref.WeakKeyDictionary()
+# The lineages of train jobs looked up by train id in data managers.
+_TRAIN_JOB_LINEAGES = weakref.WeakKeyDictionary()
+_LINEAGE_CACHES_LOCK = threading.Lock()
+
 
 def filter_summary_lineage(data_manager=None, summary_base_dir=None, search_condition=None):
     """
@@ -68,7 +83,8 @@ def filter_summary_lineage(data_manager=None, summary_base_dir=None, search_cond
 
     try:
         lineage_objects = LineageOrganizer(data_manager, summary_base_dir).super_lineage_objs
-        result = Querier(lineage_objects).filter_summary_lineage(condition=search_condition)
+        result = Querier(lineage_objects, _get_lineage_table(data_manager)).filter_summary_lineage(
+            condition=search_condition)
     except LineageSummaryParseException:
         result = {'object': [], 'count': 0}
     except (LineageQuerierParamException, LineageParamTypeError) as error:
@@ -79,6 +95,70 @@ def filter_summary_lineage(data_manager=None, summary_base_dir=None, search_cond
     return result
 
 
+def _get_lineage_table(data_manager):
+    """
+    Get the lineage table of the data manager.
+
+    Args:
+        data_manager (DataManager): Data manager defined as
+            mindinsight.datavisual.data_transform.data_manager.DataManager
+
+    Returns:
+        Union[LineageColumnTable, None], the table kept for the data manager, None if data manager is None.
+    """
+    if data_manager is None:
+        return None
+    with _LINEAGE_CACHES_LOCK:
+        table = _LINEAGE_TABLES.get(data_manager)
+        if table is None:
+            table = LineageColumnTable()
+            _LINEAGE_TABLES[data_manager] = table
+    return table
+
+
+def get_summary_lineage_by_train_id(data_manager, train_id):
+    """
+    Get the lineage of the train job from the brief cache of data manager.
+
+    The lineage is in the same structure as the objects returned by `filter_summary_lineage`, and it is cached
+    until the lineage of the train job changes. The returned dict is shared by the callers, it should not be
+    modified.
+
+    Args:
+        data_manager (DataManager): Data manager defined as
+            mindinsight.datavisual.data_transform.data_manager.DataManager
+        train_id (str): The train id, which is the relative path of summary directory.
+
+    Returns:
+        Union[dict, None], the lineage of the train job, None if the train job has no lineage.
+    """
+    try:
+        cache_item = data_manager.get_brief_train_job(train_id)
+    except TrainJobNotExistError:
+        return None
+    lineage_parser = cache_item.get(key=LINEAGE, raise_exception=False)
+    super_lineage_obj = None if lineage_parser is None else lineage_parser.super_lineage_obj
+    if super_lineage_obj is None:
+        return None
+
+    fingerprint = get_lineage_fingerprint(super_lineage_obj)
+    with _LINEAGE_CACHES_LOCK:
+        lineages = _TRAIN_JOB_LINEAGES.get(data_manager)
+        if lineages is None:
+            lineages = LRUCache(MAX_TRAIN_JOB_LINEAGE_COUNT)
+            _TRAIN_JOB_LINEAGES[data_manager] = lineages
+    cached_lineage = lineages.get(train_id)
+    if cached_lineage is not None and cached_lineage[0] == fingerprint:
+        return cached_lineage[1]
+
+    lineage = dict()
+    lineage.update(super_lineage_obj.lineage_obj.to_model_lineage_dict())
+    lineage.update(super_lineage_obj.lineage_obj.to_dataset_lineage_dict())
+    lineage.update({"added_info": super_lineage_obj.added_info})
+    lineages.put(train_id, (fingerprint, lineage), 1)
+    return lineage
+
+
 def get_flattened_lineage(data_manager=None, summary_base_dir=None, search_condition=None):
     """
     Get lineage data in a table from data manager.
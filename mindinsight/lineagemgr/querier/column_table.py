@@ -0,0 +1,214 @@
+# Copyright 2026 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""This file is used to define the columnar table of lineage objects."""
+import math
+import threading
+
+import numpy as np
+
+from mindinsight.utils.cache import LRUCache
+
+# The max total size of the cached query results, in bytes.
+MAX_RESULT_CACHE_SIZE = 64 * 1024 * 1024
+# The integers out of this range can not be converted to float exactly.
+_MAX_EXACT_INT = 2 ** 53
+_NUMBER_GROUP = 'float'
+_NAN_GROUP = 'float nan'
+
+
+def is_exact_number(value):
+    """
+    Check whether the value is a number which can be converted to float exactly.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        bool, `True` if the value is an int, float or bool which is converted to float exactly.
+    """
+    if isinstance(value, float):
+        return True
+    return isinstance(value, int) and -_MAX_EXACT_INT <= value <= _MAX_EXACT_INT
+
+
+def get_sort_keys(values):
+    """
+    Get the keys to sort the values, the values compared equal have the same key.
+
+    None is the smallest. The values of different types are ordered by the type name, and the numbers are
+    compared by value regardless of their types.
+
+    Args:
+        values (list): The values.
+
+    Returns:
+        numpy.ndarray, the int64 keys of values.
+    """
+    groups = {}
+    for index, value in enumerate(values):
+        if value is None:
+            group = ''
+        elif isinstance(value, (int, float)):
+            group = _NAN_GROUP if isinstance(value, float) and math.isnan(value) else _NUMBER_GROUP
+        else:
+            group = type(value).__name__
+        groups.setdefault(group, []).append(index)
+
+    keys = np.zeros(len(values), dtype=np.int64)
+    offset = 0
+    for group in sorted(groups):
+        indexes = groups[group]
+        group_values = [values[index] for index in indexes]
+        try:
+            ranks = {value: rank for rank, value in enumerate(sorted(set(group_values)))}
+            group_keys = [ranks[value] for value in group_values]
+        except TypeError:
+            # The values can not be compared are equal in order.
+            ranks, group_keys = {None: 0}, 0
+        keys[indexes] = np.array(group_keys, dtype=np.int64) + offset
+        offset += len(ranks)
+    return keys
+
+
+def get_lineage_fingerprint(super_lineage_obj):
+    """
+    Get the fingerprint of the lineage object, which changes when the lineage is updated.
+
+    Args:
+        super_lineage_obj (SuperLineageObj): The lineage object.
+
+    Returns:
+        tuple, the lineage object, its version, the added info and the update time.
+    """
+    return (super_lineage_obj, super_lineage_obj.lineage_obj, super_lineage_obj.lineage_obj.version,
+            super_lineage_obj.added_info, super_lineage_obj.update_time)
+
+
+class LineageColumn:
+    """
+    The values of a field in all rows.
+
+    The numbers are also kept in a float64 array, so the comparisons of numbers are done by arrays.
+
+    Args:
+        values (list): The values of the field in all rows.
+    """
+
+    def __init__(self, values):
+        self.values = values
+        self.is_number = np.fromiter((is_exact_number(value) for value in values), dtype=bool, count=len(values))
+        self.numbers = np.full(len(values), np.nan)
+        self.numbers[self.is_number] = [value for value in values if is_exact_number(value)]
+        self._sort_keys = None
+
+    def __len__(self):
+        return len(self.values)
+
+    @property
+    def sort_keys(self):
+        """The keys to sort the rows by the values, see `get_sort_keys`."""
+        if self._sort_keys is None:
+            self._sort_keys = get_sort_keys(self.values)
+        return self._sort_keys
+
+
+class LineageColumnTable:
+    """
+    The lineage objects in rows, with the values of fields in columns.
+
+    The rows are ordered by update time descending. Each row is checked by the lineage object, its version,
+    the added info and the update time, so the table only changes when some lineage is updated. The columns
+    are built when queried, and the query results cached in `results` are kept until the table changes.
+    The table is shared by queriers, which hold `lock` when using it.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.results = LRUCache(MAX_RESULT_CACHE_SIZE)
+        self._fingerprints = {}
+        self._super_lineage_objs = []
+        self._columns = {}
+
+    def __len__(self):
+        return len(self._super_lineage_objs)
+
+    def update(self, super_lineage_objs):
+        """
+        Update the rows with the lineage objects.
+
+        Args:
+            super_lineage_objs (dict): A dict of <summary_dir, SuperLineageObject>.
+
+        Returns:
+            bool, `True` if the table changes.
+        """
+        fingerprints = {
+            summary_dir: get_lineage_fingerprint(super_lineage_obj)
+            for summary_dir, super_lineage_obj in super_lineage_objs.items()
+        }
+        # The order of lineage objects is also compared, which decides the order of rows with same update time.
+        if list(fingerprints.items()) == list(self._fingerprints.items()):
+            return False
+
+        self._fingerprints = fingerprints
+        self._super_lineage_objs = sorted(super_lineage_objs.values(), key=lambda x: x.update_time, reverse=True)
+        self._columns = {}
+        self.results.clear()
+        return True
+
+    def get_super_lineage_objs(self, indexes):
+        """
+        Get the lineage objects of rows.
+
+        Args:
+            indexes (Iterable[int]): The row indexes.
+
+        Returns:
+            list[SuperLineageObj], the lineage objects.
+        """
+        return [self._super_lineage_objs[index] for index in indexes]
+
+    def get_column(self, key):
+        """
+        Get the column of the field.
+
+        Args:
+            key (str): The key in `FIELD_MAPPING` or prefixed with `metric/` or `user_defined/`.
+
+        Returns:
+            LineageColumn, the column.
+        """
+        column = self._columns.get(key)
+        if column is None:
+            column = LineageColumn([obj.lineage_obj.get_value_by_key(key) for obj in self._super_lineage_objs])
+            self._columns[key] = column
+        return column
+
+    def get_added_info_column(self, key):
+        """
+        Get the column of the added info.
+
+        Args:
+            key (str): The key of added info.
+
+        Returns:
+            LineageColumn, the column.
+        """
+        column_key = ('added_info', key)
+        column = self._columns.get(column_key)
+        if column is None:
+            column = LineageColumn([obj.added_info.get(key) for obj in self._super_lineage_objs])
+            self._columns[column_key] = column
+        return column
@@ -14,12 +14,14 @@
 # ============================================================================
 """This file is used to define lineage info querier."""
 import enum
-import functools
+import json
 import operator
 
+import numpy as np
+
 from mindinsight.lineagemgr.common.exceptions.exceptions import LineageQuerierParamException, LineageParamTypeError
 from mindinsight.lineagemgr.common.utils import enum_to_list
-from mindinsight.lineagemgr.lineage_parser import SuperLineageObj
+from mindinsight.lineagemgr.querier.column_table import LineageColumnTable, is_exact_number
 from mindinsight.lineagemgr.querier.query_model import FIELD_MAPPING
 
 
@@ -113,6 +115,46 @@ class ExpressionType(enum.Enum):
             return False
         return state
 
+    @classmethod
+    def match_column(cls, except_key, except_value, column):
+        """
+        Determine whether the values of a column meet the expected requirement.
+
+        The numbers are matched by arrays, and the other values are matched by `is_match`.
+
+        Args:
+            except_key (str): The expression key.
+            except_value (Union[str, int, float, list, tuple]): The expected
+                value.
+            column (LineageColumn): The column of actual values.
+
+        Returns:
+            numpy.ndarray, the bool array of whether each value meets the expected requirement.
+        """
+        states = np.zeros(len(column), dtype=bool)
+        number_states = cls._match_numbers(except_key, except_value, column.numbers[column.is_number])
+        if number_states is None:
+            other_indexes = range(len(column))
+        else:
+            states[column.is_number] = number_states
+            other_indexes = np.flatnonzero(~column.is_number).tolist()
+        for index in other_indexes:
+            states[index] = cls.is_match(except_key, except_value, column.values[index])
+        return states
+
+    @classmethod
+    def _match_numbers(cls, except_key, except_value, numbers):
+        """Match the numbers by arrays, return None if the expected value can not be matched by arrays."""
+        if except_key in [cls.IN.value, cls.NOT_IN.value]:
+            if not isinstance(except_value, (list, tuple)) \
+                    or any(isinstance(value, (int, float)) and not is_exact_number(value) for value in except_value):
+                return None
+            states = np.isin(numbers, [value for value in except_value if is_exact_number(value)])
+            return states if except_key == cls.IN.value else ~states
+        if not is_exact_number(except_value):
+            return None
+        return getattr(operator, except_key)(numbers, except_value)
+
 
 @enum.unique
 class LineageFilterKey(enum.Enum):
@@ -169,16 +211,26 @@ class Querier:
     The condition explain in `ConditionParam` and `ExpressionType` class.
     See the method `filter_summary_lineage` for supported fields.
 
+    The lineage objects are kept in a columnar table. The table can be shared
+    by queriers of the same lineage objects, so it is updated incrementally and
+    the filtered and sorted rows of each condition are cached in it.
+
     Args:
         super_lineage_objs (dict): A dict of <summary_dir, SuperLineageObject>.
+        table (LineageColumnTable): The table shared by queriers, a new table is
+            used if it is None. Default: None.
 
     Raises:
         LineageParamTypeError: If the input parameter type is invalid.
         LineageQuerierParamException: If the input parameter value is invalid.
         LineageSummaryParseException: If all summary logs parsing failed.
     """
-    def __init__(self, super_lineage_objs):
+    def __init__(self, super_lineage_objs, table=None):
         self._super_lineage_objs = self._check_objs(super_lineage_objs)
+        self._table = LineageColumnTable() if table is None else table
+        with self._table.lock:
+            if self._table.update(self._super_lineage_objs):
+                self._add_dataset_mark()
 
     def _check_objs(self, super_lineage_objs):
         if super_lineage_objs is None:
@@ -207,38 +259,12 @@ class Querier:
         Returns:
             dict, filtered and sorted model lineage information.
         """
-        def _filter(super_lineage_obj: SuperLineageObj):
-            for condition_key, condition_value in condition.items():
-                if ConditionParam.is_condition_type(condition_key):
-                    continue
-                if self._is_valid_field(condition_key):
-                    raise LineageQuerierParamException(
-                        'condition',
-                        'The field {} not supported'.format(condition_key)
-                    )
-
-                value = super_lineage_obj.lineage_obj.get_value_by_key(condition_key)
-                for exp_key, exp_value in condition_value.items():
-                    if not ExpressionType.is_valid_exp(exp_key):
-                        raise LineageQuerierParamException(
-                            'condition',
-                            'The expression {} not supported.'.format(exp_key)
-                        )
-                    if not ExpressionType.is_match(exp_key, exp_value, value):
-                        return False
-            return True
-
         if condition is None:
             condition = {}
 
-        self._add_dataset_mark()
-        super_lineage_objs = list(self._super_lineage_objs.values())
-        super_lineage_objs.sort(key=lambda x: x.update_time, reverse=True)
-
-        results = list(filter(_filter, super_lineage_objs))
-        results = self._sorted_results(results, condition)
-
-        offset_results = self._handle_limit_and_offset(condition, results)
+        with self._table.lock:
+            results = self._get_results(condition)
+            offset_results = self._table.get_super_lineage_objs(self._handle_limit_and_offset(condition, results))
 
         customized = self._organize_customized(offset_results)
 
@@ -263,54 +289,89 @@ class Querier:
 
         return lineage_info
 
-    def _sorted_results(self, results, condition):
-        """Get sorted results."""
-        def _cmp(value1, value2):
-            if value1 is None and value2 is None:
-                cmp_result = 0
-            elif value1 is None:
-                cmp_result = -1
-            elif value2 is None:
-                cmp_result = 1
-            else:
-                try:
-                    cmp_result = (value1 > value2) - (value1 < value2)
-                except TypeError:
-                    type1 = type(value1).__name__
-                    type2 = type(value2).__name__
-                    cmp_result = (type1 > type2) - (type1 < type2)
-            return cmp_result
-
-        def _cmp_added_info(obj1: SuperLineageObj, obj2: SuperLineageObj):
-            value1 = obj1.added_info.get(sorted_name)
-            value2 = obj2.added_info.get(sorted_name)
-            return _cmp(value1, value2)
-
-        def _cmp_super_lineage_obj(obj1: SuperLineageObj, obj2: SuperLineageObj):
-            value1 = obj1.lineage_obj.get_value_by_key(sorted_name)
-            value2 = obj2.lineage_obj.get_value_by_key(sorted_name)
-
-            return _cmp(value1, value2)
-
-        if ConditionParam.SORTED_NAME.value in condition:
-            sorted_name = condition.get(ConditionParam.SORTED_NAME.value)
-            sorted_type = condition.get(ConditionParam.SORTED_TYPE.value)
-            reverse = sorted_type == 'descending'
-            if sorted_name in ['tag']:
-                results = sorted(
-                    results, key=functools.cmp_to_key(_cmp_added_info), reverse=reverse
-                )
-                return results
+    def _get_results(self, condition):
+        """
+        Get the filtered and sorted rows of the condition, the rows are cached by the condition.
+
+        Args:
+            condition (dict): Filter and sort condition.
+
+        Returns:
+            numpy.ndarray, the row indexes of results.
+        """
+        cache_key = json.dumps({
+            key: value for key, value in condition.items()
+            if key not in [ConditionParam.LIMIT.value, ConditionParam.OFFSET.value, ConditionParam.LINEAGE_TYPE.value]
+        }, sort_keys=True, default=repr)
+        results = self._table.results.get(cache_key)
+        if results is None:
+            results = self._sorted_results(self._filter_results(condition), condition)
+            self._table.results.put(cache_key, results, results.nbytes + len(cache_key))
+        return results
+
+    def _filter_results(self, condition):
+        """
+        Get the rows which meet the filter condition.
 
-            if self._is_valid_field(sorted_name):
+        Args:
+            condition (dict): Filter and sort condition.
+
+        Returns:
+            numpy.ndarray, the row indexes of results.
+        """
+        states = np.ones(len(self._table), dtype=bool)
+        for condition_key, condition_value in condition.items():
+            if ConditionParam.is_condition_type(condition_key):
+                continue
+            if self._is_valid_field(condition_key):
                 raise LineageQuerierParamException(
                     'condition',
-                    'The sorted name {} not supported.'.format(sorted_name)
+                    'The field {} not supported'.format(condition_key)
                 )
-            results = sorted(
-                results, key=functools.cmp_to_key(_cmp_super_lineage_obj), reverse=reverse
+
+            column = self._table.get_column(condition_key)
+            for exp_key, exp_value in condition_value.items():
+                if not ExpressionType.is_valid_exp(exp_key):
+                    raise LineageQuerierParamException(
+                        'condition',
+                        'The expression {} not supported.'.format(exp_key)
+                    )
+                states &= ExpressionType.match_column(exp_key, exp_value, column)
+        return np.flatnonzero(states)
+
+    def _sorted_results(self, results, condition):
+        """
+        Get sorted results.
+
+        None is the smallest, and the values can not be compared are ordered by
+        their type names. The order of rows with equal values is kept.
+
+        Args:
+            results (numpy.ndarray): The row indexes of filtered results.
+            condition (dict): Filter and sort condition.
+
+        Returns:
+            numpy.ndarray, the sorted row indexes.
+        """
+        if ConditionParam.SORTED_NAME.value not in condition:
+            return results
+
+        sorted_name = condition.get(ConditionParam.SORTED_NAME.value)
+        sorted_type = condition.get(ConditionParam.SORTED_TYPE.value)
+        if sorted_name in ['tag']:
+            column = self._table.get_added_info_column(sorted_name)
+        elif self._is_valid_field(sorted_name):
+            raise LineageQuerierParamException(
+                'condition',
+                'The sorted name {} not supported.'.format(sorted_name)
             )
-        return results
+        else:
+            column = self._table.get_column(sorted_name)
+
+        sort_keys = column.sort_keys[results]
+        if sorted_type == 'descending':
+            sort_keys = -sort_keys
+        return results[np.argsort(sort_keys, kind='stable')]
 
     def _organize_customized(self, offset_results):
         """Organize customized."""
@@ -386,10 +447,10 @@ class Querier:
 
         Args:
             condition (dict): Filter and sort condition.
-            result (list[SuperLineageObj]): Filtered and sorted result.
+            result (Sequence): Filtered and sorted result.
 
         Returns:
-            list[SuperLineageObj], paginated result.
+            Sequence, paginated result.
         """
         offset = 0
         limit = 10
@@ -82,6 +82,7 @@ class LineageObj:
         self._lineage_info = {
             self._name_summary_dir: summary_dir
         }
+        self._version = 0
         self._init_lineage()
         self.parse_and_update_lineage(**kwargs)
 
@@ -111,6 +112,7 @@ class LineageObj:
         dataset_graph = kwargs.get('dataset_graph')
         if not any([train_lineage, evaluation_lineage, dataset_graph]):
             raise LineageEventNotExistException()
+        self._version += 1
 
         # If new train lineage, will clean the lineage saved before.
         if train_lineage is not None or dataset_graph is not None:
@@ -123,6 +125,16 @@ class LineageObj:
 
         self._filtration_result = self._organize_filtration_result()
 
+    @property
+    def version(self):
+        """
+        Get the version, which increases when the lineage is updated.
+
+        Returns:
+            int, the version.
+        """
+        return self._version
+
     @property
     def summary_dir(self):
         """
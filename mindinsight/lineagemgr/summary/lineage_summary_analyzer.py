@@ -13,6 +13,7 @@
 # limitations under the License.
 # ============================================================================
 """This module provides python APIs to get lineage summary from summary log."""
+import os
 import struct
 from collections import namedtuple
 from enum import Enum
@@ -209,15 +210,27 @@ class LineageSummaryAnalyzer(SummaryAnalyzer):
 
         for event in summary_analyzer.load_events():
             if event.HasField("user_defined_info"):
-                user_defined_info = MessageToDict(
-                    event,
-                    preserving_proto_field_name=True
-                ).get("user_defined_info")
-                user_dict = LineageSummaryAnalyzer._get_dict_from_proto(user_defined_info)
-                all_user_message.append(user_dict)
+                all_user_message.append(LineageSummaryAnalyzer.get_user_defined_dict(event))
 
         return all_user_message
 
+    @staticmethod
+    def get_user_defined_dict(event):
+        """
+        Get the dict format user defined info of the event.
+
+        Args:
+            event (LineageEvent): The event with user defined info.
+
+        Returns:
+            dict, the user defined information.
+        """
+        user_defined_info = MessageToDict(
+            event,
+            preserving_proto_field_name=True
+        ).get("user_defined_info")
+        return LineageSummaryAnalyzer._get_dict_from_proto(user_defined_info)
+
     @staticmethod
     def _get_dict_from_proto(user_defined_info):
         """
@@ -240,3 +253,90 @@ class LineageSummaryAnalyzer(SummaryAnalyzer):
                     user_dict[key] = value
 
         return user_dict
+
+
+class LineageSummaryReader:
+    """
+    Incremental reader of lineage summary log.
+
+    Each read only parses the records appended since the last read, the latest lineage events and the user
+    defined info read so far are kept. A record not completely written is left to the next read.
+
+    Args:
+        file_path (str): The path of summary log.
+
+    Raises:
+        LineageSummaryAnalyzeException: If failed to read lineage information.
+    """
+    _LINEAGE_TAGS = (SummaryTag.TRAIN_LINEAGE, SummaryTag.EVAL_LINEAGE, SummaryTag.DATASET_GRAPH)
+    _HEADER_LEN = SummaryAnalyzer.HEADER_SIZE + SummaryAnalyzer.HEADER_CRC_SIZE
+
+    def __init__(self, file_path):
+        self._file_path = safe_normalize_path(file_path, 'lineage_summary_path', None)
+        self._init_variables()
+
+    def _init_variables(self):
+        """Init variables."""
+        self._offset = 0
+        self._lineage_events = dict.fromkeys(self._LINEAGE_TAGS)
+        self._user_defined_info = []
+
+    @property
+    def offset(self):
+        """The offset of the next record to read."""
+        return self._offset
+
+    def read(self):
+        """
+        Read the appended records of summary log.
+
+        Returns:
+            tuple[LineageInfo, list[dict]], the latest lineage summary information, and the user defined
+                information in the order of records, of all records read so far.
+
+        Raises:
+            LineageSummaryAnalyzeException: If failed to read lineage information.
+        """
+        try:
+            self._read_events()
+        except (MindInsightException, IOError, DecodeError) as err:
+            log.debug("Can not analyze lineage info, file path is %s. Detail: %s", self._file_path, str(err))
+            raise LineageSummaryAnalyzeException(str(err))
+
+        lineage_info = LineageInfo(
+            train_lineage=self._lineage_events.get(SummaryTag.TRAIN_LINEAGE),
+            eval_lineage=self._lineage_events.get(SummaryTag.EVAL_LINEAGE),
+            dataset_graph=self._lineage_events.get(SummaryTag.DATASET_GRAPH)
+        )
+        return lineage_info, list(self._user_defined_info)
+
+    def _read_events(self):
+        """Read the events from the offset, and move the offset after the last complete record."""
+        with open(self._file_path, 'rb') as log_file:
+            file_size = os.fstat(log_file.fileno()).st_size
+            if file_size < self._offset:
+                log.info("The summary log is truncated, read it again, file path is %s.", self._file_path)
+                self._init_variables()
+            log_file.seek(self._offset)
+            content = log_file.read(file_size - self._offset)
+
+        pos = 0
+        while pos + self._HEADER_LEN <= len(content):
+            body_size = struct.unpack_from("<Q", content, pos)[0]
+            body_start = pos + self._HEADER_LEN
+            body_end = body_start + body_size
+            if body_end + SummaryAnalyzer.BODY_CRC_SIZE > len(content):
+                break
+            self._add_event(LineageEvent().FromString(content[body_start:body_end]))
+            record_size = body_end + SummaryAnalyzer.BODY_CRC_SIZE - pos
+            pos += record_size
+            self._offset += record_size
+
+    def _add_event(self, event):
+        """Keep the event if it is the latest lineage event, and collect its user defined info."""
+        for tag in self._LINEAGE_TAGS:
+            if event.HasField(tag.value):
+                self._lineage_events[tag] = event
+                break
+        if event.HasField("user_defined_info"):
+            self._user_defined_info.append(LineageSummaryAnalyzer.get_user_defined_dict(event))
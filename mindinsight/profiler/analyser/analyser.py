@@ -37,6 +37,8 @@ class AicoreTypeAnalyser(BaseAnalyser):
     """
     _col_names = ['kernel_type', 'total_time', 'execution_frequency', 'total_percent', 'avg_time']
     _file_name_aicore_type_time = 'aicore_intermediate_{}_type.csv'
+    _dependent_file_names = (_file_name_aicore_type_time,)
+    _columnar_query = True
 
     def _load(self):
         """Load data according to the parsed AICORE operator types file."""
@@ -79,8 +81,8 @@ class AicoreTypeAnalyser(BaseAnalyser):
         Returns:
             dict, the query result.
         """
-        for item in self._result:
-            item[1] = float(format(item[1], '.6f'))
+        # The rows are copied, since the loaded rows may be shared by the cached analyser.
+        self._result = [[item[0], float(format(item[1], '.6f'))] + item[2:] for item in self._result]
         return super()._organize_query_result()
 
     def _convert_field_type(self, row):
@@ -116,6 +118,8 @@ class AicoreDetailAnalyser(BaseAnalyser):
     _file_name_aicore_detail_time = 'aicore_intermediate_{}_detail.csv'
     _file_name_flops = 'flops_{}.txt'
     _file_name_framework_info = 'framework_raw_{}.csv'
+    _dependent_file_names = (_file_name_aicore_detail_time, _file_name_flops, _file_name_framework_info)
+    _columnar_query = True
 
     def __init__(self, profiling_dir, device_id):
         super().__init__(profiling_dir, device_id)
@@ -243,6 +247,19 @@ class AicoreDetailAnalyser(BaseAnalyser):
         def _inner_filter(item: list):
             return self._default_filter(item, filter_condition)
 
+        self._result = self._convert_rows(list(filter(_inner_filter, self._data)), filter_condition)
+
+    def _convert_rows(self, rows, filter_condition):
+        """
+        Convert the filtered rows to the result rows.
+
+        Args:
+            rows (list[list]): The filtered rows of the loaded data.
+            filter_condition (dict): The filter condition.
+
+        Returns:
+            list[list], the result rows.
+        """
         def _inner_map(item: list):
             inner_item = item[1:9]
             if is_display_full_op_name:
@@ -257,11 +274,8 @@ class AicoreDetailAnalyser(BaseAnalyser):
         )
         self._set_display_col_name(is_display_detail, is_display_full_op_name)
         if is_display_detail and is_display_full_op_name:
-            self._result = list(filter(_inner_filter, self._data))
-        else:
-            self._result = list(
-                map(_inner_map, filter(_inner_filter, self._data))
-            )
+            return rows
+        return list(map(_inner_map, rows))
 
     def _set_display_col_name(self, is_display_detail, is_display_full_op_name):
         """
@@ -339,6 +353,8 @@ class AicpuTypeAnalyser(BaseAnalyser):
     """
     _col_names = ['kernel_type', 'total_time', 'execution_frequency', 'percent']
     _file_name_aicpu_time = 'aicpu_intermediate_{}.csv'
+    _dependent_file_names = (_file_name_aicpu_time,)
+    _columnar_query = True
 
     def _load(self):
         """Load data according to the parsed AICPU operator file."""
@@ -412,6 +428,8 @@ class AicpuDetailAnalyser(BaseAnalyser):
     _col_names = ['kernel_name', 'kernel_type', 'avg_execution_time', 'dispatch_time',
                   'execution_frequency']
     _file_name_aicpu_time = 'aicpu_intermediate_{}.csv'
+    _dependent_file_names = (_file_name_aicpu_time,)
+    _columnar_query = True
 
     def _load(self):
         """Load data according to the parsed AICPU operator file."""
@@ -486,6 +504,8 @@ class PynativeTypeAnalyser(BaseAnalyser):
     """
     _col_names = ['op_type', 'execution_time', 'execution_frequency', 'percent']
     _file_name_aicore_type_time = 'pynative_op_intermediate_{}_type.csv'
+    _dependent_file_names = (_file_name_aicore_type_time,)
+    _columnar_query = True
 
     def _load(self):
         """Load data according to the parsed Pynative operator types file."""
@@ -528,8 +548,8 @@ class PynativeTypeAnalyser(BaseAnalyser):
         Returns:
             dict, the query result.
         """
-        for item in self._result:
-            item[1] = float(format(item[1], '.6f'))
+        # The rows are copied, since the loaded rows may be shared by the cached analyser.
+        self._result = [[item[0], float(format(item[1], '.6f'))] + item[2:] for item in self._result]
         return super()._organize_query_result()
 
     def _convert_field_type(self, row):
@@ -560,6 +580,8 @@ class PynativeDetailAnalyser(BaseAnalyser):
     """
     _col_names = ['op_name', 'op_type', 'avg_execution_time', 'subgraph', 'full_op_name']
     _file_name_aicore_detail_time = 'pynative_op_intermediate_{}_detail.csv'
+    _dependent_file_names = (_file_name_aicore_detail_time,)
+    _columnar_query = True
 
     def query_and_sort_by_op_type(self, filter_condition, op_type_order: list):
         """
@@ -634,6 +656,19 @@ class PynativeDetailAnalyser(BaseAnalyser):
         def _inner_filter(item: list):
             return self._default_filter(item, filter_condition)
 
+        self._result = self._convert_rows(list(filter(_inner_filter, self._data)), filter_condition)
+
+    def _convert_rows(self, rows, filter_condition):
+        """
+        Convert the filtered rows to the result rows.
+
+        Args:
+            rows (list[list]): The filtered rows of the loaded data.
+            filter_condition (dict): The filter condition.
+
+        Returns:
+            list[list], the result rows.
+        """
         def _inner_map(item: list):
             inner_item = item[0:4]
             if is_display_full_op_name:
@@ -645,11 +680,8 @@ class PynativeDetailAnalyser(BaseAnalyser):
         )
         self._set_display_col_name(is_display_full_op_name)
         if is_display_full_op_name:
-            self._result = list(filter(_inner_filter, self._data))
-        else:
-            self._result = list(
-                map(_inner_map, filter(_inner_filter, self._data))
-            )
+            return rows
+        return list(map(_inner_map, rows))
 
     def _set_display_col_name(self, is_display_full_op_name):
         """
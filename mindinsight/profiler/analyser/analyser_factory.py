@@ -13,11 +13,17 @@
 # limitations under the License.
 # ============================================================================
 """The analyser factory."""
+import copy
+import os
 import threading
 
 from mindinsight.profiler import analyser as analyser_module
 from mindinsight.profiler.common.exceptions.exceptions import \
     ProfilerAnalyserNotExistException
+from mindinsight.utils.cache import LRUCache
+
+# The max total memory size of the data loaded by the cached analysers, in bytes.
+MAX_ANALYSER_CACHE_SIZE = 1024 * 1024 * 1024
 
 
 class AnalyserFactory:
@@ -35,6 +41,8 @@ class AnalyserFactory:
     """
     _lock = threading.Lock()
     _instance = None
+    _analyser_classes = {}
+    _analyser_cache = LRUCache(MAX_ANALYSER_CACHE_SIZE)
 
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
@@ -50,11 +58,14 @@ class AnalyserFactory:
             cls._instance = cls()
         return cls._instance
 
-    @staticmethod
-    def get_analyser(analyser_type, *args):
+    @classmethod
+    def get_analyser(cls, analyser_type, *args):
         """
         Get the specified analyser according to the analyser type.
 
+        The analysers declaring `_dependent_file_names` are cached with the modification time and size of the
+        files, a copy of the cached analyser is returned if the files are not changed.
+
         Args:
             analyser_type (str): The analyser type.
             args (list): The parameters required for the specific analyser class.
@@ -65,6 +76,30 @@ class AnalyserFactory:
         Raises:
             ProfilerAnalyserNotExistException: If the analyser type does not exist.
         """
+        analyser_class = cls._get_analyser_class(analyser_type)
+        file_names = getattr(analyser_class, '_dependent_file_names', ())
+        if not file_names or len(args) != 2:
+            return analyser_class(*args)
+
+        profiling_dir, device_id = args
+        file_stats = cls._get_file_stats(profiling_dir, device_id, file_names)
+        cache_key = (analyser_type, profiling_dir, device_id)
+        cached = cls._analyser_cache.get(cache_key)
+        if cached is not None and cached[0] == file_stats:
+            analyser = cached[1]
+        else:
+            analyser = analyser_class(*args)
+            cls._analyser_cache.put(cache_key, (file_stats, analyser), max(analyser.get_memory_size(), 1))
+        # The query states are set on the copy, the loaded data is shared and never modified by queries.
+        return copy.copy(analyser)
+
+    @classmethod
+    def _get_analyser_class(cls, analyser_type):
+        """Get the analyser class by the analyser type."""
+        analyser_class = cls._analyser_classes.get(analyser_type)
+        if analyser_class is not None:
+            return analyser_class
+
         subnames = analyser_type.split('_')
         analyser_class_name = ''.join([name.capitalize() for name in subnames])
         analyser_class_name += 'Analyser'
@@ -74,5 +109,35 @@ class AnalyserFactory:
             if sub_module.endswith('analyser') and sub_module != 'base_analyser':
                 analyser_sub_module = getattr(analyser_module, sub_module)
                 if hasattr(analyser_sub_module, analyser_class_name):
-                    return getattr(analyser_sub_module, analyser_class_name)(*args)
+                    analyser_class = getattr(analyser_sub_module, analyser_class_name)
+                    cls._analyser_classes[analyser_type] = analyser_class
+                    return analyser_class
         raise ProfilerAnalyserNotExistException(analyser_type)
+
+    @staticmethod
+    def _get_file_stats(profiling_dir, device_id, file_names):
+        """
+        Get the modification time and size of the files.
+
+        Args:
+            profiling_dir (str): The directory where the parsed profiling files are located.
+            device_id (str): The device ID.
+            file_names (tuple[str]): The file names to be formatted with the device ID.
+
+        Returns:
+            tuple, the modification time and size of each file, None if the file does not exist.
+        """
+        file_stats = []
+        for file_name in file_names:
+            try:
+                stat = os.stat(os.path.join(profiling_dir, file_name.format(device_id)))
+            except (OSError, ValueError, TypeError):
+                file_stats.append(None)
+                continue
+            file_stats.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(file_stats)
+
+    @classmethod
+    def clear_cache(cls):
+        """Clear the cached analysers."""
+        cls._analyser_cache.clear()
@@ -14,10 +14,12 @@
 # ============================================================================
 """The base analyser."""
 import functools
+import sys
 from abc import ABC, abstractmethod
 
 from marshmallow import ValidationError
 
+from mindinsight.profiler.analyser.column_store import ColumnStore, compare_values
 from mindinsight.profiler.common.exceptions.exceptions import \
     ProfilerColumnNotExistException, ProfilerPathErrorException, \
     ProfilerIOException, ProfilerColumnNotSupportSortException
@@ -26,6 +28,21 @@ from mindinsight.profiler.common.validator.validate_path import \
     validate_and_normalize_path
 
 
+def _get_object_size(obj):
+    """Get the memory size of the object and the objects in it, the containers are lists, tuples and dicts."""
+    size = 0
+    objs = [obj]
+    while objs:
+        obj = objs.pop()
+        size += sys.getsizeof(obj)
+        if isinstance(obj, (list, tuple)):
+            objs.extend(obj)
+        elif isinstance(obj, dict):
+            objs.extend(obj.keys())
+            objs.extend(obj.values())
+    return size
+
+
 class BaseAnalyser(ABC):
     """
     The base analyser.
@@ -44,6 +61,12 @@ class BaseAnalyser(ABC):
         ProfilerPathErrorException: If the profiling dir is invalid.
     """
     _col_names = []
+    # The names of the files loaded by `_load`, formatted with the device ID. If it is not empty, the loaded
+    # analyser is cached by `AnalyserFactory` until the files change, so queries should not modify the loaded data.
+    _dependent_file_names = ()
+    # Whether `query` filters and sorts the loaded data by a `ColumnStore`. If it is True, `_filter` should only
+    # filter by `_default_filter` and convert the filtered rows by `_convert_rows`.
+    _columnar_query = False
 
     def __init__(self, profiling_dir, device_id):
         self._profiling_dir = self._normalize_profiling_dir(profiling_dir)
@@ -64,6 +87,7 @@ class BaseAnalyser(ABC):
         except IOError as err:
             logger.exception(err)
             raise ProfilerIOException()
+        self._column_store = ColumnStore(self._data) if self._columnar_query else None
 
     @property
     def col_names(self):
@@ -75,6 +99,19 @@ class BaseAnalyser(ABC):
         """The data in the parsed profiling file."""
         return self._data
 
+    def get_memory_size(self):
+        """
+        Estimate the memory size of the loaded data, including the columns of the column store when all of them are
+        encoded.
+
+        Returns:
+            int, the estimated size in bytes.
+        """
+        size = _get_object_size(self._data)
+        if self._column_store is not None:
+            size += self._column_store.get_max_columns_size()
+        return size
+
     def query(self, condition=None):
         """
         Query data according to the condition.
@@ -95,6 +132,10 @@ class BaseAnalyser(ABC):
 
         self._result = []
         self._display_col_names = self._col_names[:]
+        if self._column_store is not None:
+            self._query_columns(filter_condition, sort_condition, group_condition)
+            return self._organize_query_result()
+
         self._filter(filter_condition)
         self._size = len(self._result)
         if sort_condition:
@@ -103,6 +144,48 @@ class BaseAnalyser(ABC):
             self._group(group_condition)
         return self._organize_query_result()
 
+    def _query_columns(self, filter_condition, sort_condition, group_condition):
+        """
+        Filter, sort and group the loaded data by the column store, the selected rows are set to the result.
+
+        Args:
+            filter_condition (dict): The filter condition.
+            sort_condition (dict): The sort condition.
+            group_condition (dict): The group condition.
+        """
+        conditions = [(self._col_names.index(condition_key), condition_value)
+                      for condition_key, condition_value in filter_condition.items()
+                      if condition_key not in self._none_filter_condition_key
+                      and condition_key in self._col_names and isinstance(condition_value, dict)]
+        indexes = self._column_store.filter(conditions, self._is_match_condition)
+        self._size = len(indexes)
+
+        group_range = self._get_group_range(group_condition) if group_condition else None
+        sort_column = self._get_sort_column(sort_condition) if sort_condition else None
+        if sort_column is not None:
+            top_k = group_range[1] if group_range is not None and min(group_range) >= 0 else None
+            indexes = self._column_store.sort(indexes, sort_column[0], sort_column[1], top_k)
+        if group_range is not None:
+            indexes = indexes[group_range[0]:group_range[1]]
+        self._result = self._convert_rows(self._column_store.take(indexes), filter_condition)
+
+    def _convert_rows(self, rows, filter_condition):
+        """
+        Convert the filtered rows to the result rows.
+
+        The rows are kept as they are by default. Subclasses may override it to convert the rows by the filter
+        condition, e.g. the detail analysers select the displayed columns by the display options in it.
+
+        Args:
+            rows (list[list]): The filtered rows of the loaded data, which should not be modified.
+            filter_condition (dict): The filter condition.
+
+        Returns:
+            list[list], the result rows.
+        """
+        del filter_condition
+        return rows
+
     @abstractmethod
     def _load(self):
         """Load data according to the parsed profiling files."""
@@ -126,37 +209,40 @@ class BaseAnalyser(ABC):
         Raises:
             ProfilerColumnNotExistException: If the sort name does not exist.
         """
-        def _cmp(item1, item2):
-            value1 = item1[index]
-            value2 = item2[index]
-
-            if value1 is None and value2 is None:
-                cmp_result = 0
-            elif value1 is None:
-                cmp_result = -1
-            elif value2 is None:
-                cmp_result = 1
-            else:
-                try:
-                    cmp_result = (value1 > value2) - (value1 < value2)
-                except TypeError:
-                    type1 = type(value1).__name__
-                    type2 = type(value2).__name__
-                    cmp_result = (type1 > type2) - (type1 < type2)
-            return cmp_result
+        sort_column = self._get_sort_column(sort_condition)
+        if sort_column is None:
+            return
+        index, reverse = sort_column
+        self._result.sort(key=functools.cmp_to_key(lambda item1, item2: compare_values(item1[index], item2[index])),
+                          reverse=reverse)
+
+    def _get_sort_column(self, sort_condition):
+        """
+        Get the sorted column according to the sort condition.
+
+        Args:
+            sort_condition (dict): The sort condition.
+
+        Returns:
+            Union[tuple[int, bool], None], the column index and whether to sort in descending order,
+                None if the sort name is not given.
 
+        Raises:
+            ProfilerColumnNotExistException: If the sort name does not exist.
+            ProfilerColumnNotSupportSortException: If the column does not support sorting.
+        """
         sort_name = sort_condition.get('name')
         sort_type = sort_condition.get('type', 'descending')
         reverse = sort_type == 'descending'
         if not sort_name:
-            return
+            return None
         try:
             index = self._col_names.index(sort_name)
         except ValueError:
             raise ProfilerColumnNotExistException(sort_name)
         if self._none_sort_col_names and sort_name in self._none_sort_col_names:
             raise ProfilerColumnNotSupportSortException(sort_name)
-        self._result.sort(key=functools.cmp_to_key(_cmp), reverse=reverse)
+        return index, reverse
 
     def _group(self, group_condition: dict):
         """
@@ -165,15 +251,31 @@ class BaseAnalyser(ABC):
         Args:
             group_condition (dict): The group condition.
         """
+        group_range = self._get_group_range(group_condition)
+        if group_range is None:
+            return
+        self._result = self._result[group_range[0]:group_range[1]]
+
+    @staticmethod
+    def _get_group_range(group_condition):
+        """
+        Get the range of the page according to the group condition.
+
+        Args:
+            group_condition (dict): The group condition.
+
+        Returns:
+            Union[tuple[int, int], None], the start and end of the page, None if the page is not given.
+        """
         limit = group_condition.get('limit')
         offset = group_condition.get('offset')
         if limit is None and offset is None:
-            return
+            return None
         if limit is None:
             limit = 10
         if offset is None:
             offset = 0
-        self._result = self._result[limit * offset: limit * (offset + 1)]
+        return limit * offset, limit * (offset + 1)
 
     def _default_filter(self, item, condition):
         """
@@ -20,6 +20,7 @@ import re
 import pandas as pd
 
 from mindinsight.profiler.analyser.base_analyser import BaseAnalyser
+from mindinsight.profiler.analyser.cluster_step_trace_store import ClusterStepTraceStore
 from mindinsight.profiler.common.exceptions.exceptions import ProfilerFileNotFoundException, \
     ProfilerDirNotFoundException, ProfilerIOException
 from mindinsight.profiler.common.log import logger as log
@@ -130,27 +131,30 @@ class ClusterStepTraceAnalyser(ClusterAnalyser):
                 continue
             if entry.is_file() and entry.name.startswith('step_trace_raw'):
                 file_path = os.path.join(self._target_dir_path, entry.name)
-                with open(file_path, 'r') as src_file:
-                    lines = src_file.readlines()
+                table = ClusterStepTraceStore.get_table(file_path)
                 # The penultimate line represents the information of the last step
                 # The step num index is 0
-                if len(lines) > 1:
-                    total_step_num = lines[-2].split(',')[0]
+                if len(table) > 1:
+                    total_step_num = table.labels[-2]
+                elif len(table) == 1:
+                    total_step_num = table.col_names[0]
                 break
         return total_step_num
 
     def _get_cluster_step_trace_info(self, step_num):
         """Get cluster step trace info."""
         cluster_step_trace_info = list()
-        for item in self._cluster_rank_ids:
-            step_trace_info = self._get_step_trace_info(item, step_num)
-            step_trace_info.append(item)
+        step_trace_tables = ClusterStepTraceStore.get_tables(
+            [self._get_step_trace_file_path(rank_id) for rank_id in self._cluster_rank_ids])
+        for rank_id, step_trace_table in zip(self._cluster_rank_ids, step_trace_tables):
+            step_trace_info = self._get_step_trace_info(step_trace_table, step_num)
+            step_trace_info.append(rank_id)
             cluster_step_trace_info.append(step_trace_info)
         self._cluster_info_size = len(cluster_step_trace_info)
         return cluster_step_trace_info
 
-    def _get_step_trace_info(self, rank_id, step_num):
-        """Get step trace info."""
+    def _get_step_trace_file_path(self, rank_id):
+        """Get the path of the step trace file of the rank."""
         file_name = 'step_trace_raw_{}_detail_time.csv'.format(rank_id)
         step_trace_file_path = \
             os.path.join(self._target_dir_path, file_name)
@@ -159,42 +163,49 @@ class ClusterStepTraceAnalyser(ClusterAnalyser):
         if not os.path.exists(step_trace_file_path):
             log.error('Did not find the file: %s', step_trace_file_path)
             raise ProfilerFileNotFoundException(msg='Did not find the file:{}'.format(step_trace_file_path))
+        return step_trace_file_path
 
-        with open(step_trace_file_path, 'r') as src_file:
-            lines = src_file.readlines()
-            # when the step_num value is 0, it means the average value.
-            # The last line of the step_trace_raw_{}_detail_time.csv records the average value.
-            if step_num == 0:
-                step_trace_info = lines[-1].strip('\n').split(',')
-            else:
-                step_trace_info = lines[step_num].strip('\n').split(',')
+    @staticmethod
+    def _get_step_trace_info(step_trace_table, step_num):
+        """Get step trace info."""
+        # when the step_num value is 0, it means the average value.
+        # The last line of the step_trace_raw_{}_detail_time.csv records the average value.
+        step_trace_info = step_trace_table.get_row(step_num)
         # step_trace_info[6]: iteration_interval time
         # step_trace_info[7]: fp_and_bp time
         # step_trace_info[8]: tail time
         # divided by 1e5, the unit becomes a millisecond
-        iter_total_time = round(float(step_trace_info[3]) / 1e5, 4)
-        iteration_interval = round(float(step_trace_info[6]) / 1e5, 4)
-        fp_and_bp = round(float(step_trace_info[7]) / 1e5, 4)
-        tail = round(float(step_trace_info[8]) / 1e5, 4)
+        iter_total_time = round(step_trace_info[3] / 1e5, 4)
+        iteration_interval = round(step_trace_info[6] / 1e5, 4)
+        fp_and_bp = round(step_trace_info[7] / 1e5, 4)
+        tail = round(step_trace_info[8] / 1e5, 4)
         step_trace_info = [iteration_interval, fp_and_bp, tail, iter_total_time]
         return step_trace_info
 
     def _get_cluster_step_bottleneck_info(self, step_num, stage_id):
         """Get cluster step bottleneck info."""
         cluster_step_bottleneck_info = []
+        rank_ids = []
         for rank_id in self._cluster_rank_ids:
             cur_stage_id = int(int(rank_id) / int((self._rank_size / self._stage_num))) + 1
             # If stage_id is 0 (default value), display all data.
-            if stage_id not in (0, cur_stage_id):
-                continue
-            step_bottleneck_info = self.get_step_bottleneck_info(rank_id, step_num)
+            if stage_id in (0, cur_stage_id):
+                rank_ids.append(rank_id)
+        # Load the files of all the ranks at once, so that they are loaded in parallel.
+        file_paths = []
+        for rank_id in rank_ids:
+            file_paths.extend((self._get_step_bottleneck_file_path(rank_id), self._get_step_trace_file_path(rank_id)))
+        tables = ClusterStepTraceStore.get_tables(file_paths)
+
+        for index, rank_id in enumerate(rank_ids):
+            step_bottleneck_info = self._get_step_bottleneck_info(tables[2 * index], tables[2 * index + 1], step_num)
             step_bottleneck_info.append(rank_id)
             cluster_step_bottleneck_info.append(step_bottleneck_info)
         self._cluster_info_size = len(cluster_step_bottleneck_info)
         return cluster_step_bottleneck_info
 
-    def get_step_bottleneck_info(self, rank_id, step_num):
-        """Get cluster analyse info."""
+    def _get_step_bottleneck_file_path(self, rank_id):
+        """Get the path of the cluster analyse file of the rank."""
         if self._device_type == 'ascend':
             file_name = \
                 f'ascend_cluster_analyse_{self._parallel_mode}_{self._stage_num}_{self._rank_size}_{rank_id}.csv'
@@ -207,27 +218,30 @@ class ClusterStepTraceAnalyser(ClusterAnalyser):
         if not os.path.exists(step_bottleneck_file_path):
             log.error('Did not find the file: %s', step_bottleneck_file_path)
             raise ProfilerFileNotFoundException(msg='Did not find the file:{}'.format(step_bottleneck_file_path))
+        return step_bottleneck_file_path
 
-        with open(step_bottleneck_file_path, 'r') as src_file:
-            lines = src_file.readlines()
-            # when the step_num value is 0, it means the average value.
-            # The last line of the ascend_cluster_analyse_xxx.csv records the average value.
-            if step_num == 0:
-                step_bottleneck_info = lines[-1].strip('\n').split(',')
-            else:
-                step_bottleneck_info = lines[step_num].strip('\n').split(',')
+    def get_step_bottleneck_info(self, rank_id, step_num):
+        """Get cluster analyse info."""
+        step_bottleneck_table, step_trace_table = ClusterStepTraceStore.get_tables(
+            [self._get_step_bottleneck_file_path(rank_id), self._get_step_trace_file_path(rank_id)])
+        return self._get_step_bottleneck_info(step_bottleneck_table, step_trace_table, step_num)
+
+    def _get_step_bottleneck_info(self, step_bottleneck_table, step_trace_table, step_num):
+        """Get cluster analyse info from the tables of a rank."""
+        # when the step_num value is 0, it means the average value.
+        # The last line of the ascend_cluster_analyse_xxx.csv records the average value.
+        step_bottleneck_info = step_bottleneck_table.get_row(step_num)
 
-        step_trace_info = self._get_step_trace_info(rank_id, step_num)
+        step_trace_info = self._get_step_trace_info(step_trace_table, step_num)
         # Insert the step iteration_interval time into the cluster_bottleneck_info
-        step_bottleneck_info.insert(0, str(step_trace_info[0]))
-        step_bottleneck_info = list(map(float, step_bottleneck_info))
+        step_bottleneck_info.insert(0, step_trace_info[0])
 
         return step_bottleneck_info
 
     def get_overview_time_info(self):
         """Get overview time info."""
         device_list, _, _ = analyse_device_list_from_profiler_dir(self._profiling_dir)
-        data = {}
+        file_paths = []
         for device in device_list:
             file_name = 'step_trace_raw_{}_detail_time.csv'.format(device)
             file_path = os.path.join(self._profiling_dir, file_name)
@@ -237,12 +251,14 @@ class ClusterStepTraceAnalyser(ClusterAnalyser):
             if not os.path.exists(file_path):
                 log.error('Did not find the file: %s', file_path)
                 raise ProfilerFileNotFoundException(msg='Did not find the file:{}'.format(file_path))
-            df = pd.read_csv(file_path)
-            df = pd.DataFrame(df, columns=['step_num', 'start_point', 'end_point', 'total', \
-                                           'fp_point', 'bp_point', 'iteration_interval', 'fp_and_bp', 'tail'])
-            cur_data = list(json.loads(df.to_json(orient="index")).values())
+            file_paths.append(file_path)
+
+        data = {}
+        col_names = ['step_num', 'start_point', 'end_point', 'total', 'fp_point', 'bp_point',
+                     'iteration_interval', 'fp_and_bp', 'tail']
+        for device, table in zip(device_list, ClusterStepTraceStore.get_tables(file_paths)):
             device_entry = "device" + device
-            data[device_entry] = cur_data
+            data[device_entry] = table.get_records(col_names)
         return data
 
     def _load(self):
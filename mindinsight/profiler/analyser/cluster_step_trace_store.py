@@ -0,0 +1,226 @@
+# Copyright 2026 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""The store of the step trace files of cluster ranks."""
+import os
+
+import numpy as np
+import pandas as pd
+
+from mindinsight.conf import settings
+from mindinsight.utils.cache import LRUCache
+from mindinsight.utils.computing_resource_mgr import ComputingResourceManager
+
+# The max total size of the cached tables, in bytes.
+MAX_STEP_TRACE_CACHE_SIZE = 256 * 1024 * 1024
+# Fewer files are loaded in the current process, as starting the process pool takes longer than loading them.
+MIN_POOL_FILE_COUNT = 32
+
+
+class StepTraceTable:
+    """
+    The rows of a step trace file, the values of each column are kept in an array.
+
+    The first line of the file is the header, and the last line is the average of steps.
+
+    Args:
+        col_names (list[str]): The column names.
+        labels (list[str]): The values of the first column in each row.
+        columns (list[numpy.ndarray]): The values of each column, in int64 if all the values are integers,
+            else in float64 with NaN for the values not numeric.
+    """
+
+    def __init__(self, col_names, labels, columns):
+        self.col_names = col_names
+        self.labels = labels
+        self.columns = columns
+
+    def __len__(self):
+        return len(self.labels)
+
+    @property
+    def nbytes(self):
+        """The approximate memory size of the table."""
+        return sum(column.nbytes for column in self.columns) + sum(len(label) for label in self.labels) + 1
+
+    def get_row(self, step_num):
+        """
+        Get the values of the step, the average of steps is got if the step num is 0.
+
+        Args:
+            step_num (int): The step num, which is the line number in the file.
+
+        Returns:
+            list[float], the values of the row.
+
+        Raises:
+            IndexError: If the step num is out of range.
+        """
+        row_index = -1 if step_num == 0 else step_num - 1 if step_num > 0 else step_num
+        return [float(column[row_index]) for column in self.columns]
+
+    def get_records(self, col_names):
+        """
+        Get the rows as dicts of the given columns, the values are None if the columns do not exist.
+
+        Args:
+            col_names (list[str]): The column names.
+
+        Returns:
+            list[dict], the records of rows.
+        """
+        columns = []
+        for col_name in col_names:
+            if col_name not in self.col_names:
+                columns.append([None] * len(self))
+                continue
+            column = self.columns[self.col_names.index(col_name)]
+            if column.dtype == np.int64:
+                columns.append(column.tolist())
+            elif col_name == self.col_names[0]:
+                columns.append(self.labels)
+            else:
+                columns.append([None if np.isnan(value) else value for value in column.tolist()])
+        return [dict(zip(col_names, row)) for row in zip(*columns)]
+
+
+def load_step_trace_table(file_path):
+    """
+    Load the table of a step trace file.
+
+    Args:
+        file_path (str): The file path.
+
+    Returns:
+        StepTraceTable, the loaded table.
+    """
+    with open(file_path, 'r') as src_file:
+        header = src_file.readline().rstrip('\n')
+    col_names = header.split(',') if header else []
+    try:
+        # The floats are parsed as the `float` function does.
+        data_frame = pd.read_csv(file_path, header=None, skiprows=1, float_precision='round_trip')
+    except pd.errors.EmptyDataError:
+        return StepTraceTable(col_names, [], [np.empty(0, dtype=np.int64) for _ in col_names])
+    except pd.errors.ParserError:
+        return _load_irregular_table(file_path, col_names)
+
+    columns = []
+    for col_index in data_frame.columns:
+        column = data_frame[col_index]
+        if column.dtype != np.int64:
+            column = pd.to_numeric(column, errors='coerce').astype(np.float64)
+        columns.append(column.to_numpy())
+    # The rows with less values than the header are filled with NaN.
+    for _ in range(len(columns), len(col_names)):
+        columns.append(np.full(len(data_frame), np.nan))
+    labels = data_frame[0].astype(str).tolist() if columns else []
+    return StepTraceTable(col_names, labels, columns)
+
+
+def _load_irregular_table(file_path, col_names):
+    """Load the table of a step trace file whose rows have different numbers of values."""
+    with open(file_path, 'r') as src_file:
+        lines = src_file.read().splitlines()
+    rows = [line.split(',') for line in lines[1:]]
+    col_count = max([len(col_names)] + [len(row) for row in rows])
+    columns = []
+    for col_index in range(col_count):
+        values = [row[col_index] if col_index < len(row) else '' for row in rows]
+        try:
+            column = np.array([int(value) for value in values], dtype=np.int64)
+        except (ValueError, OverflowError):
+            column = np.array([_to_float(value) for value in values], dtype=np.float64)
+        columns.append(column)
+    return StepTraceTable(col_names, [row[0] for row in rows], columns)
+
+
+def _load_step_trace_tables(file_paths):
+    """Load the tables of the step trace files."""
+    return [load_step_trace_table(file_path) for file_path in file_paths]
+
+
+def _to_float(value):
+    """Convert the value to float, NaN if it is not numeric."""
+    try:
+        return float(value)
+    except ValueError:
+        return np.nan
+
+
+class ClusterStepTraceStore:
+    """
+    The store of the step trace tables, each file is loaded once until it changes.
+
+    The files of ranks are loaded in a process pool, and queries of steps are answered by the loaded tables.
+    """
+    _tables = LRUCache(MAX_STEP_TRACE_CACHE_SIZE)
+
+    @classmethod
+    def get_tables(cls, file_paths):
+        """
+        Get the tables of the files, the files not cached or changed are loaded in parallel.
+
+        Args:
+            file_paths (list[str]): The paths of existing files.
+
+        Returns:
+            list[StepTraceTable], the table of each file.
+        """
+        tables = {}
+        loading_files = {}
+        for file_path in file_paths:
+            stat = os.stat(file_path)
+            file_stat = (stat.st_mtime_ns, stat.st_size)
+            cached = cls._tables.get(file_path)
+            if cached is not None and cached[0] == file_stat:
+                tables[file_path] = cached[1]
+            else:
+                loading_files[file_path] = file_stat
+
+        for file_path, table in cls._load_tables(list(loading_files)):
+            cls._tables.put(file_path, (loading_files[file_path], table), table.nbytes)
+            tables[file_path] = table
+        return [tables[file_path] for file_path in file_paths]
+
+    @classmethod
+    def get_table(cls, file_path):
+        """Get the table of a file."""
+        return cls.get_tables([file_path])[0]
+
+    @staticmethod
+    def _load_tables(file_paths):
+        """
+        Load the tables in a process pool, or in the current process if there are only a few files.
+
+        Args:
+            file_paths (list[str]): The file paths.
+
+        Returns:
+            list[tuple[str, StepTraceTable]], the file path and the loaded table.
+        """
+        max_processes_cnt = min(len(file_paths), settings.MAX_PROCESSES_COUNT)
+        if max_processes_cnt <= 1 or len(file_paths) < MIN_POOL_FILE_COUNT:
+            return [(file_path, load_step_trace_table(file_path)) for file_path in file_paths]
+
+        # Each process loads a chunk of files, which saves the overhead of submitting small tasks.
+        chunks = [file_paths[index::max_processes_cnt] for index in range(max_processes_cnt)]
+        with ComputingResourceManager.get_instance().get_executor(max_processes_cnt=max_processes_cnt) as executor:
+            futures = [executor.submit(_load_step_trace_tables, chunk) for chunk in chunks]
+            return [item for chunk, future in zip(chunks, futures) for item in zip(chunk, future.result())]
+
+    @classmethod
+    def clear_cache(cls):
+        """Clear the cached tables."""
+        cls._tables.clear()
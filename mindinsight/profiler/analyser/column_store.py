@@ -0,0 +1,217 @@
+# Copyright 2026 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""The column store to filter and sort the rows of analysers."""
+import functools
+
+import numpy as np
+
+# The types whose values can be ordered by `_sort_key` consistently with `compare_values`.
+_ENCODABLE_TYPES = (type(None), bool, int, float, str)
+# The size of an object reference or a code, in bytes.
+_REFERENCE_SIZE = 8
+
+
+def compare_values(value1, value2):
+    """
+    Compare two values of a column, None is the smallest, values of different types are compared by type names.
+
+    Args:
+        value1 (Any): The first value.
+        value2 (Any): The second value.
+
+    Returns:
+        int, -1 if value1 is smaller, 1 if value1 is larger, else 0.
+    """
+    if value1 is None and value2 is None:
+        cmp_result = 0
+    elif value1 is None:
+        cmp_result = -1
+    elif value2 is None:
+        cmp_result = 1
+    else:
+        try:
+            cmp_result = (value1 > value2) - (value1 < value2)
+        except TypeError:
+            type1 = type(value1).__name__
+            type2 = type(value2).__name__
+            cmp_result = (type1 > type2) - (type1 < type2)
+    return cmp_result
+
+
+def _sort_key(value):
+    """The sort key of an encodable value, the names of numeric types are all smaller than 'str'."""
+    if value is None:
+        return 0, 0
+    if isinstance(value, str):
+        return 2, value
+    return 1, value
+
+
+class _Column:
+    """
+    A dictionary encoded column.
+
+    The distinct values are sorted, and each row is encoded as the index of its value in the distinct values,
+    so that the codes can be compared and sorted in place of the values. If the values can not be encoded, such as
+    dicts, they are kept as they are.
+
+    Args:
+        values (list): The values of the column.
+    """
+
+    def __init__(self, values):
+        self.values = values
+        self.uniques = None
+        self.codes = None
+        if all(isinstance(value, _ENCODABLE_TYPES) for value in values):
+            value_codes = dict.fromkeys(values)
+            self.uniques = sorted(value_codes, key=_sort_key)
+            for code, value in enumerate(self.uniques):
+                value_codes[value] = code
+            self.codes = np.fromiter((value_codes[value] for value in values), dtype=np.int64, count=len(values))
+
+    def match(self, indexes, predicate):
+        """
+        Get the mask of the rows whose values meet the predicate.
+
+        The predicate is evaluated once for each distinct value of the given rows.
+
+        Args:
+            indexes (numpy.ndarray): The indexes of rows.
+            predicate (Callable[[Any], bool]): The predicate of values.
+
+        Returns:
+            numpy.ndarray, the mask of the given rows.
+        """
+        if self.codes is None:
+            return np.fromiter((bool(predicate(self.values[index])) for index in indexes.tolist()),
+                               dtype=bool, count=len(indexes))
+        codes = self.codes[indexes]
+        present_codes = np.unique(codes)
+        unique_mask = np.zeros(len(self.uniques), dtype=bool)
+        unique_mask[present_codes] = [bool(predicate(self.uniques[code])) for code in present_codes.tolist()]
+        return unique_mask[codes]
+
+    def sort(self, indexes, reverse, top_k=None):
+        """
+        Sort the rows stably by the values.
+
+        Args:
+            indexes (numpy.ndarray): The indexes of rows in increasing order.
+            reverse (bool): Whether to sort in descending order.
+            top_k (int): Only the first `top_k` sorted rows are needed if it is given. Default: None.
+
+        Returns:
+            numpy.ndarray, the sorted indexes of rows, at least the first `top_k` rows are sorted.
+        """
+        if self.codes is None:
+            values = self.values
+            return np.array(sorted(indexes.tolist(),
+                                   key=functools.cmp_to_key(lambda i, j: compare_values(values[i], values[j])),
+                                   reverse=reverse), dtype=np.int64)
+
+        count = len(indexes)
+        codes = self.codes[indexes]
+        if reverse:
+            codes = len(self.uniques) - 1 - codes
+        # The position is added to the key, so equal values keep their order like a stable sort.
+        keys = codes * max(count, 1) + np.arange(count, dtype=np.int64)
+        if top_k is not None and top_k < count:
+            order = np.argpartition(keys, top_k - 1)[:top_k] if top_k > 0 else np.empty(0, dtype=np.int64)
+            order = order[np.argsort(keys[order])]
+        else:
+            order = np.argsort(keys)
+        return indexes[order]
+
+
+class ColumnStore:
+    """
+    The columns of the rows loaded by an analyser, columns are encoded on first use.
+
+    Args:
+        rows (list[list]): The rows, which should not be modified.
+    """
+
+    def __init__(self, rows):
+        self._rows = rows
+        self._columns = {}
+
+    def _get_column(self, col_index):
+        """Get the encoded column."""
+        column = self._columns.get(col_index)
+        if column is None:
+            column = _Column([row[col_index] for row in self._rows])
+            self._columns[col_index] = column
+        return column
+
+    def filter(self, conditions, is_match_condition):
+        """
+        Filter the rows, the conditions are checked in order, like `BaseAnalyser._default_filter`.
+
+        Args:
+            conditions (list[tuple[int, dict]]): The column index and the expected values of each condition.
+            is_match_condition (Callable[[str, Any, Any], bool]): Whether the actual value meets the expected
+                value, refer to `BaseAnalyser._is_match_condition`.
+
+        Returns:
+            numpy.ndarray, the indexes of the rows meeting the conditions, in increasing order.
+        """
+        indexes = np.arange(len(self._rows), dtype=np.int64)
+        for col_index, condition_value in conditions:
+            column = self._get_column(col_index)
+            for exp_key, exp_value in condition_value.items():
+                if not len(indexes):
+                    return indexes
+                mask = column.match(
+                    indexes, functools.partial(_match_value, is_match_condition, exp_key, exp_value))
+                indexes = indexes[mask]
+        return indexes
+
+    def sort(self, indexes, col_index, reverse, top_k=None):
+        """
+        Sort the rows stably by the column, refer to `_Column.sort`.
+
+        Args:
+            indexes (numpy.ndarray): The indexes of rows in increasing order.
+            col_index (int): The index of the sorted column.
+            reverse (bool): Whether to sort in descending order.
+            top_k (int): Only the first `top_k` sorted rows are needed if it is given. Default: None.
+
+        Returns:
+            numpy.ndarray, the sorted indexes of rows.
+        """
+        return self._get_column(col_index).sort(indexes, reverse, top_k)
+
+    def get_max_columns_size(self):
+        """
+        Estimate the memory size of the columns when all of them are encoded.
+
+        Returns:
+            int, the estimated size in bytes.
+        """
+        row_count = len(self._rows)
+        col_count = max((len(row) for row in self._rows), default=0)
+        # Each encoded column keeps the references to values, the codes, and at most as many distinct values.
+        return row_count * col_count * 3 * _REFERENCE_SIZE
+
+    def take(self, indexes):
+        """Get the rows by indexes."""
+        rows = self._rows
+        return [rows[index] for index in indexes.tolist()]
+
+
+def _match_value(is_match_condition, exp_key, exp_value, actual_value):
+    """Check the actual value, the arguments are ordered for `functools.partial`."""
+    return is_match_condition(exp_key, exp_value, actual_value)
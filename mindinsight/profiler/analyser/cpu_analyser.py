@@ -26,6 +26,7 @@ from mindinsight.profiler.common.validator.validate_path import validate_and_nor
 class CpuAnalyser(BaseAnalyser):
     """Cpu base analyser."""
     _csv_file_to_analyse = ""
+    _columnar_query = True
 
     def _load(self):
         """Load data according to the parsed CPU operator types file."""
@@ -74,6 +75,7 @@ class CpuOpTypeAnalyser(CpuAnalyser):
     """Cpu operation type analyser."""
     _col_names = validate.CPU_TYPE_COL
     _csv_file_to_analyse = 'cpu_op_type_info_{}.csv'
+    _dependent_file_names = (_csv_file_to_analyse,)
 
     def _convert_field_type(self, row):
         """
@@ -99,6 +101,7 @@ class CpuOpInfoAnalyser(CpuAnalyser):
     """Cpu operation detail info analyser."""
     _col_names = validate.CPU_DETAIL_COL
     _csv_file_to_analyse = 'cpu_op_detail_info_{}.csv'
+    _dependent_file_names = (_csv_file_to_analyse,)
 
     def _convert_field_type(self, row):
         """
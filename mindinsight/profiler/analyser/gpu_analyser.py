@@ -26,6 +26,7 @@ from mindinsight.profiler.common.validator.validate_path import validate_and_nor
 class GpuAnalyser(BaseAnalyser):
     """Gpu base analyser."""
     _csv_file_to_analyse = ""
+    _columnar_query = True
 
     def _load(self):
         """Load data according to the parsed AICORE operator types file."""
@@ -75,6 +76,7 @@ class GpuOpTypeAnalyser(GpuAnalyser):
     """Gpu operation type analyser."""
     _col_names = ["op_type", "total_time", "execution_frequency", "total_percent", "avg_time"]
     _csv_file_to_analyse = 'gpu_op_type_info_{}.csv'
+    _dependent_file_names = (_csv_file_to_analyse,)
 
     def _convert_field_type(self, row):
         """
@@ -96,6 +98,7 @@ class GpuOpInfoAnalyser(GpuAnalyser):
                   "op_occurrences", "op_total_time", "op_avg_time",
                   "proportion", "cuda_activity_cost_time", "cuda_activity_call_count"]
     _csv_file_to_analyse = 'gpu_op_detail_info_{}.csv'
+    _dependent_file_names = (_csv_file_to_analyse,)
 
     def _convert_field_type(self, row):
         """
@@ -118,6 +121,7 @@ class GpuCudaActivityAnalyser(GpuAnalyser):
                   "block_dim", "grid_dim", "occurrences", "total_duration",
                   "avg_duration", "max_duration", "min_duration"]
     _csv_file_to_analyse = 'gpu_activity_data_{}.csv'
+    _dependent_file_names = (_csv_file_to_analyse,)
 
     def _convert_field_type(self, row):
         """
@@ -18,6 +18,7 @@ import json
 import os
 
 from mindinsight.profiler.analyser.base_analyser import BaseAnalyser
+from mindinsight.profiler.analyser.memory_usage_index import MemoryDetailsIndex
 from mindinsight.profiler.common.exceptions.exceptions import ProfilerIOException, \
     ProfilerFileNotFoundException
 from mindinsight.profiler.common.log import logger
@@ -73,12 +74,7 @@ class MemoryUsageAnalyser(BaseAnalyser):
         Returns:
             json, the content of memory usage data.
         """
-        memory_details = self._get_file_content(device_type, FileType.DETAILS.value)
-        for graph_id in memory_details.keys():
-            if 'breakdowns' in memory_details[graph_id]:
-                memory_details[graph_id].pop('breakdowns')
-
-        return memory_details
+        return self._get_details_index(device_type).graphics
 
     def get_memory_usage_breakdowns(self, device_type, graph_id, node_id):
         """
@@ -92,22 +88,26 @@ class MemoryUsageAnalyser(BaseAnalyser):
         Returns:
             json, the content of memory usage breakdowns.
         """
-        memory_details = self._get_file_content(device_type, FileType.DETAILS.value)
-        graph = None
-        if memory_details:
-            for memory_data in memory_details.values():
-                if graph_id == str(memory_data.get('graph_id', -1)):
-                    graph = memory_data
-                    break
-        if not graph:
+        details_index = self._get_details_index(device_type)
+        graph_key = None
+        for key, memory_data in details_index.graphics.items():
+            if graph_id == str(memory_data.get('graph_id', -1)):
+                graph_key = key
+                break
+        breakdowns_count = details_index.get_breakdowns_count(graph_key)
+        if graph_key is None or not (details_index.graphics[graph_key] or breakdowns_count is not None):
             logger.error('Invalid graph id: %s', graph_id)
             raise ParamValueError('Invalid graph id.')
 
-        if not ('breakdowns' in graph and node_id < len(graph['breakdowns'])):
+        if not (breakdowns_count is not None and node_id < breakdowns_count):
             logger.error('Invalid node id: %s', node_id)
             raise ParamValueError('Invalid node id.')
 
-        memory_breakdowns = graph.get('breakdowns')[node_id]
+        try:
+            memory_breakdowns = details_index.read_breakdowns(graph_key, node_id)
+        except (IOError, OSError, json.JSONDecodeError) as err:
+            logger.error('Error occurred when read memory file: %s', err)
+            raise ProfilerIOException()
 
         return {'breakdowns': memory_breakdowns}
 
@@ -126,7 +126,7 @@ class MemoryUsageAnalyser(BaseAnalyser):
         for device in device_list:
             self._device_id = device
             summary = self._get_file_content(device_type, FileType.SUMMARY.value)
-            details = self._get_memory_file_without_breakdown(device_type)
+            details = self._get_details_index(device_type).graphics
             device_entry = "device" + device
             data[device_entry] = {}
             data.get(device_entry)['summary'] = summary
@@ -158,15 +158,15 @@ class MemoryUsageAnalyser(BaseAnalyser):
 
         return file_content
 
-    def _get_memory_file_without_breakdown(self, device_type):
+    def _get_details_index(self, device_type):
         """
-        Get file content for memory usage details files without breakdowns.
+        Get the index of the memory usage details file, which keeps the file content without breakdowns.
 
         Args:
             device_type (str): Device type, e.g., GPU, Ascend.
 
         Returns:
-            dict, file content corresponding to file_type.
+            MemoryDetailsIndex, the index of the details file.
         """
         file_path = self._get_file_path(device_type, FileType.DETAILS.value)
         if not os.path.exists(file_path):
@@ -174,17 +174,12 @@ class MemoryUsageAnalyser(BaseAnalyser):
             raise ProfilerFileNotFoundException(msg='Invalid memory file path.')
 
         try:
-            with open(file_path, 'r') as f_obj:
-                f_obj_str = f_obj.read()
-                del_start = f_obj_str.find(", \"breakdowns\"")
-                new_str = f_obj_str[:del_start] + f_obj_str[-2:]
-                del f_obj_str
-                file_content = json.loads(new_str)
-        except (IOError, OSError, json.JSONDecodeError) as err:
+            details_index = MemoryDetailsIndex.get_index(file_path)
+        except (IOError, OSError, ValueError) as err:
             logger.error('Error occurred when read memory file: %s', err)
             raise ProfilerIOException()
 
-        return file_content
+        return details_index
 
     def _get_file_path(self, device_type, file_type):
         """
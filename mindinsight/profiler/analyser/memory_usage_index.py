@@ -0,0 +1,435 @@
+# Copyright 2026 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""The index of memory usage details files."""
+import hashlib
+import json
+import os
+import re
+import time
+
+import numpy as np
+
+from mindinsight.conf import settings
+from mindinsight.profiler.common.log import logger
+from mindinsight.utils.cache import LRUCache, remove_stale_cache_files, write_cache_file
+
+INDEX_VERSION = 1
+# The max total size of the cached indexes, in bytes.
+MAX_INDEX_CACHE_SIZE = 256 * 1024 * 1024
+# The index files of the removed details files are removed at most once in this many seconds.
+STALE_INDEX_CHECK_INTERVAL = 3600
+
+_INDEX_SUFFIX = '.memindex'
+_CHUNK_SIZE = 16 * 1024 * 1024
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_DECODER = json.JSONDecoder()
+# The characters which may continue a number.
+_NUMBER_CHARS = frozenset('0123456789.eE+-')
+
+
+def get_index_cache_dir():
+    """Get the directory to store the indexes of memory usage details files."""
+    return os.path.join(settings.WORKSPACE, 'cache', 'memory_usage')
+
+
+class _JsonStream:
+    """
+    Read the JSON values of a file one by one, the file is read in chunks.
+
+    The bytes are decoded as latin-1, so that the positions in the text are the offsets in the file.
+
+    Args:
+        file (BinaryIO): The file.
+        chunk_size (int): The size of each read. Default: _CHUNK_SIZE.
+    """
+
+    def __init__(self, file, chunk_size=_CHUNK_SIZE):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._text = ''
+        self.kept_size = 0
+        self._offset = 0
+        self._pos = 0
+        self._eof = False
+
+    @property
+    def offset(self):
+        """The offset of the next character in the file."""
+        return self._offset + self._pos
+
+    def peek(self):
+        """
+        Skip the whitespaces and get the next character.
+
+        Returns:
+            str, the next character, empty at the end of the file.
+        """
+        while True:
+            self._pos = _WHITESPACE.match(self._text, self._pos).end()
+            if self._pos < len(self._text):
+                return self._text[self._pos]
+            if not self._read(self._chunk_size):
+                return ''
+
+    def expect(self, chars):
+        """
+        Read the next character, which should be one of the given characters.
+
+        Args:
+            chars (str): The expected characters.
+
+        Returns:
+            str, the character read.
+
+        Raises:
+            ValueError: If the next character is not expected.
+        """
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError('Expecting one of %r at offset %d.' % (chars, self.offset))
+        self._pos += 1
+        return char
+
+    def decode(self, keep=True):
+        """
+        Decode the next value.
+
+        Args:
+            keep (bool): Whether to return the value, or only skip it. Default: True.
+
+        Returns:
+            Any, the decoded value, None if it is skipped.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._text, self._pos)
+                # A number cut by the end of the text is decoded as its prefix, e.g. `12` of `12.5`.
+                if self._eof or not self._may_be_truncated(value, end):
+                    break
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            # The value is larger than the text, read as much text as the value so far.
+            self._read(max(self._chunk_size, len(self._text) - self._pos))
+        if keep:
+            text = self._text[self._pos:end]
+            self.kept_size += len(text)
+            if not text.isascii():
+                value = json.loads(text.encode('latin-1').decode('utf-8'))
+        self._pos = end
+        return value if keep else None
+
+    def _may_be_truncated(self, value, end):
+        """Check whether the decoded value is a number which may continue after the text."""
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            return False
+        return end == len(self._text) or self._text[end] in _NUMBER_CHARS
+
+    def _read(self, size):
+        """Drop the text read and append the next chunk, return False at the end of the file."""
+        if self._eof:
+            return False
+        data = self._file.read(size)
+        if not data:
+            self._eof = True
+            return False
+        self._offset += self._pos
+        self._text = self._text[self._pos:] + data.decode('latin-1')
+        self._pos = 0
+        return True
+
+
+class MemoryDetailsIndex:
+    """
+    The index of a memory usage details file.
+
+    The details file is a JSON object of graphs, the breakdowns of a graph are the memory blocks of each node,
+    which take most of the file. The index keeps the graphs without breakdowns, and the offsets of the breakdowns
+    of each node, so a node is read from the file without loading the others.
+
+    Args:
+        file_path (str): The path of the details file.
+        fingerprint (list[int]): The modification time and size of the details file.
+        graphics (dict): The graphs without breakdowns.
+        breakdown_offsets (dict[str, list[int]]): The start and end offsets of the breakdowns of each node in
+            the graphs, flattened.
+        graphics_size (int): The size of the graphs in JSON.
+    """
+    _indexes = LRUCache(MAX_INDEX_CACHE_SIZE)
+    _last_stale_check_time = 0
+
+    def __init__(self, file_path, fingerprint, graphics, breakdown_offsets, graphics_size):
+        self._file_path = file_path
+        self.fingerprint = fingerprint
+        self.graphics = graphics
+        self._breakdown_offsets = {graph_key: np.array(offsets, dtype=np.int64)
+                                   for graph_key, offsets in breakdown_offsets.items()}
+        self._graphics_size = graphics_size
+
+    @property
+    def memory_size(self):
+        """The approximate memory size of the index."""
+        return self._graphics_size + sum(offsets.nbytes for offsets in self._breakdown_offsets.values()) + 1
+
+    @classmethod
+    def get_index(cls, file_path):
+        """
+        Get the index of the details file, the index is built if it is not cached or the file changes.
+
+        Args:
+            file_path (str): The path of the details file.
+
+        Returns:
+            MemoryDetailsIndex, the index.
+
+        Raises:
+            OSError: If the file can not be read.
+            ValueError: If the file is not a JSON object.
+        """
+        file_stat = os.stat(file_path)
+        fingerprint = [file_stat.st_mtime_ns, file_stat.st_size]
+        index = cls._indexes.get(file_path)
+        if index is not None and index.fingerprint == fingerprint:
+            return index
+
+        index_path = os.path.join(get_index_cache_dir(),
+                                  hashlib.sha256(file_path.encode('utf-8')).hexdigest() + _INDEX_SUFFIX)
+        index = cls.load(index_path, file_path, fingerprint)
+        if index is None:
+            logger.info("Start to index memory usage details file: %s.", file_path)
+            index = cls.build(file_path, fingerprint)
+            if index.save(index_path):
+                cls._remove_stale_indexes()
+        cls._indexes.put(file_path, index, index.memory_size)
+        return index
+
+    @classmethod
+    def build(cls, file_path, fingerprint, chunk_size=_CHUNK_SIZE):
+        """
+        Build the index by reading the details file once.
+
+        Args:
+            file_path (str): The path of the details file.
+            fingerprint (list[int]): The modification time and size of the details file.
+            chunk_size (int): The size of each read. Default: _CHUNK_SIZE.
+
+        Returns:
+            MemoryDetailsIndex, the index.
+
+        Raises:
+            ValueError: If the file is not a JSON object.
+        """
+        graphics = {}
+        breakdown_offsets = {}
+        with open(file_path, 'rb') as file:
+            stream = _JsonStream(file, chunk_size)
+            stream.expect('{')
+            if stream.peek() == '}':
+                stream.expect('}')
+            else:
+                while True:
+                    graph_key = _decode_key(stream)
+                    if stream.peek() == '{':
+                        graph, offsets = _read_graph(stream)
+                        if offsets is not None:
+                            breakdown_offsets[graph_key] = offsets
+                    else:
+                        graph = stream.decode()
+                    graphics[graph_key] = graph
+                    if stream.expect(',}') == '}':
+                        break
+            if stream.peek():
+                raise ValueError('Extra data at offset %d.' % stream.offset)
+        return cls(file_path, fingerprint, graphics, breakdown_offsets, stream.kept_size)
+
+    def get_breakdowns_count(self, graph_key):
+        """
+        Get the count of nodes with breakdowns in a graph.
+
+        Args:
+            graph_key (str): The key of the graph in the details file.
+
+        Returns:
+            Union[int, None], the count of nodes, None if the graph has no breakdowns.
+        """
+        offsets = self._breakdown_offsets.get(graph_key)
+        return None if offsets is None else len(offsets) // 2
+
+    def read_breakdowns(self, graph_key, node_id):
+        """
+        Read the breakdowns of a node from the details file.
+
+        Args:
+            graph_key (str): The key of the graph in the details file.
+            node_id (int): The node ID, which is the index of the node in the breakdowns.
+
+        Returns:
+            Any, the breakdowns of the node.
+
+        Raises:
+            IndexError: If the node ID is out of range.
+        """
+        offsets = self._breakdown_offsets[graph_key]
+        count = len(offsets) // 2
+        if not -count <= node_id < count:
+            raise IndexError('The node id is out of range.')
+        node_id %= count
+        start, end = offsets[2 * node_id:2 * node_id + 2].tolist()
+        with open(self._file_path, 'rb') as file:
+            file.seek(start)
+            return json.loads(file.read(end - start))
+
+    def save(self, index_path):
+        """
+        Save the index to a file.
+
+        Args:
+            index_path (str): The path of the index file.
+
+        Returns:
+            bool, True if the index is saved.
+        """
+        content = {
+            'version': INDEX_VERSION,
+            'file_path': self._file_path,
+            'fingerprint': self.fingerprint,
+            'graphics': self.graphics,
+            'breakdown_offsets': {graph_key: offsets.tolist()
+                                  for graph_key, offsets in self._breakdown_offsets.items()}
+        }
+        try:
+            write_cache_file(index_path, lambda file: json.dump(content, file), binary=False)
+        except OSError as ex:
+            logger.warning("Save memory usage index failed, file path: %s, detail: %s.", index_path, str(ex))
+            return False
+        return True
+
+    @classmethod
+    def load(cls, index_path, file_path, fingerprint):
+        """
+        Load the index from a file.
+
+        Args:
+            index_path (str): The path of the index file.
+            file_path (str): The path of the details file.
+            fingerprint (list[int]): The current modification time and size of the details file.
+
+        Returns:
+            Union[MemoryDetailsIndex, None], the index if it matches the details file, else None.
+        """
+        if not os.path.isfile(index_path):
+            return None
+        try:
+            with open(index_path, 'r') as file:
+                content = json.load(file)
+            if content.get('version') != INDEX_VERSION or content.get('file_path') != file_path \
+                    or content.get('fingerprint') != fingerprint:
+                return None
+            return cls(file_path, fingerprint, content['graphics'], content['breakdown_offsets'],
+                       os.path.getsize(index_path))
+        except (OSError, ValueError, KeyError, AttributeError) as ex:
+            logger.warning("Load memory usage index failed, file path: %s, detail: %s.", index_path, str(ex))
+        return None
+
+    @classmethod
+    def clear_cache(cls):
+        """Clear the cached indexes."""
+        cls._indexes.clear()
+
+    @classmethod
+    def _remove_stale_indexes(cls):
+        """Remove the index files of the removed details files, at most once in `STALE_INDEX_CHECK_INTERVAL`."""
+        now = time.time()
+        if now - cls._last_stale_check_time < STALE_INDEX_CHECK_INTERVAL:
+            return
+        cls._last_stale_check_time = now
+        removed_count = remove_stale_cache_files(get_index_cache_dir(), _INDEX_SUFFIX, _read_details_file_path)
+        if removed_count:
+            logger.info("Remove %d stale memory usage indexes.", removed_count)
+
+
+def _read_details_file_path(index_path):
+    """Read the path of the details file from the leading members of its index file, None if it is invalid."""
+    try:
+        with open(index_path, 'rb') as file:
+            stream = _JsonStream(file, chunk_size=4096)
+            stream.expect('{')
+            while True:
+                key = _decode_key(stream)
+                if key == 'file_path':
+                    file_path = stream.decode()
+                    return file_path if isinstance(file_path, str) else None
+                stream.decode(keep=False)
+                if stream.expect(',}') == '}':
+                    return None
+    except (OSError, ValueError) as ex:
+        logger.warning("Read memory usage index failed, index path: %s, detail: %s.", index_path, str(ex))
+        return None
+
+
+def _decode_key(stream):
+    """Decode the key of an object member and the colon after it."""
+    key = stream.decode()
+    if not isinstance(key, str):
+        raise ValueError('Expecting property name at offset %d.' % stream.offset)
+    stream.expect(':')
+    return key
+
+
+def _read_graph(stream):
+    """
+    Read a graph, the breakdowns are skipped with their offsets recorded.
+
+    Args:
+        stream (_JsonStream): The stream at the start of the graph.
+
+    Returns:
+        tuple[dict, Union[list[int], None]], the graph without breakdowns, and the start and end offsets of
+            each node in the breakdowns, None if there are no breakdowns.
+    """
+    graph = {}
+    offsets = None
+    stream.expect('{')
+    if stream.peek() == '}':
+        stream.expect('}')
+        return graph, offsets
+    while True:
+        key = _decode_key(stream)
+        if key != 'breakdowns':
+            graph[key] = stream.decode()
+        elif stream.peek() == '[':
+            offsets = _read_array_offsets(stream)
+        else:
+            # The breakdowns which are not a list can not be read by node.
+            offsets = None
+            stream.decode(keep=False)
+        if stream.expect(',}') == '}':
+            return graph, offsets
+
+
+def _read_array_offsets(stream):
+    """Skip an array and get the start and end offsets of its elements, flattened."""
+    offsets = []
+    stream.expect('[')
+    if stream.peek() == ']':
+        stream.expect(']')
+        return offsets
+    while True:
+        offsets.append(stream.offset)
+        stream.decode(keep=False)
+        offsets.append(stream.offset)
+        if stream.expect(',]') == ']':
+            return offsets
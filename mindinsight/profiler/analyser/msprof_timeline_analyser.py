@@ -14,17 +14,31 @@
 # ============================================================================
 """The Timeline Analyser."""
 import csv
+import hashlib
+import itertools
 import json
 import os
 import glob
 import re
 import time
 from decimal import Decimal
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+
+import numpy as np
 from marshmallow import ValidationError
 
+from mindinsight.conf import settings
 from mindinsight.profiler.analyser.base_analyser import BaseAnalyser
+from mindinsight.profiler.analyser.timeline_store import TimelineStore, TimelineStoreBuilder, format_ns, \
+    get_store_path, prune_store_files, to_ns
 from mindinsight.profiler.common.log import logger
+from mindinsight.utils.cache import LRUCache
+from mindinsight.utils.computing_resource_mgr import ComputingResourceManager
+
+# The timestamps are in microseconds with 3 decimals, they are merged as int64 nanoseconds.
+_US_TO_NS = 1000
+# The max memory size of the cached timeline stores which are not saved in the workspace, in bytes.
+MAX_TIMELINE_STORE_CACHE_SIZE = 1024 * 1024 * 1024
 
 
 def get_diff_time(rank_id, prof_path):
@@ -41,6 +55,23 @@ def get_diff_time(rank_id, prof_path):
     return Decimal(diff_time).quantize(Decimal('0.000'))
 
 
+def shift_events_ts(events, offset_ns):
+    """
+    Subtract the offset from the timestamps of events in place.
+
+    Args:
+        events (list[dict]): The events, the events without timestamps are skipped.
+        offset_ns (int): The offset in nanoseconds.
+    """
+    ts_events = [event for event in events if event.get('ts')]
+    if not ts_events:
+        return
+    ts_values = np.array([to_ns(event['ts']) for event in ts_events], dtype=np.int64)
+    ts_values -= offset_ns
+    for event, ts in zip(ts_events, format_ns(ts_values)):
+        event['ts'] = ts
+
+
 def get_rank_id_from_info_json(pro_path):
     """
     Get rank id and device id from PROFXXX
@@ -75,14 +106,14 @@ def get_timeline_info(prof_dirs):
 
     for prof_path in prof_dirs:
         rank_id, _ = get_rank_id_from_info_json(prof_path)
-        ts_difference_us = get_diff_time(rank_id, prof_path)
+        ts_difference_ns = to_ns(get_diff_time(rank_id, prof_path))
         if rank_id is None:
             logger.warning('Could not find the rank id in %s, ignore this file.', prof_path)
             continue
 
         if rank_id not in timeline_info or (rank_id in timeline_info and prof_path > timeline_info.get(rank_id)[0]):
             prof_path = os.path.join(prof_path, 'mindstudio_profiler_output')
-            timeline_info[rank_id] = (prof_path, ts_difference_us)
+            timeline_info[rank_id] = (prof_path, ts_difference_ns)
 
     return timeline_info
 
@@ -116,6 +147,7 @@ class MsprofTimelineAnalyser(BaseAnalyser):
     """
     Analyse timeline data from file.
     """
+    _timeline_stores = LRUCache(MAX_TIMELINE_STORE_CACHE_SIZE)
 
     def __init__(self, profiling_dir, device_id=None):
         super(MsprofTimelineAnalyser, self).__init__(profiling_dir, device_id)
@@ -132,7 +164,69 @@ class MsprofTimelineAnalyser(BaseAnalyser):
         """
         Get the merged timeline
         """
+        sub_dirs = self._get_sub_dirs(rank_list)
+        if not sub_dirs:
+            return []
+
+        start = time.time()
+        timeline_data = list(itertools.chain.from_iterable(
+            self._iter_timeline_data(sub_dirs, model_list, kind, merge_model, scope_name)))
+        logger.info("%s timeline time consuming: %s", kind, time.time() - start)
+        return timeline_data
+
+    def query_merged_timeline(self, rank_list, model_list, kind, merge_model=True, scope_name=False,
+                              start=None, end=None, resolution=None):
+        """
+        Query the merged timeline in the time window `[start, end)`.
+
+        The merged timeline is built into a store once, which is saved in the workspace and rebuilt only if the
+        source files change.
 
+        Args:
+            rank_list (list[int]): The ranks to merge, all the ranks are merged if it is empty.
+            model_list (list[int]): The models to merge, all the models are merged if it is empty.
+            kind (str): The kind of the timeline, 'summary' or 'detail'.
+            merge_model (bool): Whether to merge the step trace of models. Default: True.
+            scope_name (bool): Whether to add the scope layers. Default: False.
+            start (int): The start of the window in nanoseconds. Default: None.
+            end (int): The end of the window in nanoseconds. Default: None.
+            resolution (int): The number of buckets of the window to merge short events in, refer to
+                `TimelineStore.query`. Default: None.
+
+        Returns:
+            list[dict], the events of the merged timeline in the window.
+        """
+        store = self._get_timeline_store(rank_list, model_list, kind, merge_model, scope_name)
+        if store is None:
+            return []
+        return store.query(start, end, resolution)
+
+    def iter_merged_timeline_json(self, rank_list, model_list, kind, merge_model=True, scope_name=False,
+                                  start=None, end=None, resolution=None):
+        """
+        Query the merged timeline like `MsprofTimelineAnalyser.query_merged_timeline`, the events are encoded as a
+        JSON array piece by piece, so that a large timeline can be sent without decoding the stored events.
+
+        Args:
+            rank_list (list[int]): The ranks to merge, all the ranks are merged if it is empty.
+            model_list (list[int]): The models to merge, all the models are merged if it is empty.
+            kind (str): The kind of the timeline, 'summary' or 'detail'.
+            merge_model (bool): Whether to merge the step trace of models. Default: True.
+            scope_name (bool): Whether to add the scope layers. Default: False.
+            start (int): The start of the window in nanoseconds. Default: None.
+            end (int): The end of the window in nanoseconds. Default: None.
+            resolution (int): The number of buckets of the window to merge short events in. Default: None.
+
+        Returns:
+            iterator[bytes], the pieces of the JSON array.
+        """
+        store = self._get_timeline_store(rank_list, model_list, kind, merge_model, scope_name)
+        if store is None:
+            return iter([b'[]'])
+        return store.iter_json(start, end, resolution)
+
+    def _get_sub_dirs(self, rank_list):
+        """Get the job directory and the time difference of the ranks to merge."""
         # get all job path, like PROF_*
         sub_dirs = get_job_dir(self._profiling_dir)
 
@@ -145,25 +239,76 @@ class MsprofTimelineAnalyser(BaseAnalyser):
 
         if not sub_dirs:
             logger.error('Could not found any rank from %s', rank_list)
-            return []
+        return sub_dirs
 
+    def _iter_timeline_data(self, sub_dirs, model_list, kind, merge_model, scope_name):
+        """Iterate the timeline data of each rank by the kind of the timeline."""
         if kind == 'summary':
-            start = time.time()
-            summary_data = self._get_summary_timeline_data(sub_dirs, merge_model)
-            logger.info("Summary timeline time consuming: %s", time.time() - start)
-            return summary_data
-
+            return self._get_summary_timeline_data(sub_dirs, merge_model)
         if kind == 'detail':
+            return self._get_detail_timeline_data(sub_dirs, model_list, merge_model, scope_name)
+        return iter([])
+
+    def _get_timeline_store(self, rank_list, model_list, kind, merge_model, scope_name):
+        """
+        Get the store of the merged timeline, the store is built if it is not cached or the source files change.
+
+        Returns:
+            Union[TimelineStore, None], the store, None if there is no rank to merge.
+        """
+        sub_dirs = self._get_sub_dirs(rank_list)
+        if not sub_dirs or kind not in ('summary', 'detail'):
+            return None
+
+        store_key = hashlib.sha256(json.dumps([self._profiling_dir, sorted(sub_dirs), sorted(model_list or []),
+                                               kind, merge_model, scope_name]).encode('utf-8')).hexdigest()
+        fingerprint = self._get_timeline_fingerprint(sub_dirs)
+        store = self._timeline_stores.get(store_key)
+        if store is not None and store.fingerprint == fingerprint:
+            return store
+
+        store_path = get_store_path(store_key)
+        store = TimelineStore.load(store_path, fingerprint)
+        if store is None:
             start = time.time()
-            detail_data = self._get_detail_timeline_data(sub_dirs, model_list, merge_model, scope_name)
-            logger.info("Detail timeline time consuming: %s", time.time() - start)
-            return detail_data
-        return []
+            builder = TimelineStoreBuilder(fingerprint)
+            for rank_timeline in self._iter_timeline_data(sub_dirs, model_list, kind, merge_model, scope_name):
+                builder.add_events(rank_timeline)
+            store = builder.build()
+            logger.info("Build %s timeline store time consuming: %s", kind, time.time() - start)
+            if store.save(store_path):
+                prune_store_files()
+                store = TimelineStore.load(store_path, fingerprint) or store
+        self._timeline_stores.put(store_key, store, store.memory_size)
+        return store
+
+    def _get_timeline_fingerprint(self, sub_dirs):
+        """
+        Get the fingerprint of the files the merged timeline is built from.
+
+        Args:
+            sub_dirs (dict[int, tuple[str, int]]): The job directory and the time difference of each rank.
+
+        Returns:
+            str, the hex digest of the paths, modification time and size of the files.
+        """
+        file_stats = []
+        for rank_id, (job_dir, _) in sorted(sub_dirs.items()):
+            file_paths = sorted(glob.glob(os.path.join(job_dir, '*')))
+            file_paths.append(os.path.join(self._profiling_dir, f'profiler_info_{rank_id}.json'))
+            file_paths.append(os.path.join(self._profiling_dir, f'cpu_op_execute_timestamp_{rank_id}.txt'))
+            for file_path in file_paths:
+                try:
+                    file_stat = os.stat(file_path)
+                except OSError:
+                    file_stats.append([file_path, None])
+                    continue
+                file_stats.append([file_path, file_stat.st_mtime_ns, file_stat.st_size])
+        return hashlib.sha256(json.dumps(file_stats).encode('utf-8')).hexdigest()
 
     def parse_cpu_timeline(self, file_list, rank_id, difference_ts, scope_name):
-        """Load cpu operator data from file"""
+        """Load cpu operator data from file, the timestamps are in nanoseconds."""
         ms_to_us = 1e3
-        ps_to_ns = 1e-3
         new_pid = int(f'{self.cpu_index}{rank_id}')
         process_list = [{"name": "process_name",
                          "pid": new_pid,
@@ -177,6 +322,7 @@ class MsprofTimelineAnalyser(BaseAnalyser):
         tid_set = set()
         thread_list = []
         new_timeline = []
+        ts_list = []
         scope_data = []
         try:
             flags = os.O_RDONLY
@@ -189,13 +335,14 @@ class MsprofTimelineAnalyser(BaseAnalyser):
                         time_arr = time_arr.split(" ")
                         for time_str in time_arr:
                             ts, dur, tid = time_str.split(",")
-                            ts = Decimal(ts).quantize(Decimal('0.000')) * Decimal(ps_to_ns).quantize(Decimal('0.000'))
+                            # The timestamp in nanoseconds, the fraction of nanoseconds is dropped.
+                            ts = to_ns(ts) // _US_TO_NS
 
                             if scope_name and op_full_name and op_full_name.startswith(self.top_scope_name):
-                                te = ts + Decimal(dur).quantize(Decimal('0.000'))
+                                te = ts + to_ns(dur)
                                 scope_data.append((op_full_name.split('/')[:-1], ts, te))
 
-                            ts -= difference_ts
+                            ts_list.append(ts)
 
                             if int(tid) not in tid_set:
                                 tid_set.add(int(tid))
@@ -210,18 +357,20 @@ class MsprofTimelineAnalyser(BaseAnalyser):
                                                  'pid': new_pid,
                                                  'tid': int(tid),
                                                  'ph': 'X',
-                                                 'ts': str(ts),
                                                  'dur': float(dur) * ms_to_us,
                                                  'args':
                                                      {'type': op_list[1]}
                                                  })
                 break
 
+            ts_values = np.array(ts_list, dtype=np.int64) - difference_ts
+            for event, ts in zip(new_timeline, format_ns(ts_values)):
+                event['ts'] = ts
             return process_list + thread_list + new_timeline, scope_data
 
         except (ValidationError, IOError, OSError, json.JSONDecodeError) as err:
             logger.error('parse_cann_data failed! please theck. detail: %s', err)
-            return []
+            return [], []
 
     def get_option(self):
         """
@@ -284,13 +433,9 @@ class MsprofTimelineAnalyser(BaseAnalyser):
                     event["args"]["sort_index"] = self.overlap_index
 
                 event['pid'] = new_pid
-                if event.get('ts'):
-                    ts = Decimal(event.get('ts')).quantize(Decimal('0.000'))
-                    ts += difference_ts
-                    event['ts'] = str(ts)
-
                 new_events.append(event)
 
+            shift_events_ts(new_events, -difference_ts)
             return new_events
 
         except (ValidationError, IOError, OSError, json.JSONDecodeError) as err:
@@ -364,13 +509,10 @@ class MsprofTimelineAnalyser(BaseAnalyser):
                     event_name.split(' ')) == 2:
                 event['name'] = f"{arg_name} {event_name}"
 
-            if event.get('ts'):
-                ts = Decimal(event.get('ts')).quantize(Decimal('0.000'))
-                ts -= difference_ts
-                event['ts'] = str(ts)
             event['pid'] = new_pid
             event['tid'] = 0
             new_events.append(event)
+        shift_events_ts(new_events, difference_ts)
         return new_events
 
     def _parse_step_trace_not_merge(self, old_pid, new_pid, rank_id, raw_data, difference_ts):
@@ -385,11 +527,8 @@ class MsprofTimelineAnalyser(BaseAnalyser):
                 event['args']['sort_index'] = self.step_trace_index
 
             event['pid'] = new_pid
-            if event.get('ts'):
-                ts = Decimal(event.get('ts')).quantize(Decimal('0.000'))
-                ts -= difference_ts
-                event['ts'] = str(ts)
             new_events.append(event)
+        shift_events_ts(new_events, difference_ts)
         return new_events
 
     def _parse_step_trace_data(self, file_list, rank_id, difference_ts, model_list, merge_model):
@@ -474,15 +613,10 @@ class MsprofTimelineAnalyser(BaseAnalyser):
 
             op_full_name = event.get('name')
             if scope_name and op_full_name and op_full_name.startswith(self.top_scope_name):
-                ts = Decimal(event.get('ts')).quantize(Decimal('0.000'))
-                te = ts + Decimal(event.get('dur')).quantize(Decimal('0.000'))
+                ts = to_ns(event.get('ts'))
+                te = ts + to_ns(event.get('dur'))
                 scope_data.append((op_full_name.split('/')[:-1], ts, te))
 
-            if event.get('ts'):
-                ts = Decimal(event.get('ts')).quantize(Decimal('0.000'))
-                ts -= difference_ts
-                event['ts'] = str(ts)
-
             if event.get('pid') == kwargs.get('pid_hardware') and event.get('ph') != 'M' \
                     and event.get('tid') in tid_mapper_hardware:
                 event['pid'] = kwargs.get('new_pid_hardware')
@@ -500,7 +634,9 @@ class MsprofTimelineAnalyser(BaseAnalyser):
                 event['pid'] = kwargs.get('new_pid_overlap')
                 new_events_overlap.append(event)
 
-        return new_events_hardware + new_events_hccl + new_events_cann + new_events_overlap, scope_data
+        new_events = new_events_hardware + new_events_hccl + new_events_cann + new_events_overlap
+        shift_events_ts(new_events, difference_ts)
+        return new_events, scope_data
 
     def _parse_msprof_data(self, file_list, rank_id, difference_ts, model_list, scope_name):
         """
@@ -564,7 +700,7 @@ class MsprofTimelineAnalyser(BaseAnalyser):
 
             if is_pid_valid:
                 logger.error('Could not found process_name pid. method: _parse_msprof_data')
-                return []
+                return [], []
 
             pid_dict = {'pid_hardware': pid_hardware, 'pid_hccl': pid_hccl,
                         'pid_cann': pid_cann, 'pid_overlap': pid_overlap,
@@ -577,7 +713,7 @@ class MsprofTimelineAnalyser(BaseAnalyser):
 
         except (ValidationError, IOError, OSError, json.JSONDecodeError) as err:
             logger.error('_parse_msprof_data failed! please theck. detail: %s', err)
-            return []
+            return [], []
 
     def _parse_scope_info(self, scope_data, rank_id, difference_ts):
         """parse scope layer"""
@@ -615,15 +751,13 @@ class MsprofTimelineAnalyser(BaseAnalyser):
                     if layer_stack[layer_depth][0] == layer_name and flag:
                         layer_stack[layer_depth][2] = op[2]  # 合并
                     else:
-                        ts = layer_stack[layer_depth][1]
-                        ts -= difference_ts
                         new_events.append({
                             "name": layer_stack[layer_depth][0],
                             "pid": new_pid,
                             "tid": layer_depth,
                             "ph": "X",
-                            "ts": str(ts),
-                            "dur": float(layer_stack[layer_depth][2] - layer_stack[layer_depth][1])
+                            "ts": layer_stack[layer_depth][1],
+                            "dur": (layer_stack[layer_depth][2] - layer_stack[layer_depth][1]) / _US_TO_NS
                         })
                         layer_stack[layer_depth] = [layer_name, op[1], op[2]]
                         flag = False
@@ -646,57 +780,47 @@ class MsprofTimelineAnalyser(BaseAnalyser):
                 "ph": "M"
             }])
             if layer:
-                ts = layer[1]
-                ts -= difference_ts
                 new_events.append({
                     "name": layer[0],
                     "pid": new_pid,
                     "tid": index,
                     "ph": "X",
-                    "ts": str(ts),
-                    "dur": float(layer[2] - layer[1])
+                    "ts": layer[1],
+                    "dur": (layer[2] - layer[1]) / _US_TO_NS
                 })
 
+        ts_values = np.fromiter((event['ts'] for event in new_events), dtype=np.int64, count=len(new_events))
+        for event, ts in zip(new_events, format_ns(ts_values - difference_ts)):
+            event['ts'] = ts
         return process_list + thread_list + new_events
 
     def _get_summary_timeline_data(self, sub_dirs, merge_model):
         """
         Get summary timeline
         Returns:
-            json, the content of timeline data.
+            iterator, the timeline data of each rank.
         """
-        task_list = []
-        timeline_data = []
-        with ThreadPoolExecutor() as pool:
-            for rank_id, (job_dir, difference_ts) in sub_dirs.items():
-
-                # get step trace
-                step_trace_file_name = fr'{job_dir}/step_trace_*.json'
-                file_list = get_newest_file(glob.glob(step_trace_file_name))
-
-                if not file_list:
-                    logger.warning('Could not find step trace file in %s', job_dir)
-                else:
-                    task_list.append(pool.submit(self._parse_step_trace_data, file_list,
-                                                 rank_id, difference_ts, None,
-                                                 merge_model))
-
-                # get overlap analysis
-                overlap_file_name = fr'{job_dir}/msprof_*.json'
-                file_list = get_newest_file(glob.glob(overlap_file_name))
+        return self._iter_rank_timelines(sub_dirs, self._get_rank_summary_timeline, merge_model)
 
-                if not file_list:
-                    logger.warning('Could not find overlap analysis file in %s', job_dir)
-                else:
-                    task_list.append(pool.submit(self._parse_overlap_analysis_data, file_list,
-                                                 rank_id, difference_ts))
+    def _get_rank_summary_timeline(self, rank_id, job_dir, difference_ts, merge_model):
+        """Get the summary timeline of a rank."""
+        timeline_data = []
 
-            all_done = list(range(len(task_list)))
-            while all_done:
-                for ind, t in enumerate(task_list):
-                    if ind in all_done and t.done():
-                        timeline_data.extend(t.result())
-                        all_done.remove(ind)
+        # get step trace
+        step_trace_file_name = fr'{job_dir}/step_trace_*.json'
+        file_list = get_newest_file(glob.glob(step_trace_file_name))
+        if not file_list:
+            logger.warning('Could not find step trace file in %s', job_dir)
+        else:
+            timeline_data.extend(self._parse_step_trace_data(file_list, rank_id, difference_ts, None, merge_model))
+
+        # get overlap analysis
+        overlap_file_name = fr'{job_dir}/msprof_*.json'
+        file_list = get_newest_file(glob.glob(overlap_file_name))
+        if not file_list:
+            logger.warning('Could not find overlap analysis file in %s', job_dir)
+        else:
+            timeline_data.extend(self._parse_overlap_analysis_data(file_list, rank_id, difference_ts))
 
         return timeline_data
 
@@ -704,12 +828,8 @@ class MsprofTimelineAnalyser(BaseAnalyser):
         """
         Get detail timeline
         Returns:
-            json, the content of timeline data.
+            iterator, the timeline data of each rank.
         """
-
-        timeline_data = []
-        task_list = []
-
         _, model_merged = self._get_models(sub_dirs)
         model_list_all = list(model_merged)
         if model_list_all:
@@ -719,57 +839,78 @@ class MsprofTimelineAnalyser(BaseAnalyser):
         if model_list_all == model_list:
             model_list = None
 
-        with ThreadPoolExecutor() as pool:
-            for rank_id, (job_dir, difference_ts) in sub_dirs.items():
-                all_scope_data = []  # 所有带scope的算子
+        return self._iter_rank_timelines(sub_dirs, self._get_rank_detail_timeline,
+                                          model_list, merge_model, scope_name)
 
-                # get step_trace data
-                step_trace_file_name = fr'{job_dir}/step_trace_*.json'
-                file_list_step_trace = get_newest_file(glob.glob(step_trace_file_name))
-                if not file_list_step_trace:
-                    logger.warning('Could not find step trace file in %s', job_dir)
-                else:
-                    task_list.append(pool.submit(self._parse_step_trace_data, file_list_step_trace,
-                                                 rank_id, difference_ts, model_list, merge_model))
-
-                # get Ascend Hardware 、Hccl、CANN、overlap
-                msprof_file_name = fr'{job_dir}/msprof_*.json'
-                file_list_msprof = get_newest_file(glob.glob(msprof_file_name))
-                if not file_list_msprof:
-                    logger.warning('Could not find msprof file in %s', job_dir)
-                else:
-                    ascend_timeline, scope_data = self._parse_msprof_data(file_list_msprof,
-                                                                          rank_id, difference_ts, model_list,
-                                                                          scope_name)
-                    timeline_data.extend(ascend_timeline)
-                    all_scope_data.extend(scope_data)
-
-                if not model_list:
-                    # get cpu op
-                    cpu_op_file_name = fr'{self._profiling_dir}/cpu_op_execute_timestamp_{rank_id}.txt'
-                    file_list = glob.glob(cpu_op_file_name)
-
-                    if not file_list:
-                        logger.warning('Could not find cpu op file in %s', job_dir)
-                    else:
-                        cpu_timeline, scope_data = self.parse_cpu_timeline(get_newest_file(file_list),
-                                                                           rank_id, difference_ts, scope_name)
-                        timeline_data.extend(cpu_timeline)
-                        all_scope_data.extend(scope_data)
-
-                # parse scope info
-                task_list.append(pool.submit(self._parse_scope_info, all_scope_data,
-                                             rank_id, difference_ts))
-
-            all_done = list(range(len(task_list)))
-            while all_done:
-                for ind, t in enumerate(task_list):
-                    if ind in all_done and t.done():
-                        timeline_data.extend(t.result())
-                        all_done.remove(ind)
+    def _get_rank_detail_timeline(self, rank_id, job_dir, difference_ts, model_list, merge_model, scope_name):
+        """Get the detail timeline of a rank."""
+        timeline_data = []
+        all_scope_data = []  # 所有带scope的算子
+
+        # get step_trace data
+        step_trace_file_name = fr'{job_dir}/step_trace_*.json'
+        file_list_step_trace = get_newest_file(glob.glob(step_trace_file_name))
+        if not file_list_step_trace:
+            logger.warning('Could not find step trace file in %s', job_dir)
+        else:
+            timeline_data.extend(self._parse_step_trace_data(file_list_step_trace, rank_id, difference_ts,
+                                                             model_list, merge_model))
+
+        # get Ascend Hardware 、Hccl、CANN、overlap
+        msprof_file_name = fr'{job_dir}/msprof_*.json'
+        file_list_msprof = get_newest_file(glob.glob(msprof_file_name))
+        if not file_list_msprof:
+            logger.warning('Could not find msprof file in %s', job_dir)
+        else:
+            ascend_timeline, scope_data = self._parse_msprof_data(file_list_msprof, rank_id, difference_ts,
+                                                                  model_list, scope_name)
+            timeline_data.extend(ascend_timeline)
+            all_scope_data.extend(scope_data)
+
+        if not model_list:
+            # get cpu op
+            cpu_op_file_name = fr'{self._profiling_dir}/cpu_op_execute_timestamp_{rank_id}.txt'
+            file_list = glob.glob(cpu_op_file_name)
 
+            if not file_list:
+                logger.warning('Could not find cpu op file in %s', job_dir)
+            else:
+                cpu_timeline, scope_data = self.parse_cpu_timeline(get_newest_file(file_list),
+                                                                   rank_id, difference_ts, scope_name)
+                timeline_data.extend(cpu_timeline)
+                all_scope_data.extend(scope_data)
+
+        # parse scope info
+        timeline_data.extend(self._parse_scope_info(all_scope_data, rank_id, difference_ts))
         return timeline_data
 
+    def _iter_rank_timelines(self, sub_dirs, get_rank_timeline, *args):
+        """
+        Get the timelines of ranks in a process pool, the timelines are yielded once they are completed.
+
+        Args:
+            sub_dirs (dict[int, tuple[str, int]]): The job directory and the time difference in nanoseconds
+                of each rank.
+            get_rank_timeline (Callable): The method to get the timeline of a rank, which is called with the rank
+                ID, the job directory, the time difference and `args`.
+            args (tuple): The other arguments of `get_rank_timeline`.
+
+        Yields:
+            list[dict], the timeline data of a rank.
+        """
+        max_processes_cnt = min(len(sub_dirs), settings.MAX_PROCESSES_COUNT)
+        if max_processes_cnt <= 1:
+            # The events are passed between processes by pickling, which is not worthwhile with one process.
+            for rank_id, (job_dir, difference_ts) in sub_dirs.items():
+                yield get_rank_timeline(rank_id, job_dir, difference_ts, *args)
+            return
+
+        with ComputingResourceManager.get_instance().get_executor(max_processes_cnt=max_processes_cnt) as executor:
+            futures = [executor.submit(get_rank_timeline, rank_id, job_dir, difference_ts, *args)
+                       for rank_id, (job_dir, difference_ts) in sub_dirs.items()]
+            for future in as_completed(futures):
+                yield future.result()
+
     def _get_models(self, sub_dirs):
         """
         Get all models
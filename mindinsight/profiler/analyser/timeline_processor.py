@@ -17,106 +17,210 @@ import os
 import re
 import json
 import collections
+
+import numpy as np
+
 from mindinsight.profiler.common.util import analyse_device_list_from_profiler_dir
 from mindinsight.profiler.common.validator.validate_path import validate_and_normalize_path
+from mindinsight.utils.cache import LRUCache
+
+
+# The max total size of the display files loaded by the cached services, in bytes.
+MAX_SERVICE_CACHE_SIZE = 1024 * 1024 * 1024
+
+TimelineData = collections.namedtuple('TimelineData', ['operator_time_maps', 'min_time', 'max_time', 'stage_data'])
 
 
 class TimelineService:
     """
     Analyse timeline data for marey's graph from file.
+
+    The operators of each device are indexed by their start time when the data is loaded, so the operators of a
+    step are found by range lookups instead of scanning all the operators.
     """
     _ascend_display_filename = 'ascend_timeline_display_{}.json'
     _gpu_display_filename = 'gpu_timeline_display_{}.json'
+    _service_cache = LRUCache(MAX_SERVICE_CACHE_SIZE)
 
     def __init__(self, path, device_list):
         self._display_timeline = True
         self.__read_data(path, device_list)
         self.__align_time()
+        self.__build_index()
+
+    @classmethod
+    def get_service(cls, path, device_list):
+        """
+        Get the service of the timeline data, which is cached until the display files change.
+
+        Args:
+            path (str): The current train log directory.
+            device_list (str): The device IDs separated by commas, the first 8 devices are used if it is None.
+
+        Returns:
+            TimelineService, the service of the timeline data.
+        """
+        file_stats = []
+        for device in cls._get_device_ids(path, device_list):
+            try:
+                stat = os.stat(os.path.join(path, cls._ascend_display_filename.format(device)))
+            except (OSError, ValueError):
+                file_stats.append(None)
+                continue
+            file_stats.append((stat.st_mtime_ns, stat.st_size))
+        file_stats = tuple(file_stats)
+        cache_key = (path, device_list)
+        cached = cls._service_cache.get(cache_key)
+        if cached is not None and cached[0] == file_stats:
+            return cached[1]
+        service = cls(path, device_list)
+        size = sum(stat[1] for stat in file_stats if stat is not None)
+        cls._service_cache.put(cache_key, (file_stats, service), max(size, 1))
+        return service
+
+    @classmethod
+    def clear_cache(cls):
+        """Clear the cached services."""
+        cls._service_cache.clear()
 
     def get_ops_by_step(self, step):
         """
         Get the operators of the given step.
 
+        An operator belongs to the step if it starts in the step, or it starts before the step and ends in the
+        step. If an operator name occurs several times in a step, the last operator is kept.
+
         Args:
-            step (int): The current step.
+            step (str): The current step.
+
+        Returns:
+            TimelineData, the operators of each device, the min start time and the max end time of the operators,
+                and the statistics of the operators in each stage.
         """
         min_time = float('inf')
         max_time = 0
         operator_time_maps = {}
+        step_ops = {}
 
-        for device_name, cur_op_nodes in self.op_nodes.items():
-            step_start = 0.0
-            step_end = float('inf')
-            for item in self.all_data.get(device_name):
-                if item['name'] == step:
-                    step_start = float(item['ts'])
-                    step_end = step_start + float(item['dur'])
-                    break
+        for device_name, op_index in self._op_index.items():
+            step_start, step_end = self.__get_step_range(device_name, step)
+            indexes = op_index.query(step_start, step_end)
+            if indexes.size:
+                min_time = min(min_time, op_index.starts[indexes].min().item())
+                max_time = max(max_time, op_index.ends[indexes].max().item())
+            indexes = _get_last_indexes(op_index.codes[indexes], indexes)
+            codes = op_index.codes[indexes]
+            starts = op_index.starts[indexes]
+            ends = op_index.ends[indexes]
+            step_ops[device_name] = (codes, starts, ends)
+            operator_time_maps[device_name] = {
+                self._op_names[code]: {"st": st, "ed": ed, "dur": dur}
+                for code, st, ed, dur in zip(codes.tolist(), starts.tolist(), ends.tolist(),
+                                             op_index.durs[indexes].tolist())
+            }
 
-            operator_time_maps[device_name] = {}
-            for item in cur_op_nodes:
-                ts = float(item['ts'])
-                dur = float(item['dur'])
-                if step_start < ts < step_end or dur < step_start < ts + dur:
-                    operator_time_maps.get(device_name)[item['name']] = {"st": ts,
-                                                                         "ed": ts + dur,
-                                                                         "dur": dur}
-                    max_time = max(max_time, ts + dur)
-                    min_time = min(min_time, ts)
+        stage_data = {}
+        for stage_name, device_names in self.stage_device_map.items():
+            stage_ops = [step_ops.get(device_name) for device_name in device_names]
+            stage_data[stage_name] = {"data": self.__aggregate_stage_ops(stage_ops), "devices": device_names}
+        return TimelineData(operator_time_maps, min_time, max_time, stage_data)
 
-        def cmp(a):
-            return int(re.search(r'\d+', a[0]).group())
+    def __get_step_range(self, device_name, step):
+        """
+        Get the start and end time of the step marker on the device.
 
-        a = 0
-        stage_data = {}
-        for device_names in sorted(self.stage_info, key=cmp):
-            stage_name = 'stage' + str(a)
-            a += 1
-            data = {}
-            for device_name in device_names:
-                nodes = operator_time_maps.get(device_name)
-                for node_name, node in nodes.items():
-                    if node_name in data:
-                        aggre_node = data.get(node_name)
-                        aggre_node['st_max'] = max(aggre_node.get('st_max'), node.get('st'))
-                        aggre_node['st_min'] = min(aggre_node.get('st_min'), node.get('st'))
-                        aggre_node['ed_max'] = max(aggre_node.get('ed_max'), node.get('ed'))
-                        aggre_node['ed_min'] = min(aggre_node.get('ed_min'), node.get('ed'))
-                        aggre_node['st_avg'] = (node['st'] + aggre_node['st_avg'] *
-                                                aggre_node['n']) / (aggre_node['n'] + 1)
-                        aggre_node['ed_avg'] = (node['ed'] + aggre_node['ed_avg'] *
-                                                aggre_node['n']) / (aggre_node['n'] + 1)
-                        aggre_node['n'] += 1
-                    else:
-                        data[node_name] = {
-                            'st_max': node['st'],
-                            'st_min': node['st'],
-                            'st_avg': node['st'],
-                            'ed_max': node['ed'],
-                            'ed_min': node['ed'],
-                            'ed_avg': node['ed'],
-                            'n': 1
-                        }
-            stage_data[stage_name] = {"data": data, "devices": device_names}
-        TimelineData = collections.namedtuple('TimelineData',
-                                              ['operator_time_maps', 'min_time', 'max_time', 'stage_data'])
-        timeline_data = TimelineData(operator_time_maps, min_time, max_time, stage_data)
-        return timeline_data
+        Args:
+            device_name (str): The device name.
+            step (str): The step name.
 
-    def __read_data(self, path, device_list):
+        Returns:
+            tuple[float, float], the start and end time, the whole timeline if the step is not found.
         """
-        Get timeline data.
+        item = self._first_items.get(device_name).get(step)
+        if item is None:
+            return 0.0, float('inf')
+        step_start = float(item['ts'])
+        return step_start, step_start + float(item['dur'])
+
+    def __aggregate_stage_ops(self, stage_ops):
+        """
+        Aggregate the start and end time of the operators with the same name in a stage.
 
         Args:
-            path (string): The current train log directory.
+            stage_ops (list[tuple[numpy.ndarray]]): The name codes, start time and end time of the operators
+                on each device of the stage.
+
+        Returns:
+            dict, the max, min and average start and end time, and the count of each operator name, ordered by
+                the first occurrence.
         """
+        codes, starts, ends = (np.concatenate(columns) for columns in zip(*stage_ops))
+        unique_codes, first_indexes, inverse, counts = np.unique(
+            codes, return_index=True, return_inverse=True, return_counts=True)
+        columns = []
+        for values in (starts, ends):
+            max_values = np.full(unique_codes.size, -np.inf)
+            min_values = np.full(unique_codes.size, np.inf)
+            np.maximum.at(max_values, inverse, values)
+            np.minimum.at(min_values, inverse, values)
+            avg_values = np.bincount(inverse, weights=values, minlength=unique_codes.size) / counts
+            columns.extend((max_values, min_values, avg_values))
+        order = np.argsort(first_indexes, kind='stable')
+        columns = [column[order].tolist() for column in columns]
+        data = {}
+        for code, st_max, st_min, st_avg, ed_max, ed_min, ed_avg, count in zip(
+                unique_codes[order].tolist(), *columns, counts[order].tolist()):
+            data[self._op_names[code]] = {
+                'st_max': st_max,
+                'st_min': st_min,
+                'st_avg': st_avg,
+                'ed_max': ed_max,
+                'ed_min': ed_min,
+                'ed_avg': ed_avg,
+                'n': count
+            }
+        return data
+
+    def __build_index(self):
+        """Index the operators and the step markers of each device."""
+        self._op_names = []
+        self._op_index = {}
+        self._first_items = {}
+        name_codes = {}
+        for device_name, cur_op_nodes in self.op_nodes.items():
+            codes = []
+            for item in cur_op_nodes:
+                code = name_codes.get(item['name'])
+                if code is None:
+                    code = len(self._op_names)
+                    name_codes[item['name']] = code
+                    self._op_names.append(item['name'])
+                codes.append(code)
+            self._op_index[device_name] = _OperatorIndex(
+                codes, [item['ts'] for item in cur_op_nodes], [float(item['dur']) for item in cur_op_nodes])
+
+            first_items = {}
+            for item in self.all_data.get(device_name):
+                first_items.setdefault(item.get('name'), item)
+            self._first_items[device_name] = first_items
+
+    @staticmethod
+    def _get_device_ids(path, device_list):
+        """Get the device IDs, the first 8 devices in the directory are used if the device list is None."""
         if device_list is None:
             device_list, _, _ = analyse_device_list_from_profiler_dir(path)
             sorted_device_list = sorted(device_list, key=int)
-            device_list = sorted_device_list[:8]
-        else:
-            device_list = device_list.split(",")
+            return sorted_device_list[:8]
+        return device_list.split(",")
 
+    def __read_data(self, path, device_list):
+        """
+        Get timeline data.
+
+        Args:
+            path (string): The current train log directory.
+        """
+        device_list = self._get_device_ids(path, device_list)
         self.all_data = {}
         self.op_nodes = {}
         for device in device_list:
@@ -235,6 +339,63 @@ class TimelineService:
         return ret
 
 
+class _OperatorIndex:
+    """
+    The operators of a device sorted by the start time.
+
+    Args:
+        codes (list[int]): The name codes of the operators.
+        starts (list[float]): The start time of the operators.
+        durs (list[float]): The duration of the operators.
+    """
+
+    def __init__(self, codes, starts, durs):
+        self.codes = np.array(codes, dtype=np.int64)
+        self.starts = np.array(starts, dtype=np.float64)
+        self.durs = np.array(durs, dtype=np.float64)
+        self.ends = self.starts + self.durs
+        self._order = np.argsort(self.starts, kind='stable')
+        self._sorted_starts = self.starts[self._order]
+        # The max end time of the operators starting earlier, which is increasing for binary search.
+        self._max_ends = np.maximum.accumulate(self.ends[self._order]) if self._order.size else self.ends
+
+    def query(self, start, end):
+        """
+        Get the operators starting in the range, or starting before the range and ending after its start.
+
+        Args:
+            start (float): The start of the range, exclusive.
+            end (float): The end of the range, exclusive.
+
+        Returns:
+            numpy.ndarray, the indexes of the operators in increasing order.
+        """
+        before_begin = np.searchsorted(self._max_ends, start, side='right')
+        before_end = np.searchsorted(self._sorted_starts, start, side='left')
+        inside_begin = np.searchsorted(self._sorted_starts, start, side='right')
+        inside_end = max(np.searchsorted(self._sorted_starts, end, side='left'), inside_begin)
+        before = self._order[before_begin:before_end]
+        before = before[self.ends[before] > start]
+        return np.sort(np.concatenate((before, self._order[inside_begin:inside_end])))
+
+
+def _get_last_indexes(codes, indexes):
+    """
+    Get the last operator of each name, ordered by the first occurrence of the names.
+
+    Args:
+        codes (numpy.ndarray): The name codes of the operators.
+        indexes (numpy.ndarray): The indexes of the operators.
+
+    Returns:
+        numpy.ndarray, the indexes of the last operators.
+    """
+    _, first_positions = np.unique(codes, return_index=True)
+    _, last_positions = np.unique(codes[::-1], return_index=True)
+    last_positions = codes.size - 1 - last_positions
+    return indexes[last_positions[np.argsort(first_positions, kind='stable')]]
+
+
 def _filt_op(item):
     if 'AtomicAddrClean' in item['name'] or 'StreamSend' in item['name'] or 'StreamReceive' in item['name']:
         return False
@@ -0,0 +1,457 @@
+# Copyright 2026 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+The store of merged timelines.
+
+The events of a merged timeline are serialized one by one into a blob, and indexed by their start and end time in
+nanoseconds, so that the events in a time window can be read without loading the whole timeline. The store is saved
+as a single file in the MindInsight workspace, whose arrays are memory mapped when it is loaded.
+"""
+import json
+import os
+import struct
+from decimal import Decimal
+
+import numpy as np
+
+from mindinsight.conf import settings
+from mindinsight.profiler.common.log import logger
+from mindinsight.utils.cache import write_cache_file
+
+STORE_VERSION = 1
+# The max total size of the store files in the workspace, the least recently used files are removed beyond it.
+MAX_STORE_DISK_SIZE = 16 * 1024 * 1024 * 1024
+MERGED_EVENTS_ARG = 'Merged Events'
+
+_US_TO_NS = 1000
+_MAGIC = b'MITLSTOR'
+# The magic and the length of the JSON header.
+_PREFIX = struct.Struct('<8sQ')
+_ALIGNMENT = 8
+_STORE_SUFFIX = '.timeline'
+_ENCODER = json.JSONEncoder(separators=(',', ':'))
+# The max size and count of events of the pieces of JSON.
+_JSON_PIECE_SIZE = 16 * 1024 * 1024
+_JSON_PIECE_COUNT = 10000
+
+
+def get_store_cache_dir():
+    """Get the directory to store merged timelines."""
+    return os.path.join(settings.WORKSPACE, 'cache', 'msprof_timeline')
+
+
+def to_ns(value):
+    """
+    Convert a timestamp in microseconds to nanoseconds, the timestamp is rounded to 3 decimals like
+    `Decimal(value).quantize(Decimal('0.000'))`.
+
+    Args:
+        value (Union[str, int, float, Decimal]): The timestamp in microseconds.
+
+    Returns:
+        int, the timestamp in nanoseconds.
+    """
+    if isinstance(value, int):
+        return value * _US_TO_NS
+    if isinstance(value, str):
+        integer, _, fraction = value.partition('.')
+        if len(fraction) <= 3:
+            try:
+                return int(integer + fraction.ljust(3, '0'))
+            except ValueError:
+                pass
+    return int(Decimal(value).quantize(Decimal('0.000')) * _US_TO_NS)
+
+
+def format_ns(ns_values):
+    """
+    Format timestamps in nanoseconds as strings of microseconds with 3 decimals.
+
+    Args:
+        ns_values (numpy.ndarray): The timestamps in nanoseconds.
+
+    Returns:
+        list[str], the formatted timestamps.
+    """
+    formatted = []
+    for ns in ns_values.tolist():
+        if ns >= _US_TO_NS:
+            digits = str(ns)
+            formatted.append(f'{digits[:-3]}.{digits[-3:]}')
+        else:
+            sign = '-' if ns < 0 else ''
+            formatted.append(f'{sign}{abs(ns) // _US_TO_NS}.{abs(ns) % _US_TO_NS:03d}')
+    return formatted
+
+
+class TimelineStoreBuilder:
+    """
+    Build a timeline store from events, the events are serialized once they are added.
+
+    Args:
+        fingerprint (Any): The JSON serializable fingerprint of the source files of the timeline.
+    """
+
+    def __init__(self, fingerprint):
+        self._fingerprint = fingerprint
+        self._metadata_events = []
+        self._chunks = []
+        self._lengths = []
+        self._starts = []
+        self._ends = []
+        self._tracks = []
+        self._names = []
+        self._complete_flags = []
+        self._track_indexes = {}
+        self._name_indexes = {}
+
+    def add_events(self, events):
+        """
+        Add events, the events without timestamps, such as metadata events, are returned by every query.
+
+        Args:
+            events (list[dict]): The events in Chrome trace event format.
+        """
+        track_indexes = self._track_indexes
+        name_indexes = self._name_indexes
+        encode = _ENCODER.encode
+        records = []
+        for event in events:
+            ts = event.get('ts')
+            if not ts:
+                self._metadata_events.append(event)
+                continue
+            start = to_ns(ts)
+            dur = event.get('dur')
+            self._starts.append(start)
+            # The end is only used to find the events in a window, so the duration needs not to be exact.
+            self._ends.append(start + max(round(float(dur) * _US_TO_NS), 0) if dur else start)
+            self._tracks.append(track_indexes.setdefault((event.get('pid'), event.get('tid')), len(track_indexes)))
+            self._names.append(name_indexes.setdefault(event.get('name'), len(name_indexes)))
+            self._complete_flags.append(event.get('ph') == 'X')
+            # The separator of the items of a JSON array is prepended, so the records can be joined into an array.
+            records.append((',' + encode(event)).encode('utf-8'))
+        self._lengths.extend(len(record) for record in records)
+        self._chunks.append(b''.join(records))
+
+    def build(self):
+        """
+        Build the store.
+
+        Returns:
+            TimelineStore, the store in memory.
+        """
+        starts = np.array(self._starts, dtype=np.int64)
+        order = np.argsort(starts, kind='stable')
+        starts = starts[order]
+        ends = np.array(self._ends, dtype=np.int64)[order]
+        lengths = np.array(self._lengths, dtype=np.int64)
+        arrays = {
+            'starts': starts,
+            'ends': ends,
+            # The max end of the events before each event, to find the first event overlapping a window.
+            'max_ends': np.maximum.accumulate(ends) if len(ends) else ends,
+            'tracks': np.array(self._tracks, dtype=np.int32)[order],
+            'names': np.array(self._names, dtype=np.int32)[order],
+            'complete_flags': np.array(self._complete_flags, dtype=np.bool_)[order],
+            'records': order.astype(np.int64),
+            'offsets': np.concatenate(([0], np.cumsum(lengths))).astype(np.int64)
+        }
+        header = {
+            'version': STORE_VERSION,
+            'fingerprint': self._fingerprint,
+            'metadata_events': self._metadata_events,
+            'tracks': list(self._track_indexes),
+            'names': list(self._name_indexes)
+        }
+        return TimelineStore(header, arrays, b''.join(self._chunks))
+
+
+class TimelineStore:
+    """
+    The events of a merged timeline indexed by time.
+
+    Args:
+        header (dict): The fingerprint, metadata events, tracks and names of the timeline.
+        arrays (dict[str, numpy.ndarray]): The index arrays of the events sorted by start time.
+        blob (Union[bytes, numpy.ndarray]): The serialized events.
+    """
+
+    def __init__(self, header, arrays, blob):
+        self._header = header
+        self._arrays = arrays
+        self._blob = blob
+        self._mapped = not isinstance(blob, bytes)
+
+    @property
+    def fingerprint(self):
+        """The fingerprint of the source files of the timeline."""
+        return self._header['fingerprint']
+
+    @property
+    def memory_size(self):
+        """The size of the memory used by the store, the memory mapped arrays are not counted."""
+        if self._mapped:
+            return 1
+        return len(self._blob) + sum(array.nbytes for array in self._arrays.values())
+
+    def __len__(self):
+        return len(self._header['metadata_events']) + len(self._arrays['starts'])
+
+    def query(self, start=None, end=None, resolution=None):
+        """
+        Query the events in the time window `[start, end)`.
+
+        If the resolution is given, the window is divided into `resolution` buckets, and the complete events of each
+        track starting in the same bucket are merged into one event, which is named after the longest event and
+        spans all the merged events.
+
+        Args:
+            start (int): The start of the window in nanoseconds, the window is unbounded if it is None.
+                Default: None.
+            end (int): The end of the window in nanoseconds, the window is unbounded if it is None. Default: None.
+            resolution (int): The number of buckets of the window. Default: None.
+
+        Returns:
+            list[dict], the metadata events followed by the events in the window sorted by start time.
+        """
+        events = [dict(event) for event in self._header['metadata_events']]
+        items = self._query_items(start, end, resolution)
+        records = iter(self._read_records(np.array([item for item in items if not isinstance(item, dict)],
+                                                   dtype=np.int64)))
+        for item in items:
+            events.append(item if isinstance(item, dict) else json.loads(next(records)[1:]))
+        return events
+
+    def iter_json(self, start=None, end=None, resolution=None):
+        """
+        Query the events like `TimelineStore.query`, the events are encoded as a JSON array piece by piece.
+
+        Args:
+            start (int): The start of the window in nanoseconds. Default: None.
+            end (int): The end of the window in nanoseconds. Default: None.
+            resolution (int): The number of buckets of the window. Default: None.
+
+        Yields:
+            bytes, the pieces of the JSON array, the events of the whole timeline are not sorted.
+        """
+        metadata_events = self._header['metadata_events']
+        yield ('[' + ','.join(_ENCODER.encode(event) for event in metadata_events)).encode('utf-8')
+        if start is None and end is None and resolution is None:
+            pieces = (self._blob[offset:offset + _JSON_PIECE_SIZE]
+                      for offset in range(0, len(self._blob), _JSON_PIECE_SIZE))
+        else:
+            pieces = self._iter_item_pieces(self._query_items(start, end, resolution))
+
+        # The separator before the first item is removed.
+        is_first = not metadata_events
+        for piece in pieces:
+            piece = bytes(piece)
+            if is_first and piece:
+                piece = piece[1:]
+                is_first = False
+            yield piece
+        yield b']'
+
+    def _iter_item_pieces(self, items):
+        """Encode the queried items in pieces."""
+        for piece_start in range(0, len(items), _JSON_PIECE_COUNT):
+            piece_items = items[piece_start:piece_start + _JSON_PIECE_COUNT]
+            records = iter(self._read_records(
+                np.array([item for item in piece_items if not isinstance(item, dict)], dtype=np.int64)))
+            yield b''.join((',' + _ENCODER.encode(item)).encode('utf-8') if isinstance(item, dict) else next(records)
+                           for item in piece_items)
+
+    def _query_items(self, start, end, resolution):
+        """
+        Query the events in the window.
+
+        Returns:
+            list[Union[int, dict]], the indexes of the stored events or the merged events, sorted by start time.
+        """
+        starts = self._arrays['starts']
+        ends = self._arrays['ends']
+        low = 0 if start is None else int(np.searchsorted(self._arrays['max_ends'], start, side='left'))
+        high = len(starts) if end is None else int(np.searchsorted(starts, end, side='left'))
+        indexes = np.arange(low, max(low, high), dtype=np.int64)
+        if start is not None and len(indexes):
+            indexes = indexes[(ends[low:high] > start) | (starts[low:high] >= start)]
+        if resolution is None or not len(indexes):
+            return indexes.tolist()
+
+        window_start = int(starts[indexes[0]]) if start is None else start
+        window_end = int(ends[indexes].max()) if end is None else end
+        return self._merge_events(indexes, window_start, window_end, resolution)
+
+    def _merge_events(self, indexes, window_start, window_end, resolution):
+        """Merge the complete events of each track starting in the same bucket of the window."""
+        starts = self._arrays['starts'][indexes]
+        ends = self._arrays['ends'][indexes]
+        span = max(window_end - window_start, 1)
+        # A bucket is at least one nanosecond.
+        resolution = min(resolution, span)
+        # The buckets are computed in float to avoid overflow.
+        buckets = np.clip(((starts - window_start) / span * resolution).astype(np.int64), 0, resolution - 1)
+        # Incomplete events, such as flow events, are kept as separate groups.
+        keys = np.where(self._arrays['complete_flags'][indexes],
+                        self._arrays['tracks'][indexes].astype(np.int64) * resolution + buckets,
+                        -1 - np.arange(len(indexes), dtype=np.int64))
+        # Sort by keys, and then the longest event first in each group.
+        order = np.lexsort((starts - ends, keys))
+        group_starts = np.flatnonzero(np.concatenate(([True], np.diff(keys[order]) != 0)))
+        counts = np.diff(np.append(group_starts, len(order)))
+        first_starts = np.minimum.reduceat(starts[order], group_starts)
+        last_ends = np.maximum.reduceat(ends[order], group_starts)
+        longest = indexes[order[group_starts]]
+
+        items = []
+        tracks = self._header['tracks']
+        names = self._header['names']
+        for index, count, first_start, first_ts, last_end in zip(
+                longest.tolist(), counts.tolist(), first_starts.tolist(), format_ns(first_starts),
+                last_ends.tolist()):
+            if count == 1:
+                items.append((first_start, index))
+                continue
+            pid, tid = tracks[self._arrays['tracks'][index]]
+            items.append((first_start, {
+                'name': names[self._arrays['names'][index]],
+                'pid': pid,
+                'tid': tid,
+                'ph': 'X',
+                'ts': first_ts,
+                'dur': (last_end - first_start) / _US_TO_NS,
+                'args': {MERGED_EVENTS_ARG: count}
+            }))
+        items.sort(key=lambda item: item[0])
+        return [item for _, item in items]
+
+    def _read_records(self, indexes):
+        """Read the records of events by their indexes in the sorted events, with the leading separators."""
+        offsets = self._arrays['offsets']
+        records = self._arrays['records'][indexes]
+        blob = self._blob
+        return [bytes(blob[record_start:record_end])
+                for record_start, record_end in zip(offsets[records].tolist(), offsets[records + 1].tolist())]
+
+    def save(self, file_path):
+        """
+        Save the store to a file.
+
+        Args:
+            file_path (str): The path of the store file.
+
+        Returns:
+            bool, True if the store is saved.
+        """
+        array_specs = {}
+        offset = 0
+        for name, array in self._arrays.items():
+            array_specs[name] = [array.dtype.str, offset, len(array)]
+            offset += _align(array.nbytes)
+        array_specs['blob'] = ['|u1', offset, len(self._blob)]
+        header = dict(self._header, arrays=array_specs)
+        header_bytes = json.dumps(header).encode('utf-8')
+        data_offset = _align(_PREFIX.size + len(header_bytes))
+
+        def write(file):
+            file.write(_PREFIX.pack(_MAGIC, len(header_bytes)))
+            file.write(header_bytes)
+            for name, array in self._arrays.items():
+                file.seek(data_offset + array_specs[name][1])
+                file.write(np.ascontiguousarray(array).tobytes())
+            file.seek(data_offset + array_specs['blob'][1])
+            file.write(self._blob)
+
+        try:
+            write_cache_file(file_path, write)
+        except OSError as ex:
+            logger.warning("Save timeline store failed, file path: %s, detail: %s.", file_path, str(ex))
+            return False
+        return True
+
+    @classmethod
+    def load(cls, file_path, fingerprint):
+        """
+        Load the store from a file, the arrays are memory mapped.
+
+        Args:
+            file_path (str): The path of the store file.
+            fingerprint (Any): The current fingerprint of the source files of the timeline.
+
+        Returns:
+            Union[TimelineStore, None], the store if it matches the fingerprint, else None.
+        """
+        if not os.path.isfile(file_path):
+            return None
+        try:
+            with open(file_path, 'rb') as file:
+                magic, header_size = _PREFIX.unpack(file.read(_PREFIX.size))
+                if magic != _MAGIC:
+                    return None
+                header = json.loads(file.read(header_size))
+            if header.get('version') != STORE_VERSION or header.get('fingerprint') != fingerprint:
+                return None
+            data_offset = _align(_PREFIX.size + header_size)
+            arrays = {}
+            for name, (dtype, offset, count) in header.pop('arrays').items():
+                if count:
+                    arrays[name] = np.memmap(file_path, dtype=np.dtype(dtype), mode='r',
+                                             offset=data_offset + offset, shape=(count,))
+                else:
+                    arrays[name] = np.empty(0, dtype=np.dtype(dtype))
+            header['tracks'] = [tuple(track) for track in header['tracks']]
+            os.utime(file_path)
+        except (OSError, ValueError, KeyError, struct.error) as ex:
+            logger.warning("Load timeline store failed, file path: %s, detail: %s.", file_path, str(ex))
+            return None
+        blob = arrays.pop('blob')
+        return cls(header, arrays, blob)
+
+
+def get_store_path(store_key):
+    """Get the path of the store file by the hex digest of the store key."""
+    return os.path.join(get_store_cache_dir(), store_key + _STORE_SUFFIX)
+
+
+def prune_store_files(max_size=MAX_STORE_DISK_SIZE):
+    """
+    Remove the least recently used store files if their total size exceeds the max size.
+
+    Args:
+        max_size (int): The max total size of the store files. Default: MAX_STORE_DISK_SIZE.
+    """
+    cache_dir = get_store_cache_dir()
+    try:
+        entries = [entry for entry in os.scandir(cache_dir)
+                   if entry.is_file() and entry.name.endswith(_STORE_SUFFIX)]
+        file_stats = sorted(((entry.path, entry.stat()) for entry in entries),
+                            key=lambda item: item[1].st_mtime, reverse=True)
+    except OSError:
+        return
+    total_size = 0
+    for file_path, file_stat in file_stats:
+        total_size += file_stat.st_size
+        if total_size <= max_size:
+            continue
+        try:
+            os.remove(file_path)
+        except OSError as ex:
+            logger.warning("Remove timeline store failed, file path: %s, detail: %s.", file_path, str(ex))
+
+
+def _align(size):
+    """Align the size to the alignment of arrays."""
+    return (size + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
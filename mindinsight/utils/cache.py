@@ -0,0 +1,186 @@
+# Copyright 2026 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Bounded caches, and the files cached in the workspace."""
+import collections
+import os
+import stat
+import threading
+
+
+class LRUCache:
+    """
+    A thread-safe cache evicting the least recently used items.
+
+    Each item has a size, and the least recently used items are evicted when the total size exceeds the max size.
+
+    Args:
+        max_size (int): The max total size of cached items.
+    """
+
+    def __init__(self, max_size):
+        if max_size <= 0:
+            raise ValueError("'max_size' should be greater than 0.")
+        self._max_size = max_size
+        self._total_size = 0
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def total_size(self):
+        """The total size of cached items."""
+        return self._total_size
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get(self, key, default=None):
+        """
+        Get an item and mark it as the most recently used.
+
+        Args:
+            key (Hashable): The key of the item.
+            default (Any): The value returned if the key is not cached.
+
+        Returns:
+            Any, the cached value or the default value.
+        """
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return default
+            self._items.move_to_end(key)
+            return item[0]
+
+    def put(self, key, value, size=1):
+        """
+        Put an item, least recently used items are evicted if the total size exceeds the max size.
+
+        An item larger than the max size is not cached.
+
+        Args:
+            key (Hashable): The key of the item.
+            value (Any): The value of the item.
+            size (int): The size of the item. Default: 1.
+        """
+        with self._lock:
+            self._pop(key)
+            if size > self._max_size:
+                return
+            self._items[key] = (value, size)
+            self._total_size += size
+            while self._total_size > self._max_size:
+                _, (_, evicted_size) = self._items.popitem(last=False)
+                self._total_size -= evicted_size
+
+    def pop(self, key, default=None):
+        """
+        Remove an item.
+
+        Args:
+            key (Hashable): The key of the item.
+            default (Any): The value returned if the key is not cached.
+
+        Returns:
+            Any, the removed value or the default value.
+        """
+        with self._lock:
+            item = self._pop(key)
+            return default if item is None else item[0]
+
+    def pop_if(self, predicate):
+        """
+        Remove the items whose keys meet the predicate.
+
+        Args:
+            predicate (Callable[[Hashable], bool]): Determines whether an item is removed by its key.
+        """
+        with self._lock:
+            for key in [key for key in self._items if predicate(key)]:
+                self._pop(key)
+
+    def clear(self):
+        """Remove all items."""
+        with self._lock:
+            self._items.clear()
+            self._total_size = 0
+
+    def _pop(self, key):
+        """Remove an item without locking."""
+        item = self._items.pop(key, None)
+        if item is not None:
+            self._total_size -= item[1]
+        return item
+
+
+def write_cache_file(file_path, write, binary=True):
+    """
+    Write a cache file atomically, the file is only readable and writable by the owner.
+
+    The content is written to a temp file unique to the process and thread, which then replaces the cache file,
+    so the readers never see a partially written file.
+
+    Args:
+        file_path (str): The path of the cache file, its directory is created if it does not exist.
+        write (Callable[[IO], None]): Writes the content to the opened temp file.
+        binary (bool): Whether to open the temp file in binary mode. Default: True.
+
+    Raises:
+        OSError: If the cache file can not be written, the temp file is removed.
+    """
+    tmp_path = '%s.%d.%d.tmp' % (file_path, os.getpid(), threading.get_ident())
+    try:
+        os.makedirs(os.path.dirname(file_path), mode=stat.S_IRWXU, exist_ok=True)
+        with open(tmp_path, 'wb' if binary else 'w') as file:
+            write(file)
+        os.chmod(tmp_path, stat.S_IRUSR | stat.S_IWUSR)
+        os.replace(tmp_path, file_path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def remove_stale_cache_files(cache_dir, suffix, get_source_path):
+    """
+    Remove the cache files whose source files no longer exist.
+
+    Args:
+        cache_dir (str): The directory of the cache files.
+        suffix (str): The suffix of the cache files.
+        get_source_path (Callable[[str], Union[str, None]]): Gets the path of the source file from the path of a
+            cache file, None if the cache file is invalid, which is removed too.
+
+    Returns:
+        int, the number of removed cache files.
+    """
+    try:
+        with os.scandir(cache_dir) as entries:
+            cache_paths = [entry.path for entry in entries if entry.name.endswith(suffix) and entry.is_file()]
+    except OSError:
+        return 0
+    removed_count = 0
+    for cache_path in cache_paths:
+        source_path = get_source_path(cache_path)
+        if source_path is not None and os.path.exists(source_path):
+            continue
+        try:
+            os.remove(cache_path)
+        except FileNotFoundError:
+            continue
+        removed_count += 1
+    return removed_count
@@ -23,6 +23,8 @@ from mindinsight.utils.log import setup_logger
 
 F32_MIN, F32_MAX = np.finfo(np.float32).min, np.finfo(np.float32).max
 MAX_DIMENSIONS_FOR_TENSOR = 2
+# The number of elements processed at a time when calculating statistics, which bounds the temporary memory.
+STATISTICS_CHUNK_SIZE = 1024 * 1024
 
 
 class Statistics:
@@ -244,67 +246,82 @@ class TensorUtils:
         """
         logger = setup_logger("utils", "utils")
         try:
-            ma_value = np.ma.masked_invalid(tensors)
+            accumulated = TensorUtils._accumulate_statistics(tensors)
         except MemoryError as err:
             logger.error("Memory Error. %s", str(err))
             raise MindInsightMemoryError(str(err))
-        total, valid = tensors.size, ma_value.count()
-        invalids = []
-        for isfn in np.isnan, np.isposinf, np.isneginf:
-            if total - valid > sum(invalids):
-                count = np.count_nonzero(isfn(tensors))
-                invalids.append(count)
-            else:
-                invalids.append(0)
-
-        nan_count, pos_inf_count, neg_inf_count = invalids
+        total, valid = tensors.size, accumulated['valid_count']
         if not valid:
             logger.warning('There are no valid values in the tensors(size=%d, shape=%s)', total, tensors.shape)
             statistics = Statistics({'max_value': 0,
                                      'min_value': 0,
                                      'avg_value': 0,
                                      'count': total,
-                                     'nan_count': nan_count,
-                                     'neg_inf_count': neg_inf_count,
-                                     'pos_inf_count': pos_inf_count})
+                                     'nan_count': accumulated['nan_count'],
+                                     'neg_inf_count': accumulated['neg_inf_count'],
+                                     'pos_inf_count': accumulated['pos_inf_count']})
             return statistics
 
-        # BUG: max of a masked array with dtype np.float16 returns inf
-        # See numpy issue#15077
-        if issubclass(tensors.dtype.type, np.floating):
-            tensor_min = ma_value.min(fill_value=np.PINF)
-            tensor_max = ma_value.max(fill_value=np.NINF)
-            if tensor_min < F32_MIN or tensor_max > F32_MAX:
-                logger.warning('Values(%f, %f) are too large, you may encounter some undefined '
-                               'behaviours hereafter.', tensor_min, tensor_max)
-        else:
-            tensor_min = ma_value.min()
-            tensor_max = ma_value.max()
-        tensor_sum = ma_value.sum(dtype=np.float64)
-        neg_zero_count, pos_zero_count, zero_count = TensorUtils._np_count_comp_zero(ma_value)
+        tensor_min, tensor_max = accumulated['min_value'], accumulated['max_value']
+        if issubclass(tensors.dtype.type, np.floating) and (tensor_min < F32_MIN or tensor_max > F32_MAX):
+            logger.warning('Values(%f, %f) are too large, you may encounter some undefined '
+                           'behaviours hereafter.', tensor_min, tensor_max)
         statistics = Statistics({'is_bool': tensors.dtype == bool,
                                  'max_value': tensor_max,
                                  'min_value': tensor_min,
-                                 'avg_value': tensor_sum / valid,
+                                 'avg_value': accumulated['sum_value'] / valid,
                                  'count': total,
-                                 'neg_zero_count': neg_zero_count,
-                                 'pos_zero_count': pos_zero_count,
-                                 'zero_count': zero_count,
-                                 'nan_count': nan_count,
-                                 'neg_inf_count': neg_inf_count,
-                                 'pos_inf_count': pos_inf_count})
+                                 'neg_zero_count': accumulated['neg_zero_count'],
+                                 'pos_zero_count': accumulated['pos_zero_count'],
+                                 'zero_count': valid - accumulated['neg_zero_count'] - accumulated['pos_zero_count'],
+                                 'nan_count': accumulated['nan_count'],
+                                 'neg_inf_count': accumulated['neg_inf_count'],
+                                 'pos_inf_count': accumulated['pos_inf_count']})
         return statistics
 
     @staticmethod
-    def _np_count_comp_zero(ma_value):
-        """Sum the count of >0, <0 and =0."""
-        with np.errstate(invalid='ignore'):
-            neg_zero_count = np.sum(ma_value < 0)
-        with np.errstate(invalid='ignore'):
-            pos_zero_count = np.sum(ma_value > 0)
-        with np.errstate(invalid='ignore'):
-            zero_count = np.sum(ma_value == 0)
-        return neg_zero_count, pos_zero_count, zero_count
+    def _accumulate_statistics(tensors):
+        """
+        Accumulate the counts, extrema and sum of tensor in one pass.
+
+        The tensor is read by chunks of `STATISTICS_CHUNK_SIZE` elements in C order, so the temporary arrays
+        are bounded by the chunk size whatever the tensor size and memory layout are.
+
+        Args:
+            tensors (numpy.ndarray): An numpy.ndarray of tensor data.
+
+        Returns:
+            dict, the count of valid values, NAN, INF, negative and positive values, and the min, max and sum of
+                valid values.
+        """
+        accumulated = {'valid_count': 0, 'nan_count': 0, 'pos_inf_count': 0, 'neg_inf_count': 0,
+                       'neg_zero_count': 0, 'pos_zero_count': 0, 'min_value': None, 'max_value': None,
+                       'sum_value': np.float64(0)}
+        is_floating = issubclass(tensors.dtype.type, np.floating)
+        iterator = np.nditer(tensors, flags=['external_loop', 'buffered', 'zerosize_ok'], order='C',
+                             buffersize=STATISTICS_CHUNK_SIZE)
+        for chunk in iterator:
+            if is_floating:
+                finite = np.isfinite(chunk)
+                if not finite.all():
+                    nan_count = np.count_nonzero(np.isnan(chunk))
+                    pos_inf_count = np.count_nonzero(chunk == np.inf)
+                    accumulated['nan_count'] += nan_count
+                    accumulated['pos_inf_count'] += pos_inf_count
+                    accumulated['neg_inf_count'] += chunk.size - np.count_nonzero(finite) - nan_count - pos_inf_count
+                    chunk = chunk[finite]
+            if not chunk.size:
+                continue
+            chunk_min, chunk_max = chunk.min(), chunk.max()
+            if accumulated['min_value'] is None or chunk_min < accumulated['min_value']:
+                accumulated['min_value'] = chunk_min
+            if accumulated['max_value'] is None or chunk_max > accumulated['max_value']:
+                accumulated['max_value'] = chunk_max
+            accumulated['sum_value'] += chunk.sum(dtype=np.float64)
+            accumulated['valid_count'] += chunk.size
+            accumulated['neg_zero_count'] += np.count_nonzero(chunk < 0)
+            accumulated['pos_zero_count'] += np.count_nonzero(chunk > 0)
+        return accumulated
 
     @staticmethod
     def get_statistics_dict(stats, overall_stats):
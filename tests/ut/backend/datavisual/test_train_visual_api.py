@@ -18,14 +18,18 @@ Function:
 Usage:
     pytest tests/ut/datavisual
 """
+import json
+import struct
 from unittest.mock import Mock, patch
 
+import numpy as np
 import pytest
 
 from mindinsight.datavisual.processors.graph_processor import GraphProcessor
 from mindinsight.datavisual.processors.images_processor import ImageProcessor
 from mindinsight.datavisual.processors.scalars_processor import ScalarsProcessor
 from mindinsight.datavisual.processors.histogram_processor import HistogramProcessor
+from mindinsight.datavisual.processors.tensor_processor import TensorProcessor
 
 from ....utils.tools import get_url
 from .conftest import TRAIN_ROUTES
@@ -214,6 +218,17 @@ class TestTrainVisual:
         results = response.get_json()
         assert results == dict(metadatas=[dict(value=1)])
 
+    @patch.object(ScalarsProcessor, 'get_metadata_list')
+    def test_scalar_metadata_downsampled(self, mock_scalar_processor, client):
+        """Parsing downsampling params to get scalar metadata."""
+        mock_scalar_processor.return_value = {'metadatas': [{'value': 1}]}
+
+        params = dict(train_id='aa', tag='bb', max_points=100, downsample='minmax')
+        url = get_url(TRAIN_ROUTES['scalar_metadata'], params)
+        response = client.get(url)
+        assert response.status_code == 200
+        mock_scalar_processor.assert_called_once_with('aa', 'bb', max_points='100', downsample_mode='minmax')
+
     def test_graph_nodes_with_train_id_is_none(self, client):
         """Test getting graph nodes when train_id is none."""
         params = dict()
@@ -451,3 +466,32 @@ class TestTrainVisual:
         assert response.status_code == 200
         results = response.get_json()
         assert results == expect_resp
+
+    @patch.object(TensorProcessor, 'get_tensors')
+    def test_tensors_binary(self, mock_tensor_processor, client):
+        """Get tensor data in binary, with the data in aligned little-endian buffers."""
+        data = np.array([[1.5, np.nan], [np.inf, -np.inf]], dtype=np.float32)
+        mock_tensor_processor.return_value = {'tensors': [{'value': {'dims': [2, 2], 'data': data.T}}]}
+
+        params = dict(train_id='aa', tag='bb', step=1, dims='[:,:]', detail='data', format='binary')
+        response = client.get(get_url(TRAIN_ROUTES['tensors'], params))
+        assert response.status_code == 200
+        assert response.content_type == 'application/octet-stream'
+        mock_tensor_processor.assert_called_once_with(['aa'], ['bb'], '1', '[:,:]', 'data', binary=True)
+
+        body = response.get_data()
+        header_length = struct.unpack('<I', body[:4])[0]
+        assert (header_length + 4) % 8 == 0
+        header = json.loads(body[4:4 + header_length])
+        descriptor = header['tensors'][0]['value'].pop('data')['__ndarray__']
+        assert header == {'tensors': [{'value': {'dims': [2, 2]}}]}
+        assert descriptor == {'dtype': 'float32', 'shape': [2, 2], 'offset': 0, 'byte_length': 16}
+        recv_data = np.frombuffer(body, dtype='<f4', count=4, offset=4 + header_length).reshape(2, 2)
+        np.testing.assert_array_equal(recv_data, data.T)
+
+    def test_tensors_with_invalid_format(self, client):
+        """Test getting tensor data with invalid format."""
+        params = dict(train_id='aa', tag='bb', format='csv')
+        response = client.get(get_url(TRAIN_ROUTES['tensors'], params))
+        assert response.status_code == 400
+        assert response.get_json()['error_code'] == '50540002'
@@ -183,13 +183,29 @@ class TestExplainerApi:
         expect_result = {"explainer_scores": explainer_scores}
         assert response.get_json() == expect_result
 
+    @patch.object(DatafileEncap, "query_image_etag")
     @patch.object(DatafileEncap, "query_image_binary")
-    def test_query_image(self, mock_query_image_binary, client):
+    def test_query_image(self, mock_query_image_binary, mock_query_image_etag, client):
         """Test query a image's binary content."""
 
         mock_query_image_binary.return_value = b'123'
+        mock_query_image_etag.return_value = 'mock_etag'
 
         response = client.get(f"{EXPLAINER_ROUTES['image']}?train_id=.%2Fmock_job_1&path=1&type=original")
 
         assert response.status_code == 200
         assert response.data == b'123'
+        assert response.headers['ETag'] == '"mock_etag"'
+
+    @patch.object(DatafileEncap, "query_image_etag")
+    @patch.object(DatafileEncap, "query_image_binary")
+    def test_query_image_not_modified(self, mock_query_image_binary, mock_query_image_etag, client):
+        """Test query a image which is not modified since the last query."""
+
+        mock_query_image_etag.return_value = 'mock_etag'
+
+        response = client.get(f"{EXPLAINER_ROUTES['image']}?train_id=.%2Fmock_job_1&path=1&type=overlay",
+                              headers={'If-None-Match': '"mock_etag"'})
+
+        assert response.status_code == 304
+        mock_query_image_binary.assert_not_called()
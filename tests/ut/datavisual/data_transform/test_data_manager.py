@@ -27,9 +27,10 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from mindinsight.conf import settings
 from mindinsight.datavisual.common.enums import DataManagerStatus, PluginNameEnum
 from mindinsight.datavisual.common.exceptions import TrainJobNotExistError
-from mindinsight.datavisual.data_transform import data_manager
+from mindinsight.datavisual.data_transform import data_manager, summary_index
 from mindinsight.datavisual.data_transform.data_loader import DataLoader
 from mindinsight.datavisual.data_transform.data_manager import DataManager
 from mindinsight.datavisual.data_transform.events_data import EventsData
@@ -39,6 +40,7 @@ from mindinsight.datavisual.data_transform.ms_data_loader import MSDataLoader
 from mindinsight.utils.exceptions import ParamValueError
 
 from ..mock import MockLogger
+from ....utils.log_operations import LogOperations
 
 
 class TestDataManager:
@@ -212,3 +214,81 @@ class TestDataManager:
         assert sorted(current_loader_ids) == sorted(expected_loader_ids)
 
         shutil.rmtree(summary_base_dir)
+
+    def test_brief_cache_update_changed_train_jobs(self):
+        """Test brief cache updaters only update the train jobs changed on disk."""
+        summary_base_dir = tempfile.mkdtemp()
+        for index in range(3):
+            self._make_path_and_file_list(os.path.join(summary_base_dir, f'job{index}'))
+        old_time = time.time() - 3600
+        for name in os.listdir(summary_base_dir):
+            os.utime(os.path.join(summary_base_dir, name), (old_time, old_time))
+
+        updater = Mock(spec=data_manager.BaseCacheItemUpdater)
+        brief_cache = data_manager._BriefCacheManager(summary_base_dir)
+        brief_cache.register_cache_item_updater(updater)
+        brief_cache.update_cache()
+        assert updater.update_item.call_count == 3
+
+        updater.update_item.reset_mock()
+        brief_cache.update_cache()
+        updater.update_item.assert_not_called()
+
+        with open(os.path.join(summary_base_dir, 'job1', 'summary.001'), 'a') as file:
+            file.write('data')
+        brief_cache.update_cache()
+        assert [call[0][0].train_id for call in updater.update_item.call_args_list] == ['./job1']
+        shutil.rmtree(summary_base_dir)
+
+    def test_summary_index_saved_for_unchanged_train_job(self):
+        """Test the index of a summary file settled after loaded is saved, though the train job is unchanged."""
+        summary_base_dir = tempfile.mkdtemp()
+        workspace = tempfile.mkdtemp()
+        log_dir = os.path.join(summary_base_dir, 'job')
+        os.mkdir(log_dir)
+        old_time = int(time.time() - 3600)
+        file_path, _, _ = LogOperations().generate_log(PluginNameEnum.SCALAR.value, log_dir, {'time': old_time})
+        for path in (file_path, log_dir):
+            os.utime(path, (old_time, old_time))
+
+        with patch.object(settings, 'WORKSPACE', workspace):
+            d_manager = DataManager(summary_base_dir)
+            # The summary file is still being written when it is loaded.
+            with patch.object(summary_index, 'INDEX_SETTLE_SECONDS', 7200):
+                thread, brief_thread = d_manager.start_load_data()
+                thread.join()
+                brief_thread.join()
+            index_dir = summary_index.get_index_cache_dir()
+            assert not os.path.exists(index_dir) or not os.listdir(index_dir)
+
+            thread, brief_thread = d_manager.start_load_data()
+            thread.join()
+            brief_thread.join()
+            assert d_manager._detail_cache.summary_changes is not None
+            assert './job' not in d_manager._detail_cache.summary_changes.updated
+            assert len(os.listdir(index_dir)) == 1
+
+            loader = d_manager._detail_cache._loader_pool['./job']
+            assert not loader.data_loader.has_unsaved_indexes
+            d_manager.close()
+        shutil.rmtree(summary_base_dir)
+        shutil.rmtree(workspace)
+
+    def test_close(self):
+        """Test the summary watchers of data manager share the directory monitor, which is closed with it."""
+        summary_base_dir = tempfile.mkdtemp()
+        d_manager = DataManager(summary_base_dir)
+        monitor = d_manager._directory_monitor
+        if monitor is None:
+            shutil.rmtree(summary_base_dir)
+            pytest.skip("Inotify is not available.")
+        assert d_manager._brief_cache._summary_watcher._monitor is monitor
+        assert d_manager._summary_watcher._monitor is monitor
+
+        self._make_path_and_file_list(os.path.join(summary_base_dir, 'job'))
+        d_manager.close()
+        assert monitor.closed
+        d_manager._summary_watcher.list_summary_directories_with_changes(summary_base_dir)
+        assert not monitor.is_watching(os.path.join(os.path.realpath(summary_base_dir), 'job'),
+                                       d_manager._summary_watcher)
+        shutil.rmtree(summary_base_dir)
@@ -51,6 +51,11 @@ class MockReservoir:
 
         self._samples.append(sample)
 
+    def last_step(self):
+        """Replace the last_step function."""
+
+        return self._samples[-1].step if self._samples else None
+
     def remove_sample(self, sample):
         """Replace the remove_sample function."""
 
@@ -68,12 +73,12 @@ class TestEventsData:
         """Mock original logger, init a EventsData object for use."""
         self._ev_data = EventsData()
         self._ev_data._tags_by_plugin = {
-            'plugin_name1': [f'tag{i}' for i in range(10)],
-            'plugin_name2': [f'tag{i}' for i in range(20, 30)]
+            'plugin_name1': dict.fromkeys(f'tag{i}' for i in range(10)),
+            'plugin_name2': dict.fromkeys(f'tag{i}' for i in range(20, 30))
         }
         self._ev_data._tags_by_plugin_mutex_lock.update({'plugin_name1': threading.Lock()})
         self._ev_data._reservoir_by_tag = {'tag0': MockReservoir(500), 'new_tag': MockReservoir(500)}
-        self._ev_data._tags = [f'tag{i}' for i in range(settings.MAX_TAG_SIZE_PER_EVENTS_DATA)]
+        self._ev_data._tags = dict.fromkeys(f'tag{i}' for i in range(settings.MAX_TAG_SIZE_PER_EVENTS_DATA))
 
     def get_ev_data(self):
         """Get the EventsData object."""
@@ -112,7 +117,7 @@ class TestEventsData:
 
         ev_data.add_tensor_event(t_event)
         assert 'tag0' not in ev_data._tags
-        assert ev_data._tags[-1] == 'new_tag'
+        assert list(ev_data._tags)[-1] == 'new_tag'
         assert 'tag0' not in ev_data._tags_by_plugin['plugin_name1']
         assert 'tag0' not in ev_data._reservoir_by_tag
         assert 'new_tag' in ev_data._tags_by_plugin['plugin_name1']
@@ -122,7 +127,7 @@ class TestEventsData:
     def test_add_tensor_event_out_of_order(self):
         """Test add_tensor_event success for out_of_order summaries."""
         wall_time = 1
-        value = '1'
+        value = 1.0
         tag = 'tag'
         plugin_name = 'scalar'
         file1 = 'summary.1'
@@ -19,15 +19,22 @@ Usage:
     pytest tests/ut/datavisual
 """
 import os
+import pickle
 import shutil
 import tempfile
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
+from mindinsight.conf import settings
 from mindinsight.datavisual.data_transform import ms_data_loader
 from mindinsight.datavisual.data_transform.ms_data_loader import MSDataLoader
 from mindinsight.datavisual.data_transform.ms_data_loader import _PbParser
+from mindinsight.datavisual.data_transform.ms_data_loader import _SummaryParser
 from mindinsight.datavisual.data_transform.events_data import TensorEvent
+from mindinsight.datavisual.data_transform.graph import MSGraph
+from mindinsight.datavisual.data_transform.graph import OptimizedGraph
+from mindinsight.datavisual.data_transform.summary_index import SummaryIndex
 from mindinsight.datavisual.common.enums import PluginNameEnum
+from mindinsight.datavisual.proto_files import mindinsight_anf_ir_pb2 as anf_ir_pb2
 
 from ..mock import MockLogger
 from ....utils.log_generators.graph_pb_generator import create_graph_pb_file
@@ -94,6 +101,78 @@ class TestMsDataLoader:
         assert len(plugins) == 1
         assert plugins[0] == filename
 
+    def test_load_summary_file_in_batches(self):
+        """Test load summary file with batches smaller than the file."""
+        summary_dir = tempfile.mkdtemp()
+        write_file(os.path.join(summary_dir, 'test.summary.1'), SCALAR_RECORD)
+        ms_loader = MSDataLoader(summary_dir)
+        ms_loader._parser_list[0] = _SummaryParser(summary_dir, max_batch_count=2)
+        ms_loader.load()
+        events_data = ms_loader.get_events_data()
+        tensors = events_data.tensors('tag_name/scalar')
+        shutil.rmtree(summary_dir)
+        assert [tensor.step for tensor in tensors] == [1, 3, 5]
+
+    def test_events_parse(self):
+        """Test parse a batch of event strings in order."""
+        events = []
+        offset = 0
+        while offset < RECORD_LEN:
+            event_len = int.from_bytes(SCALAR_RECORD[offset:offset + 8], 'little')
+            events.append((offset, SCALAR_RECORD[offset + 12:offset + 12 + event_len]))
+            offset += 12 + event_len + 4
+        records = _SummaryParser._events_parse(events, 'test.summary.1')
+        assert [record[0] for record in records] == [event[0] for event in events]
+        assert [tensor_events[0].step for _, tensor_events in records] == [1, 3, 5]
+
+    def test_load_summary_file_from_index(self):
+        """Test load summary file from its saved index."""
+        summary_dir = tempfile.mkdtemp()
+        workspace = tempfile.mkdtemp()
+        file_path = os.path.join(summary_dir, 'test.summary.1')
+        write_file(file_path, SCALAR_RECORD)
+        os.utime(file_path, (1, 1))
+        with patch.object(settings, 'WORKSPACE', workspace):
+            ms_loader = MSDataLoader(summary_dir)
+            ms_loader.load()
+            # The index is saved once all the events of the settled file are added.
+            assert SummaryIndex.load(file_path, RECORD_LEN, 1) is not None
+
+            ms_loader = MSDataLoader(summary_dir)
+            with patch.object(_SummaryParser, '_load_single_file') as mock_load_single_file:
+                ms_loader.load()
+            tensors = ms_loader.get_events_data().tensors('tag_name/scalar')
+        shutil.rmtree(summary_dir)
+        shutil.rmtree(workspace)
+        mock_load_single_file.assert_not_called()
+        assert [tensor.step for tensor in tensors] == [1, 3, 5]
+
+    def test_index_extended_after_loaded_from_index(self):
+        """Test the records appended to a summary file loaded from its index are added to the index."""
+        summary_dir = tempfile.mkdtemp()
+        workspace = tempfile.mkdtemp()
+        file_path = os.path.join(summary_dir, 'test.summary.1')
+        write_file(file_path, SCALAR_RECORD)
+        os.utime(file_path, (1, 1))
+        with patch.object(settings, 'WORKSPACE', workspace):
+            ms_loader = MSDataLoader(summary_dir)
+            ms_loader.load()
+            ms_loader.load()
+
+            ms_loader = MSDataLoader(summary_dir)
+            ms_loader.load()
+            with open(file_path, 'ab') as file:
+                file.write(SCALAR_RECORD)
+            os.utime(file_path, (2, 2))
+            ms_loader.load()
+            ms_loader.load()
+            summary_index = SummaryIndex.load(file_path, RECORD_LEN * 2, 2)
+        shutil.rmtree(summary_dir)
+        shutil.rmtree(workspace)
+        assert summary_index is not None
+        assert summary_index.end_offset == RECORD_LEN * 2
+        assert len(summary_index.get_scalar_records('test.summary.1')) == 6
+
 
 class TestPbParser:
     """Test pb parser"""
@@ -116,6 +195,45 @@ class TestPbParser:
         for tensor_event in tensor_events:
             assert isinstance(tensor_event, TensorEvent)
 
+    def test_build_graph_events(self):
+        """Test building graph events from a graph proto parsed once."""
+        filename = 'ms_output.pb'
+        file_path = create_graph_pb_file(output_dir=self._summary_dir, filename=filename)
+        with open(file_path, 'rb') as file:
+            model_proto = anf_ir_pb2.ModelProto.FromString(file.read())
+        expected_graph = OptimizedGraph()
+        expected_graph.build_graph(model_proto.graph)
+
+        graph_event, optimized_graph_event = ms_data_loader.build_graph_events(model_proto.graph, filename, 0, 0)
+        assert isinstance(graph_event.value.get_graph(), MSGraph)
+        assert optimized_graph_event.plugin_name == PluginNameEnum.OPTIMIZED_GRAPH.value
+        lazy_graph = pickle.loads(pickle.dumps(optimized_graph_event.value))
+        assert lazy_graph._graph is None
+        assert lazy_graph.list_node_by_scope() == expected_graph.list_node_by_scope()
+        assert lazy_graph.list_node_by_scope('Default') == expected_graph.list_node_by_scope('Default')
+
+    def test_pickle_graph_event(self):
+        """Test the built graph is unpacked from the pickled graph event."""
+        filename = 'ms_output.pb'
+        file_path = create_graph_pb_file(output_dir=self._summary_dir, filename=filename)
+        with open(file_path, 'rb') as file:
+            model_proto = anf_ir_pb2.ModelProto.FromString(file.read())
+        expected_graph = MSGraph()
+        expected_graph.build_graph(model_proto.graph)
+
+        graph_event = ms_data_loader.build_graph_events(model_proto.graph, filename, 0, 0)[0]
+        lazy_graph = pickle.loads(pickle.dumps(graph_event))
+        assert lazy_graph.value._graph is None
+        graph = lazy_graph.value.get_graph()
+        assert isinstance(graph, MSGraph)
+        for scope in [None] + list(expected_graph._normal_node_map):
+            assert graph.list_node_by_scope(scope) == expected_graph.list_node_by_scope(scope)
+        for name, node in expected_graph._normal_node_map.items():
+            assert vars(graph._normal_node_map[name]) == vars(node)
+        assert list(graph._leaf_nodes) == list(expected_graph._leaf_nodes)
+        assert graph._node_id_map_name == expected_graph._node_id_map_name
+        assert graph._full_name_map_name == expected_graph._full_name_map_name
+
     def test_set_latest_file(self):
         """Test set latest file."""
         filename = 'ms_output.pb'
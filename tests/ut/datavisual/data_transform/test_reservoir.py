@@ -16,6 +16,7 @@
 import unittest.mock as mock
 
 import mindinsight.datavisual.data_transform.reservoir as reservoir
+from mindinsight.datavisual.data_transform.events_data import _Tensor
 
 
 class TestHistogramReservoir:
@@ -39,3 +40,50 @@ class TestHistogramReservoir:
         my_reservoir.add_sample(sample2)
         samples = my_reservoir.samples()
         assert len(samples) == 2
+
+
+class TestScalarReservoir:
+    """Test scalar reservoir."""
+    @staticmethod
+    def _create_sample(step, filename='summary.1'):
+        """Create a scalar sample."""
+        return _Tensor(wall_time=float(step), step=step, value=step / 10, filename=filename)
+
+    def test_samples_same_as_reservoir(self):
+        """Test scalar reservoir keeps the same samples as the list based reservoir."""
+        scalar_reservoir = reservoir.ReservoirFactory().create_reservoir(reservoir.PluginNameEnum.SCALAR.value, size=10)
+        list_reservoir = reservoir.Reservoir(size=10)
+        for step in [*range(50), 3, 70, 60]:
+            scalar_reservoir.add_sample(self._create_sample(step))
+            list_reservoir.add_sample(self._create_sample(step))
+
+        samples = scalar_reservoir.samples()
+        assert isinstance(samples, reservoir.ScalarSamples)
+        assert list(samples) == list_reservoir.samples()
+        assert samples.steps.tolist() == [sample.step for sample in list_reservoir.samples()]
+        assert scalar_reservoir.last_step() == list_reservoir.last_step() == samples[-1].step
+
+    def test_remove_sample_by_step(self):
+        """Test remove samples by step."""
+        scalar_reservoir = reservoir.ScalarReservoir(size=0)
+        assert scalar_reservoir.last_step() is None
+        for step in range(100):
+            scalar_reservoir.add_sample(self._create_sample(step, 'summary.1' if step < 80 else 'summary.2'))
+
+        remove_size = scalar_reservoir.remove_sample_by_step(50, lambda filename: filename == 'summary.2')
+        samples = scalar_reservoir.samples()
+        assert remove_size == 30
+        assert samples.steps.tolist() == [*range(50), *range(80, 100)]
+        assert samples[-1].filename == 'summary.2'
+
+    def test_grow_within_size(self):
+        """Test the columns start small and grow on demand, up to the size of the reservoir."""
+        scalar_reservoir = reservoir.ScalarReservoir(size=100)
+        list_reservoir = reservoir.Reservoir(size=100)
+        assert len(scalar_reservoir._steps) == reservoir.ScalarReservoir._INITIAL_CAPACITY
+        for step in range(300):
+            scalar_reservoir.add_sample(self._create_sample(step))
+            list_reservoir.add_sample(self._create_sample(step))
+
+        assert len(scalar_reservoir._steps) == 100
+        assert list(scalar_reservoir.samples()) == list_reservoir.samples()
@@ -0,0 +1,109 @@
+# Copyright 2026 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test summary index."""
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from mindinsight.conf import settings
+from mindinsight.datavisual.common.enums import PluginNameEnum
+from mindinsight.datavisual.data_transform.events_data import TensorEvent
+from mindinsight.datavisual.data_transform import summary_index as summary_index_module
+from mindinsight.datavisual.data_transform.summary_index import SummaryIndex
+
+
+def _tensor_event(tag, plugin_name, step, value=None):
+    """Create a tensor event."""
+    return TensorEvent(wall_time=float(step), step=step, tag=tag, plugin_name=plugin_name,
+                       value=value, filename='test.summary.1')
+
+
+class TestSummaryIndex:
+    """Test summary index."""
+
+    def setup_method(self):
+        """Run before method."""
+        self._workspace = tempfile.mkdtemp()
+        self._summary_dir = tempfile.mkdtemp()
+        self._summary_path = os.path.join(self._summary_dir, 'test.summary.1')
+        with open(self._summary_path, 'wb'):
+            pass
+
+    def teardown_method(self):
+        """Run after method."""
+        shutil.rmtree(self._workspace)
+        shutil.rmtree(self._summary_dir)
+
+    def _create_index(self):
+        """Create an index with scalars and an image in the same record."""
+        summary_index = SummaryIndex(self._summary_path)
+        summary_index.add_record(0, [_tensor_event('loss/scalar', PluginNameEnum.SCALAR.value, 1, 0.5)])
+        summary_index.add_record(20, [_tensor_event('loss/scalar', PluginNameEnum.SCALAR.value, 2, 0.25),
+                                      _tensor_event('input/image', PluginNameEnum.IMAGE.value, 2)])
+        summary_index.end_offset = 60
+        return summary_index
+
+    def test_get_scalar_records(self):
+        """Test scalars of records to be decoded are not rebuilt from the index."""
+        summary_index = self._create_index()
+        assert summary_index.get_decode_offsets() == [20]
+        records = summary_index.get_scalar_records('test.summary.1')
+        assert len(records) == 1
+        offset, tensor_events = records[0]
+        assert offset == 0
+        assert tensor_events[0].value == 0.5
+
+    def test_save_and_load(self):
+        """Test load index with the same file size and modify time."""
+        with patch.object(settings, 'WORKSPACE', self._workspace):
+            assert self._create_index().save(60, 1.5)
+            assert SummaryIndex.load(self._summary_path, 60, 2.5) is None
+            assert SummaryIndex.load(self._summary_path, 80, 1.5) is None
+            summary_index = SummaryIndex.load(self._summary_path, 60, 1.5)
+        assert summary_index.end_offset == 60
+        assert summary_index.get_decode_offsets() == [20]
+
+    def test_save_if_settled(self):
+        """Test index is not saved when the file is still being loaded."""
+        summary_index = self._create_index()
+        with patch.object(settings, 'WORKSPACE', self._workspace):
+            summary_index.pending_count = 1
+            assert not summary_index.save_if_settled(60, 1.5)
+            summary_index.pending_count = 0
+            assert not summary_index.save_if_settled(80, 1.5)
+            assert summary_index.save_if_settled(60, 1.5)
+            assert summary_index.is_saved()
+
+    def test_remove_stale_indexes(self):
+        """Test the index files of the removed summary files are removed when an index is saved."""
+        removed_path = os.path.join(self._summary_dir, 'removed.summary.1')
+        with open(removed_path, 'wb'):
+            pass
+        with patch.object(settings, 'WORKSPACE', self._workspace), \
+                patch.object(SummaryIndex, '_last_stale_check_time', 0):
+            assert SummaryIndex(removed_path).save(0, 1.5)
+            assert len(os.listdir(summary_index_module.get_index_cache_dir())) == 1
+            assert SummaryIndex._last_stale_check_time > 0
+
+            os.remove(removed_path)
+            assert self._create_index().save(60, 1.5)
+            # The stale indexes are checked at most once in the interval.
+            assert len(os.listdir(summary_index_module.get_index_cache_dir())) == 2
+            SummaryIndex._last_stale_check_time = 0
+            assert self._create_index().save(60, 1.5)
+            assert SummaryIndex.load(removed_path, 0, 1.5) is None
+            assert os.listdir(summary_index_module.get_index_cache_dir()) == [
+                os.path.basename(summary_index_module._get_index_path(os.path.realpath(self._summary_path)))]
@@ -24,10 +24,14 @@ import os
 import random
 import shutil
 import tempfile
+from unittest.mock import patch
 
 import pytest
 
+from mindinsight.datavisual.data_transform.summary_watcher import IncrementalSummaryWatcher
+from mindinsight.datavisual.data_transform.summary_watcher import SummaryDirectoryChanges
 from mindinsight.datavisual.data_transform.summary_watcher import SummaryWatcher
+from mindinsight.datavisual.utils.directory_monitor import DirectoryMonitor
 
 
 def gen_directories_and_files(summary_base_dir, file_count, directory_count):
@@ -168,3 +172,120 @@ class TestSummaryWatcher:
             assert len(result) == 1
         else:
             assert len(result) == limit
+
+
+def set_old_times(summary_base_dir):
+    """Set the modification time of all the files and directories to an hour ago."""
+    old_time = datetime.datetime.now().timestamp() - 3600
+    for root, dirs, files in os.walk(summary_base_dir):
+        for name in dirs + files:
+            os.utime(os.path.join(root, name), (old_time, old_time))
+
+
+class TestIncrementalSummaryWatcher:
+    """Test incremental summary watcher."""
+
+    def setup_method(self):
+        """Create summary base directory."""
+        self.summary_base_dir = tempfile.mkdtemp()
+        gen_directories_and_files(self.summary_base_dir, file_count=2, directory_count=3)
+        set_old_times(self.summary_base_dir)
+        self.monitor = DirectoryMonitor.create()
+
+    def teardown_method(self):
+        """Delete temp files."""
+        if self.monitor is not None:
+            self.monitor.close()
+        shutil.rmtree(self.summary_base_dir)
+
+    @pytest.mark.parametrize("use_inotify", [True, False])
+    def test_same_as_summary_watcher(self, use_inotify):
+        """Test incremental listing is the same as full listing."""
+        summary_watcher = IncrementalSummaryWatcher(self.monitor if use_inotify else None)
+        expected = SummaryWatcher().list_summary_directories(self.summary_base_dir)
+        assert summary_watcher.list_summary_directories(self.summary_base_dir) == expected
+        assert summary_watcher.list_summary_directories(self.summary_base_dir) == expected
+
+    @pytest.mark.parametrize("use_inotify", [True, False])
+    def test_unchanged_directories_not_scanned(self, use_inotify):
+        """Test unchanged subdirectories are not scanned again."""
+        summary_watcher = IncrementalSummaryWatcher(self.monitor if use_inotify else None)
+        scan = SummaryWatcher._update_subdir_summary_dict
+        with patch.object(SummaryWatcher, '_update_subdir_summary_dict', autospec=True, side_effect=scan) as mock_scan:
+            _, changes = summary_watcher.list_summary_directories_with_changes(self.summary_base_dir)
+            assert mock_scan.call_count == 3
+            assert changes.added == {'./', './run', './run0', './run1'}
+
+            _, changes = summary_watcher.list_summary_directories_with_changes(self.summary_base_dir)
+            assert mock_scan.call_count == 3
+            assert changes == SummaryDirectoryChanges(set(), set(), set())
+
+    @pytest.mark.parametrize("use_inotify", [True, False])
+    def test_list_changes(self, use_inotify):
+        """Test the changes of summary directories."""
+        summary_watcher = IncrementalSummaryWatcher(self.monitor if use_inotify else None)
+        summary_watcher.list_summary_directories_with_changes(self.summary_base_dir)
+
+        summary_file = os.path.join(self.summary_base_dir, 'run0', os.listdir(os.path.join(self.summary_base_dir,
+                                                                                          'run0'))[0])
+        with open(summary_file, 'a') as file:
+            file.write('data')
+        shutil.rmtree(os.path.join(self.summary_base_dir, 'run1'))
+        os.mkdir(os.path.join(self.summary_base_dir, 'run2'))
+        with open(os.path.join(self.summary_base_dir, 'run2', 'prefix.summary.1'), 'w'):
+            pass
+
+        directories, changes = summary_watcher.list_summary_directories_with_changes(self.summary_base_dir)
+        assert changes.added == {'./run2'}
+        assert changes.updated == {'./run0'}
+        assert changes.removed == {'./run1'}
+        assert directories == SummaryWatcher().list_summary_directories(self.summary_base_dir)
+
+
+class TestDirectoryMonitor:
+    """Test directory monitor."""
+
+    def setup_method(self):
+        """Create the monitor and the directory."""
+        self.monitor = DirectoryMonitor.create()
+        if self.monitor is None:
+            pytest.skip("Inotify is not available.")
+        self.base_dir = os.path.realpath(tempfile.mkdtemp())
+
+    def teardown_method(self):
+        """Close the monitor and delete the directory."""
+        self.monitor.close()
+        shutil.rmtree(self.base_dir)
+
+    def test_fetch_changed_paths(self):
+        """Test fetching the changed directories."""
+        owner = object()
+        assert self.monitor.watch(self.base_dir, owner)
+        assert self.monitor.fetch_changed_paths(owner) == set()
+        with open(os.path.join(self.base_dir, 'file'), 'w'):
+            pass
+        assert self.monitor.fetch_changed_paths(owner) == {self.base_dir}
+        self.monitor.unwatch(self.base_dir, owner)
+        assert not self.monitor.is_watching(self.base_dir, owner)
+
+        self.monitor.close()
+        assert self.monitor.closed
+        assert not self.monitor.watch(self.base_dir, owner)
+        assert self.monitor.fetch_changed_paths(owner) == set()
+
+    def test_shared_by_owners(self):
+        """Test the changes are fetched by each owner, and the directory is watched until all owners unwatch it."""
+        owner, other_owner = object(), object()
+        assert self.monitor.watch(self.base_dir, owner)
+        assert self.monitor.watch(self.base_dir, other_owner)
+        with open(os.path.join(self.base_dir, 'file'), 'w'):
+            pass
+        assert self.monitor.fetch_changed_paths(owner) == {self.base_dir}
+        assert self.monitor.fetch_changed_paths(other_owner) == {self.base_dir}
+
+        self.monitor.unwatch(self.base_dir, owner)
+        assert not self.monitor.is_watching(self.base_dir, owner)
+        with open(os.path.join(self.base_dir, 'file'), 'a') as file:
+            file.write('data')
+        assert self.monitor.fetch_changed_paths(owner) == set()
+        assert self.monitor.fetch_changed_paths(other_owner) == {self.base_dir}
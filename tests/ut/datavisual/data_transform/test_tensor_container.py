@@ -44,6 +44,20 @@ class TestTensorContainer:
                (5, 1, 3, 8,
                 1, 1, 1)
 
+    def test_get_statistics_by_chunks(self):
+        """Tests statistics are accumulated by chunks, including the transposed tensor."""
+        ndarray = np.array([-1, -0.0, 0, 2, 3, float('-INF'), float('INF'), float('NAN'), 4, -5, 6, 7]).reshape(
+            [3, 4])
+        with mock.patch('mindinsight.utils.tensor.STATISTICS_CHUNK_SIZE', 5):
+            for value in ndarray, ndarray.T:
+                statistics = TensorUtils.get_statistics_from_tensor(value)
+                assert (statistics.max, statistics.min, statistics.avg, statistics.count,
+                        statistics.nan_count, statistics.neg_inf_count, statistics.pos_inf_count,
+                        statistics.neg_zero_count, statistics.pos_zero_count, statistics.zero_count) == \
+                       (7, -5, 16 / 9, 12,
+                        1, 1, 1,
+                        2, 5, 2)
+
     def test_calc_original_buckets(self):
         """Tests calculate original buckets."""
         ndarray = np.array([1, 2, 3, 4, 5, float('-INF'), float('INF'), float('NAN')]).reshape(
@@ -53,3 +67,19 @@ class TestTensorContainer:
 
         assert (buckets[0].left, buckets[0].width, buckets[0].count) == (1, 2, 2)
         assert (buckets[1].left, buckets[1].width, buckets[1].count) == (3, 2, 3)
+
+    def test_lazy_statistics(self):
+        """Tests statistics and histogram are calculated on first access."""
+        mocked_input = mock.MagicMock()
+        mocked_input.float_data = [1, 2, 3, 4, 5, float('-INF'), float('INF'), float('NAN')]
+        mocked_input.dims = [2, 2, 2]
+        with mock.patch.object(TensorUtils, 'get_statistics_from_tensor',
+                               wraps=TensorUtils.get_statistics_from_tensor) as mocked_get_statistics:
+            tensor_container = tensor.TensorContainer(mocked_input)
+            assert tensor_container.size == 8
+            mocked_get_statistics.assert_not_called()
+
+            assert (tensor_container.max, tensor_container.min, tensor_container.count) == (5, 1, 5)
+            assert tensor_container.tensor_value.shape == (2, 2, 2)
+            assert [bucket[2] for bucket in tensor_container.buckets()] == [2, 3]
+            mocked_get_statistics.assert_called_once()
@@ -137,6 +137,19 @@ class TestGraphProcessor:
         expected_file_path = os.path.join(self.graph_results_dir, result_file)
         compare_result_with_file(results, expected_file_path)
 
+    @pytest.mark.usefixtures('load_graph_record')
+    @pytest.mark.parametrize("name", [None, 'Default/conv1-Conv2d', 'Default/bn1/Reshape[12]_1'])
+    def test_get_nodes_repeatedly(self, name):
+        """Test getting nodes of the same scope repeatedly."""
+        graph_processor = GraphProcessor(self._train_id, self._mock_data_manager)
+        results = graph_processor.list_nodes(name)
+        results['nodes'].clear()
+
+        assert graph_processor.list_nodes(name) == graph_processor.list_nodes(name)
+        nodes = graph_processor.list_nodes(name)['nodes']
+        assert nodes
+        assert len(nodes) == graph_processor._graph.count_node_by_scope(name)
+
     @pytest.mark.usefixtures('load_graph_record')
     @pytest.mark.parametrize("search_content, result_file",
                              [(None, 'test_search_node_names_with_search_content_expected_results1.json'),
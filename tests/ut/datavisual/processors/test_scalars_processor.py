@@ -18,15 +18,21 @@ Function:
 Usage:
     pytest tests/ut/datavisual
 """
+import math
 import tempfile
+from unittest.mock import MagicMock
 
 import pytest
 
+from mindinsight.utils.exceptions import ParamValueError
 from mindinsight.datavisual.common.enums import PluginNameEnum
 from mindinsight.datavisual.common.exceptions import TrainJobNotExistError
 from mindinsight.datavisual.common.exceptions import ScalarNotExistError
 from mindinsight.datavisual.data_transform import data_manager
+from mindinsight.datavisual.data_transform.events_data import _Tensor
+from mindinsight.datavisual.data_transform.reservoir import ScalarReservoir
 from mindinsight.datavisual.processors.scalars_processor import ScalarsProcessor
+from mindinsight.datavisual.utils.downsample import DownsampleMode
 
 from ....utils.log_operations import LogOperations
 from ....utils.tools import delete_files_or_dirs
@@ -127,3 +133,47 @@ class TestScalarsProcessor:
             assert recv_values.get('wall_time') == expected_values.get('wall_time')
             assert recv_values.get('step') == expected_values.get('step')
             assert abs(recv_values.get('value') - expected_values.get('value')) < 1e-6
+
+
+class TestScalarsDownsample:
+    """Test downsampling scalars."""
+
+    def setup_method(self):
+        """Create a data manager with a sine wave scalar tag."""
+        self._reservoir = ScalarReservoir(size=0)
+        for step in range(1000):
+            self._reservoir.add_sample(_Tensor(wall_time=float(step), step=step,
+                                               value=math.sin(step / 50), filename='summary.1'))
+        self._reservoir.add_sample(_Tensor(wall_time=1000.0, step=1000, value=float('nan'), filename='summary.1'))
+        self._data_manager = MagicMock()
+        self._data_manager.list_tensors.side_effect = lambda train_id, tag: self._reservoir.samples()
+
+    @pytest.mark.parametrize('mode', DownsampleMode.list_members())
+    def test_get_scalars_downsampled(self, mode):
+        """Test scalars are downsampled and the first and last points are kept."""
+        scalar_processor = ScalarsProcessor(self._data_manager)
+        scalars = scalar_processor.get_scalars(['./run'], ['sin/scalar'], max_points='100', downsample_mode=mode)
+        values = scalars[0]['values']
+        steps = [value['step'] for value in values]
+        assert len(values) <= 100
+        assert steps == sorted(steps)
+        assert steps[0] == 0 and steps[-1] == 1000
+        assert values[-1]['value'] is None
+        assert max(value['value'] for value in values[:-1]) > 0.99
+
+    def test_downsampled_scalars_cache_invalidated(self):
+        """Test cached downsampled scalars are updated when new samples arrive."""
+        scalar_processor = ScalarsProcessor(self._data_manager)
+        metadatas = scalar_processor.get_metadata_list('./run', 'sin/scalar', max_points=10)['metadatas']
+        assert metadatas[-1]['step'] == 1000
+        self._reservoir.add_sample(_Tensor(wall_time=1001.0, step=1001, value=0.0, filename='summary.1'))
+        metadatas = scalar_processor.get_metadata_list('./run', 'sin/scalar', max_points=10)['metadatas']
+        assert metadatas[-1]['step'] == 1001
+
+    def test_downsample_with_invalid_params(self):
+        """Test downsample with invalid max points and mode."""
+        scalar_processor = ScalarsProcessor(self._data_manager)
+        with pytest.raises(ParamValueError):
+            scalar_processor.get_scalars(['./run'], ['sin/scalar'], max_points=2)
+        with pytest.raises(ParamValueError):
+            scalar_processor.get_scalars(['./run'], ['sin/scalar'], max_points=10, downsample_mode='avg')
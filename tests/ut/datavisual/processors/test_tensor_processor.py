@@ -186,6 +186,26 @@ class TestTensorProcessor:
                 assert recv_tensor.shape == expected_tensor.shape
                 assert np.allclose(recv_tensor, expected_tensor, rtol=1e-6)
 
+    @pytest.mark.usefixtures('load_tensor_record')
+    def test_get_tensor_data_binary(self):
+        """Get tensor data as numpy.ndarray for the binary response."""
+        test_tag_name = self._complete_tag_name
+
+        processor = TensorProcessor(self._mock_data_manager)
+        results = processor.get_tensors([self._train_id], [test_tag_name], step='1', dims='[0,0,:-1,:]', detail='data',
+                                        binary=True)
+
+        recv_values = results.get('tensors')[0].get("values")[0]
+        expected_values = self._tensors[0]
+        dims = expected_values.get('value').get("dims")
+        expected_data = np.array(expected_values.get('value').get("float_data")).reshape(dims)
+        recv_tensor = recv_values.get('value').get("data")
+        assert isinstance(recv_tensor, np.ndarray)
+        assert recv_tensor.dtype == np.float32
+        expected_tensor = TensorUtils.get_specific_dims_data(
+            expected_data, (0, 0, slice(None, -1, None), slice(None)))
+        assert np.allclose(recv_tensor, expected_tensor, rtol=1e-6)
+
     @pytest.mark.usefixtures('load_tensor_record')
     def test_get_tensor_stats_success(self):
         """Get tensor stats success."""
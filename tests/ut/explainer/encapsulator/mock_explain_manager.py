@@ -97,6 +97,15 @@ class MockExplainJob:
         }
         return [sample]
 
+    def query_samples(self, **kwargs):
+        """Query the ids of mock samples."""
+        del kwargs
+        return [sample["id"] for sample in self.get_all_samples()]
+
+    def get_samples(self, sample_ids):
+        """Get the mock samples of ids."""
+        return [sample for sample in self.get_all_samples() if sample["id"] in sample_ids]
+
 
 class MockExplainManager:
     """Mock ExplainManger."""
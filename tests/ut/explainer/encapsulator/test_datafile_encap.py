@@ -0,0 +1,86 @@
+# Copyright 2026 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the module of explainer.datafile_encap."""
+import io
+import os
+import shutil
+import tempfile
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+from PIL import Image
+
+from mindinsight.conf import settings
+from mindinsight.explainer.encapsulator import datafile_encap
+from mindinsight.explainer.encapsulator._image_cache import get_image_cache_dir
+from mindinsight.explainer.encapsulator.datafile_encap import DatafileEncap
+
+
+class TestDatafileEncap:
+    """Test case for DatafileEncap."""
+
+    def setup_method(self):
+        """Create the saliency map."""
+        self._base_dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self._base_dir, 'job'))
+        self._saliency = np.arange(256, dtype=np.uint8).reshape(16, 16)
+        self._save_saliency(self._saliency)
+        self.encapsulator = DatafileEncap(MagicMock(summary_base_dir=self._base_dir))
+        datafile_encap._RENDERED_IMAGES.clear()
+
+    def teardown_method(self):
+        """Remove the saliency map."""
+        shutil.rmtree(self._base_dir)
+        datafile_encap._RENDERED_IMAGES.clear()
+
+    def _save_saliency(self, saliency):
+        """Save the saliency map in grayscale."""
+        Image.fromarray(saliency, mode='L').save(os.path.join(self._base_dir, 'job', 'saliency.png'))
+
+    def _query_overlay(self):
+        """Query the overlay image and its ETag."""
+        etag = self.encapsulator.query_image_etag('./job', 'saliency.png', 'overlay')
+        overlay = self.encapsulator.query_image_binary('./job', 'saliency.png', 'overlay')
+        return etag, np.asarray(Image.open(io.BytesIO(overlay)))
+
+    def test_query_overlay(self):
+        """Test rendering the saliency map in the color map, the image is rendered once until it changes."""
+        etag, overlay = self._query_overlay()
+        assert overlay.shape == (16, 16, 4)
+        assert overlay[0, 0].tolist() == [55, 25, 86, 0]
+        assert overlay[15, 15].tolist() == [255, 255, 0, 255]
+        assert overlay[:, :, 3].tolist() == self._saliency.tolist()
+
+        with patch.object(Image, 'open', wraps=Image.open) as mock_open:
+            assert self._query_overlay()[0] == etag
+        assert mock_open.call_count == 1
+
+        self._save_saliency(self._saliency[::-1])
+        os.utime(os.path.join(self._base_dir, 'job', 'saliency.png'), ns=(0, 0))
+        changed_etag, changed_overlay = self._query_overlay()
+        assert changed_etag != etag
+        assert changed_overlay[:, :, 3].tolist() == self._saliency[::-1].tolist()
+
+    def test_query_overlay_from_disk(self):
+        """Test saving the rendered image in the workspace."""
+        with patch.object(settings, 'WORKSPACE', self._base_dir), \
+                patch.object(settings, 'ENABLE_EXPLAINER_IMAGE_DISK_CACHE', True, create=True):
+            etag, overlay = self._query_overlay()
+            assert os.listdir(get_image_cache_dir()) == [etag + '.png']
+
+            datafile_encap._RENDERED_IMAGES.clear()
+            with patch.object(DatafileEncap, '_get_overlay_image') as mock_render:
+                assert np.array_equal(self._query_overlay()[1], overlay)
+            mock_render.assert_not_called()
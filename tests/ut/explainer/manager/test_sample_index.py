@@ -0,0 +1,69 @@
+# Copyright 2026 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""UT for explainer.manager.sample_index."""
+from mindinsight.explainer.manager.sample_index import SampleIndex
+
+
+def _create_sample(image, *inferences):
+    """Create the sample with inferences of (label, confidence, prediction_type, hoc_layers)."""
+    return {
+        'image': image,
+        'inferences': {
+            index: {'label': label, 'confidence': confidence, 'prediction_type': prediction_type,
+                    'saliency_maps': [], 'hoc_layers': hoc_layers}
+            for index, (label, confidence, prediction_type, hoc_layers) in enumerate(inferences)
+        }
+    }
+
+
+class TestSampleIndex:
+    """Test the sample index."""
+
+    def setup_method(self):
+        """Create the index of samples."""
+        self.samples = {
+            10: _create_sample('10.png', ('car', 0.9, 'TP', {}), ('cat', 0.2, 'FN', [{}])),
+            11: _create_sample('', ('car', 0.8, 'TP', {})),
+            12: _create_sample('12.png', ('dog', 0.7, 'FP', [{}])),
+            13: _create_sample('13.png', ('car', 0.5, 'TP', {}), ('dog', 0.6, 'FP', {})),
+        }
+        self.index = SampleIndex()
+        for sample_id, sample in self.samples.items():
+            self.index.update(sample_id, sample)
+
+    def test_query(self):
+        """Test filtering and sorting the samples with image."""
+        assert self.index.sample_count == 3
+        assert self.index.query() == [10, 12, 13]
+        assert self.index.query(labels=['car']) == [10, 13]
+        assert self.index.query(prediction_types=['FP']) == [12, 13]
+        assert self.index.query(drop_type='hoc_layers') == [10, 12]
+        assert self.index.query(sorted_name='confidence', sorted_type='descending') == [10, 12, 13]
+        assert self.index.query(sorted_name='confidence', sorted_type='ascending') == [10, 13, 12]
+        assert self.index.query(labels=['dog', 'car'], sorted_name='confidence',
+                                sorted_type='ascending') == [13, 12, 10]
+
+    def test_update(self):
+        """Test the changed samples are read again."""
+        self.samples[11]['image'] = '11.png'
+        self.samples[13]['inferences'][0]['confidence'] = 1.0
+        self.index.update(11, self.samples[11])
+        self.index.update(13, self.samples[13])
+        assert self.index.sample_count == 4
+        assert self.index.query(labels=['car'], sorted_name='confidence', sorted_type='descending') == [13, 10, 11]
+
+        self.index.clear()
+        assert self.index.sample_count == 0
+        assert self.index.query() == []
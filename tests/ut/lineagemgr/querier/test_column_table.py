@@ -0,0 +1,66 @@
+# Copyright 2026 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the columnar table of lineage objects."""
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from mindinsight.lineagemgr.lineage_parser import SuperLineageObj
+from mindinsight.lineagemgr.querier.column_table import LineageColumn, LineageColumnTable, get_sort_keys
+from mindinsight.lineagemgr.querier.querier import ExpressionType
+
+
+def _create_super_lineage_obj(learning_rate, update_time):
+    """Create the lineage object with the learning rate."""
+    lineage_obj = MagicMock(version=1)
+    lineage_obj.get_value_by_key.side_effect = lambda key: learning_rate if key == 'learning_rate' else None
+    return SuperLineageObj(lineage_obj, update_time)
+
+
+class TestLineageColumnTable(TestCase):
+    """Test the class of `LineageColumnTable`."""
+
+    def test_get_sort_keys(self):
+        """Test that None is the smallest, numbers are compared by value and others by type name."""
+        keys = get_sort_keys([2, 'b', None, 1.5, True, 'a', 2.0, {'k': 1}]).tolist()
+        self.assertEqual(keys, [4, 6, 0, 3, 2, 5, 4, 1])
+
+    def test_match_column(self):
+        """Test matching the numbers by arrays and the other values one by one."""
+        column = LineageColumn([0.1, None, 'Adam', 2 ** 60, 3])
+        self.assertEqual(ExpressionType.match_column('lt', 1, column).tolist(), [True, False, False, False, False])
+        self.assertEqual(ExpressionType.match_column('ge', 'A', column).tolist(), [False, False, True, False, False])
+        self.assertEqual(ExpressionType.match_column('in', [3, None, 2 ** 60], column).tolist(),
+                         [False, True, False, True, True])
+        self.assertEqual(ExpressionType.match_column('not_in', [0.1], column).tolist(),
+                         [False, True, True, True, True])
+
+    def test_update(self):
+        """Test that the table only changes when lineage objects change."""
+        objs = {'./run0': _create_super_lineage_obj(0.1, 1), './run1': _create_super_lineage_obj(0.2, 2)}
+        table = LineageColumnTable()
+        self.assertTrue(table.update(objs))
+        self.assertEqual(table.get_column('learning_rate').values, [0.2, 0.1])
+        table.results.put('condition', 'result', 1)
+
+        self.assertFalse(table.update(dict(objs)))
+        self.assertEqual(table.results.get('condition'), 'result')
+
+        objs['./run0'].update_time = 3
+        self.assertTrue(table.update(objs))
+        self.assertIsNone(table.results.get('condition'))
+        self.assertEqual(table.get_column('learning_rate').values, [0.1, 0.2])
+
+        objs['./run1'].lineage_obj.version = 2
+        self.assertTrue(table.update(objs))
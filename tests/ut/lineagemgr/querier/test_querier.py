@@ -256,25 +256,17 @@ class TestQuerier(TestCase):
     _MOCK_DATA_MANAGER = MagicMock()
 
     @mock.patch('mindinsight.lineagemgr.lineage_parser.SummaryPathParser.get_lineage_summaries')
-    @mock.patch('mindinsight.lineagemgr.lineage_parser.LineageSummaryAnalyzer.get_user_defined_info')
-    @mock.patch('mindinsight.lineagemgr.lineage_parser.LineageSummaryAnalyzer.get_summary_infos')
-    @mock.patch('mindinsight.lineagemgr.lineage_parser.FileHandler')
-    def setUp(self, mock_file_handler, *args):
+    @mock.patch('mindinsight.lineagemgr.lineage_parser.LineageSummaryReader')
+    @mock.patch('mindinsight.lineagemgr.lineage_parser.os.path.getsize')
+    def setUp(self, mock_getsize, *args):
         """Initialization before test case execution."""
-        args[0].return_value = create_lineage_info(
-            event_data.EVENT_TRAIN_DICT_0,
-            event_data.EVENT_EVAL_DICT_0,
-            event_data.EVENT_DATASET_DICT_0
-        )
-        args[1].return_value = []
-        args[2].return_value = ['path']
-        mock_file_handler = MagicMock()
-        mock_file_handler.size = 1
+        mock_getsize.return_value = 1
+        args[1].return_value = ['path']
 
         summary_dir = '/path/test/'
 
         lineage_infos = get_lineage_infos()
-        args[0].side_effect = lineage_infos
+        args[0].return_value.read.side_effect = [(lineage_info, []) for lineage_info in lineage_infos]
         lineage_objects = {}
         for i in range(7):
             train_id = f'./summary{i}'
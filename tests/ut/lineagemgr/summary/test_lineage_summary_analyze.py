@@ -13,6 +13,10 @@
 # limitations under the License.
 # ============================================================================
 """Test LineageSummaryAnalyzer.py."""
+import os
+import shutil
+import struct
+import tempfile
 from unittest import mock, TestCase
 from unittest.mock import MagicMock
 
@@ -20,7 +24,7 @@ from mindinsight.datavisual.proto_files.mindinsight_lineage_pb2 import LineageEv
 from mindinsight.lineagemgr.common.exceptions.exceptions import LineageSummaryAnalyzeException
 from mindinsight.lineagemgr.common.log import logger as log
 from mindinsight.lineagemgr.summary.lineage_summary_analyzer import LineageSummaryAnalyzer, \
-    LineageInfo, SummaryAnalyzer
+    LineageInfo, LineageSummaryReader, SummaryAnalyzer
 
 
 class TestSummaryAnalyzer(TestCase):
@@ -123,3 +127,64 @@ class TestLineageSummaryAnalyzer(TestCase):
         args[0].side_effect = IOError("mock exception")
         with self.assertRaises(LineageSummaryAnalyzeException):
             _ = LineageSummaryAnalyzer.get_summary_infos('fake_path.log')
+
+
+def _create_record(event):
+    """Create the record of the event in summary log."""
+    body = event.SerializeToString()
+    return struct.pack("<Q", len(body)) + b'\x00' * 4 + body + b'\x00' * 4
+
+
+class TestLineageSummaryReader(TestCase):
+    """Test LineageSummaryReader class."""
+
+    def setUp(self):
+        """Create the summary log."""
+        self._summary_dir = tempfile.mkdtemp()
+        self._file_path = os.path.join(self._summary_dir, 'test.summary_lineage')
+        train_event = LineageEvent(wall_time=1.0)
+        train_event.train_lineage.hyper_parameters.epoch = 10
+        user_event = LineageEvent(wall_time=2.0)
+        user_event.user_defined_info.user_info.add().map_int32['batch'] = 32
+        eval_event = LineageEvent(wall_time=3.0)
+        eval_event.evaluation_lineage.metric = '{"acc": 0.9}'
+        self._records = [_create_record(event) for event in (train_event, user_event, eval_event)]
+        self._events = [train_event, user_event, eval_event]
+
+    def tearDown(self):
+        """Remove the summary log."""
+        shutil.rmtree(self._summary_dir)
+
+    def _append(self, content):
+        """Append the content to the summary log."""
+        with open(self._file_path, 'ab') as log_file:
+            log_file.write(content)
+
+    def test_read_appended_records(self):
+        """Test reading only the appended records, and leaving the incomplete record to the next read."""
+        self._append(self._records[0] + self._records[1][:-2])
+        reader = LineageSummaryReader(self._file_path)
+        lineage_info, user_defined_info = reader.read()
+        self.assertEqual(lineage_info.train_lineage, self._events[0])
+        self.assertIsNone(lineage_info.eval_lineage)
+        self.assertEqual(user_defined_info, [])
+        self.assertEqual(reader.offset, len(self._records[0]))
+
+        self._append(self._records[1][-2:] + self._records[2])
+        with mock.patch.object(LineageEvent, 'FromString', wraps=LineageEvent.FromString) as mock_parse:
+            lineage_info, user_defined_info = reader.read()
+        self.assertEqual(mock_parse.call_count, 2)
+        self.assertEqual(lineage_info, LineageInfo(self._events[0], self._events[2], None))
+        self.assertEqual(user_defined_info, [{'batch': 32}])
+        self.assertEqual(reader.offset, os.path.getsize(self._file_path))
+
+    def test_read_truncated_file(self):
+        """Test reading the summary log again after it is truncated."""
+        self._append(self._records[0] + self._records[1])
+        reader = LineageSummaryReader(self._file_path)
+        reader.read()
+        os.remove(self._file_path)
+        self._append(self._records[2])
+        lineage_info, user_defined_info = reader.read()
+        self.assertEqual(lineage_info, LineageInfo(None, self._events[2], None))
+        self.assertEqual(user_defined_info, [])
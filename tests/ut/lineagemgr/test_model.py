@@ -16,7 +16,10 @@
 from unittest import TestCase, mock
 from unittest.mock import MagicMock
 
-from mindinsight.lineagemgr.model import filter_summary_lineage, get_flattened_lineage
+from mindinsight.datavisual.common.exceptions import TrainJobNotExistError
+from mindinsight.lineagemgr.lineage_parser import SuperLineageObj
+from mindinsight.lineagemgr.model import filter_summary_lineage, get_flattened_lineage, \
+    get_summary_lineage_by_train_id
 from mindinsight.lineagemgr.common.exceptions.exceptions import LineageSummaryParseException, \
     LineageQuerierParamException, LineageQuerySummaryDataError, LineageSearchConditionParamError, LineageParamTypeError
 from mindinsight.lineagemgr.common.path_parser import SummaryPathParser
@@ -91,3 +94,29 @@ class TestFilterAPI(TestCase):
         mock_filter_summary_lineage.return_value = mock_data
         result = get_flattened_lineage(mock_data_manager)
         assert result.get('[U]info') == [None, 'info1', 'info1']
+
+
+class TestGetSummaryLineageByTrainId(TestCase):
+    """Test the function of get_summary_lineage_by_train_id."""
+
+    def test_get_summary_lineage_by_train_id(self):
+        """Test the lineage is looked up from brief cache and cached until it changes."""
+        lineage_obj = MagicMock(version=1)
+        lineage_obj.to_model_lineage_dict.return_value = {'summary_dir': './run1', 'model_lineage': {'loss': 0.1}}
+        lineage_obj.to_dataset_lineage_dict.return_value = {'summary_dir': './run1', 'dataset_graph': {}}
+        super_lineage_obj = SuperLineageObj(lineage_obj, 1)
+        data_manager = MagicMock()
+        data_manager.get_brief_train_job.return_value.get.return_value.super_lineage_obj = super_lineage_obj
+
+        expected = {'summary_dir': './run1', 'model_lineage': {'loss': 0.1}, 'dataset_graph': {}, 'added_info': {}}
+        self.assertEqual(get_summary_lineage_by_train_id(data_manager, './run1'), expected)
+        self.assertEqual(get_summary_lineage_by_train_id(data_manager, './run1'), expected)
+        data_manager.get_brief_train_job.assert_called_with('./run1')
+        lineage_obj.to_model_lineage_dict.assert_called_once()
+
+        super_lineage_obj.added_info = {'tag': 1}
+        self.assertEqual(get_summary_lineage_by_train_id(data_manager, './run1')['added_info'], {'tag': 1})
+        self.assertEqual(lineage_obj.to_model_lineage_dict.call_count, 2)
+
+        data_manager.get_brief_train_job.side_effect = TrainJobNotExistError()
+        self.assertIsNone(get_summary_lineage_by_train_id(data_manager, './run2'))
@@ -0,0 +1,71 @@
+# Copyright 2026 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the analyser factory."""
+import copy
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from mindinsight.profiler.analyser.analyser_factory import AnalyserFactory
+from tests.ut.profiler import PROFILER_DIR
+
+
+class TestAnalyserFactory(TestCase):
+    """Test the class of `AnalyserFactory`."""
+    def setUp(self) -> None:
+        """Initialization before test case execution."""
+        self._profiling_dir = tempfile.mkdtemp()
+        self._type_file = os.path.join(self._profiling_dir, 'aicore_intermediate_1_type.csv')
+        shutil.copyfile(os.path.join(PROFILER_DIR, 'aicore_intermediate_1_type.csv'), self._type_file)
+        AnalyserFactory.clear_cache()
+
+    def tearDown(self) -> None:
+        """Clean up after test case execution."""
+        shutil.rmtree(self._profiling_dir)
+        AnalyserFactory.clear_cache()
+
+    def test_get_cached_analyser(self):
+        """Test the loaded analyser is reused until the dependent files change."""
+        analyser = AnalyserFactory.instance().get_analyser('aicore_type', self._profiling_dir, '1')
+        cached_analyser = AnalyserFactory.instance().get_analyser('aicore_type', self._profiling_dir, '1')
+        assert cached_analyser is not analyser
+        assert cached_analyser.data is analyser.data
+        assert cached_analyser.query()['size'] == analyser.query()['size'] == 5
+
+        with open(self._type_file, 'r') as file:
+            lines = file.readlines()
+        with open(self._type_file, 'w') as file:
+            file.writelines(lines[:-1])
+        reloaded_analyser = AnalyserFactory.instance().get_analyser('aicore_type', self._profiling_dir, '1')
+        assert reloaded_analyser.data is not analyser.data
+        assert reloaded_analyser.query()['size'] == 4
+
+    def test_query_not_modify_cached_data(self):
+        """Test querying the copies of the cached analyser does not modify the loaded data."""
+        analyser = AnalyserFactory.instance().get_analyser('aicore_type', self._profiling_dir, '1')
+        analyser.data[0][1] = 1.23456789
+        loaded_data = copy.deepcopy(analyser.data)
+        cached_analyser = AnalyserFactory.instance().get_analyser('aicore_type', self._profiling_dir, '1')
+        result = cached_analyser.query({'sort_condition': {'name': 'total_time', 'type': 'ascending'}})
+        assert 1.234568 in [row[1] for row in result['object']]
+        assert analyser.data == loaded_data
+
+    def test_cache_size(self):
+        """Test the cached analyser is charged with the memory size of the loaded data."""
+        analyser = AnalyserFactory.instance().get_analyser('aicore_type', self._profiling_dir, '1')
+        memory_size = analyser.get_memory_size()
+        assert memory_size > os.path.getsize(self._type_file)
+        assert AnalyserFactory._analyser_cache.total_size == memory_size
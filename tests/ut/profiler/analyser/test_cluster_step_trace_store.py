@@ -0,0 +1,108 @@
+# Copyright 2026 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the store of cluster step trace files."""
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+from mindinsight.profiler.analyser import cluster_step_trace_store
+from mindinsight.profiler.analyser.cluster_step_trace_store import ClusterStepTraceStore, load_step_trace_table
+
+STEP_TRACE_LINES = [
+    'step_num,start_point,total,tail',
+    '1,100,20,1.5',
+    '2,120,30,2.25',
+    '-,110,25,1.875'
+]
+
+
+class TestClusterStepTraceStore:
+    """Test the cluster step trace store."""
+
+    def setup_method(self):
+        """Create the step trace file."""
+        self._profiler_dir = tempfile.mkdtemp()
+        self._file_path = os.path.join(self._profiler_dir, 'step_trace_raw_0_detail_time.csv')
+        self._write_lines(STEP_TRACE_LINES)
+        ClusterStepTraceStore.clear_cache()
+
+    def teardown_method(self):
+        """Remove the step trace file."""
+        shutil.rmtree(self._profiler_dir)
+        ClusterStepTraceStore.clear_cache()
+
+    def _write_lines(self, lines):
+        """Write the lines to the step trace file."""
+        with open(self._file_path, 'w') as file:
+            file.write('\n'.join(lines) + '\n')
+
+    def test_get_row(self):
+        """Test getting the row of a step by the line number, the average is got by step 0."""
+        table = load_step_trace_table(self._file_path)
+        assert len(table) == 3
+        assert table.get_row(1) == [1.0, 100.0, 20.0, 1.5]
+        assert table.get_row(0)[1:] == table.get_row(-1)[1:] == table.get_row(3)[1:] == [110.0, 25.0, 1.875]
+        with pytest.raises(IndexError):
+            table.get_row(4)
+
+    def test_get_records(self):
+        """Test getting the rows as records, the integer columns are kept as integers."""
+        records = load_step_trace_table(self._file_path).get_records(['step_num', 'total', 'tail', 'fp_point'])
+        assert records == [
+            {'step_num': '1', 'total': 20, 'tail': 1.5, 'fp_point': None},
+            {'step_num': '2', 'total': 30, 'tail': 2.25, 'fp_point': None},
+            {'step_num': '-', 'total': 25, 'tail': 1.875, 'fp_point': None}
+        ]
+
+    def test_load_irregular_table(self):
+        """Test loading the file whose rows have different numbers of values."""
+        self._write_lines(STEP_TRACE_LINES[:2] + ['2,120,30,2.25,7'] + STEP_TRACE_LINES[3:])
+        table = load_step_trace_table(self._file_path)
+        assert table.get_row(2) == [2.0, 120.0, 30.0, 2.25, 7.0]
+        assert table.get_records(['step_num', 'start_point']) == [
+            {'step_num': '1', 'start_point': 100},
+            {'step_num': '2', 'start_point': 120},
+            {'step_num': '-', 'start_point': 110}
+        ]
+
+    def test_get_tables(self):
+        """Test caching the tables until the files change."""
+        table = ClusterStepTraceStore.get_table(self._file_path)
+        assert ClusterStepTraceStore.get_tables([self._file_path]) == [table]
+
+        self._write_lines(STEP_TRACE_LINES[:2] + STEP_TRACE_LINES[3:])
+        changed_table = ClusterStepTraceStore.get_table(self._file_path)
+        assert changed_table is not table
+        assert len(changed_table) == 2
+
+    @pytest.mark.parametrize('min_pool_file_count', [2, 32])
+    def test_load_tables(self, min_pool_file_count):
+        """Test loading the tables of a few files in the current process, and of more files in the process pool."""
+        file_paths = [self._file_path]
+        for rank_id in range(1, 4):
+            file_path = os.path.join(self._profiler_dir, 'step_trace_raw_%d_detail_time.csv' % rank_id)
+            shutil.copy(self._file_path, file_path)
+            file_paths.append(file_path)
+        with patch.object(cluster_step_trace_store, 'MIN_POOL_FILE_COUNT', min_pool_file_count), \
+                patch.object(cluster_step_trace_store.settings, 'MAX_PROCESSES_COUNT', 2), \
+                patch.object(cluster_step_trace_store, 'ComputingResourceManager',
+                             wraps=cluster_step_trace_store.ComputingResourceManager) as mock_manager:
+            tables = ClusterStepTraceStore.get_tables(file_paths)
+        assert mock_manager.get_instance.called == (len(file_paths) >= min_pool_file_count)
+        assert [table.get_records(['step_num', 'total']) for table in tables] == \
+               [load_step_trace_table(self._file_path).get_records(['step_num', 'total'])] * len(file_paths)
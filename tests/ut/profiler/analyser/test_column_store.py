@@ -0,0 +1,73 @@
+# Copyright 2026 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the column store of analysers."""
+import random
+
+import pytest
+
+from mindinsight.profiler.analyser.base_analyser import BaseAnalyser
+from tests.ut.profiler import PROFILER_DIR
+
+
+class _RowAnalyser(BaseAnalyser):
+    """The analyser querying rows one by one."""
+    _col_names = ['op_name', 'op_type', 'avg_time', 'flops', 'op_info']
+
+    def __init__(self, rows):
+        self._rows = rows
+        super().__init__(PROFILER_DIR, '0')
+        self._none_sort_col_names = ['op_info']
+
+    def _load(self):
+        self._data = self._rows
+
+    def _filter(self, filter_condition):
+        self._result = list(filter(lambda item: self._default_filter(item, filter_condition), self._data))
+
+
+class _ColumnAnalyser(_RowAnalyser):
+    """The analyser querying rows by the column store."""
+    _columnar_query = True
+
+
+def _create_rows(count):
+    """Create rows with duplicated values, None and values of different types."""
+    rng = random.Random(0)
+    rows = []
+    for index in range(count):
+        op_type = rng.choice(['MatMul', 'Conv2D', 'ReLU', 'Add'])
+        avg_time = rng.choice([None, rng.randint(0, 5), round(rng.random() * 5, 1)])
+        flops = rng.choice(['-', rng.randint(0, 3) * 1.5])
+        rows.append([f'Default/{op_type}-op{index}', op_type, avg_time, flops, {'index': index}])
+    return rows
+
+
+@pytest.mark.parametrize('condition', [
+    None,
+    {'filter_condition': {'op_type': {'in': ['MatMul', 'Add']}},
+     'sort_condition': {'name': 'avg_time', 'type': 'descending'},
+     'group_condition': {'limit': 7, 'offset': 2}},
+    {'filter_condition': {'op_type': {'not_in': ['ReLU']}, 'op_name': {'partial_match_str_in': ['OP1', 'op2']}},
+     'sort_condition': {'name': 'flops', 'type': 'ascending'}},
+    {'sort_condition': {'name': 'avg_time', 'type': 'ascending'}, 'group_condition': {'limit': 10}},
+    {'sort_condition': {'name': 'op_type'}, 'group_condition': {'offset': 100}},
+    {'filter_condition': {'op_type': {'equal': 'Add'}}},
+])
+def test_query_same_as_rows(condition):
+    """Test the column store returns the same result as querying rows one by one."""
+    rows = _create_rows(500)
+    expected = _RowAnalyser(rows).query(condition)
+    result = _ColumnAnalyser(rows).query(condition)
+    assert result == expected
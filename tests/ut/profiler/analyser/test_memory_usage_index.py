@@ -0,0 +1,138 @@
+# Copyright 2026 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the index of memory usage details files."""
+import copy
+import json
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+from mindinsight.conf import settings
+from mindinsight.profiler.analyser.memory_usage_index import MemoryDetailsIndex, _INDEX_SUFFIX, get_index_cache_dir
+
+DETAILS = {
+    '0': {
+        'graph_id': 0,
+        'peak_mem': 1.25,
+        'breakdowns': [
+            [{'name': 'Default/Conv2D-op1', 'size': 12, 'shape': [1, 3]}],
+            [],
+            [{'name': '默认/MatMul-op2', 'size': 3e-05}, {'name': 'Default/Add-op3', 'size': 100}]
+        ],
+        'lines': [0.5, 1.25, 0.75]
+    },
+    '1': {'graph_id': 1, 'breakdowns': [], 'nodes': {'name': 'node'}},
+    '2': {'graph_id': 2},
+    'extra': 'value'
+}
+
+
+def _get_graphics():
+    """Get the details without breakdowns."""
+    graphics = copy.deepcopy(DETAILS)
+    for graph in graphics.values():
+        if isinstance(graph, dict):
+            graph.pop('breakdowns', None)
+    return graphics
+
+
+class TestMemoryDetailsIndex:
+    """Test the index of memory usage details files."""
+
+    def setup_method(self):
+        """Create the details file."""
+        self._workspace = tempfile.mkdtemp()
+        self._file_path = os.path.join(self._workspace, 'memory_usage_details_0.json')
+        with open(self._file_path, 'w', encoding='utf-8') as file:
+            json.dump(DETAILS, file, ensure_ascii=False, indent=1)
+        MemoryDetailsIndex.clear_cache()
+
+    def teardown_method(self):
+        """Remove the workspace."""
+        shutil.rmtree(self._workspace)
+        MemoryDetailsIndex.clear_cache()
+
+    @pytest.mark.parametrize('chunk_size', [1, 7, 1024])
+    def test_build(self, chunk_size):
+        """Test reading the graphs without breakdowns, and the breakdowns of each node by offsets."""
+        index = MemoryDetailsIndex.build(self._file_path, [0, 0], chunk_size)
+        assert index.graphics == _get_graphics()
+        assert index.get_breakdowns_count('0') == 3
+        assert index.get_breakdowns_count('1') == 0
+        assert index.get_breakdowns_count('2') is None
+        for node_id in range(-3, 3):
+            assert index.read_breakdowns('0', node_id) == DETAILS['0']['breakdowns'][node_id]
+        with pytest.raises(IndexError):
+            index.read_breakdowns('0', 3)
+
+    def test_build_with_numbers_cut(self):
+        """Test reading the numbers cut by chunks at every offset."""
+        details = {'0': {'graph_id': 0, 'peak_mem': 12.5,
+                         'breakdowns': [[{'size': -25000000000.0}, {'size': 3e-05}, {'size': 1.5E+10}]]}}
+        with open(self._file_path, 'w') as file:
+            json.dump(details, file)
+        content = json.dumps(details)
+        for chunk_size in range(1, len(content) + 1):
+            index = MemoryDetailsIndex.build(self._file_path, [0, 0], chunk_size)
+            assert index.graphics == {'0': {'graph_id': 0, 'peak_mem': 12.5}}
+            assert index.read_breakdowns('0', 0) == details['0']['breakdowns'][0]
+
+    def test_build_invalid_file(self):
+        """Test building the index of an invalid file."""
+        with open(self._file_path, 'w') as file:
+            file.write('{"0": {"graph_id": 0, "breakdowns": [[], [}}')
+        with pytest.raises(ValueError):
+            MemoryDetailsIndex.build(self._file_path, [0, 0], 4)
+
+    def test_get_index(self):
+        """Test caching the index in memory and in the workspace until the details file changes."""
+        with patch.object(settings, 'WORKSPACE', self._workspace):
+            index = MemoryDetailsIndex.get_index(self._file_path)
+            assert MemoryDetailsIndex.get_index(self._file_path) is index
+
+            MemoryDetailsIndex.clear_cache()
+            with patch.object(MemoryDetailsIndex, 'build') as mock_build:
+                loaded_index = MemoryDetailsIndex.get_index(self._file_path)
+            mock_build.assert_not_called()
+            assert loaded_index.graphics == index.graphics
+            assert loaded_index.read_breakdowns('0', 2) == DETAILS['0']['breakdowns'][2]
+
+            with open(self._file_path, 'w') as file:
+                json.dump({'0': {'graph_id': 0, 'breakdowns': [[{'name': 'op'}]]}}, file)
+            changed_index = MemoryDetailsIndex.get_index(self._file_path)
+            assert changed_index.graphics == {'0': {'graph_id': 0}}
+            assert changed_index.read_breakdowns('0', 0) == [{'name': 'op'}]
+
+    def test_remove_stale_indexes(self):
+        """Test removing the index files of the removed details files."""
+        removed_path = os.path.join(self._workspace, 'memory_usage_details_1.json')
+        shutil.copy(self._file_path, removed_path)
+        with patch.object(settings, 'WORKSPACE', self._workspace), \
+                patch.object(MemoryDetailsIndex, '_last_stale_check_time', 0):
+            MemoryDetailsIndex.get_index(removed_path)
+            index_dir = get_index_cache_dir()
+            assert len(os.listdir(index_dir)) == 1
+            os.remove(removed_path)
+            invalid_path = os.path.join(index_dir, 'invalid' + _INDEX_SUFFIX)
+            with open(invalid_path, 'w') as file:
+                file.write('{"version": 1')
+
+            MemoryDetailsIndex._last_stale_check_time = 0
+            MemoryDetailsIndex.get_index(self._file_path)
+            assert len(os.listdir(index_dir)) == 1
+            assert MemoryDetailsIndex.get_index(self._file_path).graphics == _get_graphics()
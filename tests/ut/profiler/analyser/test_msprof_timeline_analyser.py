@@ -0,0 +1,46 @@
+# Copyright 2026 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the timestamps of the msprof timeline analyser."""
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from mindinsight.profiler.analyser.msprof_timeline_analyser import format_ns, shift_events_ts, to_ns
+
+
+@pytest.mark.parametrize('value', ['1692339224591037.125', '1692339224591037.1', '1692339224591037',
+                                   '-5.25', '.5', '0.000', '1.23456', '1.5e3', 12, 2.5, Decimal('3.0004')])
+def test_to_ns(value):
+    """Test converting timestamps like Decimal."""
+    assert to_ns(value) == int(Decimal(value).quantize(Decimal('0.000')) * 1000)
+
+
+def test_format_ns():
+    """Test formatting timestamps like Decimal."""
+    ns_values = [-1234567, -1, 0, 1, 999, 1000, 1692339224591037125]
+    expected = [str(Decimal(ns).scaleb(-3).quantize(Decimal('0.000'))) for ns in ns_values]
+    assert format_ns(np.array(ns_values, dtype=np.int64)) == expected
+
+
+def test_shift_events_ts():
+    """Test subtracting the offset from the timestamps of events."""
+    events = [{'name': 'process_name', 'ph': 'M'},
+              {'name': 'op1', 'ph': 'X', 'ts': '1692339224591037.125'},
+              {'name': 'op2', 'ph': 'X', 'ts': 1692339224591038}]
+    shift_events_ts(events, to_ns(Decimal('12.3456')))
+    assert events == [{'name': 'process_name', 'ph': 'M'},
+                      {'name': 'op1', 'ph': 'X', 'ts': '1692339224591024.779'},
+                      {'name': 'op2', 'ph': 'X', 'ts': '1692339224591025.654'}]
@@ -0,0 +1,91 @@
+# Copyright 2026 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the timeline service of marey's graph."""
+import json
+import os
+import shutil
+import tempfile
+
+from mindinsight.profiler.analyser.timeline_processor import TimelineService
+
+
+def _create_events(offset):
+    """Create the events of two steps, the timestamps are shifted by the offset."""
+    events = [
+        {'name': '1', 'pid': 2, 'tid': 's', 'ts': 100, 'dur': 100},
+        {'name': '2', 'pid': 2, 'tid': 's', 'ts': 200, 'dur': 100},
+        {'name': 'Cast-op1', 'pid': 1, 'tid': 1, 'ts': 90, 'dur': 20},
+        {'name': 'AllReduce-op1', 'pid': 1, 'tid': 1, 'ts': 120, 'dur': 10},
+        {'name': 'MatMul-op1', 'pid': 1, 'tid': 1, 'ts': 140, 'dur': 10},
+        {'name': 'MatMul-op1', 'pid': 1, 'tid': 1, 'ts': 160, 'dur': 30},
+        {'name': 'AtomicAddrClean-op1', 'pid': 1, 'tid': 1, 'ts': 170, 'dur': 10},
+        {'name': 'MatMul-op1', 'pid': 1, 'tid': 1, 'ts': 250, 'dur': 10},
+    ]
+    for event in events:
+        event['ts'] += offset
+    return events
+
+
+class TestTimelineService:
+    """Test the timeline service."""
+
+    def setup_method(self):
+        """Create the display files of two devices."""
+        self._profiler_dir = tempfile.mkdtemp()
+        for device_id, offset in (('0', 0), ('1', 5)):
+            file_path = os.path.join(self._profiler_dir, f'ascend_timeline_display_{device_id}.json')
+            with open(file_path, 'w') as file:
+                json.dump(_create_events(offset), file)
+        TimelineService.clear_cache()
+
+    def teardown_method(self):
+        """Remove the display files."""
+        shutil.rmtree(self._profiler_dir)
+        TimelineService.clear_cache()
+
+    def test_get_ops_by_step(self):
+        """Test getting the operators of a step and aggregating them by stage."""
+        service = TimelineService(self._profiler_dir, '0,1')
+        timeline_data = service.get_ops_by_step('1')
+        assert timeline_data.operator_time_maps['device0'] == {
+            'Cast-op1': {'st': 90.0, 'ed': 110.0, 'dur': 20.0},
+            'AllReduce-op1': {'st': 120.0, 'ed': 130.0, 'dur': 10.0},
+            'MatMul-op1': {'st': 160.0, 'ed': 190.0, 'dur': 30.0}
+        }
+        # The timeline of device1 is aligned to device0 by the first AllReduce of step 1.
+        assert timeline_data.operator_time_maps['device1'] == timeline_data.operator_time_maps['device0']
+        assert (timeline_data.min_time, timeline_data.max_time) == (90.0, 190.0)
+        assert list(timeline_data.stage_data) == ['stage0']
+        stage = timeline_data.stage_data['stage0']
+        assert stage['devices'] == ['device0', 'device1']
+        assert stage['data']['MatMul-op1'] == {'st_max': 160.0, 'st_min': 160.0, 'st_avg': 160.0,
+                                               'ed_max': 190.0, 'ed_min': 190.0, 'ed_avg': 190.0, 'n': 2}
+
+        timeline_data = service.get_ops_by_step('2')
+        assert timeline_data.operator_time_maps['device0'] == {'MatMul-op1': {'st': 250.0, 'ed': 260.0, 'dur': 10.0}}
+        assert (timeline_data.min_time, timeline_data.max_time) == (250.0, 260.0)
+
+    def test_get_service(self):
+        """Test caching the service until the display files change."""
+        service = TimelineService.get_service(self._profiler_dir, '0,1')
+        assert TimelineService.get_service(self._profiler_dir, '0,1') is service
+        assert TimelineService.get_service(self._profiler_dir, '0') is not service
+
+        file_path = os.path.join(self._profiler_dir, 'ascend_timeline_display_1.json')
+        with open(file_path, 'w') as file:
+            json.dump(_create_events(10)[:4], file)
+        changed_service = TimelineService.get_service(self._profiler_dir, '0,1')
+        assert changed_service is not service
+        assert list(changed_service.get_ops_by_step('1').operator_time_maps['device1']) == ['Cast-op1', 'AllReduce-op1']
@@ -0,0 +1,103 @@
+# Copyright 2026 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the store of merged timelines."""
+import json
+import os
+import shutil
+import tempfile
+
+from mindinsight.profiler.analyser.timeline_store import MERGED_EVENTS_ARG, TimelineStore, TimelineStoreBuilder
+
+
+def _create_events():
+    """Create events of two tracks, the timestamps are in microseconds."""
+    events = [{'name': 'process_name', 'pid': 1, 'ph': 'M', 'args': {'name': 'Ascend Hardware Rank0'}}]
+    for index in range(10):
+        events.append({'name': f'op{index}', 'pid': 1, 'tid': 1, 'ph': 'X', 'ts': f'{index * 10}.500', 'dur': 5})
+    events.append({'name': 'op_long', 'pid': 1, 'tid': 2, 'ph': 'X', 'ts': '1.000', 'dur': 100.25})
+    events.append({'name': 'flow', 'pid': 1, 'tid': 2, 'ph': 's', 'id': 1, 'ts': '42.000'})
+    return events
+
+
+def _names(events):
+    """Get the names of the events with timestamps."""
+    return [event['name'] for event in events if event.get('ts')]
+
+
+class TestTimelineStore:
+    """Test the timeline store."""
+
+    def setup_method(self):
+        """Build the store."""
+        self._events = _create_events()
+        builder = TimelineStoreBuilder('fingerprint')
+        builder.add_events(self._events[:5])
+        builder.add_events(self._events[5:])
+        self._store = builder.build()
+        self._workspace = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        """Remove the workspace."""
+        shutil.rmtree(self._workspace)
+
+    def test_query_all(self):
+        """Test querying all the events."""
+        events = self._store.query()
+        assert len(self._store) == len(self._events)
+        assert events[0] == self._events[0]
+        assert _names(events) == ['op0', 'op_long', 'op1', 'op2', 'op3', 'op4', 'flow', 'op5', 'op6', 'op7', 'op8',
+                                  'op9']
+
+    def test_query_window(self):
+        """Test querying the events overlapping a window, in nanoseconds."""
+        assert _names(self._store.query(14000, 31000)) == ['op_long', 'op1', 'op2', 'op3']
+        assert _names(self._store.query(15500, 20500)) == ['op_long']
+        assert _names(self._store.query(42000, 42001)) == ['op_long', 'op4', 'flow']
+        assert not _names(self._store.query(200000, 300000))
+
+    def test_query_zero_duration_at_start(self):
+        """Test the events of zero duration at the start of the window are queried."""
+        builder = TimelineStoreBuilder('fingerprint')
+        builder.add_events([{'name': f'op{index}', 'pid': 1, 'tid': 1, 'ph': 'X', 'ts': f'{index * 10}.000', 'dur': 0}
+                            for index in range(3)])
+        store = builder.build()
+        assert _names(store.query(10000, 20000)) == ['op1']
+        assert _names(store.query(10000, 20001)) == ['op1', 'op2']
+        assert _names(store.query(0, 10000)) == ['op0']
+
+    def test_query_resolution(self):
+        """Test merging the events of each track in the buckets of the window."""
+        events = [event for event in self._store.query(0, 100000, 2) if event.get('ts')]
+        assert [(event['name'], event['ts'], event.get('dur'), event.get('args')) for event in events] == [
+            ('op0', '0.500', 45.0, {MERGED_EVENTS_ARG: 5}),
+            ('op_long', '1.000', 100.25, None),
+            ('flow', '42.000', None, None),
+            ('op5', '50.500', 45.0, {MERGED_EVENTS_ARG: 5})
+        ]
+
+    def test_iter_json(self):
+        """Test encoding the queried events as a JSON array."""
+        for args in [(), (14000, 31000), (0, 100000, 2), (200000, 300000)]:
+            events = json.loads(b''.join(self._store.iter_json(*args)))
+            assert sorted(map(json.dumps, events)) == sorted(map(json.dumps, self._store.query(*args)))
+
+    def test_save_and_load(self):
+        """Test saving the store and loading it by the fingerprint."""
+        file_path = os.path.join(self._workspace, 'cache', 'store.timeline')
+        assert self._store.save(file_path)
+        assert TimelineStore.load(file_path, 'changed') is None
+        store = TimelineStore.load(file_path, 'fingerprint')
+        assert store.query() == self._store.query()
+        assert store.query(14000, 31000, 3) == self._store.query(14000, 31000, 3)